@@ -1,41 +1,55 @@
 """AWS 클라이언트 관리 모듈."""
 
+import threading
 from functools import lru_cache
 
 import boto3
+from botocore.config import Config
+
+# boto3 기본 세션은 스레드 안전하지 않으므로 클라이언트는 한 번에 하나씩 만든다
+_create_lock = threading.Lock()
+
+# Route53 API는 계정당 초당 요청 수가 제한된다. adaptive 모드는 Throttling이 난 요청(페이지)만
+# 재시도하면서, 클라이언트를 공유하는 모든 Zone 조회 워커의 요청 속도를 함께 낮춘다
+ROUTE53_CONFIG = Config(retries={"mode": "adaptive", "total_max_attempts": 10})
+
+
+def _create_client(service: str, region: str | None = None, config: Config | None = None):
+    with _create_lock:
+        return boto3.client(service, region_name=region, config=config)
 
 
 @lru_cache
 def get_route53_client():
-    """Route53 클라이언트 반환."""
-    return boto3.client("route53")
+    """Route53 클라이언트 반환 (Throttling 시 adaptive 재시도)."""
+    return _create_client("route53", config=ROUTE53_CONFIG)
 
 
 @lru_cache
 def get_cloudfront_client():
     """CloudFront 클라이언트 반환."""
-    return boto3.client("cloudfront")
+    return _create_client("cloudfront")
 
 
 @lru_cache
 def get_elbv2_client(region: str = "ap-northeast-2"):
     """ELBv2 클라이언트 반환."""
-    return boto3.client("elbv2", region_name=region)
+    return _create_client("elbv2", region)
 
 
 @lru_cache
 def get_elb_client(region: str = "ap-northeast-2"):
     """Classic ELB 클라이언트 반환."""
-    return boto3.client("elb", region_name=region)
+    return _create_client("elb", region)
 
 
 @lru_cache
 def get_ec2_client(region: str = "ap-northeast-2"):
     """EC2 클라이언트 반환."""
-    return boto3.client("ec2", region_name=region)
+    return _create_client("ec2", region)
 
 
 @lru_cache
 def get_s3_client():
     """S3 클라이언트 반환."""
-    return boto3.client("s3")
+    return _create_client("s3")
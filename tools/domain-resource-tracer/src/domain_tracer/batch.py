@@ -0,0 +1,131 @@
+"""여러 식별자 일괄 추적 모듈 (drt trace-batch).
+
+파일 / stdin에서 도메인, LB DNS, EC2 식별자를 한 줄에 하나씩 읽어 정방향 또는 역방향으로
+추적한다. 식별자는 워커 수만큼 병렬로 추적하고 끝나는 순서대로 결과를 돌려주며,
+동시에 처리 중인 식별자는 워커 수의 2배로 제한하므로 입력이 많아도 메모리가 늘지 않는다.
+"""
+
+import time
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any
+
+from .inventory import Inventory
+from .memo import submit_in_context
+from .tracer import InputType, identify_input_type, reverse_trace_auto, trace_domain
+
+BATCH_MODES = ("auto", "forward", "reverse")
+DEFAULT_BATCH_WORKERS = 8
+
+
+def read_identifiers(lines: Iterable[str]) -> Iterator[tuple[int, str]]:
+    """(줄 번호, 식별자). 빈 줄과 `#` 이후 주석은 건너뛴다."""
+    for lineno, raw in enumerate(lines, start=1):
+        identifier = raw.split("#", 1)[0].strip()
+        if identifier:
+            yield lineno, identifier
+
+
+def resolve_mode(identifier: str, mode: str) -> str:
+    """auto면 LB DNS / Instance ID / IP / Private DNS는 reverse, 나머지는 forward."""
+    if mode not in BATCH_MODES:
+        raise ValueError(f"알 수 없는 모드: {mode} (지원: {', '.join(BATCH_MODES)})")
+    if mode != "auto":
+        return mode
+    return "forward" if identify_input_type(identifier) == InputType.EC2_NAME else "reverse"
+
+
+def trace_identifier(
+    identifier: str,
+    mode: str,
+    region: str | None = None,
+    inventory: Inventory | None = None,
+    regex: bool = False,
+) -> Any:
+    """식별자 1개 추적.
+
+    forward는 도메인 이름이 같은 레코드(regex면 정규표현식 패턴)를 trace_domain으로,
+    reverse는 reverse_trace_auto로 추적한다.
+
+    Raises:
+        LookupError: forward에서 일치하는 레코드가 없거나 (와일드카드 레코드로만
+            응답하는 이름 포함), reverse에서 일치하는 LB / EC2 인스턴스가 없는 경우
+        RuntimeError: reverse에서 EC2 조회가 실패한 경우 (결과에 담긴 error)
+    """
+    if mode == "forward":
+        results = trace_domain(identifier, region, inventory, exact=not regex)
+        if not results:
+            raise LookupError("일치하는 Route53 레코드가 없습니다.")
+        return results
+
+    result = reverse_trace_auto(identifier, region, inventory)
+    if "lb_dns" in result:
+        if not result["load_balancer"].get("lb_name"):
+            raise LookupError("일치하는 Load Balancer가 없습니다.")
+        return result
+    instances = result["ec2_instances"]
+    if not instances:
+        raise LookupError("일치하는 EC2 인스턴스가 없습니다.")
+    if "error" in instances[0]:
+        raise RuntimeError(instances[0]["error"])
+    return result
+
+
+def trace_batch(
+    identifiers: Iterable[tuple[int, str]],
+    mode: str = "auto",
+    region: str | None = None,
+    inventory: Inventory | None = None,
+    workers: int = DEFAULT_BATCH_WORKERS,
+    regex: bool = False,
+) -> Iterator[dict[str, Any]]:
+    """식별자들을 병렬로 추적하고 끝나는 순서대로 결과 레코드를 돌려준다.
+
+    결과 레코드: line, identifier, mode, ok, elapsed_ms와 result(성공) 또는 error(실패).
+    식별자 하나의 실패는 해당 레코드의 error로만 기록하고 나머지는 계속 추적한다.
+    """
+    if workers < 1:
+        raise ValueError("workers는 1 이상이어야 합니다.")
+    if mode not in BATCH_MODES:
+        raise ValueError(f"알 수 없는 모드: {mode} (지원: {', '.join(BATCH_MODES)})")
+
+    def run(lineno: int, identifier: str) -> dict[str, Any]:
+        record: dict[str, Any] = {"line": lineno, "identifier": identifier}
+        started = time.perf_counter()
+        try:
+            record["mode"] = resolve_mode(identifier, mode)
+            record["result"] = trace_identifier(
+                identifier, record["mode"], region, inventory, regex
+            )
+            record["ok"] = True
+        except Exception as e:
+            record["ok"] = False
+            record["error"] = str(e)
+        record["elapsed_ms"] = round((time.perf_counter() - started) * 1000, 1)
+        return record
+
+    yield from _bounded_map(run, identifiers, workers)
+
+
+def _bounded_map(
+    fn: Callable[[int, str], dict[str, Any]],
+    items: Iterable[tuple[int, str]],
+    workers: int,
+) -> Iterator[dict[str, Any]]:
+    """items를 workers개 스레드로 처리하되 제출은 workers * 2개까지만 앞서 나간다."""
+    pending_items = iter(items)
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="trace-batch")
+    pending: set[Future] = set()
+    try:
+        while True:
+            for item in pending_items:
+                pending.add(submit_in_context(executor, fn, *item))
+                if len(pending) >= workers * 2:
+                    break
+            if not pending:
+                return
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
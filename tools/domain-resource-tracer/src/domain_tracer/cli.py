@@ -1,6 +1,9 @@
 """CLI 인터페이스."""
 
 import json
+import sys
+import time
+from contextlib import nullcontext
 from typing import Annotated
 
 import typer
@@ -10,8 +13,12 @@ from rich.table import Table
 from rich.tree import Tree
 
 from . import __version__
+from .batch import BATCH_MODES, DEFAULT_BATCH_WORKERS, read_identifiers, trace_batch
+from .inventory import DEFAULT_REGION, GLOBAL_SERVICES, SERVICES, Inventory
+from .memo import CallMemo, call_memo
 from .tracer import (
     InputType,
+    TraceResult,
     identify_input_type,
     reverse_trace_auto,
     trace_domain,
@@ -41,6 +48,29 @@ def main(
     """AWS 도메인 기반 리소스 추적 도구."""
 
 
+NoCacheOption = Annotated[
+    bool,
+    typer.Option("--no-cache", help="로컬 인벤토리 캐시를 쓰지 않고 AWS API를 직접 조회"),
+]
+CacheTtlOption = Annotated[
+    float | None,
+    typer.Option("--cache-ttl", help="인벤토리 캐시 유효 시간(초, 기본: $DRT_CACHE_TTL 또는 900)"),
+]
+
+
+def open_inventory(
+    no_cache: bool, cache_ttl: float | None, err_console: Console = console
+) -> Inventory | None:
+    """CLI 옵션에 따른 인벤토리 (--no-cache면 None). 오류는 err_console에 출력한다."""
+    if no_cache:
+        return None
+    try:
+        return Inventory(ttl=cache_ttl)
+    except ValueError as e:
+        err_console.print(f"[red]오류: {e}[/red]")
+        raise typer.Exit(1) from e
+
+
 @app.command()
 def trace(
     pattern: Annotated[
@@ -59,6 +89,8 @@ def trace(
         bool,
         typer.Option("--verbose", "-V", help="상세 출력"),
     ] = False,
+    no_cache: NoCacheOption = False,
+    cache_ttl: CacheTtlOption = None,
 ):
     """도메인 패턴으로 AWS 리소스 체인을 추적합니다.
 
@@ -67,9 +99,30 @@ def trace(
         drt trace ".*\\.example\\.com"
         drt trace "prod-.*"
     """
-    with console.status(f"[bold green]'{pattern}' 패턴으로 검색 중..."):
+    inventory = open_inventory(no_cache, cache_ttl)
+    zones_done = 0
+    matched = 0
+
+    def on_zone(zone_name: str, matches: list[TraceResult]) -> None:
+        # Zone 검색이 끝날 때마다 진행 상황 표시 (JSON 출력이면 일치 목록은 생략)
+        nonlocal zones_done, matched
+        zones_done += 1
+        matched += len(matches)
+        status.update(
+            f"[bold green]'{pattern}' 패턴으로 검색 중... "
+            f"(Zone {zones_done}개 완료, {matched}개 일치)"
+        )
+        if matches and not output_json:
+            names = ", ".join(m.domain for m in matches[:3])
+            more = f" 외 {len(matches) - 3}개" if len(matches) > 3 else ""
+            console.print(f"[dim]{zone_name}: {names}{more}[/dim]")
+
+    with (
+        console.status(f"[bold green]'{pattern}' 패턴으로 검색 중...") as status,
+        call_memo() as memo,
+    ):
         try:
-            results = trace_domain(pattern, region)
+            results = trace_domain(pattern, region, inventory, on_zone)
         except ValueError as e:
             console.print(f"[red]오류: {e}[/red]")
             raise typer.Exit(1) from e
@@ -91,6 +144,9 @@ def trace(
     for result in results:
         render_result(result, verbose)
 
+    if verbose:
+        render_memo_stats(memo)
+
 
 def render_result(result: dict, verbose: bool = False):
     """결과를 트리 형태로 렌더링."""
@@ -198,17 +254,23 @@ def render_result(result: dict, verbose: bool = False):
 
 
 @app.command()
-def list_zones():
+def list_zones(
+    no_cache: NoCacheOption = False,
+    cache_ttl: CacheTtlOption = None,
+):
     """Route53 Hosted Zone 목록을 조회합니다."""
     from .aws_clients import get_route53_client
 
-    client = get_route53_client()
+    inventory = open_inventory(no_cache, cache_ttl)
 
     with console.status("[bold green]Hosted Zone 조회 중..."):
-        paginator = client.get_paginator("list_hosted_zones")
-        zones = []
-        for page in paginator.paginate():
-            zones.extend(page["HostedZones"])
+        if inventory is not None:
+            zones = list(inventory.hosted_zones())
+        else:
+            paginator = get_route53_client().get_paginator("list_hosted_zones")
+            zones = []
+            for page in paginator.paginate():
+                zones.extend(page["HostedZones"])
 
     if not zones:
         console.print("[yellow]등록된 Hosted Zone이 없습니다.[/yellow]")
@@ -243,13 +305,15 @@ def list_records(
         str,
         typer.Option("--pattern", "-p", help="필터링 패턴 (정규표현식)"),
     ] = None,
+    no_cache: NoCacheOption = False,
+    cache_ttl: CacheTtlOption = None,
 ):
     """특정 Hosted Zone의 레코드를 조회합니다."""
     import re
 
     from .aws_clients import get_route53_client
 
-    client = get_route53_client()
+    inventory = open_inventory(no_cache, cache_ttl)
 
     regex = None
     if pattern:
@@ -260,13 +324,16 @@ def list_records(
             raise typer.Exit(1) from e
 
     with console.status("[bold green]레코드 조회 중..."):
-        paginator = client.get_paginator("list_resource_record_sets")
-        records = []
-        for page in paginator.paginate(HostedZoneId=zone_id):
-            for record in page["ResourceRecordSets"]:
-                if regex and not regex.search(record["Name"]):
-                    continue
-                records.append(record)
+        # 스냅샷에 없는 Zone(스냅샷 이후 생성 등)은 API로 조회
+        zone_records = inventory.zone_records(zone_id) if inventory is not None else None
+        if zone_records is None:
+            paginator = get_route53_client().get_paginator("list_resource_record_sets")
+            zone_records = [
+                record
+                for page in paginator.paginate(HostedZoneId=zone_id)
+                for record in page["ResourceRecordSets"]
+            ]
+        records = [r for r in zone_records if not regex or regex.search(r["Name"])]
 
     if not records:
         console.print("[yellow]레코드를 찾지 못했습니다.[/yellow]")
@@ -314,6 +381,8 @@ def reverse_trace(
         bool,
         typer.Option("--verbose", "-V", help="상세 출력"),
     ] = False,
+    no_cache: NoCacheOption = False,
+    cache_ttl: CacheTtlOption = None,
 ):
     """LB DNS 또는 EC2로부터 역방향 추적을 수행합니다.
 
@@ -342,9 +411,10 @@ def reverse_trace(
 
     console.print(f"[dim]입력 타입: {type_desc}[/dim]")
 
-    with console.status(f"[bold green]'{identifier}' 역추적 중..."):
+    inventory = open_inventory(no_cache, cache_ttl)
+    with console.status(f"[bold green]'{identifier}' 역추적 중..."), call_memo() as memo:
         try:
-            result = reverse_trace_auto(identifier, region)
+            result = reverse_trace_auto(identifier, region, inventory)
         except Exception as e:
             console.print(f"[red]AWS API 오류: {e}[/red]")
             raise typer.Exit(1) from e
@@ -359,6 +429,173 @@ def reverse_trace(
     else:
         render_reverse_ec2_result(result, verbose)
 
+    if verbose:
+        render_memo_stats(memo)
+
+
+def render_memo_stats(memo: CallMemo):
+    """이번 실행에서 AWS API를 호출한 횟수(miss)와 메모를 재사용한 횟수(hit)."""
+    stats = memo.stats()
+    if not stats:
+        console.print("[dim]AWS API 직접 호출 없음 (인벤토리 캐시 사용)[/dim]")
+        return
+
+    table = Table(title="AWS 조회 메모", show_header=True, header_style="bold")
+    table.add_column("API")
+    table.add_column("호출 (miss)", justify="right")
+    table.add_column("재사용 (hit)", justify="right")
+    for operation, misses, hits in stats:
+        table.add_row(operation, str(misses), str(hits))
+    console.print(table)
+
+
+@app.command(name="trace-batch")
+def trace_batch_command(
+    source: Annotated[
+        str,
+        typer.Argument(help="식별자 파일 (한 줄에 하나, 생략하거나 -면 stdin)"),
+    ] = "-",
+    mode: Annotated[
+        str,
+        typer.Option(
+            "--mode",
+            "-m",
+            help="auto: LB DNS / EC2 ID / IP는 역추적, 나머지는 도메인 정방향 추적",
+        ),
+    ] = "auto",
+    workers: Annotated[
+        int,
+        typer.Option("--workers", "-w", min=1, help="동시에 추적할 식별자 수"),
+    ] = DEFAULT_BATCH_WORKERS,
+    regex: Annotated[
+        bool,
+        typer.Option("--regex", help="정방향 추적 식별자를 도메인 이름 대신 정규표현식으로 사용"),
+    ] = False,
+    region: Annotated[
+        str,
+        typer.Option("--region", "-r", help="AWS 리전 (기본: 식별자에서 자동 감지)"),
+    ] = None,
+    no_cache: NoCacheOption = False,
+    cache_ttl: CacheTtlOption = None,
+):
+    """여러 식별자를 한 번에 추적하여 JSON Lines로 출력합니다.
+
+    식별자마다 끝나는 순서대로 JSON 객체 한 줄
+    (line, identifier, mode, ok, result 또는 error, elapsed_ms)을 stdout에 출력하고,
+    진행 요약은 stderr에 출력합니다. 한 식별자라도 실패하면 종료 코드는 1입니다.
+
+    예시:
+        drt trace-batch domains.txt > traces.jsonl
+        cat ips.txt | drt trace-batch --mode reverse -w 16 | jq 'select(.ok | not)'
+        drt trace-batch patterns.txt --mode forward --regex
+    """
+    stderr = Console(stderr=True)
+    if mode not in BATCH_MODES:
+        stderr.print(f"[red]알 수 없는 모드: {mode} (지원: {', '.join(BATCH_MODES)})[/red]")
+        raise typer.Exit(1)
+
+    try:
+        source_file = nullcontext(sys.stdin) if source == "-" else open(source, encoding="utf-8")
+    except OSError as e:
+        stderr.print(f"[red]파일을 열 수 없습니다: {e}[/red]")
+        raise typer.Exit(1) from e
+
+    inventory = open_inventory(no_cache, cache_ttl, stderr)
+    done = failed = 0
+    start = time.monotonic()
+    with source_file as lines, call_memo():
+        records = trace_batch(read_identifiers(lines), mode, region, inventory, workers, regex)
+        for record in records:
+            typer.echo(json.dumps(record, ensure_ascii=False, default=str))
+            done += 1
+            failed += not record["ok"]
+
+    stderr.print(
+        f"[dim]{done}개 추적 완료 (실패 {failed}개, {time.monotonic() - start:.1f}s)[/dim]"
+    )
+    if failed:
+        raise typer.Exit(1)
+
+
+@app.command()
+def refresh(
+    service: Annotated[
+        list[str] | None,
+        typer.Option(
+            "--service",
+            "-s",
+            help=f"갱신할 서비스 (여러 번 지정 가능, 기본: 전체 {', '.join(SERVICES)})",
+        ),
+    ] = None,
+    region: Annotated[
+        list[str] | None,
+        typer.Option(
+            "--region", "-r", help=f"ELB / EC2 리전 (여러 번 지정 가능, 기본: {DEFAULT_REGION})"
+        ),
+    ] = None,
+    status_only: Annotated[
+        bool,
+        typer.Option("--status", help="갱신하지 않고 캐시 상태만 표시"),
+    ] = False,
+):
+    """로컬 인벤토리 캐시(Route53 / CloudFront / ELB / EC2)를 AWS API로 다시 조회합니다.
+
+    예시:
+        drt refresh
+        drt refresh -s route53 -s cloudfront
+        drt refresh -s elbv2 -s ec2 -r ap-northeast-2 -r us-east-1
+        drt refresh --status
+    """
+    services = service or list(SERVICES)
+    unknown = [s for s in services if s not in SERVICES]
+    if unknown:
+        console.print(
+            f"[red]알 수 없는 서비스: {', '.join(unknown)} (지원: {', '.join(SERVICES)})[/red]"
+        )
+        raise typer.Exit(1)
+    regions = region or [DEFAULT_REGION]
+
+    inventory = Inventory()
+    sections = [(s, r) for s in services for r in ([None] if s in GLOBAL_SERVICES else regions)]
+
+    table = Table(
+        title=f"Inventory Cache ({inventory.cache_dir})", show_header=True, header_style="bold"
+    )
+    table.add_column("Service")
+    table.add_column("Region")
+    table.add_column("Items", justify="right")
+    table.add_column("Age", justify="right")
+    table.add_column("Elapsed", justify="right")
+
+    failed = False
+    for s, r in sections:
+        elapsed = "-"
+        if status_only:
+            section_status = inventory.status(s, r)
+        else:
+            start = time.monotonic()
+            with console.status(f"[bold green]{s} {r or ''} 조회 중..."):
+                try:
+                    section_status = inventory.refresh(s, r)
+                except Exception as e:
+                    console.print(f"[red]{s} {r or ''} 갱신 실패: {e}[/red]")
+                    failed = True
+                    continue
+            elapsed = f"{time.monotonic() - start:.1f}s"
+
+        age = section_status.age()
+        table.add_row(
+            s,
+            r or "global",
+            str(section_status.items) if age is not None else "-",
+            f"{age:.0f}s" if age is not None else "[dim]없음[/dim]",
+            elapsed,
+        )
+
+    console.print(table)
+    if failed:
+        raise typer.Exit(1)
+
 
 def render_reverse_lb_result(result: dict, verbose: bool = False):
     """LB 역추적 결과를 트리 형태로 렌더링."""
@@ -0,0 +1,508 @@
+"""AWS 리소스 인벤토리 로컬 캐시 모듈.
+
+Route53 레코드, CloudFront 배포, ELB, EC2 인스턴스 목록을 서비스(리전)별 JSON 스냅샷으로
+디스크에 저장하고, TTL 안에서는 API를 다시 호출하지 않고 스냅샷을 읽는다.
+
+캐시 위치: $DRT_CACHE_DIR 또는 ~/.cache/domain-resource-tracer/<AWS 프로파일>/
+
+역추적(DNS → 레코드, Origin → 배포, 타겟 → Target Group)에 쓰는 역색인은 섹션을 읽을 때
+한 번만 만들고 섹션이 다시 조회될 때까지 재사용하므로, 식별자 수와 무관하게 조회 1건은
+dict 조회 1번이다.
+"""
+
+import ipaddress
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from .aws_clients import (
+    get_cloudfront_client,
+    get_ec2_client,
+    get_elb_client,
+    get_elbv2_client,
+    get_route53_client,
+)
+from .zones import iter_zone_records, list_hosted_zones
+
+DEFAULT_CACHE_TTL = 900  # 15분
+DEFAULT_REGION = "ap-northeast-2"
+# 전역 서비스 (리전 무관)
+GLOBAL_SERVICES = ("route53", "cloudfront")
+REGIONAL_SERVICES = ("elbv2", "elb", "ec2")
+SERVICES = GLOBAL_SERVICES + REGIONAL_SERVICES
+CACHE_VERSION = 1
+
+
+def default_cache_dir() -> Path:
+    """캐시 디렉토리 (AWS 프로파일별로 분리)."""
+    base = os.environ.get("DRT_CACHE_DIR")
+    if base:
+        root = Path(base)
+    else:
+        xdg = os.environ.get("XDG_CACHE_HOME")
+        root = (Path(xdg) if xdg else Path.home() / ".cache") / "domain-resource-tracer"
+    return root / os.environ.get("AWS_PROFILE", "default")
+
+
+def default_cache_ttl() -> float:
+    """기본 TTL(초). $DRT_CACHE_TTL로 변경 가능."""
+    value = os.environ.get("DRT_CACHE_TTL")
+    if value is None:
+        return DEFAULT_CACHE_TTL
+    try:
+        return float(value)
+    except ValueError as e:
+        raise ValueError(f"DRT_CACHE_TTL이 숫자가 아닙니다: {value}") from e
+
+
+@dataclass
+class SectionStatus:
+    """캐시 섹션(서비스 + 리전) 1개의 상태."""
+
+    service: str
+    region: str | None
+    path: Path
+    fetched_at: float | None
+    items: int
+
+    def age(self, now: float | None = None) -> float | None:
+        """스냅샷 경과 시간(초). 캐시가 없으면 None."""
+        if self.fetched_at is None:
+            return None
+        return (time.time() if now is None else now) - self.fetched_at
+
+
+def _paginate(client, operation: str, key: str, **kwargs) -> list[dict]:
+    return [
+        item for page in client.get_paginator(operation).paginate(**kwargs) for item in page[key]
+    ]
+
+
+def _fetch_route53(region: str | None) -> dict[str, Any]:
+    client = get_route53_client()
+    zones = list_hosted_zones(client)
+    records = {
+        zone["Id"].replace("/hostedzone/", ""): zone_records
+        for _, zone, zone_records in iter_zone_records(client, zones)
+    }
+    return {"zones": zones, "records": records}
+
+
+def _fetch_cloudfront(region: str | None) -> dict[str, Any]:
+    client = get_cloudfront_client()
+    distributions = []
+    for page in client.get_paginator("list_distributions").paginate():
+        distributions.extend((page.get("DistributionList") or {}).get("Items") or [])
+    return {"distributions": distributions}
+
+
+def _fetch_elbv2(region: str | None) -> dict[str, Any]:
+    client = get_elbv2_client(region)
+    target_groups = _paginate(client, "describe_target_groups", "TargetGroups")
+    return {
+        "load_balancers": _paginate(client, "describe_load_balancers", "LoadBalancers"),
+        "target_groups": target_groups,
+        "target_health": {
+            tg["TargetGroupArn"]: client.describe_target_health(
+                TargetGroupArn=tg["TargetGroupArn"]
+            )["TargetHealthDescriptions"]
+            for tg in target_groups
+        },
+    }
+
+
+def _fetch_elb(region: str | None) -> dict[str, Any]:
+    client = get_elb_client(region)
+    return {
+        "load_balancers": _paginate(client, "describe_load_balancers", "LoadBalancerDescriptions")
+    }
+
+
+def _fetch_ec2(region: str | None) -> dict[str, Any]:
+    client = get_ec2_client(region)
+    reservations = _paginate(client, "describe_instances", "Reservations")
+    return {"instances": [i for r in reservations for i in r.get("Instances", [])]}
+
+
+_FETCHERS: dict[str, Callable[[str | None], dict[str, Any]]] = {
+    "route53": _fetch_route53,
+    "cloudfront": _fetch_cloudfront,
+    "elbv2": _fetch_elbv2,
+    "elb": _fetch_elb,
+    "ec2": _fetch_ec2,
+}
+
+
+def _normalize_dns(name: str) -> str:
+    """역색인 키용 DNS 정규화 (소문자 + trailing dot 제거 + dualstack. 제거)."""
+    name = name.lower().rstrip(".")
+    return name[len("dualstack.") :] if name.startswith("dualstack.") else name
+
+
+def _normalize_ip(value: str) -> str:
+    """역색인 키용 타겟 ID 정규화 (IPv6 축약 표기 등 IP 표기 차이 무시)."""
+    try:
+        return str(ipaddress.ip_address(value))
+    except ValueError:
+        return value
+
+
+def _iter_records(data: dict[str, Any]) -> Iterator[tuple[str, str, dict]]:
+    for zone in data["zones"]:
+        zone_id = zone["Id"].replace("/hostedzone/", "")
+        zone_name = zone["Name"].rstrip(".")
+        for record in data["records"].get(zone_id, []):
+            yield zone_id, zone_name, record
+
+
+def _index_record_targets(data: dict[str, Any]) -> dict[str, list[tuple[str, str, dict]]]:
+    """Alias / CNAME 대상 DNS → (Zone ID, Zone 이름, 레코드)."""
+    index: dict[str, list[tuple[str, str, dict]]] = defaultdict(list)
+    for zone_id, zone_name, record in _iter_records(data):
+        if "AliasTarget" in record:
+            index[_normalize_dns(record["AliasTarget"]["DNSName"])].append(
+                (zone_id, zone_name, record)
+            )
+        elif record["Type"] == "CNAME":
+            for rr in record.get("ResourceRecords", []):
+                index[_normalize_dns(rr["Value"])].append((zone_id, zone_name, record))
+    return dict(index)
+
+
+def _index_record_names(data: dict[str, Any]) -> dict[str, list[tuple[str, str, dict]]]:
+    """레코드 이름 → (Zone ID, Zone 이름, 레코드)."""
+    index: dict[str, list[tuple[str, str, dict]]] = defaultdict(list)
+    for zone_id, zone_name, record in _iter_records(data):
+        index[record["Name"].lower().rstrip(".")].append((zone_id, zone_name, record))
+    return dict(index)
+
+
+def _index_distribution_domains(data: dict[str, Any]) -> dict[str, list[dict]]:
+    """배포 도메인(xxx.cloudfront.net) → 배포."""
+    index: dict[str, list[dict]] = defaultdict(list)
+    for dist in data["distributions"]:
+        index[_normalize_dns(dist["DomainName"])].append(dist)
+    return dict(index)
+
+
+def _index_distribution_origins(data: dict[str, Any]) -> dict[str, list[tuple[dict, list[dict]]]]:
+    """Origin 도메인 → (배포, 그 도메인을 쓰는 Origin 목록)."""
+    index: dict[str, list[tuple[dict, list[dict]]]] = defaultdict(list)
+    for dist in data["distributions"]:
+        origins: dict[str, list[dict]] = defaultdict(list)
+        for origin in dist.get("Origins", {}).get("Items", []):
+            origins[_normalize_dns(origin["DomainName"])].append(origin)
+        for domain, matching in origins.items():
+            index[domain].append((dist, matching))
+    return dict(index)
+
+
+def _index_by_dns(load_balancers: list[dict]) -> dict[str, list[dict]]:
+    index: dict[str, list[dict]] = defaultdict(list)
+    for lb in load_balancers:
+        index[_normalize_dns(lb["DNSName"])].append(lb)
+    return dict(index)
+
+
+def _index_targets(data: dict[str, Any]) -> dict[str, list[tuple[int, int, dict, dict]]]:
+    """타겟 ID(Instance ID / IP) → (TG 순번, 타겟 순번, Target Group, TargetHealthDescription)."""
+    index: dict[str, list[tuple[int, int, dict, dict]]] = defaultdict(list)
+    for tg_pos, tg in enumerate(data["target_groups"]):
+        descriptions = data["target_health"].get(tg["TargetGroupArn"], [])
+        for pos, description in enumerate(descriptions):
+            index[_normalize_ip(description["Target"]["Id"])].append((tg_pos, pos, tg, description))
+    return dict(index)
+
+
+def _index_instance_ips(data: dict[str, Any]) -> dict[str, dict[str, list[dict]]]:
+    """ENI Private IP / Public IP → 인스턴스."""
+    private: dict[str, list[dict]] = defaultdict(list)
+    public: dict[str, list[dict]] = defaultdict(list)
+    for instance in data["instances"]:
+        ips = {
+            addr["PrivateIpAddress"]
+            for eni in instance.get("NetworkInterfaces", [])
+            for addr in eni.get("PrivateIpAddresses", [])
+            if addr.get("PrivateIpAddress")
+        }
+        for ip in ips:
+            private[_normalize_ip(ip)].append(instance)
+        if instance.get("PublicIpAddress"):
+            public[_normalize_ip(instance["PublicIpAddress"])].append(instance)
+    return {"private": dict(private), "public": dict(public)}
+
+
+def _count_items(service: str, data: dict[str, Any]) -> int:
+    if service == "route53":
+        return sum(len(records) for records in data["records"].values())
+    if service == "cloudfront":
+        return len(data["distributions"])
+    if service == "ec2":
+        return len(data["instances"])
+    return len(data["load_balancers"])
+
+
+class Inventory:
+    """서비스(리전)별 AWS 리소스 스냅샷.
+
+    각 섹션은 처음 접근할 때 디스크 캐시를 읽고, 없거나 TTL이 지났으면 API로 다시
+    조회하여 저장한다. 한 번 읽은 섹션은 프로세스가 끝날 때까지 메모리에 유지한다.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path | None = None,
+        ttl: float | None = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.cache_dir = cache_dir or default_cache_dir()
+        self.ttl = default_cache_ttl() if ttl is None else ttl
+        self._clock = clock
+        self._sections: dict[tuple[str, str | None], dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._section_locks: dict[tuple[str, str | None], threading.Lock] = {}
+        # (섹션 키, 색인 이름) → (색인을 만든 섹션 데이터, 색인)
+        self._indexes: dict[tuple[tuple[str, str | None], str], tuple[dict, Any]] = {}
+
+    # ------------------------------------------------------------------
+    # 섹션 로드 / 갱신
+    # ------------------------------------------------------------------
+
+    def path(self, service: str, region: str | None = None) -> Path:
+        """섹션 캐시 파일 경로."""
+        if service in GLOBAL_SERVICES:
+            return self.cache_dir / f"{service}.json"
+        return self.cache_dir / f"{service}-{region or DEFAULT_REGION}.json"
+
+    def section(self, service: str, region: str | None = None) -> dict[str, Any]:
+        """섹션 데이터 (메모리 → 유효한 디스크 캐시 → API 순)."""
+        key = self._key(service, region)
+        with self._section_lock(key):
+            if key not in self._sections:
+                data = self._read(service, key[1])
+                if data is None:
+                    data = self._fetch(service, key[1])
+                self._sections[key] = data
+            return self._sections[key]
+
+    def refresh(self, service: str, region: str | None = None) -> SectionStatus:
+        """TTL과 무관하게 섹션을 API로 다시 조회하여 저장한다."""
+        key = self._key(service, region)
+        with self._section_lock(key):
+            self._sections[key] = self._fetch(service, key[1])
+        return self.status(service, key[1])
+
+    def status(self, service: str, region: str | None = None) -> SectionStatus:
+        """디스크 캐시 기준 섹션 상태."""
+        service, region = self._key(service, region)
+        path = self.path(service, region)
+        payload = self._load_file(path)
+        if payload is None:
+            return SectionStatus(service, region, path, None, 0)
+        return SectionStatus(
+            service, region, path, payload["fetched_at"], _count_items(service, payload["data"])
+        )
+
+    def _key(self, service: str, region: str | None) -> tuple[str, str | None]:
+        if service not in _FETCHERS:
+            raise ValueError(f"알 수 없는 서비스: {service} (지원: {', '.join(SERVICES)})")
+        return service, None if service in GLOBAL_SERVICES else (region or DEFAULT_REGION)
+
+    def _section_lock(self, key: tuple[str, str | None]) -> threading.Lock:
+        with self._lock:
+            return self._section_locks.setdefault(key, threading.Lock())
+
+    def _index(
+        self,
+        name: str,
+        service: str,
+        region: str | None,
+        build: Callable[[dict[str, Any]], Any],
+    ) -> Any:
+        """섹션 데이터로 만든 색인. 섹션이 다시 조회되면 새로 만든다."""
+        key = self._key(service, region)
+        data = self.section(*key)
+        with self._section_lock(key):
+            cached = self._indexes.get((key, name))
+            if cached is None or cached[0] is not data:
+                cached = (data, build(data))
+                self._indexes[(key, name)] = cached
+            return cached[1]
+
+    def _read(self, service: str, region: str | None) -> dict[str, Any] | None:
+        payload = self._load_file(self.path(service, region))
+        if payload is None or self._clock() - payload["fetched_at"] > self.ttl:
+            return None
+        return payload["data"]
+
+    @staticmethod
+    def _load_file(path: Path) -> dict[str, Any] | None:
+        try:
+            with open(path, encoding="utf-8") as f:
+                payload = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if payload.get("version") != CACHE_VERSION or "data" not in payload:
+            return None
+        return payload
+
+    def _fetch(self, service: str, region: str | None) -> dict[str, Any]:
+        fetched_at = self._clock()
+        data = _FETCHERS[service](region)
+        # datetime 등은 문자열로 저장 (추적 로직은 사용하지 않음)
+        data = json.loads(json.dumps(data, default=str))
+        path = self.path(service, region)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        payload = {
+            "version": CACHE_VERSION,
+            "service": service,
+            "region": region,
+            "fetched_at": fetched_at,
+            "data": data,
+        }
+        tmp.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp, path)
+        return data
+
+    # ------------------------------------------------------------------
+    # 조회 헬퍼
+    # ------------------------------------------------------------------
+
+    def hosted_zones(self) -> list[dict]:
+        """Hosted Zone 목록 (list_hosted_zones 응답 형식)."""
+        return self.section("route53")["zones"]
+
+    def zone_records(self, zone_id: str) -> list[dict] | None:
+        """Zone의 레코드 목록. 스냅샷에 없는 Zone이면 None."""
+        return self.section("route53")["records"].get(zone_id)
+
+    def route53_records(self) -> Iterator[tuple[str, str, dict]]:
+        """모든 Zone의 (Zone ID, Zone 이름, 레코드)."""
+        yield from _iter_records(self.section("route53"))
+
+    def distributions(self) -> list[dict]:
+        """CloudFront 배포 목록 (list_distributions Items 형식)."""
+        return self.section("cloudfront")["distributions"]
+
+    def load_balancers(self, region: str | None = None) -> list[dict]:
+        """ALB/NLB 목록."""
+        return self.section("elbv2", region)["load_balancers"]
+
+    def target_groups(self, region: str | None = None) -> list[dict]:
+        """Target Group 목록."""
+        return self.section("elbv2", region)["target_groups"]
+
+    def target_health(self, target_group_arn: str, region: str | None = None) -> list[dict]:
+        """Target Group의 TargetHealthDescriptions (스냅샷 시점 상태)."""
+        return self.section("elbv2", region)["target_health"].get(target_group_arn, [])
+
+    def classic_load_balancers(self, region: str | None = None) -> list[dict]:
+        """Classic ELB 목록."""
+        return self.section("elb", region)["load_balancers"]
+
+    def instances(self, region: str | None = None) -> list[dict]:
+        """EC2 인스턴스 목록."""
+        return self.section("ec2", region)["instances"]
+
+    # ------------------------------------------------------------------
+    # 역색인 조회
+    # ------------------------------------------------------------------
+
+    def records_by_target(self, dns_name: str) -> list[tuple[str, str, dict]]:
+        """Alias / CNAME 값이 dns_name인 레코드의 (Zone ID, Zone 이름, 레코드).
+
+        CNAME 값이 여러 개면 일치하는 값마다 한 번씩 나온다.
+        """
+        index = self._index("record_targets", "route53", None, _index_record_targets)
+        return index.get(_normalize_dns(dns_name), [])
+
+    def records_by_name(self, name: str) -> list[tuple[str, str, dict]]:
+        """이름이 name인 레코드의 (Zone ID, Zone 이름, 레코드) (대소문자 / trailing dot 무시)."""
+        index = self._index("record_names", "route53", None, _index_record_names)
+        return index.get(name.lower().rstrip("."), [])
+
+    def distributions_by_domain(self, domain: str) -> list[dict]:
+        """배포 도메인(xxx.cloudfront.net)이 domain인 배포."""
+        index = self._index("domains", "cloudfront", None, _index_distribution_domains)
+        return index.get(_normalize_dns(domain), [])
+
+    def distributions_by_origin(self, origin_dns: str) -> list[tuple[dict, list[dict]]]:
+        """origin_dns를 Origin으로 쓰는 (배포, 일치하는 Origin 목록)."""
+        index = self._index("origins", "cloudfront", None, _index_distribution_origins)
+        return index.get(_normalize_dns(origin_dns), [])
+
+    def load_balancers_by_dns(self, dns_name: str, region: str | None = None) -> list[dict]:
+        """DNS 이름이 dns_name인 ALB/NLB."""
+        index = self._index(
+            "dns", "elbv2", region, lambda data: _index_by_dns(data["load_balancers"])
+        )
+        return index.get(_normalize_dns(dns_name), [])
+
+    def load_balancer_by_arn(self, arn: str, region: str | None = None) -> dict | None:
+        """ARN으로 ALB/NLB 조회."""
+        index = self._index(
+            "arn",
+            "elbv2",
+            region,
+            lambda data: {lb["LoadBalancerArn"]: lb for lb in data["load_balancers"]},
+        )
+        return index.get(arn)
+
+    def target_group_by_arn(self, arn: str, region: str | None = None) -> dict | None:
+        """ARN으로 Target Group 조회."""
+        index = self._index(
+            "target_group_arn",
+            "elbv2",
+            region,
+            lambda data: {tg["TargetGroupArn"]: tg for tg in data["target_groups"]},
+        )
+        return index.get(arn)
+
+    def targets_by_id(
+        self, target_ids: Iterable[str], region: str | None = None
+    ) -> list[tuple[dict, dict]]:
+        """타겟 ID(Instance ID / IP) 중 하나로 등록된 (Target Group, TargetHealthDescription).
+
+        Target Group 목록 순서를 따르며, IP는 표기 차이를 무시하고 비교한다.
+        """
+        index = self._index("targets", "elbv2", region, _index_targets)
+        matches = {
+            (tg_pos, pos): (tg, description)
+            for target_id in {_normalize_ip(t) for t in target_ids}
+            for tg_pos, pos, tg, description in index.get(target_id, [])
+        }
+        return [matches[k] for k in sorted(matches)]
+
+    def classic_load_balancers_by_dns(self, dns_name: str, region: str | None = None) -> list[dict]:
+        """DNS 이름이 dns_name인 Classic ELB."""
+        index = self._index(
+            "dns", "elb", region, lambda data: _index_by_dns(data["load_balancers"])
+        )
+        return index.get(_normalize_dns(dns_name), [])
+
+    def instance_by_id(self, instance_id: str, region: str | None = None) -> dict | None:
+        """Instance ID로 EC2 인스턴스 조회."""
+        index = self._index(
+            "instance_id",
+            "ec2",
+            region,
+            lambda data: {i["InstanceId"]: i for i in data["instances"]},
+        )
+        return index.get(instance_id)
+
+    def instances_by_private_ip(self, ip: str, region: str | None = None) -> list[dict]:
+        """ENI Private IP(primary + secondary)가 ip인 인스턴스."""
+        index = self._index("ips", "ec2", region, _index_instance_ips)
+        return index["private"].get(_normalize_ip(ip), [])
+
+    def instances_by_public_ip(self, ip: str, region: str | None = None) -> list[dict]:
+        """Public IP가 ip인 인스턴스."""
+        index = self._index("ips", "ec2", region, _index_instance_ips)
+        return index["public"].get(_normalize_ip(ip), [])
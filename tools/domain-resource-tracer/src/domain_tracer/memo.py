@@ -0,0 +1,88 @@
+"""실행 1회 범위의 AWS 조회 결과 메모 모듈.
+
+역추적은 LB마다 Route53 전체 레코드와 CloudFront 배포 목록을 다시 훑고, 여러 식별자를
+추적하면 같은 LB / Listener / Target Group을 반복해서 조회한다. call_memo() 블록 안에서는
+같은 (API, 인자) 조회를 한 번만 호출하고 결과를 재사용한다.
+
+메모는 ContextVar로 전달하므로 tracer 함수 시그니처는 그대로이며, 블록 밖에서는
+메모 없이 매번 호출한다. 스레드 풀 작업은 submit_in_context로 제출해야 같은 메모를 쓴다.
+"""
+
+import contextvars
+import threading
+from collections import Counter
+from collections.abc import Callable, Hashable, Iterator
+from concurrent.futures import Executor, Future
+from contextlib import contextmanager
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+_current: contextvars.ContextVar["CallMemo | None"] = contextvars.ContextVar(
+    "domain_tracer_call_memo", default=None
+)
+
+
+class CallMemo:
+    """(API, 인자) → 응답 메모와 API별 hit / miss 횟수.
+
+    같은 키를 여러 스레드가 동시에 조회하면 한 스레드만 호출하고 나머지는 결과를
+    기다린다. 예외는 메모하지 않는다. 반환값은 여러 호출자가 공유하므로 수정하지 않는다.
+    """
+
+    def __init__(self):
+        self.hits: Counter[str] = Counter()
+        self.misses: Counter[str] = Counter()
+        self._results: dict[tuple[str, Hashable], Any] = {}
+        self._lock = threading.Lock()
+        self._key_locks: dict[tuple[str, Hashable], threading.Lock] = {}
+
+    def get(self, operation: str, key: Hashable, fetch: Callable[[], T]) -> T:
+        """메모된 응답, 없으면 fetch()를 호출하여 저장한다."""
+        full_key = (operation, key)
+        with self._lock:
+            key_lock = self._key_locks.setdefault(full_key, threading.Lock())
+        with key_lock:
+            with self._lock:
+                if full_key in self._results:
+                    self.hits[operation] += 1
+                    return self._results[full_key]
+            result = fetch()
+            with self._lock:
+                self._results[full_key] = result
+                self.misses[operation] += 1
+            return result
+
+    def stats(self) -> list[tuple[str, int, int]]:
+        """API별 (API, miss, hit) 목록 (API 이름순)."""
+        operations = sorted(set(self.hits) | set(self.misses))
+        return [(op, self.misses[op], self.hits[op]) for op in operations]
+
+
+@contextmanager
+def call_memo() -> Iterator[CallMemo]:
+    """블록 안의 AWS 조회를 메모한다 (CLI 명령 1회 범위)."""
+    memo = CallMemo()
+    token = _current.set(memo)
+    try:
+        yield memo
+    finally:
+        _current.reset(token)
+
+
+def current_memo() -> CallMemo | None:
+    """현재 컨텍스트의 메모 (call_memo 블록 밖이면 None)."""
+    return _current.get()
+
+
+def memoized(operation: str, key: Hashable, fetch: Callable[[], T]) -> T:
+    """현재 메모가 있으면 메모를 거쳐, 없으면 바로 fetch()를 호출한다."""
+    memo = _current.get()
+    if memo is None:
+        return fetch()
+    return memo.get(operation, key, fetch)
+
+
+def submit_in_context(executor: Executor, fn: Callable[..., T], *args) -> Future[T]:
+    """현재 컨텍스트(메모 포함)를 복사하여 스레드 풀 작업을 제출한다."""
+    return executor.submit(contextvars.copy_context().run, fn, *args)
@@ -1,11 +1,16 @@
 """AWS 리소스 추적 핵심 로직."""
 
+import fnmatch
 import ipaddress
 import logging
 import re
+from collections import defaultdict
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any
+from functools import partial
+from typing import Any, TypeVar
 
 from botocore.exceptions import ClientError
 
@@ -16,9 +21,15 @@ from .aws_clients import (
     get_elbv2_client,
     get_route53_client,
 )
+from .inventory import Inventory
+from .memo import memoized, submit_in_context
+from .zones import DEFAULT_ZONE_WORKERS, iter_zone_records, list_hosted_zones
 
 logger = logging.getLogger(__name__)
 
+K = TypeVar("K")
+V = TypeVar("V")
+
 
 class RecordType(Enum):
     """DNS 레코드 타입."""
@@ -65,58 +76,274 @@ def extract_region_from_elb_dns(dns_name: str) -> str:
     return "ap-northeast-2"
 
 
-def search_route53_records(pattern: str) -> list[TraceResult]:
-    """정규표현식 패턴으로 Route53 레코드 검색."""
-    client = get_route53_client()
-    results: list[TraceResult] = []
+# ---------------------------------------------------------------------------
+# 조회 헬퍼: inventory가 있으면 로컬 스냅샷, 없으면 AWS API
+# ---------------------------------------------------------------------------
 
-    try:
-        regex = re.compile(pattern, re.IGNORECASE)
-    except re.error as e:
-        raise ValueError(f"잘못된 정규표현식: {e}") from e
-
-    # 모든 Hosted Zone 조회
-    paginator = client.get_paginator("list_hosted_zones")
-    for zones_page in paginator.paginate():
-        for zone in zones_page["HostedZones"]:
+
+def iter_route53_zones(
+    inventory: Inventory | None = None, max_workers: int = DEFAULT_ZONE_WORKERS
+) -> Iterator[tuple[int, str, str, list[dict]]]:
+    """Hosted Zone별 (Zone 순번, Zone ID, Zone 이름, 레코드 목록) 순회.
+
+    API로 조회할 때는 Zone을 max_workers개씩 병렬로 조회하므로 끝나는 순서대로 나온다.
+    """
+    if inventory is not None:
+        for index, zone in enumerate(inventory.hosted_zones()):
             zone_id = zone["Id"].replace("/hostedzone/", "")
-            zone_name = zone["Name"].rstrip(".")
-
-            # 각 Zone의 레코드 조회
-            record_paginator = client.get_paginator("list_resource_record_sets")
-            for records_page in record_paginator.paginate(HostedZoneId=zone_id):
-                for record in records_page["ResourceRecordSets"]:
-                    record_name = record["Name"].rstrip(".")
-
-                    # 패턴 매칭
-                    if regex.search(record_name):
-                        result = TraceResult(
-                            domain=record_name,
-                            hosted_zone_id=zone_id,
-                            hosted_zone_name=zone_name,
-                            record_type=record["Type"],
-                        )
+            records = inventory.zone_records(zone_id) or []
+            yield index, zone_id, zone["Name"].rstrip("."), records
+        return
 
-                        # Alias 레코드 처리
-                        if "AliasTarget" in record:
-                            result.record_type = f"{record['Type']} (Alias)"
-                            result.record_value = record["AliasTarget"]["DNSName"].rstrip(".")
-                            result.chain.append(f"Route53: {record_name}")
-                            result.chain.append(f"→ Alias: {result.record_value}")
-                        # 일반 레코드 처리
-                        elif "ResourceRecords" in record:
-                            values = [r["Value"] for r in record["ResourceRecords"]]
-                            result.record_value = ", ".join(values)
-                            result.chain.append(f"Route53: {record_name}")
-                            result.chain.append(f"→ {record['Type']}: {result.record_value}")
-
-                        # 타겟 타입 판별
-                        if result.record_value:
-                            result.target_type = identify_target_type(result.record_value)
-
-                        results.append(result)
+    client = get_route53_client()
+    zones = list_hosted_zones(client)
+    for index, zone, records in iter_zone_records(client, zones, max_workers):
+        yield index, zone["Id"].replace("/hostedzone/", ""), zone["Name"].rstrip("."), records
+
+
+def iter_route53_records(inventory: Inventory | None = None) -> Iterator[tuple[str, str, dict]]:
+    """모든 Hosted Zone의 (Zone ID, Zone 이름, 레코드) 순회."""
+    for _, zone_id, zone_name, records in iter_route53_zones(inventory):
+        for record in records:
+            yield zone_id, zone_name, record
 
-    return results
+
+def _distribution_pages(inventory: Inventory | None, domain: str | None = None) -> Iterator[dict]:
+    """list_distributions 페이지 형식으로 CloudFront 배포 순회.
+
+    inventory와 domain을 지정하면 배포 도메인 색인에서 찾은 배포만 돌려준다.
+    """
+    if inventory is not None:
+        items = (
+            inventory.distributions()
+            if domain is None
+            else inventory.distributions_by_domain(domain)
+        )
+        yield {"DistributionList": {"Items": items}}
+        return
+    paginator = get_cloudfront_client().get_paginator("list_distributions")
+    yield from memoized("cloudfront.list_distributions", None, lambda: list(paginator.paginate()))
+
+
+def _load_balancer_pages(
+    elbv2, region: str, inventory: Inventory | None, dns_name: str | None = None
+) -> Iterator[dict]:
+    """describe_load_balancers(ELBv2) 페이지 형식으로 ALB/NLB 순회.
+
+    inventory와 dns_name을 지정하면 DNS 색인에서 찾은 ALB/NLB만 돌려준다.
+    """
+    if inventory is not None:
+        if dns_name is None:
+            yield {"LoadBalancers": inventory.load_balancers(region)}
+        else:
+            yield {"LoadBalancers": inventory.load_balancers_by_dns(dns_name, region)}
+        return
+    yield from memoized(
+        "elbv2.describe_load_balancers",
+        (region, None),
+        lambda: list(elbv2.get_paginator("describe_load_balancers").paginate()),
+    )
+
+
+def _target_group_pages(elbv2, region: str, inventory: Inventory | None) -> Iterator[dict]:
+    """describe_target_groups 페이지 형식으로 Target Group 순회."""
+    if inventory is not None:
+        yield {"TargetGroups": inventory.target_groups(region)}
+        return
+    yield from memoized(
+        "elbv2.describe_target_groups",
+        (region, None),
+        lambda: list(elbv2.get_paginator("describe_target_groups").paginate()),
+    )
+
+
+def _describe_target_groups(
+    elbv2, arns: list[str], region: str, inventory: Inventory | None
+) -> dict:
+    """ARN으로 Target Group 조회 (스냅샷에 모두 있으면 API 호출 없음)."""
+    if inventory is not None:
+        cached = [inventory.target_group_by_arn(arn, region) for arn in dict.fromkeys(arns)]
+        if all(cached):
+            return {"TargetGroups": cached}
+    return memoized(
+        "elbv2.describe_target_groups",
+        (region, tuple(arns)),
+        lambda: elbv2.describe_target_groups(TargetGroupArns=arns),
+    )
+
+
+def _describe_target_health(elbv2, arn: str, region: str) -> dict:
+    """Target Group의 타겟 상태 조회.
+
+    상태(healthy / draining 등)는 수 분 만에 바뀌므로 스냅샷을 쓰지 않고 항상 API로
+    조회한다 (실행 중에는 Target Group마다 한 번).
+    """
+    return memoized(
+        "elbv2.describe_target_health",
+        (region, arn),
+        lambda: elbv2.describe_target_health(TargetGroupArn=arn),
+    )
+
+
+def _describe_load_balancers_by_arn(
+    elbv2, arns: list[str], region: str, inventory: Inventory | None
+) -> dict:
+    """ARN으로 ALB/NLB 조회 (스냅샷에 없는 ARN만 API 호출)."""
+
+    def describe(lb_arns: list[str]) -> dict:
+        return memoized(
+            "elbv2.describe_load_balancers",
+            (region, tuple(lb_arns)),
+            lambda: elbv2.describe_load_balancers(LoadBalancerArns=lb_arns),
+        )
+
+    if inventory is None:
+        return describe(arns)
+    found = {arn: inventory.load_balancer_by_arn(arn, region) for arn in dict.fromkeys(arns)}
+    cached = [lb for lb in found.values() if lb is not None]
+    missing = sorted(arn for arn, lb in found.items() if lb is None)
+    if missing:
+        cached += describe(missing)["LoadBalancers"]
+    return {"LoadBalancers": cached}
+
+
+def _describe_classic_load_balancers(
+    elb, region: str, inventory: Inventory | None, dns_name: str | None = None
+) -> dict:
+    """Classic ELB 목록 조회 (inventory와 dns_name을 지정하면 DNS 색인에서 찾은 것만)."""
+    if inventory is not None:
+        if dns_name is None:
+            return {"LoadBalancerDescriptions": inventory.classic_load_balancers(region)}
+        return {
+            "LoadBalancerDescriptions": inventory.classic_load_balancers_by_dns(dns_name, region)
+        }
+    return memoized("elb.describe_load_balancers", region, elb.describe_load_balancers)
+
+
+def _describe_instances_by_id(
+    ec2, instance_ids: list[str], region: str, inventory: Inventory | None
+) -> dict:
+    """Instance ID로 EC2 조회 (스냅샷에 없는 ID만 API 호출)."""
+
+    def describe(ids: list[str]) -> dict:
+        return memoized(
+            "ec2.describe_instances",
+            (region, tuple(ids)),
+            lambda: ec2.describe_instances(InstanceIds=ids),
+        )
+
+    if inventory is None:
+        return describe(instance_ids)
+    found = {i: inventory.instance_by_id(i, region) for i in dict.fromkeys(instance_ids)}
+    cached = [instance for instance in found.values() if instance is not None]
+    reservations = [{"Instances": cached}] if cached else []
+    missing = [i for i, instance in found.items() if instance is None]
+    if missing:
+        reservations += describe(missing)["Reservations"]
+    return {"Reservations": reservations}
+
+
+def _match_cached_instances(
+    identifier: str, input_type: "InputType", inventory: Inventory, region: str
+) -> list[dict]:
+    """스냅샷의 EC2 인스턴스 중 식별자와 일치하는 인스턴스 (find_ec2_by_identifier 규칙).
+
+    Instance ID / IP는 색인으로 찾고, Name 태그 패턴만 전체 목록을 훑는다.
+    """
+
+    def name(instance: dict) -> str:
+        return next((t["Value"] for t in instance.get("Tags", []) if t["Key"] == "Name"), "")
+
+    if input_type == InputType.EC2_INSTANCE_ID:
+        instance = inventory.instance_by_id(identifier, region)
+        return [instance] if instance is not None else []
+    if input_type == InputType.EC2_IP:
+        return inventory.instances_by_private_ip(
+            identifier, region
+        ) or inventory.instances_by_public_ip(identifier, region)
+    if input_type == InputType.EC2_PRIVATE_DNS:
+        ip = extract_ip_from_private_dns(identifier)
+        return inventory.instances_by_private_ip(ip, region) if ip else []
+    pattern = identifier if "*" in identifier else f"*{identifier}*"
+    return [i for i in inventory.instances(region) if fnmatch.fnmatchcase(name(i), pattern)]
+
+
+def search_route53_records(
+    pattern: str,
+    inventory: Inventory | None = None,
+    on_zone: Callable[[str, list[TraceResult]], None] | None = None,
+    max_workers: int = DEFAULT_ZONE_WORKERS,
+    exact: bool = False,
+) -> list[TraceResult]:
+    """정규표현식 패턴으로 Route53 레코드 검색.
+
+    Args:
+        on_zone: Zone 1개의 검색이 끝날 때마다 (Zone 이름, 일치한 레코드)로 호출된다
+            (API 조회 시 Zone이 끝나는 순서)
+        max_workers: API로 조회할 때 동시에 조회할 Zone 수
+        exact: pattern을 정규표현식이 아닌 도메인 이름으로 보고 이름이 같은 레코드만 찾는다.
+            inventory가 있으면 이름 색인에서 찾으며 on_zone은 호출하지 않는다
+
+    Returns:
+        일치한 레코드 (Hosted Zone 목록 순서)
+    """
+    if exact:
+        name = pattern.lower().rstrip(".")
+        if inventory is not None:
+            return [_to_trace_result(*match) for match in inventory.records_by_name(name)]
+
+        def is_match(record_name: str) -> bool:
+            return record_name.lower() == name
+
+    else:
+        try:
+            is_match = re.compile(pattern, re.IGNORECASE).search
+        except re.error as e:
+            raise ValueError(f"잘못된 정규표현식: {e}") from e
+
+    # Zone 순번 → 일치한 레코드
+    by_zone: dict[int, list[TraceResult]] = {}
+    for index, zone_id, zone_name, records in iter_route53_zones(inventory, max_workers):
+        matches = [
+            _to_trace_result(zone_id, zone_name, record)
+            for record in records
+            if is_match(record["Name"].rstrip("."))
+        ]
+        by_zone[index] = matches
+        if on_zone is not None:
+            on_zone(zone_name, matches)
+
+    return [result for index in sorted(by_zone) for result in by_zone[index]]
+
+
+def _to_trace_result(zone_id: str, zone_name: str, record: dict) -> TraceResult:
+    """Route53 레코드 → TraceResult."""
+    record_name = record["Name"].rstrip(".")
+    result = TraceResult(
+        domain=record_name,
+        hosted_zone_id=zone_id,
+        hosted_zone_name=zone_name,
+        record_type=record["Type"],
+    )
+
+    # Alias 레코드 처리
+    if "AliasTarget" in record:
+        result.record_type = f"{record['Type']} (Alias)"
+        result.record_value = record["AliasTarget"]["DNSName"].rstrip(".")
+        result.chain.append(f"Route53: {record_name}")
+        result.chain.append(f"→ Alias: {result.record_value}")
+    # 일반 레코드 처리
+    elif "ResourceRecords" in record:
+        values = [r["Value"] for r in record["ResourceRecords"]]
+        result.record_value = ", ".join(values)
+        result.chain.append(f"Route53: {record_name}")
+        result.chain.append(f"→ {record['Type']}: {result.record_value}")
+
+    # 타겟 타입 판별
+    if result.record_value:
+        result.target_type = identify_target_type(result.record_value)
+
+    return result
 
 
 def identify_target_type(dns_value: str) -> TargetType:
@@ -140,9 +367,8 @@ def identify_target_type(dns_value: str) -> TargetType:
     return TargetType.UNKNOWN
 
 
-def trace_cloudfront(distribution_dns: str) -> dict[str, Any]:
+def trace_cloudfront(distribution_dns: str, inventory: Inventory | None = None) -> dict[str, Any]:
     """CloudFront 배포 정보 추적."""
-    client = get_cloudfront_client()
     result = {
         "type": "CloudFront",
         "distribution_dns": distribution_dns,
@@ -152,9 +378,7 @@ def trace_cloudfront(distribution_dns: str) -> dict[str, Any]:
     }
 
     # distribution_dns에서 ID 추출 또는 전체 목록에서 검색
-    paginator = client.get_paginator("list_distributions")
-
-    for page in paginator.paginate():
+    for page in _distribution_pages(inventory, distribution_dns):
         dist_list = page.get("DistributionList")
         if not dist_list:
             continue
@@ -228,7 +452,9 @@ def normalize_elb_dns(dns_name: str) -> str:
     return dns_name
 
 
-def trace_load_balancer(lb_dns: str, region: str | None = None) -> dict[str, Any]:
+def trace_load_balancer(
+    lb_dns: str, region: str | None = None, inventory: Inventory | None = None
+) -> dict[str, Any]:
     """Load Balancer 정보 추적 (ALB/NLB/CLB)."""
     # dualstack. prefix 제거
     lb_dns = normalize_elb_dns(lb_dns)
@@ -236,6 +462,35 @@ def trace_load_balancer(lb_dns: str, region: str | None = None) -> dict[str, Any
     if region is None:
         region = extract_region_from_elb_dns(lb_dns)
 
+    result, target_group_arns = _resolve_load_balancer(lb_dns, region, inventory)
+
+    # Target Groups 상세 정보
+    if target_group_arns:
+        elbv2 = get_elbv2_client(region)
+        try:
+            tg_resp = _describe_target_groups(elbv2, target_group_arns, region, inventory)
+            health = {
+                tg["TargetGroupArn"]: _describe_target_health(elbv2, tg["TargetGroupArn"], region)[
+                    "TargetHealthDescriptions"
+                ]
+                for tg in tg_resp["TargetGroups"]
+            }
+        except ClientError as e:
+            _warn_client_error("Target Group", lb_dns, e)
+        else:
+            _attach_target_groups(result, tg_resp["TargetGroups"], health)
+
+    return result
+
+
+def _resolve_load_balancer(
+    lb_dns: str, region: str, inventory: Inventory | None
+) -> tuple[dict[str, Any], list[str]]:
+    """LB와 Listener / Rule 조회 (Target Group 상세 제외).
+
+    Returns:
+        (trace_load_balancer 결과 형식의 dict, Rule이 forward하는 Target Group ARN 목록)
+    """
     result = {
         "type": "LoadBalancer",
         "dns_name": lb_dns,
@@ -252,8 +507,7 @@ def trace_load_balancer(lb_dns: str, region: str | None = None) -> dict[str, Any
     # ALB/NLB 조회 (ELBv2)
     elbv2 = get_elbv2_client(region)
     try:
-        paginator = elbv2.get_paginator("describe_load_balancers")
-        for page in paginator.paginate():
+        for page in _load_balancer_pages(elbv2, region, inventory, lb_dns):
             for lb in page["LoadBalancers"]:
                 if lb["DNSName"].lower() == lb_dns.lower():
                     result["lb_type"] = lb["Type"]  # 'application' or 'network'
@@ -264,7 +518,11 @@ def trace_load_balancer(lb_dns: str, region: str | None = None) -> dict[str, Any
                     result["state"] = lb["State"]["Code"]
 
                     # Listeners 조회
-                    listeners_resp = elbv2.describe_listeners(LoadBalancerArn=lb["LoadBalancerArn"])
+                    listeners_resp = memoized(
+                        "elbv2.describe_listeners",
+                        lb["LoadBalancerArn"],
+                        partial(elbv2.describe_listeners, LoadBalancerArn=lb["LoadBalancerArn"]),
+                    )
                     for listener in listeners_resp["Listeners"]:
                         listener_info = {
                             "port": listener["Port"],
@@ -274,7 +532,11 @@ def trace_load_balancer(lb_dns: str, region: str | None = None) -> dict[str, Any
                         }
 
                         # Listener Rules 조회
-                        rules_resp = elbv2.describe_rules(ListenerArn=listener["ListenerArn"])
+                        rules_resp = memoized(
+                            "elbv2.describe_rules",
+                            listener["ListenerArn"],
+                            partial(elbv2.describe_rules, ListenerArn=listener["ListenerArn"]),
+                        )
                         for rule in rules_resp["Rules"]:
                             rule_info = {
                                 "priority": rule["Priority"],
@@ -324,77 +586,15 @@ def trace_load_balancer(lb_dns: str, region: str | None = None) -> dict[str, Any
                                 elif "target_groups" in action:
                                     target_group_arns.update(action["target_groups"])
 
-                    # Target Groups 상세 정보
-                    if target_group_arns:
-                        tg_resp = elbv2.describe_target_groups(
-                            TargetGroupArns=list(target_group_arns)
-                        )
-                        for tg in tg_resp["TargetGroups"]:
-                            tg_info = {
-                                "arn": tg["TargetGroupArn"],
-                                "name": tg["TargetGroupName"],
-                                "protocol": tg.get("Protocol"),
-                                "port": tg.get("Port"),
-                                "target_type": tg["TargetType"],
-                                "vpc_id": tg.get("VpcId"),
-                                "health_check": {
-                                    "protocol": tg.get("HealthCheckProtocol"),
-                                    "path": tg.get("HealthCheckPath"),
-                                    "port": tg.get("HealthCheckPort"),
-                                },
-                                "targets": [],
-                            }
-
-                            # Target Health 조회
-                            health_resp = elbv2.describe_target_health(
-                                TargetGroupArn=tg["TargetGroupArn"]
-                            )
-                            for target in health_resp["TargetHealthDescriptions"]:
-                                target_info = {
-                                    "id": target["Target"]["Id"],
-                                    "port": target["Target"].get("Port"),
-                                    "health_state": target["TargetHealth"]["State"],
-                                    "health_reason": target["TargetHealth"].get("Reason"),
-                                }
-                                tg_info["targets"].append(target_info)
-
-                                # EC2 인스턴스 정보 수집
-                                if target["Target"]["Id"].startswith("i-"):
-                                    result["targets"].append(target["Target"]["Id"])
-
-                            result["target_groups"].append(tg_info)
-
-                    return result
+                    return result, sorted(target_group_arns)
 
     except ClientError as e:
-        code = e.response["Error"]["Code"]
-        msg = e.response["Error"]["Message"]
-        if code in ("AccessDeniedException", "AccessDenied", "UnauthorizedException"):
-            logger.warning(
-                "ALB/NLB 조회 권한 없음 (dns=%s, code=%s): %s",
-                lb_dns,
-                code,
-                msg,
-            )
-        elif code in ("Throttling", "ThrottlingException", "RequestLimitExceeded"):
-            logger.warning(
-                "ALB/NLB 조회 API 요청이 스로틀링됨 (dns=%s, code=%s): %s",
-                lb_dns,
-                code,
-                msg,
-            )
-        else:
-            logger.warning(
-                "ALB/NLB 조회 중 ClientError 발생 (dns=%s, code=%s): %s",
-                lb_dns,
-                code,
-                msg,
-            )
+        _warn_client_error("ALB/NLB", lb_dns, e)
 
     # Classic ELB 조회
     elb = get_elb_client(region)
     try:
-        resp = elb.describe_load_balancers()
+        resp = _describe_classic_load_balancers(elb, region, inventory, lb_dns)
         for lb in resp["LoadBalancerDescriptions"]:
             if lb["DNSName"].lower() == lb_dns.lower():
                 result["lb_type"] = "classic"
@@ -417,37 +617,71 @@ def trace_load_balancer(lb_dns: str, region: str | None = None) -> dict[str, Any
                 if result["targets"]:
                     result["targets"] = [i["InstanceId"] for i in result["targets"]]
 
-                return result
+                return result, []
 
     except ClientError as e:
-        code = e.response["Error"]["Code"]
-        msg = e.response["Error"]["Message"]
-        if code in ("AccessDeniedException", "AccessDenied", "UnauthorizedException"):
-            logger.warning(
-                "Classic ELB 조회 권한 없음 (dns=%s, code=%s): %s",
-                lb_dns,
-                code,
-                msg,
-            )
-        elif code in ("Throttling", "ThrottlingException", "RequestLimitExceeded"):
-            logger.warning(
-                "Classic ELB 조회 API 요청이 스로틀링됨 (dns=%s, code=%s): %s",
-                lb_dns,
-                code,
-                msg,
-            )
-        else:
-            logger.warning(
-                "Classic ELB 조회 중 ClientError 발생 (dns=%s, code=%s): %s",
-                lb_dns,
-                code,
-                msg,
-            )
+        _warn_client_error("Classic ELB", lb_dns, e)
+
+    return result, []
+
+
+def _attach_target_groups(
+    result: dict[str, Any], target_groups: list[dict], health: dict[str, list[dict]]
+) -> None:
+    """Target Group 상세와 타겟 상태를 trace_load_balancer 결과에 채운다."""
+    for tg in target_groups:
+        tg_info = {
+            "arn": tg["TargetGroupArn"],
+            "name": tg["TargetGroupName"],
+            "protocol": tg.get("Protocol"),
+            "port": tg.get("Port"),
+            "target_type": tg["TargetType"],
+            "vpc_id": tg.get("VpcId"),
+            "health_check": {
+                "protocol": tg.get("HealthCheckProtocol"),
+                "path": tg.get("HealthCheckPath"),
+                "port": tg.get("HealthCheckPort"),
+            },
+            "targets": [],
+        }
 
-    return result
+        for target in health.get(tg["TargetGroupArn"], []):
+            target_info = {
+                "id": target["Target"]["Id"],
+                "port": target["Target"].get("Port"),
+                "health_state": target["TargetHealth"]["State"],
+                "health_reason": target["TargetHealth"].get("Reason"),
+            }
+            tg_info["targets"].append(target_info)
+
+            # EC2 인스턴스 정보 수집
+            if target["Target"]["Id"].startswith("i-"):
+                result["targets"].append(target["Target"]["Id"])
+
+        result["target_groups"].append(tg_info)
+
+
+def _warn_client_error(resource: str, lb_dns: str, e: ClientError) -> None:
+    """LB 추적 중 ClientError를 원인별 warning 로그로 남긴다."""
+    code = e.response["Error"]["Code"]
+    msg = e.response["Error"]["Message"]
+    if code in ("AccessDeniedException", "AccessDenied", "UnauthorizedException"):
+        logger.warning("%s 조회 권한 없음 (dns=%s, code=%s): %s", resource, lb_dns, code, msg)
+    elif code in ("Throttling", "ThrottlingException", "RequestLimitExceeded"):
+        logger.warning(
+            "%s 조회 API 요청이 스로틀링됨 (dns=%s, code=%s): %s", resource, lb_dns, code, msg
+        )
+    else:
+        logger.warning(
+            "%s 조회 중 ClientError 발생 (dns=%s, code=%s): %s", resource, lb_dns, code, msg
+        )
 
 
-def get_ec2_details(instance_ids: list[str], region: str = "ap-northeast-2") -> list[dict]:
+def get_ec2_details(
+    instance_ids: list[str],
+    region: str = "ap-northeast-2",
+    inventory: Inventory | None = None,
+) -> list[dict]:
     """EC2 인스턴스 상세 정보 조회."""
     if not instance_ids:
         return []
@@ -456,39 +690,225 @@ def get_ec2_details(instance_ids: list[str], region: str = "ap-northeast-2") ->
     results = []
 
     try:
-        resp = ec2.describe_instances(InstanceIds=instance_ids)
+        resp = _describe_instances_by_id(ec2, instance_ids, region, inventory)
         for reservation in resp["Reservations"]:
             for instance in reservation["Instances"]:
-                name = ""
-                for tag in instance.get("Tags", []):
-                    if tag["Key"] == "Name":
-                        name = tag["Value"]
-                        break
-
-                results.append(
-                    {
-                        "instance_id": instance["InstanceId"],
-                        "name": name,
-                        "state": instance["State"]["Name"],
-                        "instance_type": instance["InstanceType"],
-                        "private_ip": instance.get("PrivateIpAddress"),
-                        "public_ip": instance.get("PublicIpAddress"),
-                        "availability_zone": instance["Placement"]["AvailabilityZone"],
-                    }
-                )
+                results.append(_ec2_summary(instance))
     except ClientError as e:
         results.append({"error": str(e)})
 
     return results
 
 
-def trace_domain(pattern: str, region: str | None = None) -> list[dict[str, Any]]:
-    """도메인 패턴으로 전체 리소스 체인 추적."""
+def _ec2_summary(instance: dict) -> dict[str, Any]:
+    """describe_instances의 인스턴스 1개 → get_ec2_details 결과 형식."""
+    name = ""
+    for tag in instance.get("Tags", []):
+        if tag["Key"] == "Name":
+            name = tag["Value"]
+            break
+
+    return {
+        "instance_id": instance["InstanceId"],
+        "name": name,
+        "state": instance["State"]["Name"],
+        "instance_type": instance["InstanceType"],
+        "private_ip": instance.get("PrivateIpAddress"),
+        "public_ip": instance.get("PublicIpAddress"),
+        "availability_zone": instance["Placement"]["AvailabilityZone"],
+    }
+
+
+# ---------------------------------------------------------------------------
+# 일괄 조회: trace_domain은 모든 레코드에 필요한 리소스를 먼저 모아 중복 없이 조회한다
+# ---------------------------------------------------------------------------
+
+DEFAULT_TRACE_WORKERS = 8
+# describe_target_groups / describe_instances 1회에 넣는 ID 수
+TARGET_GROUP_BATCH = 20
+INSTANCE_BATCH = 100
+
+
+def _map_concurrently(
+    fn: Callable[[K], V], items: Iterable[K], max_workers: int = DEFAULT_TRACE_WORKERS
+) -> dict[K, V]:
+    """중복을 제거한 items에 fn을 병렬로 적용한 {항목: 결과}."""
+    unique = list(dict.fromkeys(items))
+    if len(unique) <= 1:
+        return {item: fn(item) for item in unique}
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(unique))) as executor:
+        futures = [submit_in_context(executor, fn, item) for item in unique]
+        return {item: future.result() for item, future in zip(unique, futures, strict=True)}
+
+
+def _chunks(items: list[str], size: int) -> list[tuple[str, ...]]:
+    return [tuple(items[i : i + size]) for i in range(0, len(items), size)]
+
+
+def _group_by_region(keys: Iterable[tuple[str, str]], size: int) -> list[tuple[str, tuple]]:
+    """(리전, ID) → 리전별로 size개씩 나눈 (리전, ID 묶음)."""
+    by_region: dict[str, set[str]] = defaultdict(set)
+    for region, resource_id in keys:
+        by_region[region].add(resource_id)
+    return [
+        (region, chunk)
+        for region, ids in sorted(by_region.items())
+        for chunk in _chunks(sorted(ids), size)
+    ]
+
+
+def _trace_load_balancers(
+    keys: Iterable[tuple[str, str]], inventory: Inventory | None
+) -> dict[tuple[str, str], dict[str, Any]]:
+    """여러 LB를 한꺼번에 추적한다 (키: (정규화된 LB DNS, 리전)).
+
+    LB / Listener / Rule은 LB별로 병렬 조회하고, Target Group과 타겟 상태는 모든 LB에서
+    모은 ARN을 중복 없이 병렬로 조회한 뒤 각 LB 결과에 채운다. Target Group 조회가
+    실패한 LB는 trace_load_balancer와 같이 warning 로그만 남기고 Target Group 없이 둔다.
+    """
+    resolved = _map_concurrently(
+        lambda key: _resolve_load_balancer(key[0], key[1], inventory), keys
+    )
+    tg_keys = {(region, arn) for (_, region), (_, arns) in resolved.items() for arn in arns}
+
+    def describe_target_groups(batch: tuple[str, tuple]) -> list[dict] | ClientError:
+        region, arns = batch
+        try:
+            elbv2 = get_elbv2_client(region)
+            return _describe_target_groups(elbv2, list(arns), region, inventory)["TargetGroups"]
+        except ClientError as e:
+            return e
+
+    target_groups: dict[tuple[str, str], dict | ClientError] = {}
+    batches = _group_by_region(tg_keys, TARGET_GROUP_BATCH)
+    for (region, arns), resp in _map_concurrently(describe_target_groups, batches).items():
+        if isinstance(resp, ClientError):
+            target_groups.update({(region, arn): resp for arn in arns})
+        else:
+            target_groups.update({(region, tg["TargetGroupArn"]): tg for tg in resp})
+
+    def describe_target_health(key: tuple[str, str]) -> list[dict] | ClientError:
+        region, arn = key
+        try:
+            resp = _describe_target_health(get_elbv2_client(region), arn, region)
+            return resp["TargetHealthDescriptions"]
+        except ClientError as e:
+            return e
+
+    health = _map_concurrently(
+        describe_target_health,
+        [key for key, tg in target_groups.items() if not isinstance(tg, ClientError)],
+    )
+
+    results = {}
+    for (lb_dns, region), (result, arns) in resolved.items():
+        tgs = [target_groups.get((region, arn)) for arn in arns]
+        descriptions = {arn: health.get((region, arn)) for arn in arns}
+        outcomes = [*tgs, *descriptions.values()]
+        error = next((x for x in outcomes if isinstance(x, ClientError)), None)
+        if error is not None:
+            _warn_client_error("Target Group", lb_dns, error)
+        elif arns:
+            _attach_target_groups(
+                result,
+                [tg for tg in tgs if tg is not None],
+                {arn: d for arn, d in descriptions.items() if d is not None},
+            )
+        results[(lb_dns, region)] = result
+    return results
+
+
+def _get_ec2_details_by_id(
+    keys: Iterable[tuple[str, str]], inventory: Inventory | None
+) -> dict[tuple[str, str], dict | ClientError]:
+    """(리전, Instance ID) → get_ec2_details 형식의 상세 (조회 실패 시 ClientError).
+
+    리전별로 INSTANCE_BATCH개씩 묶어 병렬로 조회한다.
+    """
+    batches = _group_by_region(keys, INSTANCE_BATCH)
+
+    def describe(batch: tuple[str, tuple]) -> dict | ClientError:
+        region, instance_ids = batch
+        try:
+            ec2 = get_ec2_client(region)
+            return _describe_instances_by_id(ec2, list(instance_ids), region, inventory)
+        except ClientError as e:
+            return e
+
+    details: dict[tuple[str, str], dict | ClientError] = {}
+    for (region, instance_ids), resp in _map_concurrently(describe, batches).items():
+        if isinstance(resp, ClientError):
+            details.update({(region, i): resp for i in instance_ids})
+            continue
+        for reservation in resp["Reservations"]:
+            for instance in reservation["Instances"]:
+                details[(region, instance["InstanceId"])] = _ec2_summary(instance)
+    return details
+
+
+def trace_domain(
+    pattern: str,
+    region: str | None = None,
+    inventory: Inventory | None = None,
+    on_zone: Callable[[str, list[TraceResult]], None] | None = None,
+    exact: bool = False,
+) -> list[dict[str, Any]]:
+    """도메인 패턴으로 전체 리소스 체인 추적.
+
+    inventory를 지정하면 Route53 / CloudFront / ELB / EC2 목록을 로컬 스냅샷에서 읽는다.
+    on_zone과 exact는 search_route53_records로 그대로 전달된다.
+
+    일치한 레코드들이 같은 CloudFront / LB / EC2를 가리켜도 한 번씩만 조회한다. 먼저 모든
+    레코드에서 필요한 배포, LB, Target Group, 인스턴스를 모아 병렬로 일괄 조회하고,
+    그 결과로 레코드별 추적 트리를 만든다.
+    """
     results = []
 
     # Route53에서 매칭되는 레코드 검색
-    route53_results = search_route53_records(pattern)
-
+    route53_results = search_route53_records(pattern, inventory, on_zone, exact=exact)
+
+    def lb_key(lb_dns: str) -> tuple[str, str]:
+        lb_dns = normalize_elb_dns(lb_dns)
+        return lb_dns, region or extract_region_from_elb_dns(lb_dns)
+
+    # 1단계: 필요한 리소스를 모두 모아 중복 없이 조회
+    cf_targets = [
+        r.record_value
+        for r in route53_results
+        if r.target_type == TargetType.CLOUDFRONT and r.record_value
+    ]
+    cloudfront = _map_concurrently(lambda dns: trace_cloudfront(dns, inventory), cf_targets)
+
+    lb_keys = [
+        lb_key(origin["domain"])
+        for cf_details in cloudfront.values()
+        for origin in cf_details.get("origins", [])
+        if origin["type"] == "ELB"
+    ]
+    lb_keys += [
+        lb_key(r.record_value)
+        for r in route53_results
+        if r.target_type == TargetType.ALB and r.record_value
+    ]
+    load_balancers = _trace_load_balancers(lb_keys, inventory)
+
+    instances = _get_ec2_details_by_id(
+        {
+            (lb_region, instance_id)
+            for (_, lb_region), lb_details in load_balancers.items()
+            for instance_id in lb_details["targets"]
+        },
+        inventory,
+    )
+
+    def ec2_details(lb_region: str, instance_ids: list[str]) -> list[dict]:
+        found = [instances.get((lb_region, i)) for i in dict.fromkeys(instance_ids)]
+        error = next((f for f in found if isinstance(f, ClientError)), None)
+        if error is not None:
+            return [{"error": str(error)}]
+        return [f for f in found if f is not None]
+
+    # 2단계: 레코드별 추적 트리 조립
     for r53_result in route53_results:
         trace_data = {
             "domain": r53_result.domain,
@@ -507,7 +927,7 @@ def trace_domain(pattern: str, region: str | None = None) -> list[dict[str, Any]
 
         # CloudFront 추적
         if r53_result.target_type == TargetType.CLOUDFRONT and r53_result.record_value:
-            cf_details = trace_cloudfront(r53_result.record_value)
+            cf_details = cloudfront[r53_result.record_value]
             trace_data["details"]["cloudfront"] = cf_details
             trace_data["chain"].append(f"→ CloudFront ID: {cf_details.get('distribution_id')}")
 
@@ -517,16 +937,18 @@ def trace_domain(pattern: str, region: str | None = None) -> list[dict[str, Any]
 
                 # ELB Origin이면 추가 추적
                 if origin["type"] == "ELB":
-                    lb_details = trace_load_balancer(origin["domain"], region)
+                    key = lb_key(origin["domain"])
+                    lb_details = load_balancers[key]
                     trace_data["details"]["load_balancer"] = lb_details
                     if lb_details.get("targets"):
-                        target_region = region or "ap-northeast-2"
-                        ec2_details = get_ec2_details(lb_details["targets"], target_region)
-                        trace_data["details"]["ec2_instances"] = ec2_details
+                        trace_data["details"]["ec2_instances"] = ec2_details(
+                            key[1], lb_details["targets"]
+                        )
 
         # Load Balancer 추적
         elif r53_result.target_type == TargetType.ALB and r53_result.record_value:
-            lb_details = trace_load_balancer(r53_result.record_value, region)
+            key = lb_key(r53_result.record_value)
+            lb_details = load_balancers[key]
             trace_data["details"]["load_balancer"] = lb_details
 
             if lb_details.get("lb_type"):
@@ -544,77 +966,81 @@ def trace_domain(pattern: str, region: str | None = None) -> list[dict[str, Any]
 
             # EC2 상세 정보
             if lb_details.get("targets"):
-                target_region = region or extract_region_from_elb_dns(r53_result.record_value)
-                ec2_details = get_ec2_details(lb_details["targets"], target_region)
-                trace_data["details"]["ec2_instances"] = ec2_details
+                trace_data["details"]["ec2_instances"] = ec2_details(key[1], lb_details["targets"])
 
         results.append(trace_data)
 
     return results
 
 
-def reverse_trace_route53(target_dns: str) -> list[dict[str, Any]]:
-    """특정 DNS 값을 가리키는 Route53 레코드 역추적."""
-    client = get_route53_client()
+def reverse_trace_route53(
+    target_dns: str, inventory: Inventory | None = None
+) -> list[dict[str, Any]]:
+    """특정 DNS 값을 가리키는 Route53 레코드 역추적.
+
+    inventory를 지정하면 전체 레코드를 훑지 않고 Alias / CNAME 대상 색인에서 찾는다.
+    """
+    if inventory is not None:
+        return [
+            _reverse_route53_entry(zone_id, zone_name, record)
+            for zone_id, zone_name, record in inventory.records_by_target(target_dns)
+        ]
+
     results: list[dict[str, Any]] = []
 
     # 정규화: 소문자 + trailing dot 제거 + dualstack. 제거
     target_normalized = normalize_elb_dns(target_dns.lower().rstrip("."))
 
-    # 모든 Hosted Zone 순회
-    zone_paginator = client.get_paginator("list_hosted_zones")
-    for zones_page in zone_paginator.paginate():
-        for zone in zones_page["HostedZones"]:
-            zone_id = zone["Id"].replace("/hostedzone/", "")
-            zone_name = zone["Name"].rstrip(".")
-
-            # 각 Zone의 레코드 순회
-            record_paginator = client.get_paginator("list_resource_record_sets")
-            for records_page in record_paginator.paginate(HostedZoneId=zone_id):
-                for record in records_page["ResourceRecordSets"]:
-                    # Alias 레코드 확인
-                    if "AliasTarget" in record:
-                        alias_dns = record["AliasTarget"]["DNSName"].lower().rstrip(".")
-                        alias_normalized = normalize_elb_dns(alias_dns)
-
-                        if alias_normalized == target_normalized:
-                            results.append(
-                                {
-                                    "domain": record["Name"].rstrip("."),
-                                    "hosted_zone_id": zone_id,
-                                    "hosted_zone_name": zone_name,
-                                    "record_type": f"{record['Type']} (Alias)",
-                                    "is_alias": True,
-                                }
-                            )
-
-                    # CNAME 레코드 확인
-                    elif record["Type"] == "CNAME" and "ResourceRecords" in record:
-                        for rr in record["ResourceRecords"]:
-                            cname_normalized = normalize_elb_dns(rr["Value"].lower().rstrip("."))
-                            if cname_normalized == target_normalized:
-                                results.append(
-                                    {
-                                        "domain": record["Name"].rstrip("."),
-                                        "hosted_zone_id": zone_id,
-                                        "hosted_zone_name": zone_name,
-                                        "record_type": "CNAME",
-                                        "is_alias": False,
-                                    }
-                                )
+    # 모든 Hosted Zone의 레코드 순회
+    for zone_id, zone_name, record in iter_route53_records(inventory):
+        # Alias 레코드 확인
+        if "AliasTarget" in record:
+            alias_dns = record["AliasTarget"]["DNSName"].lower().rstrip(".")
+            alias_normalized = normalize_elb_dns(alias_dns)
+
+            if alias_normalized == target_normalized:
+                results.append(_reverse_route53_entry(zone_id, zone_name, record))
+
+        # CNAME 레코드 확인
+        elif record["Type"] == "CNAME" and "ResourceRecords" in record:
+            for rr in record["ResourceRecords"]:
+                cname_normalized = normalize_elb_dns(rr["Value"].lower().rstrip("."))
+                if cname_normalized == target_normalized:
+                    results.append(_reverse_route53_entry(zone_id, zone_name, record))
 
     return results
 
 
-def reverse_trace_cloudfront(origin_dns: str) -> list[dict[str, Any]]:
-    """특정 DNS를 Origin으로 사용하는 CloudFront Distribution 역추적."""
-    client = get_cloudfront_client()
+def _reverse_route53_entry(zone_id: str, zone_name: str, record: dict) -> dict[str, Any]:
+    """역추적 결과 레코드 1건 (Alias / CNAME)."""
+    is_alias = "AliasTarget" in record
+    return {
+        "domain": record["Name"].rstrip("."),
+        "hosted_zone_id": zone_id,
+        "hosted_zone_name": zone_name,
+        "record_type": f"{record['Type']} (Alias)" if is_alias else "CNAME",
+        "is_alias": is_alias,
+    }
+
+
+def reverse_trace_cloudfront(
+    origin_dns: str, inventory: Inventory | None = None
+) -> list[dict[str, Any]]:
+    """특정 DNS를 Origin으로 사용하는 CloudFront Distribution 역추적.
+
+    inventory를 지정하면 전체 배포를 훑지 않고 Origin 도메인 색인에서 찾는다.
+    """
+    if inventory is not None:
+        return [
+            _reverse_cloudfront_entry(dist, origins)
+            for dist, origins in inventory.distributions_by_origin(origin_dns)
+        ]
+
     results: list[dict[str, Any]] = []
 
     origin_normalized = normalize_elb_dns(origin_dns.lower())
 
-    paginator = client.get_paginator("list_distributions")
-    for page in paginator.paginate():
+    for page in _distribution_pages(inventory):
         if "DistributionList" not in page or "Items" not in page["DistributionList"]:
             continue
 
@@ -626,28 +1052,30 @@ def reverse_trace_cloudfront(origin_dns: str) -> list[dict[str, Any]]:
                 origin_domain_normalized = normalize_elb_dns(origin_domain)
 
                 if origin_domain_normalized == origin_normalized:
-                    matching_origins.append(
-                        {
-                            "id": origin["Id"],
-                            "domain": origin["DomainName"],
-                        }
-                    )
+                    matching_origins.append(origin)
 
             if matching_origins:
-                results.append(
-                    {
-                        "distribution_id": dist["Id"],
-                        "distribution_dns": dist["DomainName"],
-                        "status": dist["Status"],
-                        "enabled": dist["Enabled"],
-                        "matching_origins": matching_origins,
-                    }
-                )
+                results.append(_reverse_cloudfront_entry(dist, matching_origins))
 
     return results
 
 
-def reverse_trace_lb(lb_dns: str, region: str | None = None) -> dict[str, Any]:
+def _reverse_cloudfront_entry(dist: dict, origins: list[dict]) -> dict[str, Any]:
+    """역추적 결과 배포 1건."""
+    return {
+        "distribution_id": dist["Id"],
+        "distribution_dns": dist["DomainName"],
+        "status": dist["Status"],
+        "enabled": dist["Enabled"],
+        "matching_origins": [
+            {"id": origin["Id"], "domain": origin["DomainName"]} for origin in origins
+        ],
+    }
+
+
+def reverse_trace_lb(
+    lb_dns: str, region: str | None = None, inventory: Inventory | None = None
+) -> dict[str, Any]:
     """LB DNS로부터 역방향 추적 (Route53, CloudFront, EC2)."""
     # 리전 자동 감지
     if region is None:
@@ -664,7 +1092,7 @@ def reverse_trace_lb(lb_dns: str, region: str | None = None) -> dict[str, Any]:
     }
 
     # 1. LB -> Target Group -> EC2 정방향 추적 (기존 로직 재사용)
-    lb_details = trace_load_balancer(lb_dns, region)
+    lb_details = trace_load_balancer(lb_dns, region, inventory)
     result["load_balancer"] = lb_details
     result["chain"].append(f"LB: {lb_dns}")
 
@@ -674,7 +1102,7 @@ def reverse_trace_lb(lb_dns: str, region: str | None = None) -> dict[str, Any]:
 
     # EC2 인스턴스 조회
     if lb_details.get("targets"):
-        ec2_details = get_ec2_details(lb_details["targets"], region)
+        ec2_details = get_ec2_details(lb_details["targets"], region, inventory)
         result["ec2_instances"] = ec2_details
         for tg in lb_details.get("target_groups", []):
             result["chain"].append(f"  → Target Group: {tg['name']}")
@@ -682,7 +1110,7 @@ def reverse_trace_lb(lb_dns: str, region: str | None = None) -> dict[str, Any]:
                 result["chain"].append(f"    → {target['id']} ({target['health_state']})")
 
     # 2. Route53 역추적 - 이 LB를 가리키는 도메인 찾기
-    route53_records = reverse_trace_route53(lb_dns)
+    route53_records = reverse_trace_route53(lb_dns, inventory)
     result["route53_records"] = route53_records
     if route53_records:
         result["chain"].append("← Route53 레코드:")
@@ -690,7 +1118,7 @@ def reverse_trace_lb(lb_dns: str, region: str | None = None) -> dict[str, Any]:
             result["chain"].append(f"  ← {r53['domain']} ({r53['hosted_zone_name']})")
 
     # 3. CloudFront 역추적 - 이 LB를 Origin으로 사용하는 Distribution 찾기
-    cf_distributions = reverse_trace_cloudfront(lb_dns)
+    cf_distributions = reverse_trace_cloudfront(lb_dns, inventory)
     result["cloudfront_distributions"] = cf_distributions
     if cf_distributions:
         result["chain"].append("← CloudFront Distributions:")
@@ -749,15 +1177,29 @@ def identify_input_type(identifier: str) -> InputType:
     return InputType.EC2_NAME
 
 
-def find_ec2_by_identifier(identifier: str, region: str = "ap-northeast-2") -> list[dict[str, Any]]:
-    """식별자로 EC2 인스턴스 검색 (Instance ID, IP, Name 태그)."""
+def find_ec2_by_identifier(
+    identifier: str,
+    region: str = "ap-northeast-2",
+    inventory: Inventory | None = None,
+) -> list[dict[str, Any]]:
+    """식별자로 EC2 인스턴스 검색 (Instance ID, IP, Name 태그).
+
+    inventory 스냅샷에서 찾지 못하면 (스냅샷 이후 생성된 인스턴스 등) API로 조회한다.
+    """
     ec2 = get_ec2_client(region)
     results: list[dict[str, Any]] = []
 
     input_type = identify_input_type(identifier)
 
     try:
-        if input_type == InputType.EC2_INSTANCE_ID:
+        cached = (
+            _match_cached_instances(identifier, input_type, inventory, region)
+            if inventory is not None
+            else []
+        )
+        if cached:
+            resp = {"Reservations": [{"Instances": cached}]}
+        elif input_type == InputType.EC2_INSTANCE_ID:
             # Instance ID로 직접 조회
             resp = ec2.describe_instances(InstanceIds=[identifier])
         elif input_type == InputType.EC2_IP:
@@ -848,6 +1290,7 @@ def find_target_groups_for_ec2(
     instance_id: str,
     all_private_ips: list[str] | None = None,
     region: str = "ap-northeast-2",
+    inventory: Inventory | None = None,
 ) -> list[dict[str, Any]]:
     """EC2 인스턴스가 등록된 Target Group 검색.
 
@@ -855,6 +1298,8 @@ def find_target_groups_for_ec2(
         instance_id: EC2 인스턴스 ID
         all_private_ips: ENI의 모든 Private IP (primary + secondary, Pod IP 포함)
         region: AWS 리전
+        inventory: 로컬 스냅샷. 지정하면 전체 Target Group을 훑지 않고 타겟 ID 색인에서
+            후보 Target Group을 고른다. 등록 여부와 타겟 상태는 어느 경우든 API로 확인한다
     """
     elbv2 = get_elbv2_client(region)
     results: list[dict[str, Any]] = []
@@ -868,36 +1313,30 @@ def find_target_groups_for_ec2(
 
     match_ips = {_normalize_ip(ip) for ip in all_private_ips} if all_private_ips else set()
 
+    def _target_groups() -> Iterator[dict]:
+        if inventory is not None:
+            target_ids = [instance_id, *(all_private_ips or [])]
+            candidates = {
+                tg["TargetGroupArn"]: tg for tg, _ in inventory.targets_by_id(target_ids, region)
+            }
+            yield from candidates.values()
+            return
+        for tg_page in _target_group_pages(elbv2, region, inventory):
+            yield from tg_page["TargetGroups"]
+
     try:
-        # 모든 Target Group 조회
-        tg_paginator = elbv2.get_paginator("describe_target_groups")
-        for tg_page in tg_paginator.paginate():
-            for tg in tg_page["TargetGroups"]:
-                # 각 Target Group의 타겟 상태 조회
-                health_resp = elbv2.describe_target_health(TargetGroupArn=tg["TargetGroupArn"])
-
-                for target_health in health_resp["TargetHealthDescriptions"]:
-                    target_id = target_health["Target"]["Id"]
-
-                    # Instance ID 또는 ENI의 모든 IP로 매칭 (Pod IP 포함, IP 정규화 적용)
-                    is_match = target_id == instance_id or _normalize_ip(target_id) in match_ips
-
-                    if is_match:
-                        results.append(
-                            {
-                                "target_group_arn": tg["TargetGroupArn"],
-                                "target_group_name": tg["TargetGroupName"],
-                                "target_type": tg["TargetType"],
-                                "protocol": tg.get("Protocol"),
-                                "port": tg.get("Port"),
-                                "vpc_id": tg.get("VpcId"),
-                                "load_balancer_arns": tg.get("LoadBalancerArns", []),
-                                "target_id": target_id,
-                                "target_port": target_health["Target"].get("Port"),
-                                "health_state": target_health["TargetHealth"]["State"],
-                                "health_reason": target_health["TargetHealth"].get("Reason"),
-                            }
-                        )
+        for tg in _target_groups():
+            # 각 Target Group의 현재 타겟 상태 조회
+            health_resp = _describe_target_health(elbv2, tg["TargetGroupArn"], region)
+
+            for target_health in health_resp["TargetHealthDescriptions"]:
+                target_id = target_health["Target"]["Id"]
+
+                # Instance ID 또는 ENI의 모든 IP로 매칭 (Pod IP 포함, IP 정규화 적용)
+                is_match = target_id == instance_id or _normalize_ip(target_id) in match_ips
+
+                if is_match:
+                    results.append(_target_group_entry(tg, target_health))
 
     except ClientError as e:
         results.append({"error": str(e)})
@@ -905,7 +1344,26 @@ def find_target_groups_for_ec2(
     return results
 
 
-def reverse_trace_ec2(identifier: str, region: str = "ap-northeast-2") -> dict[str, Any]:
+def _target_group_entry(tg: dict, target_health: dict) -> dict[str, Any]:
+    """EC2가 등록된 Target Group 1건."""
+    return {
+        "target_group_arn": tg["TargetGroupArn"],
+        "target_group_name": tg["TargetGroupName"],
+        "target_type": tg["TargetType"],
+        "protocol": tg.get("Protocol"),
+        "port": tg.get("Port"),
+        "vpc_id": tg.get("VpcId"),
+        "load_balancer_arns": tg.get("LoadBalancerArns", []),
+        "target_id": target_health["Target"]["Id"],
+        "target_port": target_health["Target"].get("Port"),
+        "health_state": target_health["TargetHealth"]["State"],
+        "health_reason": target_health["TargetHealth"].get("Reason"),
+    }
+
+
+def reverse_trace_ec2(
+    identifier: str, region: str = "ap-northeast-2", inventory: Inventory | None = None
+) -> dict[str, Any]:
     """EC2 (Instance ID/IP/Name)로부터 역방향 추적."""
     result: dict[str, Any] = {
         "identifier": identifier,
@@ -920,7 +1378,7 @@ def reverse_trace_ec2(identifier: str, region: str = "ap-northeast-2") -> dict[s
     }
 
     # 1. EC2 인스턴스 찾기
-    ec2_instances = find_ec2_by_identifier(identifier, region)
+    ec2_instances = find_ec2_by_identifier(identifier, region, inventory)
     result["ec2_instances"] = ec2_instances
 
     if not ec2_instances or "error" in ec2_instances[0]:
@@ -942,7 +1400,7 @@ def reverse_trace_ec2(identifier: str, region: str = "ap-northeast-2") -> dict[s
         result["chain"].append(f"  ENI IPs: {len(all_private_ips)}개 (Pod IP 포함)")
 
         # Target Group 검색 (ENI의 모든 IP로 매칭)
-        target_groups = find_target_groups_for_ec2(instance_id, all_private_ips, region)
+        target_groups = find_target_groups_for_ec2(instance_id, all_private_ips, region, inventory)
 
         for tg in target_groups:
             if "error" in tg:
@@ -961,7 +1419,7 @@ def reverse_trace_ec2(identifier: str, region: str = "ap-northeast-2") -> dict[s
     if all_lb_arns:
         elbv2 = get_elbv2_client(region)
         try:
-            lb_resp = elbv2.describe_load_balancers(LoadBalancerArns=list(all_lb_arns))
+            lb_resp = _describe_load_balancers_by_arn(elbv2, sorted(all_lb_arns), region, inventory)
             for lb in lb_resp["LoadBalancers"]:
                 lb_info = {
                     "lb_arn": lb["LoadBalancerArn"],
@@ -977,7 +1435,7 @@ def reverse_trace_ec2(identifier: str, region: str = "ap-northeast-2") -> dict[s
                 result["chain"].append(f"    DNS: {lb['DNSName']}")
 
                 # 4. Route53 역추적
-                r53_records = reverse_trace_route53(lb["DNSName"])
+                r53_records = reverse_trace_route53(lb["DNSName"], inventory)
                 for r53 in r53_records:
                     if r53 not in result["route53_records"]:
                         result["route53_records"].append(r53)
@@ -986,7 +1444,7 @@ def reverse_trace_ec2(identifier: str, region: str = "ap-northeast-2") -> dict[s
                         )
 
                 # 5. CloudFront 역추적
-                cf_dists = reverse_trace_cloudfront(lb["DNSName"])
+                cf_dists = reverse_trace_cloudfront(lb["DNSName"], inventory)
                 for cf in cf_dists:
                     if cf not in result["cloudfront_distributions"]:
                         result["cloudfront_distributions"].append(cf)
@@ -1000,14 +1458,16 @@ def reverse_trace_ec2(identifier: str, region: str = "ap-northeast-2") -> dict[s
     return result
 
 
-def reverse_trace_auto(identifier: str, region: str | None = None) -> dict[str, Any]:
+def reverse_trace_auto(
+    identifier: str, region: str | None = None, inventory: Inventory | None = None
+) -> dict[str, Any]:
     """입력 타입을 자동 감지하여 역추적 수행."""
     input_type = identify_input_type(identifier)
 
     if input_type == InputType.LB_DNS:
-        return reverse_trace_lb(identifier, region)
+        return reverse_trace_lb(identifier, region, inventory)
     else:
         # EC2 관련 (Instance ID, IP, Name)
         if region is None:
             region = "ap-northeast-2"
-        return reverse_trace_ec2(identifier, region)
+        return reverse_trace_ec2(identifier, region, inventory)
@@ -0,0 +1,75 @@
+"""Route53 Hosted Zone 병렬 조회 모듈.
+
+Zone이 수백 개면 Zone마다 list_resource_record_sets를 차례로 호출하는 시간이 대부분이다.
+Zone 단위로 작업을 나눠 제한된 수의 스레드로 동시에 조회하고, 끝나는 Zone부터 돌려준다.
+
+Route53 API는 계정당 초당 요청 수가 제한되어 있어 동시 요청이 많으면 Throttling이
+발생한다. 재시도는 Route53 클라이언트의 adaptive 재시도(aws_clients.ROUTE53_CONFIG)가
+요청(페이지) 단위로 맡으므로, 여기서는 Zone 전체를 다시 조회하지 않는다.
+"""
+
+from collections.abc import Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+
+from .memo import memoized, submit_in_context
+
+DEFAULT_ZONE_WORKERS = 8
+
+
+def list_hosted_zones(client) -> list[dict]:
+    """전체 Hosted Zone 목록."""
+    return memoized(
+        "route53.list_hosted_zones",
+        None,
+        lambda: [
+            zone
+            for page in client.get_paginator("list_hosted_zones").paginate()
+            for zone in page["HostedZones"]
+        ],
+    )
+
+
+def list_zone_records(client, zone_id: str) -> list[dict]:
+    """Zone의 전체 레코드."""
+    return memoized(
+        "route53.list_resource_record_sets",
+        zone_id,
+        lambda: [
+            record
+            for page in client.get_paginator("list_resource_record_sets").paginate(
+                HostedZoneId=zone_id
+            )
+            for record in page["ResourceRecordSets"]
+        ],
+    )
+
+
+def iter_zone_records(
+    client,
+    zones: list[dict],
+    max_workers: int = DEFAULT_ZONE_WORKERS,
+) -> Iterator[tuple[int, dict, list[dict]]]:
+    """Zone별 (zones 안의 순번, Zone, 레코드 목록)을 조회가 끝나는 순서대로 돌려준다.
+
+    한 Zone이라도 실패하면 남은 Zone 조회를 취소하고 예외를 그대로 올린다.
+    """
+    if max_workers < 1:
+        raise ValueError("max_workers는 1 이상이어야 합니다.")
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="route53-zone")
+    try:
+        pending: dict[Future, int] = {
+            submit_in_context(
+                executor,
+                list_zone_records,
+                client,
+                zone["Id"].replace("/hostedzone/", ""),
+            ): index
+            for index, zone in enumerate(zones)
+        }
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                index = pending.pop(future)
+                yield index, zones[index], future.result()
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
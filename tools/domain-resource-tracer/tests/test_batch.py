@@ -0,0 +1,135 @@
+"""domain_tracer.batch 일괄 추적 단위 테스트."""
+
+from __future__ import annotations
+
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from domain_tracer.batch import read_identifiers, resolve_mode, trace_batch
+
+# ---------------------------------------------------------------------------
+# 입력 / 모드
+# ---------------------------------------------------------------------------
+
+
+def test_read_identifiers_skips_blank_lines_and_comments():
+    """빈 줄과 `#` 주석은 건너뛰고 줄 번호를 유지한다."""
+    lines = ["# audit list\n", "api.example.com\n", "\n", "  10.0.0.5  # node\n"]
+    assert list(read_identifiers(lines)) == [(2, "api.example.com"), (4, "10.0.0.5")]
+
+
+def test_resolve_mode_auto_detects_direction():
+    """auto는 LB DNS / Instance ID / IP면 reverse, 그 외(도메인)는 forward."""
+    assert resolve_mode("api.example.com", "auto") == "forward"
+    assert resolve_mode("10.0.0.5", "auto") == "reverse"
+    assert resolve_mode("i-0123456789abcdef0", "auto") == "reverse"
+    assert resolve_mode("k8s-x.ap-northeast-2.elb.amazonaws.com", "auto") == "reverse"
+    assert resolve_mode("prod-web", "reverse") == "reverse"
+    with pytest.raises(ValueError, match="알 수 없는 모드"):
+        resolve_mode("x", "sideways")
+
+
+# ---------------------------------------------------------------------------
+# trace_batch
+# ---------------------------------------------------------------------------
+
+
+@patch("domain_tracer.batch.reverse_trace_auto")
+@patch("domain_tracer.batch.trace_domain")
+def test_trace_batch_streams_results_and_isolates_errors(mock_forward, mock_reverse):
+    """끝나는 순서대로 결과를 돌려주고, 실패 / 레코드 / 인스턴스 없음은 error로만 기록한다."""
+
+    def forward(identifier, region, inventory, exact):
+        if identifier == "slow.example.com":
+            time.sleep(0.1)
+        if identifier == "broken.example.com":
+            raise RuntimeError("AccessDenied")
+        if identifier == "wild.example.com":
+            return []
+        return [{"domain": identifier, "exact": exact}]
+
+    def reverse(identifier, region, inventory):
+        if identifier == "10.0.0.9":
+            return {"identifier": identifier, "ec2_instances": []}
+        if identifier == "i-0123456789abcdef0":
+            return {"identifier": identifier, "ec2_instances": [{"error": "UnauthorizedOperation"}]}
+        if identifier.endswith(".elb.amazonaws.com"):
+            return {"lb_dns": identifier, "load_balancer": {"lb_name": None}}
+        return {"identifier": identifier, "ec2_instances": [{"instance_id": "i-1"}]}
+
+    mock_forward.side_effect = forward
+    mock_reverse.side_effect = reverse
+    identifiers = [
+        (1, "slow.example.com"),
+        (2, "10.0.0.5"),
+        (3, "broken.example.com"),
+        (4, "api.example.com"),
+        (5, "wild.example.com"),
+        (6, "10.0.0.9"),
+        (7, "i-0123456789abcdef0"),
+        (8, "gone-123.ap-northeast-2.elb.amazonaws.com"),
+    ]
+
+    records = list(trace_batch(identifiers, workers=4))
+
+    assert records[-1]["identifier"] == "slow.example.com"
+    by_line = {r["line"]: r for r in records}
+    assert by_line[1]["result"] == [{"domain": "slow.example.com", "exact": True}]
+    assert by_line[2] == {
+        **by_line[2],
+        "mode": "reverse",
+        "ok": True,
+        "result": {"identifier": "10.0.0.5", "ec2_instances": [{"instance_id": "i-1"}]},
+    }
+    assert by_line[3]["ok"] is False
+    assert by_line[3]["error"] == "AccessDenied"
+    assert "result" not in by_line[3]
+    # 일치하는 레코드가 없으면 실패로 보고한다
+    assert by_line[5]["ok"] is False
+    assert by_line[5]["error"] == "일치하는 Route53 레코드가 없습니다."
+    # 역추적에서 인스턴스 / LB가 없거나 조회가 실패해도 실패로 보고한다
+    assert by_line[6]["ok"] is False
+    assert by_line[6]["error"] == "일치하는 EC2 인스턴스가 없습니다."
+    assert by_line[7]["ok"] is False
+    assert by_line[7]["error"] == "UnauthorizedOperation"
+    assert by_line[8]["ok"] is False
+    assert by_line[8]["error"] == "일치하는 Load Balancer가 없습니다."
+    assert all(r["elapsed_ms"] >= 0 for r in records)
+
+
+@patch("domain_tracer.batch.trace_domain")
+def test_trace_batch_bounds_in_flight_and_reads_input_lazily(mock_forward):
+    """동시 추적은 workers개, 입력은 workers * 2개까지만 앞서 읽는다."""
+    lock = threading.Lock()
+    in_flight = max_in_flight = 0
+
+    def forward(identifier, region, inventory, exact):
+        nonlocal in_flight, max_in_flight
+        with lock:
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+        time.sleep(0.005)
+        with lock:
+            in_flight -= 1
+        return [{"domain": identifier}]
+
+    mock_forward.side_effect = forward
+    consumed = 0
+
+    def identifiers():
+        nonlocal consumed
+        for i in range(100):
+            consumed += 1
+            yield i + 1, f"d{i}.example.com"
+
+    records = trace_batch(identifiers(), mode="forward", workers=3)
+    next(records)
+    assert consumed <= 3 * 2 + 1
+    assert len(list(records)) == 99
+    assert max_in_flight == 3
+
+    with pytest.raises(ValueError, match="workers"):
+        next(trace_batch([], workers=0))
@@ -0,0 +1,377 @@
+"""domain_tracer.inventory 로컬 캐시 단위 테스트."""
+
+from __future__ import annotations
+
+import datetime
+import json
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from domain_tracer import inventory as inventory_module
+from domain_tracer.inventory import CACHE_VERSION, Inventory
+from domain_tracer.tracer import (
+    find_ec2_by_identifier,
+    find_target_groups_for_ec2,
+    reverse_trace_cloudfront,
+    reverse_trace_route53,
+    search_route53_records,
+    trace_load_balancer,
+)
+
+
+class _Clock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _paginator(pages_by_kwargs):
+    """paginate(**kwargs) 호출마다 kwargs에 맞는 페이지 목록을 돌려주는 paginator mock."""
+    paginator = MagicMock()
+    paginator.paginate.side_effect = lambda **kwargs: iter(pages_by_kwargs(kwargs))
+    return paginator
+
+
+def _write_snapshot(inventory: Inventory, service: str, data: dict, region: str | None = None):
+    """섹션 스냅샷 파일을 직접 써서 API 호출 없이 Inventory가 읽게 한다."""
+    path = inventory.path(service, region)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {"version": CACHE_VERSION, "fetched_at": time.time(), "data": data}
+    path.write_text(json.dumps(payload), encoding="utf-8")
+
+
+def _route53_client() -> MagicMock:
+    zones = [{"Id": "/hostedzone/Z1", "Name": "example.com."}]
+    records = {
+        "Z1": [
+            {
+                "Name": "api.example.com.",
+                "Type": "A",
+                "AliasTarget": {"DNSName": "dualstack.my-alb.ap-northeast-2.elb.amazonaws.com."},
+            },
+            {"Name": "www.example.com.", "Type": "CNAME", "ResourceRecords": [{"Value": "x.net"}]},
+        ]
+    }
+    paginators = {
+        "list_hosted_zones": _paginator(lambda kw: [{"HostedZones": zones}]),
+        "list_resource_record_sets": _paginator(
+            lambda kw: [{"ResourceRecordSets": records[kw["HostedZoneId"]]}]
+        ),
+    }
+    client = MagicMock()
+    client.get_paginator.side_effect = paginators.__getitem__
+    return client
+
+
+# ---------------------------------------------------------------------------
+# Inventory 캐시 / TTL
+# ---------------------------------------------------------------------------
+
+
+@patch("domain_tracer.inventory.get_route53_client")
+def test_inventory_reuses_disk_snapshot_within_ttl(mock_client, tmp_path):
+    """TTL 안에서는 새 Inventory도 디스크 스냅샷을 읽고 API를 호출하지 않는다."""
+    mock_client.return_value = _route53_client()
+    clock = _Clock()
+
+    first = Inventory(tmp_path, ttl=60, clock=clock)
+    assert [r[2]["Name"] for r in first.route53_records()] == [
+        "api.example.com.",
+        "www.example.com.",
+    ]
+    assert mock_client.return_value.get_paginator.call_count == 2
+    assert (tmp_path / "route53.json").exists()
+
+    clock.now += 30
+    second = Inventory(tmp_path, ttl=60, clock=clock)
+    assert second.zone_records("Z1")[1]["Name"] == "www.example.com."
+    assert mock_client.return_value.get_paginator.call_count == 2
+
+    # TTL이 지나면 다시 조회
+    clock.now += 60
+    Inventory(tmp_path, ttl=60, clock=clock).hosted_zones()
+    assert mock_client.return_value.get_paginator.call_count == 4
+
+
+@patch("domain_tracer.inventory.get_ec2_client")
+def test_inventory_refresh_and_status_per_region(mock_client, tmp_path):
+    """refresh는 TTL과 무관하게 다시 조회하고, 리전별로 별도 파일에 저장한다."""
+    launch = datetime.datetime(2024, 1, 1, tzinfo=datetime.UTC)
+    mock_client.return_value.get_paginator.return_value = _paginator(
+        lambda kw: [
+            {"Reservations": [{"Instances": [{"InstanceId": "i-1", "LaunchTime": launch}]}]}
+        ]
+    )
+    clock = _Clock()
+    inventory = Inventory(tmp_path, ttl=600, clock=clock)
+
+    assert inventory.status("ec2", "us-east-1").fetched_at is None
+    status = inventory.refresh("ec2", "us-east-1")
+    assert status.items == 1
+    assert status.path == tmp_path / "ec2-us-east-1.json"
+    assert status.age(now=clock.now + 5) == 5
+    # datetime은 문자열로 저장
+    assert isinstance(inventory.instances("us-east-1")[0]["LaunchTime"], str)
+    assert not (tmp_path / "ec2-ap-northeast-2.json").exists()
+
+    with pytest.raises(ValueError, match="알 수 없는 서비스"):
+        inventory.refresh("lambda")
+
+
+@patch("domain_tracer.inventory.get_route53_client")
+def test_inventory_refetches_corrupted_snapshot(mock_client, tmp_path):
+    """캐시 파일이 손상되었으면 무시하고 다시 조회한다."""
+    mock_client.return_value = _route53_client()
+    (tmp_path / "route53.json").write_text("{not json", encoding="utf-8")
+
+    assert len(Inventory(tmp_path, ttl=60).hosted_zones()) == 1
+    assert mock_client.return_value.get_paginator.called
+
+
+# ---------------------------------------------------------------------------
+# tracer 연동
+# ---------------------------------------------------------------------------
+
+
+@patch("domain_tracer.tracer.get_route53_client")
+@patch("domain_tracer.inventory.get_route53_client")
+def test_search_route53_records_uses_inventory(mock_inventory_client, mock_live_client, tmp_path):
+    """inventory를 넘기면 tracer는 Route53 API를 직접 호출하지 않는다."""
+    mock_inventory_client.return_value = _route53_client()
+    inventory = Inventory(tmp_path, ttl=60)
+
+    results = search_route53_records(r"^api\.", inventory)
+
+    assert [r.domain for r in results] == ["api.example.com"]
+    assert results[0].hosted_zone_id == "Z1"
+    mock_live_client.assert_not_called()
+
+
+@patch("domain_tracer.tracer.get_ec2_client")
+def test_find_ec2_by_identifier_matches_snapshot_then_falls_back(mock_live_client, tmp_path):
+    """스냅샷에서 ENI IP / Name 태그로 찾고, 없으면 API로 조회한다."""
+    instance = {
+        "InstanceId": "i-0123456789",
+        "State": {"Name": "running"},
+        "InstanceType": "t3.micro",
+        "PrivateIpAddress": "10.0.0.5",
+        "Placement": {"AvailabilityZone": "ap-northeast-2a"},
+        "Tags": [{"Key": "Name", "Value": "prod-web-1"}],
+        "NetworkInterfaces": [
+            {
+                "PrivateIpAddresses": [
+                    {"PrivateIpAddress": "10.0.0.5"},
+                    {"PrivateIpAddress": "10.0.0.77"},
+                ]
+            }
+        ],
+    }
+    inventory = Inventory(tmp_path, ttl=60)
+    _write_snapshot(inventory, "ec2", {"instances": [instance]}, "ap-northeast-2")
+    live = mock_live_client.return_value
+    live.describe_instances.return_value = {"Reservations": []}
+
+    [by_pod_ip] = find_ec2_by_identifier("10.0.0.77", inventory=inventory)
+    assert by_pod_ip["instance_id"] == "i-0123456789"
+    assert by_pod_ip["all_private_ips"] == ["10.0.0.5", "10.0.0.77"]
+    assert [r["name"] for r in find_ec2_by_identifier("web", inventory=inventory)] == ["prod-web-1"]
+    live.describe_instances.assert_not_called()
+
+    assert find_ec2_by_identifier("i-9999999999", inventory=inventory) == []
+    live.describe_instances.assert_called_once_with(InstanceIds=["i-9999999999"])
+
+
+# ---------------------------------------------------------------------------
+# 역색인
+# ---------------------------------------------------------------------------
+
+ALB_DNS = "my-alb-123.ap-northeast-2.elb.amazonaws.com"
+
+
+def _route53_snapshot(count: int) -> dict:
+    records = [
+        {
+            "Name": f"svc{i}.example.com.",
+            "Type": "A",
+            "AliasTarget": {"DNSName": f"dualstack.alb-{i}.ap-northeast-2.elb.amazonaws.com."},
+        }
+        for i in range(count)
+    ]
+    records += [
+        {"Name": "api.example.com.", "Type": "A", "AliasTarget": {"DNSName": f"{ALB_DNS}."}},
+        {
+            "Name": "legacy.example.com.",
+            "Type": "CNAME",
+            "ResourceRecords": [{"Value": ALB_DNS.upper()}],
+        },
+        {"Name": "txt.example.com.", "Type": "TXT", "ResourceRecords": [{"Value": ALB_DNS}]},
+    ]
+    return {
+        "zones": [{"Id": "/hostedzone/Z1", "Name": "example.com."}],
+        "records": {"Z1": records},
+    }
+
+
+def test_reverse_trace_route53_uses_target_index(tmp_path):
+    """역추적은 Alias / CNAME 대상 색인으로 찾고, 색인은 한 번만 만든다."""
+    inventory = Inventory(tmp_path, ttl=60)
+    _write_snapshot(inventory, "route53", _route53_snapshot(500))
+
+    with patch(
+        "domain_tracer.inventory._index_record_targets",
+        wraps=inventory_module._index_record_targets,
+    ) as build:
+        results = reverse_trace_route53(f"dualstack.{ALB_DNS}", inventory)
+        for i in range(500):
+            [hit] = reverse_trace_route53(f"alb-{i}.ap-northeast-2.elb.amazonaws.com", inventory)
+            assert hit["domain"] == f"svc{i}.example.com"
+        assert build.call_count == 1
+
+    assert results == [
+        {
+            "domain": "api.example.com",
+            "hosted_zone_id": "Z1",
+            "hosted_zone_name": "example.com",
+            "record_type": "A (Alias)",
+            "is_alias": True,
+        },
+        {
+            "domain": "legacy.example.com",
+            "hosted_zone_id": "Z1",
+            "hosted_zone_name": "example.com",
+            "record_type": "CNAME",
+            "is_alias": False,
+        },
+    ]
+    assert reverse_trace_route53("unknown.example.net", inventory) == []
+
+    # 섹션을 다시 조회하면 색인도 새로 만든다
+    with patch("domain_tracer.inventory.get_route53_client") as mock_client:
+        mock_client.return_value = _route53_client()
+        inventory.refresh("route53")
+    assert reverse_trace_route53(ALB_DNS, inventory) == []
+    assert [
+        r["domain"]
+        for r in reverse_trace_route53("my-alb.ap-northeast-2.elb.amazonaws.com", inventory)
+    ] == ["api.example.com"]
+
+
+def test_reverse_trace_cloudfront_groups_matching_origins(tmp_path):
+    """Origin 색인은 배포별로 일치하는 Origin을 모아서 돌려준다."""
+    inventory = Inventory(tmp_path, ttl=60)
+    dist = {
+        "Id": "E1",
+        "DomainName": "d111.cloudfront.net",
+        "Status": "Deployed",
+        "Enabled": True,
+        "Origins": {
+            "Items": [
+                {"Id": "alb", "DomainName": ALB_DNS},
+                {"Id": "s3", "DomainName": "assets.s3.amazonaws.com"},
+                {"Id": "alb-dualstack", "DomainName": f"dualstack.{ALB_DNS}"},
+            ]
+        },
+    }
+    _write_snapshot(inventory, "cloudfront", {"distributions": [dist]})
+
+    [result] = reverse_trace_cloudfront(ALB_DNS.upper(), inventory)
+    assert result["distribution_id"] == "E1"
+    assert [o["id"] for o in result["matching_origins"]] == ["alb", "alb-dualstack"]
+    assert reverse_trace_cloudfront("other.example.com", inventory) == []
+    assert inventory.distributions_by_domain("D111.cloudfront.net.") == [dist]
+
+
+def test_find_target_groups_for_ec2_uses_target_index(tmp_path):
+    """색인으로 후보 Target Group을 TG 순서대로 찾고, 등록 여부 / 상태는 현재 값으로 확인한다."""
+    inventory = Inventory(tmp_path, ttl=60)
+
+    def tg(name: str, target_type: str) -> dict:
+        return {
+            "TargetGroupArn": f"arn:tg/{name}",
+            "TargetGroupName": name,
+            "TargetType": target_type,
+            "LoadBalancerArns": ["arn:lb/app"],
+        }
+
+    def health(target_id: str) -> dict:
+        return {"Target": {"Id": target_id, "Port": 80}, "TargetHealth": {"State": "healthy"}}
+
+    _write_snapshot(
+        inventory,
+        "elbv2",
+        {
+            "load_balancers": [
+                {
+                    "LoadBalancerArn": "arn:lb/app",
+                    "DNSName": ALB_DNS,
+                    "LoadBalancerName": "app",
+                    "Type": "application",
+                    "VpcId": "vpc-1",
+                    "Scheme": "internet-facing",
+                    "State": {"Code": "active"},
+                }
+            ],
+            "target_groups": [tg("pods", "ip"), tg("other", "instance"), tg("nodes", "instance")],
+            "target_health": {
+                "arn:tg/pods": [health("10.0.0.77"), health("2001:db8::5")],
+                "arn:tg/other": [health("i-other")],
+                "arn:tg/nodes": [health("i-0123456789")],
+            },
+        },
+        "ap-northeast-2",
+    )
+
+    # 스냅샷 이후 2001:db8::5는 등록 해제되고 상태가 바뀐 상황
+    live_health = {
+        "arn:tg/pods": [health("10.0.0.77") | {"TargetHealth": {"State": "draining"}}],
+        "arn:tg/nodes": [health("i-0123456789") | {"TargetHealth": {"State": "unhealthy"}}],
+    }
+    with patch("domain_tracer.tracer.get_elbv2_client") as mock_client:
+        elbv2 = mock_client.return_value
+        elbv2.describe_target_health.side_effect = lambda TargetGroupArn: {
+            "TargetHealthDescriptions": live_health[TargetGroupArn]
+        }
+        results = find_target_groups_for_ec2(
+            "i-0123456789", ["10.0.0.77", "2001:0db8:0:0::5"], "ap-northeast-2", inventory
+        )
+    assert [(r["target_group_name"], r["target_id"], r["health_state"]) for r in results] == [
+        ("pods", "10.0.0.77", "draining"),
+        ("nodes", "i-0123456789", "unhealthy"),
+    ]
+    # 후보 Target Group만 현재 상태를 조회한다
+    assert [c.kwargs["TargetGroupArn"] for c in elbv2.describe_target_health.call_args_list] == [
+        "arn:tg/pods",
+        "arn:tg/nodes",
+    ]
+    elbv2.get_paginator.assert_not_called()
+    assert inventory.load_balancer_by_arn("arn:lb/app")["LoadBalancerName"] == "app"
+    assert inventory.target_group_by_arn("arn:tg/missing") is None
+
+    with patch("domain_tracer.tracer.get_elbv2_client") as mock_client:
+        elbv2 = mock_client.return_value
+        elbv2.describe_listeners.return_value = {"Listeners": []}
+        lb = trace_load_balancer(f"dualstack.{ALB_DNS}", inventory=inventory)
+    assert lb["lb_arn"] == "arn:lb/app"
+    elbv2.get_paginator.assert_not_called()
+
+
+def test_exact_search_uses_record_name_index(tmp_path):
+    """exact 검색은 이름 색인으로 찾고 대소문자 / trailing dot을 무시한다."""
+    inventory = Inventory(tmp_path, ttl=60)
+    _write_snapshot(inventory, "route53", _route53_snapshot(50))
+
+    [result] = search_route53_records("API.example.com.", inventory, exact=True)
+    assert result.domain == "api.example.com"
+    assert result.record_value == f"{ALB_DNS}"
+    # 정규표현식 메타문자는 그대로 이름으로 비교
+    assert search_route53_records("api.example.co.", inventory, exact=True) == []
+    assert search_route53_records("svc1.example.com", inventory, exact=True)[0].domain == (
+        "svc1.example.com"
+    )
+
+    [legacy] = search_route53_records("legacy.example.com", inventory, exact=True)
+    assert legacy.record_type == "CNAME"
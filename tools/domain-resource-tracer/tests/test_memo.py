@@ -0,0 +1,123 @@
+"""domain_tracer.memo 조회 메모 단위 테스트."""
+
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from domain_tracer.memo import CallMemo, call_memo, current_memo, memoized, submit_in_context
+from domain_tracer.tracer import reverse_trace_cloudfront, reverse_trace_route53, trace_cloudfront
+
+# ---------------------------------------------------------------------------
+# CallMemo
+# ---------------------------------------------------------------------------
+
+
+def test_call_memo_fetches_each_key_once_across_threads():
+    """같은 키를 여러 스레드가 동시에 조회해도 fetch는 한 번만 호출된다."""
+    memo = CallMemo()
+    calls = 0
+    lock = threading.Lock()
+
+    def fetch() -> dict:
+        nonlocal calls
+        with lock:
+            calls += 1
+        time.sleep(0.02)
+        return {"ok": True}
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda _: memo.get("op", "k", fetch), range(8)))
+
+    assert calls == 1
+    assert all(r is results[0] for r in results)
+    assert memo.stats() == [("op", 1, 7)]
+
+
+def test_call_memo_does_not_cache_errors():
+    """fetch가 예외를 올리면 메모하지 않고 다음 조회에서 다시 호출한다."""
+    memo = CallMemo()
+    fetch = MagicMock(side_effect=[RuntimeError("boom"), "ok"])
+    with pytest.raises(RuntimeError):
+        memo.get("op", 1, fetch)
+    assert memo.get("op", 1, fetch) == "ok"
+    assert memo.get("op", 1, fetch) == "ok"
+    assert fetch.call_count == 2
+    assert memo.stats() == [("op", 1, 1)]
+
+
+def test_memoized_is_scoped_to_call_memo_block_and_thread_pool():
+    """call_memo 블록 밖에서는 매번 호출하고, 블록 안에서는 스레드 풀 작업도 같은 메모를 쓴다."""
+    fetch = MagicMock(return_value="value")
+    memoized("op", None, fetch)
+    memoized("op", None, fetch)
+    assert fetch.call_count == 2
+
+    with call_memo() as memo:
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [submit_in_context(executor, memoized, "op", None, fetch) for _ in range(4)]
+            assert [f.result() for f in futures] == ["value"] * 4
+        # 컨텍스트를 복사하지 않은 작업은 메모를 보지 못한다
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            assert executor.submit(current_memo).result() is None
+    assert fetch.call_count == 3
+    assert memo.stats() == [("op", 1, 3)]
+    assert current_memo() is None
+
+
+# ---------------------------------------------------------------------------
+# tracer 연동
+# ---------------------------------------------------------------------------
+
+
+@patch("domain_tracer.tracer.get_cloudfront_client")
+def test_cloudfront_listing_is_reused_within_run(mock_client):
+    """한 실행 안에서 정방향 / 역추적이 list_distributions 결과를 재사용한다."""
+    dist = {
+        "Id": "E1",
+        "DomainName": "d111.cloudfront.net",
+        "Status": "Deployed",
+        "Enabled": True,
+        "Origins": {"Items": [{"Id": "alb", "DomainName": "my-alb.elb.amazonaws.com"}]},
+    }
+    paginator = mock_client.return_value.get_paginator.return_value
+    paginator.paginate.side_effect = lambda: iter([{"DistributionList": {"Items": [dist]}}])
+
+    with call_memo() as memo:
+        for _ in range(3):
+            assert trace_cloudfront("d111.cloudfront.net")["distribution_id"] == "E1"
+        assert reverse_trace_cloudfront("my-alb.elb.amazonaws.com")[0]["distribution_id"] == "E1"
+
+    assert paginator.paginate.call_count == 1
+    assert memo.stats() == [("cloudfront.list_distributions", 1, 3)]
+
+
+@patch("domain_tracer.tracer.get_route53_client")
+def test_route53_enumeration_is_reused_within_run(mock_client):
+    """LB마다 하는 Route53 역추적이 Zone / 레코드 목록을 한 번만 조회한다."""
+    records = [
+        {"Name": f"{name}.example.com.", "Type": "A", "AliasTarget": {"DNSName": f"{name}-lb."}}
+        for name in ("a", "b")
+    ]
+    pages = {
+        "list_hosted_zones": [{"HostedZones": [{"Id": "/hostedzone/Z1", "Name": "example.com."}]}],
+        "list_resource_record_sets": [{"ResourceRecordSets": records}],
+    }
+    paginators = {op: MagicMock() for op in pages}
+    for op, paginator in paginators.items():
+        paginator.paginate.side_effect = lambda op=op, **kwargs: iter(pages[op])
+    mock_client.return_value.get_paginator.side_effect = paginators.__getitem__
+
+    with call_memo() as memo:
+        assert [r["domain"] for r in reverse_trace_route53("a-lb")] == ["a.example.com"]
+        assert [r["domain"] for r in reverse_trace_route53("b-lb")] == ["b.example.com"]
+
+    assert paginators["list_resource_record_sets"].paginate.call_count == 1
+    assert memo.stats() == [
+        ("route53.list_hosted_zones", 1, 1),
+        ("route53.list_resource_record_sets", 1, 1),
+    ]
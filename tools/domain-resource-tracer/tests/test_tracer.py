@@ -12,6 +12,7 @@ from domain_tracer.tracer import (
     identify_target_type,
     normalize_elb_dns,
     trace_cloudfront,
+    trace_domain,
     trace_load_balancer,
 )
 
@@ -252,3 +253,175 @@ def test_trace_load_balancer_throttling_logs_warning(mock_elbv2, mock_elb, caplo
         trace_load_balancer("my-alb.ap-northeast-2.elb.amazonaws.com", region="ap-northeast-2")
 
     assert any("스로틀링" in r.message for r in caplog.records)
+
+
+# ---------------------------------------------------------------------------
+# trace_domain 일괄 조회
+# ---------------------------------------------------------------------------
+
+ALB_DNS = "my-alb-1.ap-northeast-2.elb.amazonaws.com"
+TG_ARNS = ["arn:tg/api", "arn:tg/web"]
+
+
+def _paginator_for(pages_by_operation: dict[str, list[dict]]):
+    def get_paginator(operation: str):
+        paginator = MagicMock()
+        paginator.paginate.side_effect = lambda **kwargs: iter(pages_by_operation[operation])
+        return paginator
+
+    return get_paginator
+
+
+def _mock_trace_clients(mock_r53, mock_cf, mock_elbv2, mock_elb, mock_ec2) -> dict:
+    """같은 ALB를 가리키는 Alias 2개 + 그 ALB를 Origin으로 쓰는 CloudFront 1개."""
+    records = [
+        {"Name": "api.example.com.", "Type": "A", "AliasTarget": {"DNSName": f"{ALB_DNS}."}},
+        {
+            "Name": "app.example.com.",
+            "Type": "A",
+            "AliasTarget": {"DNSName": f"dualstack.{ALB_DNS}."},
+        },
+        {
+            "Name": "cdn.example.com.",
+            "Type": "A",
+            "AliasTarget": {"DNSName": "d111.cloudfront.net."},
+        },
+    ]
+    mock_r53.return_value.get_paginator.side_effect = _paginator_for(
+        {
+            "list_hosted_zones": [
+                {"HostedZones": [{"Id": "/hostedzone/Z1", "Name": "example.com."}]}
+            ],
+            "list_resource_record_sets": [{"ResourceRecordSets": records}],
+        }
+    )
+    distribution = {
+        "Id": "E1",
+        "DomainName": "d111.cloudfront.net",
+        "Status": "Deployed",
+        "Enabled": True,
+        "Origins": {"Items": [{"Id": "alb", "DomainName": ALB_DNS}]},
+    }
+    mock_cf.return_value.get_paginator.side_effect = _paginator_for(
+        {"list_distributions": [{"DistributionList": {"Items": [distribution]}}]}
+    )
+
+    elbv2 = mock_elbv2.return_value
+    lb = {
+        "DNSName": ALB_DNS,
+        "Type": "application",
+        "LoadBalancerArn": "arn:lb/my-alb-1",
+        "LoadBalancerName": "my-alb-1",
+        "VpcId": "vpc-1",
+        "Scheme": "internet-facing",
+        "State": {"Code": "active"},
+    }
+    elbv2.get_paginator.side_effect = _paginator_for(
+        {"describe_load_balancers": [{"LoadBalancers": [lb]}]}
+    )
+    elbv2.describe_listeners.return_value = {
+        "Listeners": [{"Port": 443, "Protocol": "HTTPS", "ListenerArn": "arn:listener/1"}]
+    }
+    elbv2.describe_rules.return_value = {
+        "Rules": [
+            {"Priority": "1", "Actions": [{"Type": "forward", "TargetGroupArn": arn}]}
+            for arn in TG_ARNS
+        ]
+    }
+    elbv2.describe_target_groups.side_effect = lambda TargetGroupArns: {
+        "TargetGroups": [
+            {"TargetGroupArn": arn, "TargetGroupName": arn.split("/")[-1], "TargetType": "instance"}
+            for arn in TargetGroupArns
+        ]
+    }
+    elbv2.describe_target_health.side_effect = lambda TargetGroupArn: {
+        "TargetHealthDescriptions": [
+            {"Target": {"Id": i, "Port": 80}, "TargetHealth": {"State": "healthy"}}
+            for i in ("i-1", "i-2")
+        ]
+    }
+    mock_elb.return_value.describe_load_balancers.return_value = {"LoadBalancerDescriptions": []}
+    mock_ec2.return_value.describe_instances.side_effect = lambda InstanceIds: {
+        "Reservations": [
+            {
+                "Instances": [
+                    {
+                        "InstanceId": i,
+                        "State": {"Name": "running"},
+                        "InstanceType": "t3.micro",
+                        "Placement": {"AvailabilityZone": "ap-northeast-2a"},
+                    }
+                    for i in InstanceIds
+                ]
+            }
+        ]
+    }
+    return {"elbv2": elbv2, "ec2": mock_ec2.return_value, "cf": mock_cf.return_value}
+
+
+# 테스트 인자 순서: route53, cloudfront, elbv2, elb, ec2
+_TRACE_PATCHES = [
+    patch("domain_tracer.tracer.get_route53_client"),
+    patch("domain_tracer.tracer.get_cloudfront_client"),
+    patch("domain_tracer.tracer.get_elbv2_client"),
+    patch("domain_tracer.tracer.get_elb_client"),
+    patch("domain_tracer.tracer.get_ec2_client"),
+]
+
+
+def _with_trace_clients(test):
+    for p in _TRACE_PATCHES:
+        test = p(test)
+    return test
+
+
+@_with_trace_clients
+def test_trace_domain_describes_shared_resources_once(
+    mock_r53, mock_cf, mock_elbv2, mock_elb, mock_ec2
+):
+    """여러 레코드가 같은 ALB / Target Group / EC2를 가리켜도 한 번씩만 조회한다."""
+    clients = _mock_trace_clients(mock_r53, mock_cf, mock_elbv2, mock_elb, mock_ec2)
+
+    results = trace_domain(".*")
+
+    assert [r["domain"] for r in results] == [
+        "api.example.com",
+        "app.example.com",
+        "cdn.example.com",
+    ]
+    elbv2 = clients["elbv2"]
+    elbv2.describe_listeners.assert_called_once_with(LoadBalancerArn="arn:lb/my-alb-1")
+    elbv2.describe_target_groups.assert_called_once_with(TargetGroupArns=TG_ARNS)
+    assert (
+        sorted(c.kwargs["TargetGroupArn"] for c in elbv2.describe_target_health.call_args_list)
+        == TG_ARNS
+    )
+    clients["ec2"].describe_instances.assert_called_once_with(InstanceIds=["i-1", "i-2"])
+
+    for result in results:
+        lb = result["details"]["load_balancer"]
+        assert [tg["name"] for tg in lb["target_groups"]] == ["api", "web"]
+        assert [i["instance_id"] for i in result["details"]["ec2_instances"]] == ["i-1", "i-2"]
+    assert "    → Target: i-1 (healthy)" in results[0]["chain"]
+    assert results[2]["details"]["cloudfront"]["distribution_id"] == "E1"
+
+
+@_with_trace_clients
+def test_trace_domain_target_health_error_logs_warning(
+    mock_r53, mock_cf, mock_elbv2, mock_elb, mock_ec2, caplog
+):
+    """타겟 상태 조회가 실패하면 warning 로그를 남기고 Target Group 없이 추적한다."""
+    clients = _mock_trace_clients(mock_r53, mock_cf, mock_elbv2, mock_elb, mock_ec2)
+    clients["elbv2"].describe_target_health.side_effect = _client_error(
+        "AccessDenied", "not authorized"
+    )
+
+    with caplog.at_level(logging.WARNING, logger="domain_tracer.tracer"):
+        results = trace_domain(r"^api\.")
+
+    [result] = results
+    assert result["details"]["load_balancer"]["lb_name"] == "my-alb-1"
+    assert result["details"]["load_balancer"]["target_groups"] == []
+    assert "ec2_instances" not in result["details"]
+    assert any("Target Group 조회 권한 없음" in r.message for r in caplog.records)
+    clients["ec2"].describe_instances.assert_not_called()
@@ -0,0 +1,120 @@
+"""domain_tracer.zones 병렬 조회 단위 테스트."""
+
+from __future__ import annotations
+
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+from botocore.exceptions import ClientError
+
+from domain_tracer.aws_clients import get_route53_client
+from domain_tracer.tracer import search_route53_records
+from domain_tracer.zones import iter_zone_records
+
+
+def _client_error(code: str) -> ClientError:
+    return ClientError({"Error": {"Code": code, "Message": code}}, "ListResourceRecordSets")
+
+
+class _FakeRoute53:
+    """Zone마다 delays[zone_id]초 걸려 응답하고 동시 요청 수를 기록하는 Route53 client."""
+
+    def __init__(self, zones: list[str], delays: dict[str, float] | None = None):
+        self.zones = zones
+        self.delays = delays or {}
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def _records(self, zone_id: str) -> list[dict]:
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(self.delays.get(zone_id, 0.01))
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+        return [
+            {"Name": f"api.{zone_id}.com.", "Type": "CNAME", "ResourceRecords": [{"Value": "x"}]},
+            {"Name": f"www.{zone_id}.com.", "Type": "A", "ResourceRecords": [{"Value": "1.2.3.4"}]},
+        ]
+
+    def get_paginator(self, operation: str):
+        paginator = MagicMock()
+        if operation == "list_hosted_zones":
+            zones = [{"Id": f"/hostedzone/{z}", "Name": f"{z}.com."} for z in self.zones]
+            paginator.paginate.return_value = [{"HostedZones": zones}]
+        else:
+            paginator.paginate.side_effect = lambda HostedZoneId: [
+                {"ResourceRecordSets": self._records(HostedZoneId)}
+            ]
+        return paginator
+
+
+# ---------------------------------------------------------------------------
+# Route53 클라이언트 재시도
+# ---------------------------------------------------------------------------
+
+
+@patch("domain_tracer.aws_clients.boto3.client")
+def test_route53_client_retries_throttled_pages_adaptively(mock_client):
+    """Route53 클라이언트는 Throttling을 요청(페이지) 단위 adaptive 재시도로 처리한다."""
+    get_route53_client.cache_clear()
+    try:
+        get_route53_client()
+    finally:
+        get_route53_client.cache_clear()
+
+    config = mock_client.call_args.kwargs["config"]
+    assert config.retries == {"mode": "adaptive", "total_max_attempts": 10}
+
+
+# ---------------------------------------------------------------------------
+# iter_zone_records
+# ---------------------------------------------------------------------------
+
+
+def test_iter_zone_records_bounds_workers_and_yields_as_completed():
+    """동시 조회는 max_workers개를 넘지 않고, 먼저 끝난 Zone부터 나온다."""
+    zone_ids = [f"z{i}" for i in range(12)]
+    client = _FakeRoute53(zone_ids, delays={"z0": 0.2})
+    zones = [{"Id": f"/hostedzone/{z}", "Name": f"{z}.com."} for z in zone_ids]
+
+    order = [index for index, _, _ in iter_zone_records(client, zones, max_workers=4)]
+
+    assert sorted(order) == list(range(12))
+    assert order[-1] == 0
+    assert client.max_in_flight == 4
+
+
+def test_iter_zone_records_propagates_errors():
+    """Zone 조회가 실패하면 예외를 그대로 올린다."""
+    client = MagicMock()
+    client.get_paginator.return_value.paginate.side_effect = _client_error("AccessDenied")
+    zones = [{"Id": "/hostedzone/Z1", "Name": "a.com."}]
+    with pytest.raises(ClientError):
+        list(iter_zone_records(client, zones))
+
+
+# ---------------------------------------------------------------------------
+# search_route53_records (API 조회)
+# ---------------------------------------------------------------------------
+
+
+@patch("domain_tracer.tracer.get_route53_client")
+def test_search_route53_records_streams_zones_and_keeps_zone_order(mock_client):
+    """Zone이 끝날 때마다 on_zone이 호출되고, 반환 결과는 Zone 목록 순서를 따른다."""
+    mock_client.return_value = _FakeRoute53(["slow", "fast", "empty"], delays={"slow": 0.1})
+    streamed: list[tuple[str, list[str]]] = []
+
+    results = search_route53_records(
+        r"^api\.",
+        on_zone=lambda zone, matches: streamed.append((zone, [m.domain for m in matches])),
+    )
+
+    assert [r.domain for r in results] == ["api.slow.com", "api.fast.com", "api.empty.com"]
+    assert streamed[-1] == ("slow.com", ["api.slow.com"])
+    assert len(streamed) == 3
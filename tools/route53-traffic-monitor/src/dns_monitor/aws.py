@@ -1,17 +1,19 @@
-"""Route53 API - 가중치 레코드 및 NS 조회."""
+"""Route53 API - 가중치 레코드 및 NS 조회.
+
+boto3/botocore는 import 비용이 크므로(수백 ms) AWS API를 처음 호출할 때 import한다.
+"""
 
 from __future__ import annotations
 
+import threading
+from collections.abc import Callable
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from functools import lru_cache
 
-import boto3
-from botocore.exceptions import (
-    BotoCoreError,
-    ClientError,
-    NoCredentialsError,
-    TokenRetrievalError,
-)
+# boto3 기본 세션은 스레드 안전하지 않으므로 클라이언트 생성은 직렬화한다
+# (생성된 클라이언트는 스레드 간 공유 가능)
+_client_lock = threading.Lock()
 
 
 class AwsAuthError(Exception):
@@ -25,7 +27,10 @@ class Route53ApiError(Exception):
 @lru_cache
 def get_route53_client():
     """Route53 클라이언트 반환."""
-    return boto3.client("route53")
+    import boto3
+
+    with _client_lock:
+        return boto3.client("route53")
 
 
 def validate_credentials() -> None:
@@ -34,8 +39,17 @@ def validate_credentials() -> None:
     Raises:
         AwsAuthError: 자격증명이 없거나 만료된 경우
     """
+    import boto3
+    from botocore.exceptions import (
+        BotoCoreError,
+        ClientError,
+        NoCredentialsError,
+        TokenRetrievalError,
+    )
+
     try:
-        sts = boto3.client("sts")
+        with _client_lock:
+            sts = boto3.client("sts")
         sts.get_caller_identity()
     except NoCredentialsError as e:
         raise AwsAuthError(
@@ -60,57 +74,80 @@ class WeightedRecord:
     weight: int
     record_type: str  # A, CNAME, ALIAS
     values: list[str] = field(default_factory=list)
+    # 라우팅 정책 (weighted, latency:<리전>, geo:<위치>, failover:<역할> 등)
+    policy: str = "weighted"
 
 
-def get_weighted_records(zone_id: str, record_name: str) -> list[WeightedRecord]:
-    """해당 record_name의 Weighted 레코드 목록을 조회한다.
+def _routing_policy(rrs: dict) -> str:
+    """ResourceRecordSet의 라우팅 정책 설명."""
+    if rrs.get("Weight") is not None:
+        return "weighted"
+    if "Region" in rrs:
+        return f"latency:{rrs['Region']}"
+    if "GeoLocation" in rrs:
+        geo = rrs["GeoLocation"]
+        if "SubdivisionCode" in geo:
+            return f"geo:{geo.get('CountryCode', '')}-{geo['SubdivisionCode']}"
+        if "CountryCode" in geo:
+            return f"geo:{geo['CountryCode']}"
+        return f"geo:continent-{geo.get('ContinentCode', '?')}"
+    if "GeoProximityLocation" in rrs:
+        loc = rrs["GeoProximityLocation"]
+        where = loc.get("AWSRegion") or loc.get("LocalZoneGroup") or "coordinates"
+        return f"geoproximity:{where}"
+    if "Failover" in rrs:
+        return f"failover:{rrs['Failover']}"
+    if "CidrRoutingConfig" in rrs:
+        return f"cidr:{rrs['CidrRoutingConfig'].get('LocationName', '?')}"
+    if rrs.get("MultiValueAnswer"):
+        return "multivalue"
+    return "unknown"
 
-    Raises:
-        AwsAuthError: 자격증명 문제
-        Route53ApiError: API 호출 실패
-    """
-    try:
-        client = get_route53_client()
 
-        # record_name을 FQDN으로 정규화
-        fqdn = record_name if record_name.endswith(".") else record_name + "."
+def _parse_routed(rrs: dict) -> WeightedRecord | None:
+    """SetIdentifier가 있는 ResourceRecordSet(라우팅 정책 무관)을 WeightedRecord로 변환한다.
 
-        paginator = client.get_paginator("list_resource_record_sets")
-        records: list[WeightedRecord] = []
+    가중치 레코드가 아니면 weight는 0이다.
+    """
+    if rrs.get("SetIdentifier") is None:
+        return None
 
-        for page in paginator.paginate(
-            HostedZoneId=zone_id,
-            StartRecordName=fqdn,
-            StartRecordType="A",
-        ):
-            for rrs in page["ResourceRecordSets"]:
-                # 이름이 다르면 중단
-                if rrs["Name"] != fqdn:
-                    break
+    record_type = rrs["Type"]
+    values: list[str] = []
+    if "AliasTarget" in rrs:
+        values.append(rrs["AliasTarget"]["DNSName"].rstrip("."))
+        record_type = "ALIAS"
+    elif "ResourceRecords" in rrs:
+        values = [r["Value"] for r in rrs["ResourceRecords"]]
 
-                # Weighted 레코드만 필터
-                if rrs.get("SetIdentifier") is None or rrs.get("Weight") is None:
-                    continue
+    return WeightedRecord(
+        set_identifier=rrs["SetIdentifier"],
+        weight=rrs.get("Weight") or 0,
+        record_type=record_type,
+        values=values,
+        policy=_routing_policy(rrs),
+    )
 
-                record_type = rrs["Type"]
-                values: list[str] = []
 
-                if "AliasTarget" in rrs:
-                    values.append(rrs["AliasTarget"]["DNSName"].rstrip("."))
-                    record_type = "ALIAS"
-                elif "ResourceRecords" in rrs:
-                    values = [r["Value"] for r in rrs["ResourceRecords"]]
+def _parse_weighted(rrs: dict) -> WeightedRecord | None:
+    """ResourceRecordSet이 Weighted 레코드이면 WeightedRecord로 변환한다."""
+    if rrs.get("Weight") is None:
+        return None
+    return _parse_routed(rrs)
 
-                records.append(
-                    WeightedRecord(
-                        set_identifier=rrs["SetIdentifier"],
-                        weight=rrs["Weight"],
-                        record_type=record_type,
-                        values=values,
-                    )
-                )
 
-        return records
+@contextmanager
+def _route53_errors(zone_id: str):
+    """boto3 예외를 AwsAuthError / Route53ApiError로 변환한다."""
+    from botocore.exceptions import (
+        BotoCoreError,
+        ClientError,
+        NoCredentialsError,
+        TokenRetrievalError,
+    )
+
+    try:
+        yield
     except (NoCredentialsError, TokenRetrievalError) as e:
         raise AwsAuthError(
             "AWS 자격증명을 찾을 수 없거나 만료되었습니다. "
@@ -130,6 +167,109 @@ def get_weighted_records(zone_id: str, record_name: str) -> list[WeightedRecord]
         raise AwsAuthError(f"AWS 자격증명 확인 실패: {e}") from e
 
 
+def _fqdn(name: str) -> str:
+    """Route53 응답과 비교할 수 있도록 이름을 정규화한다 (소문자, 끝에 '.', '*' 이스케이프)."""
+    name = name.lower().replace("*", "\\052")
+    return name if name.endswith(".") else name + "."
+
+
+def _route53_order(fqdn: str) -> tuple[str, ...]:
+    """ListResourceRecordSets 정렬 순서 키 (라벨을 뒤집은 순서)."""
+    return tuple(reversed(fqdn.rstrip(".").split(".")))
+
+
+def get_weighted_records(zone_id: str, record_name: str) -> list[WeightedRecord]:
+    """해당 record_name의 Weighted 레코드 목록을 조회한다.
+
+    Raises:
+        AwsAuthError: 자격증명 문제
+        Route53ApiError: API 호출 실패
+    """
+    return _list_records(zone_id, record_name, _parse_weighted)
+
+
+def get_routed_records(zone_id: str, record_name: str) -> list[WeightedRecord]:
+    """해당 record_name의 SetIdentifier 레코드를 라우팅 정책과 무관하게 모두 조회한다.
+
+    가중치 / 지연 시간 / 지리적 위치 / 장애 조치 레코드가 섞인 이름의 응답을
+    SetIdentifier로 분류할 때 사용한다.
+
+    Raises:
+        AwsAuthError: 자격증명 문제
+        Route53ApiError: API 호출 실패
+    """
+    return _list_records(zone_id, record_name, _parse_routed)
+
+
+def _list_records(
+    zone_id: str, record_name: str, parse: Callable[[dict], WeightedRecord | None]
+) -> list[WeightedRecord]:
+    """record_name의 ResourceRecordSet 중 parse가 변환한 레코드 목록."""
+    with _route53_errors(zone_id):
+        client = get_route53_client()
+
+        # record_name을 FQDN으로 정규화
+        fqdn = _fqdn(record_name)
+
+        paginator = client.get_paginator("list_resource_record_sets")
+        records: list[WeightedRecord] = []
+
+        for page in paginator.paginate(
+            HostedZoneId=zone_id,
+            StartRecordName=fqdn,
+            StartRecordType="A",
+        ):
+            for rrs in page["ResourceRecordSets"]:
+                # 이름이 다르면 이후 레코드는 모두 다른 이름이므로 페이지네이션도 중단
+                if rrs["Name"].lower() != fqdn:
+                    return records
+                record = parse(rrs)
+                if record is not None:
+                    records.append(record)
+
+        return records
+
+
+def get_zone_weighted_records(
+    zone_id: str, record_names: list[str]
+) -> dict[str, list[WeightedRecord]]:
+    """Hosted Zone 하나에서 여러 record_name의 Weighted 레코드를 한 번에 조회한다.
+
+    레코드마다 API를 호출하지 않고, 요청한 이름 중 정렬 순서상 첫 이름부터 마지막 이름까지
+    한 번의 페이지네이션으로 훑는다.
+
+    Returns:
+        record_name(입력 그대로) → Weighted 레코드 목록. 레코드가 없는 이름은 빈 리스트.
+
+    Raises:
+        AwsAuthError: 자격증명 문제
+        Route53ApiError: API 호출 실패
+    """
+    by_fqdn = {_fqdn(name): name for name in record_names}
+    result: dict[str, list[WeightedRecord]] = {name: [] for name in record_names}
+    if not by_fqdn:
+        return result
+    ordered = sorted(by_fqdn, key=_route53_order)
+    last = _route53_order(ordered[-1])
+
+    with _route53_errors(zone_id):
+        client = get_route53_client()
+        paginator = client.get_paginator("list_resource_record_sets")
+        for page in paginator.paginate(HostedZoneId=zone_id, StartRecordName=ordered[0]):
+            for rrs in page["ResourceRecordSets"]:
+                name = rrs["Name"].lower()
+                # 마지막 대상 이름 이후의 레코드만 남았으면 페이지네이션 중단
+                if _route53_order(name) > last:
+                    return result
+                target = by_fqdn.get(name)
+                if target is None:
+                    continue
+                record = _parse_weighted(rrs)
+                if record is not None:
+                    result[target].append(record)
+    return result
+
+
 def get_zone_nameservers(zone_id: str) -> list[str]:
     """Hosted Zone의 NS 레코드를 조회한다.
 
@@ -137,25 +277,12 @@ def get_zone_nameservers(zone_id: str) -> list[str]:
         AwsAuthError: 자격증명 문제
         Route53ApiError: API 호출 실패
     """
-    try:
+    with _route53_errors(zone_id):
         client = get_route53_client()
         resp = client.get_hosted_zone(Id=zone_id)
         delegation_set = resp.get("DelegationSet", {})
         nameservers = delegation_set.get("NameServers", [])
         return nameservers
-    except (NoCredentialsError, TokenRetrievalError) as e:
-        raise AwsAuthError(
-            "AWS 자격증명을 찾을 수 없거나 만료되었습니다. "
-            "'aws configure' 또는 'aws sso login'을 실행하세요."
-        ) from e
-    except ClientError as e:
-        code = e.response.get("Error", {}).get("Code", "")
-        msg = e.response.get("Error", {}).get("Message", str(e))
-        if code in ("ExpiredToken", "ExpiredTokenException", "InvalidClientTokenId"):
-            raise AwsAuthError(f"AWS 토큰 만료 ({code}). 재인증하세요.") from e
-        raise Route53ApiError(f"Route53 API 오류 ({code}): {msg}") from e
-    except BotoCoreError as e:
-        raise AwsAuthError(f"AWS 자격증명 확인 실패: {e}") from e
 
 
 def build_value_to_identifier_map(
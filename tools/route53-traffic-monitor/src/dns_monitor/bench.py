@@ -0,0 +1,265 @@
+"""로컬 stub 권한 DNS 서버 대상 부하 시뮬레이션 / 벤치마크 모듈.
+
+AWS 없이 TrafficSender(watch)와 PropagationProber(propagation)를 StubAuthoritativeServer에
+붙여 일정 시간 실행하고 다음을 측정한다.
+
+- 달성 TPS: stub이 받은 질의 수 / 실행 시간 (목표 TPS와 비교하여 스케줄 지연 확인).
+  손실된 질의는 타임아웃 전에 실행이 끝나면 완료 probe에 잡히지 않으므로 송신 기준으로 센다
+- probe당 CPU: 프로세스 CPU 시간에서 stub 처리 시간을 뺀 값 / 질의 수 (hot path 회귀 감지)
+- 분포 검증: 측정 분포가 설정 가중치와 통계적으로 일치하는지(χ² 적합도 검정)와, 분류
+  결과가 stub이 실제로 응답한 레코드별 수를 넘지 않는지(오분류 없음). 수렴 판정
+  (신뢰구간이 허용 오차 안)은 표본 수가 충분해야 하므로 참고용으로만 기록한다
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import asdict, dataclass, field
+
+from .aws import WeightedRecord
+from .config import MonitorConfig
+from .convergence import DEFAULT_CONFIDENCE, DEFAULT_TOLERANCE, evaluate_convergence
+from .propagation import PropagationConfig, PropagationProber, PropagationResolver
+from .resolver import WeightedResolver
+from .sender import TrafficSender
+from .stats import PropagationStats, Stats
+from .stub import StubAuthoritativeServer
+from .udp import AsyncDnsClient
+
+BENCH_RECORD_NAME = "bench.dnsmon.test"
+STUB_HOST = "127.0.0.1"
+BENCH_MODES = ("watch", "propagation")
+
+DEFAULT_BENCH_RECORDS = [
+    WeightedRecord(set_identifier="blue", weight=70, record_type="A", values=["192.0.2.10"]),
+    WeightedRecord(set_identifier="green", weight=20, record_type="A", values=["192.0.2.20"]),
+    WeightedRecord(set_identifier="canary", weight=10, record_type="A", values=["192.0.2.30"]),
+]
+
+
+@dataclass
+class BenchResult:
+    """벤치마크 1회 실행 결과."""
+
+    mode: str  # watch, propagation
+    target_tps: int
+    duration: float
+    # 완료된 probe 수 (응답 / 에러 집계)
+    probes: int
+    errors: int
+    achieved_tps: float
+    # 프로세스 CPU 시간(stub 처리 시간 제외) / stub이 받은 질의 수
+    cpu_per_probe_us: float
+    stub_queries: int
+    stub_dropped: int
+    # SetIdentifier → 측정 / stub 응답 수
+    measured: dict[str, int] = field(default_factory=dict)
+    served: dict[str, int] = field(default_factory=dict)
+    confidence: float = DEFAULT_CONFIDENCE
+    converged: bool = False
+    max_error: float = 0.0
+    p_value: float | None = None
+
+    @property
+    def misclassified(self) -> int:
+        """stub이 응답한 수보다 많이 집계된 SetIdentifier의 초과분 합 (0이어야 정상)."""
+        return sum(max(0, count - self.served.get(sid, 0)) for sid, count in self.measured.items())
+
+    @property
+    def distribution_ok(self) -> bool:
+        """χ² 적합도 검정에서 설정 가중치와 다르다고 볼 수 없으면 True."""
+        return self.p_value is None or self.p_value >= 1 - self.confidence
+
+    @property
+    def passed(self) -> bool:
+        """probe가 1건 이상이고, 분포가 가중치와 일치하며 오분류가 없으면 통과."""
+        return self.probes > 0 and self.distribution_ok and self.misclassified == 0
+
+    def to_dict(self) -> dict:
+        """JSON 기록용 dict (판정 결과 포함)."""
+        return asdict(self) | {
+            "misclassified": self.misclassified,
+            "distribution_ok": self.distribution_ok,
+            "passed": self.passed,
+        }
+
+
+@dataclass
+class _Measurement:
+    wall: float
+    cpu: float
+    stub_busy: float
+
+
+async def _measure(stub: StubAuthoritativeServer, duration: float, stop) -> _Measurement:
+    """duration초 동안 실행한 뒤 stop()을 호출하고 wall / CPU / stub 처리 시간을 반환한다."""
+    wall0, cpu0, busy0 = time.perf_counter(), time.process_time(), stub.stats.busy_seconds
+    await asyncio.sleep(duration)
+    stop()
+    return _Measurement(
+        wall=time.perf_counter() - wall0,
+        cpu=time.process_time() - cpu0,
+        stub_busy=stub.stats.busy_seconds - busy0,
+    )
+
+
+def _result(
+    mode: str,
+    target_tps: int,
+    measurement: _Measurement,
+    probes: int,
+    errors: int,
+    stub: StubAuthoritativeServer,
+    measured: dict[str, int],
+    records: list[WeightedRecord],
+    tolerance: float,
+    confidence: float,
+) -> BenchResult:
+    report = evaluate_convergence(measured, records, tolerance=tolerance, confidence=confidence)
+    cpu = max(0.0, measurement.cpu - measurement.stub_busy)
+    sent = stub.stats.queries
+    return BenchResult(
+        mode=mode,
+        target_tps=target_tps,
+        duration=measurement.wall,
+        probes=probes,
+        errors=errors,
+        achieved_tps=sent / measurement.wall if measurement.wall > 0 else 0.0,
+        cpu_per_probe_us=cpu / sent * 1e6 if sent else 0.0,
+        stub_queries=sent,
+        stub_dropped=stub.stats.dropped,
+        measured=dict(measured),
+        served=dict(stub.stats.served),
+        confidence=confidence,
+        converged=report.converged,
+        max_error=max((abs(s.observed - s.expected) for s in report.shares), default=0.0),
+        p_value=report.p_value,
+    )
+
+
+async def bench_watch(
+    records: list[WeightedRecord] | None = None,
+    tps: int = 100,
+    senders: int = 1,
+    duration: float = 5.0,
+    latency: float = 0.0,
+    jitter: float = 0.0,
+    loss: float = 0.0,
+    seed: int = 0,
+    tolerance: float = DEFAULT_TOLERANCE,
+    confidence: float = DEFAULT_CONFIDENCE,
+) -> BenchResult:
+    """TrafficSender senders개(각 tps)를 stub 서버에 붙여 duration초 동안 실행한다.
+
+    모든 sender는 하나의 Stats와 하나의 UDP 소켓(AsyncDnsClient)을 공유한다 (watch-many와 동일).
+    """
+    records = records or DEFAULT_BENCH_RECORDS
+    stub = StubAuthoritativeServer(
+        BENCH_RECORD_NAME, records, latency=latency, jitter=jitter, loss=loss, seed=seed
+    )
+    port = await stub.start(STUB_HOST)
+    stats = Stats()
+    config = MonitorConfig(
+        endpoint=f"https://{BENCH_RECORD_NAME}",
+        hosted_zone_id="STUB",
+        record_name=BENCH_RECORD_NAME,
+        tps=tps,
+        http_enabled=False,
+    )
+    async with stub, AsyncDnsClient(port=port) as client:
+        resolver = WeightedResolver(
+            [STUB_HOST], BENCH_RECORD_NAME, records[0].record_type, ns_ips=[STUB_HOST]
+        )
+        # 지연 import(dnspython) / 소켓 생성을 측정 구간 밖에서 끝낸다
+        await resolver.query_async(client, STUB_HOST)
+        stub.reset_stats()
+        sender_list = [
+            TrafficSender(config, stats, records, resolver, dns_client=client)
+            for _ in range(senders)
+        ]
+        tasks = [asyncio.create_task(s.run()) for s in sender_list]
+
+        def stop() -> None:
+            for s in sender_list:
+                s.stop()
+
+        measurement = await _measure(stub, duration, stop)
+        for t in tasks:
+            t.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    snapshot = stats.get_snapshot()
+    return _result(
+        "watch",
+        tps * senders,
+        measurement,
+        snapshot.total_requests,
+        snapshot.errors,
+        stub,
+        snapshot.distribution,
+        records,
+        tolerance,
+        confidence,
+    )
+
+
+async def bench_propagation(
+    records: list[WeightedRecord] | None = None,
+    tps: int = 100,
+    resolvers: int = 1,
+    duration: float = 5.0,
+    latency: float = 0.0,
+    jitter: float = 0.0,
+    loss: float = 0.0,
+    seed: int = 0,
+    tolerance: float = DEFAULT_TOLERANCE,
+    confidence: float = DEFAULT_CONFIDENCE,
+) -> BenchResult:
+    """PropagationProber를 stub 서버에 붙여 duration초 동안 실행한다.
+
+    stub 서버 하나를 resolvers개의 리졸버 라벨로 등록하여 리졸버별 루프 수를 늘린다.
+    TTL 기반 스케줄은 끄고 항상 TPS 간격으로 질의한다. 분포는 응답 값을 레코드의 첫 번째
+    값으로 SetIdentifier에 대응시켜 집계하므로, 레코드마다 서로 다른 값을 가져야 한다.
+    """
+    records = records or DEFAULT_BENCH_RECORDS
+    first_values = [r.values[0] if r.values else None for r in records]
+    if None in first_values or len(set(first_values)) != len(records):
+        raise ValueError("propagation 벤치마크는 레코드마다 서로 다른 값이 필요합니다.")
+    stub = StubAuthoritativeServer(
+        BENCH_RECORD_NAME, records, latency=latency, jitter=jitter, loss=loss, seed=seed
+    )
+    port = await stub.start(STUB_HOST)
+    stats = PropagationStats()
+    config = PropagationConfig(
+        record_name=BENCH_RECORD_NAME,
+        resolvers=[(STUB_HOST, f"stub-{i + 1}") for i in range(resolvers)],
+        tps=tps,
+        record_type=records[0].record_type,
+        ttl_aware=False,
+    )
+    async with stub, AsyncDnsClient(port=port) as client:
+        resolver = PropagationResolver(BENCH_RECORD_NAME, config.record_type)
+        await resolver.query_async(client, STUB_HOST)
+        stub.reset_stats()
+        prober = PropagationProber(config, stats, resolver, dns_client=client)
+        task = asyncio.create_task(prober.run())
+        measurement = await _measure(stub, duration, prober.stop)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+    snapshot = stats.get_snapshot()
+    overall = {value.rstrip(".").lower(): n for value, n in snapshot.overall_distribution.items()}
+    measured = {r.set_identifier: overall.get(r.values[0].rstrip(".").lower(), 0) for r in records}
+    return _result(
+        "propagation",
+        tps * resolvers,
+        measurement,
+        snapshot.probes_sent,
+        snapshot.errors,
+        stub,
+        measured,
+        records,
+        tolerance,
+        confidence,
+    )
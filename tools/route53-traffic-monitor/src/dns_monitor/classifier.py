@@ -0,0 +1,74 @@
+"""DNS 응답 → SetIdentifier 분류 모듈.
+
+가중치 레코드와 ALIAS 해석 결과로부터 응답 인덱스를 한 번만 구성하고,
+probe마다 dict 조회만으로 응답을 분류한다.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from .aws import WeightedRecord, build_value_to_identifier_map
+from .resolver import AliasResolution
+
+DEFAULT_CACHE_SIZE = 4096
+
+
+class AnswerClassifier:
+    """DNS 응답 값 목록을 SetIdentifier로 분류한다.
+
+    매칭 우선순위 (TrafficSender 기존 규칙과 동일):
+    1. 첫 번째 값이 A/CNAME 레코드 값과 일치
+    2. 응답 IP 집합이 ALIAS 대상 IP 집합과 일치 (겹침에 강건)
+    3. 첫 번째 IP가 ALIAS 대상 IP 중 하나와 일치 (fallback)
+
+    단일 값 응답은 위 규칙을 미리 적용한 인덱스로 바로 조회한다. 여러 값 응답은
+    순서와 무관한 2번 규칙 결과만 정렬한 tuple을 키로 캐시하므로, 리졸버가 레코드 순서를
+    돌려 응답해도 같은 집합은 한 번만 저장된다. 1, 3번 규칙은 첫 번째 값 조회로 처리한다.
+    캐시는 크기 상한에 도달하면 비운다.
+    """
+
+    def __init__(
+        self,
+        records: list[WeightedRecord],
+        alias_resolution: AliasResolution | None = None,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+    ):
+        alias = alias_resolution or AliasResolution()
+        self._value_map = build_value_to_identifier_map(records)
+        self._ip_set_map = dict(alias.ip_set_map)
+        self._ip_map = dict(alias.ip_map)
+        self._cache_size = cache_size
+        self._cache: dict[tuple[str, ...], str | None] = {}
+
+        # 단일 값 응답 인덱스: 우선순위가 낮은 규칙부터 채우고 높은 규칙으로 덮어쓴다
+        single: dict[str, str] = dict(self._ip_map)
+        for ip_set, sid in self._ip_set_map.items():
+            if len(ip_set) == 1:
+                single[next(iter(ip_set))] = sid
+        single.update(self._value_map)
+        self._single = single
+
+    def classify(self, answer: Sequence[str]) -> str | None:
+        """응답 값 목록에 해당하는 SetIdentifier를 반환한다. 매칭 실패 시 None."""
+        if len(answer) == 1:
+            return self._single.get(answer[0])
+        if not answer:
+            return None
+
+        first = answer[0]
+        sid = self._value_map.get(first)
+        if sid is not None:
+            return sid
+
+        key = tuple(sorted(answer))
+        try:
+            sid = self._cache[key]
+        except KeyError:
+            sid = self._ip_set_map.get(frozenset(key))
+            if len(self._cache) >= self._cache_size:
+                self._cache.clear()
+            self._cache[key] = sid
+        if sid is not None:
+            return sid
+        return self._ip_map.get(first)
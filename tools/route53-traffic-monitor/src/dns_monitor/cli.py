@@ -3,32 +3,102 @@
 from __future__ import annotations
 
 import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 from typing import Annotated
 
 import typer
 from rich.console import Console
+from rich.table import Table
 
 from . import __version__
 from .aws import (
     AwsAuthError,
     Route53ApiError,
     WeightedRecord,
+    get_routed_records,
     get_weighted_records,
     get_zone_nameservers,
+    get_zone_weighted_records,
     validate_credentials,
 )
-from .config import build_config
-from .display import run_display, run_propagation_display
+from .bench import BENCH_MODES, BenchResult, bench_propagation, bench_watch
+from .classifier import AnswerClassifier
+from .completion import (
+    DEFAULT_CONFIRM,
+    PropagationTracker,
+    propagated_count,
+    unreachable_count,
+)
+from .config import DEFAULT_METRICS_PORT, MonitorConfig, build_config
+from .convergence import (
+    DEFAULT_CONFIDENCE,
+    DEFAULT_TOLERANCE,
+    ConvergenceReport,
+    evaluate_convergence,
+    seconds_to_converge,
+    wait_for_convergence,
+)
+from .display import (
+    build_ecs_matrix,
+    render_dashboard,
+    render_multi_dashboard,
+    run_display,
+    run_multi_display,
+    run_propagation_display,
+)
+from .ecs import (
+    DEFAULT_CONCURRENCY,
+    DEFAULT_QUERIES_PER_SUBNET,
+    dedupe_subnets,
+    load_subnets,
+    parse_subnet,
+    sweep_subnets,
+)
+from .metrics import (
+    MetricsServer,
+    render_multi_watch_metrics,
+    render_propagation_metrics,
+    render_watch_metrics,
+)
+from .multi import (
+    RecordWatch,
+    WatchTarget,
+    group_by_zone,
+    load_targets,
+    make_watch,
+    parse_targets,
+    wait_for_all_convergence,
+    zone_refreshers,
+)
 from .propagation import (
+    DEFAULT_MAX_INTERVAL,
     DEFAULT_RESOLVERS,
     PropagationConfig,
     PropagationProber,
     PropagationResolver,
+    check_resolvers,
+    is_answering,
+    load_resolvers,
+    wait_for_propagation,
+)
+from .refresh import AliasRefresher, Route53Refresher
+from .resolver import (
+    RCODE_NO_RESPONSE,
+    AliasResolution,
+    WeightedResolver,
+    resolve_alias_targets,
+    resolve_nameserver_ips,
 )
-from .resolver import AliasResolution, WeightedResolver, resolve_alias_targets
-from .sender import TrafficSender, poll_route53
-from .stats import PropagationStats, Stats
+from .samplelog import SampleLogHeader, SampleLogWriter, records_at
+from .samplelog import replay as replay_sample_log
+from .sender import TrafficSender
+from .startup import StartupProfile, run_concurrently
+from .stats import PropagationStats, Stats, StatsSnapshot
+from .timeline import TIMELINE_FORMATS, build_timeline, write_timeline
+from .udp import AsyncDnsClient
 
 app = typer.Typer(
     name="dnsmon",
@@ -37,6 +107,9 @@ app = typer.Typer(
 )
 console = Console()
 
+# 수렴 확인에 이보다 오래 걸리는 tolerance / TPS 조합이면 경고한다
+CONVERGENCE_WARN_SECONDS = 600
+
 
 def version_callback(value: bool):
     if value:
@@ -76,6 +149,70 @@ def watch(
         bool,
         typer.Option("--no-http", help="HTTP 트래픽 생성 비활성화"),
     ] = False,
+    insecure: Annotated[
+        bool,
+        typer.Option(
+            "--insecure",
+            "--no-verify",
+            help="HTTP probe의 TLS 인증서 검증 생략 (자체 서명 / 사설 CA endpoint)",
+        ),
+    ] = False,
+    auto_stop: Annotated[
+        bool,
+        typer.Option("--auto-stop", help="분포가 설정 가중치에 수렴하면 자동 종료"),
+    ] = False,
+    tolerance: Annotated[
+        float | None,
+        typer.Option("--tolerance", help="수렴 판정 허용 오차 (비율, 기본: 0.02)"),
+    ] = None,
+    confidence: Annotated[
+        float | None,
+        typer.Option("--confidence", help="수렴 판정 신뢰수준 (기본: 0.95)"),
+    ] = None,
+    timeline: Annotated[
+        Path | None,
+        typer.Option(
+            "--timeline",
+            help="종료 시 초 단위 분포/가중치 변경 수렴 타임라인 저장 (.csv 또는 .jsonl)",
+        ),
+    ] = None,
+    ns_schedule: Annotated[
+        str | None,
+        typer.Option(
+            "--ns-schedule",
+            help="권한 NS 질의 스케줄 (round-robin: 단일 루프 순환, per-ns: NS별 독립 루프)",
+        ),
+    ] = None,
+    sample_log: Annotated[
+        Path | None,
+        typer.Option(
+            "--sample-log",
+            help="probe 샘플을 바이너리 로그로 저장 (dnsmon replay로 오프라인 분석)",
+        ),
+    ] = None,
+    overwrite: Annotated[
+        bool,
+        typer.Option("--overwrite", help="--sample-log 파일이 이미 있으면 덮어쓰기"),
+    ] = False,
+    headless: Annotated[
+        bool,
+        typer.Option("--headless", help="대시보드 없이 실행 (metrics 엔드포인트로만 관측)"),
+    ] = False,
+    metrics_host: Annotated[
+        str | None,
+        typer.Option("--metrics-host", help="metrics 엔드포인트 바인딩 주소 (기본: 127.0.0.1)"),
+    ] = None,
+    metrics_port: Annotated[
+        int | None,
+        typer.Option(
+            "--metrics-port",
+            help=f"Prometheus metrics 엔드포인트 포트 (--headless 기본: {DEFAULT_METRICS_PORT})",
+        ),
+    ] = None,
+    profile_startup: Annotated[
+        bool,
+        typer.Option("--profile-startup", help="시작 준비 단계별 소요 시간 출력"),
+    ] = False,
     config_file: Annotated[
         Path | None,
         typer.Option("--config", "-c", help="TOML 설정 파일 경로"),
@@ -93,6 +230,14 @@ def watch(
             record_name=record_name,
             tps=tps,
             no_http=no_http,
+            insecure=insecure,
+            auto_stop=auto_stop,
+            tolerance=tolerance,
+            confidence=confidence,
+            ns_schedule=ns_schedule,
+            headless=headless,
+            metrics_host=metrics_host,
+            metrics_port=metrics_port,
             config_file=config_file,
             env_file=env_file,
         )
@@ -100,29 +245,49 @@ def watch(
         console.print(f"[red]설정 오류: {e}[/red]")
         raise typer.Exit(1) from e
 
+    if timeline is not None and timeline.suffix.lower() not in TIMELINE_FORMATS:
+        console.print("[red]설정 오류: --timeline 파일은 .csv 또는 .jsonl 이어야 합니다.[/red]")
+        raise typer.Exit(1)
+    if sample_log is not None and sample_log.exists() and not overwrite:
+        console.print(
+            f"[red]설정 오류: 샘플 로그 파일이 이미 있습니다: {sample_log} "
+            "(덮어쓰려면 --overwrite)[/red]"
+        )
+        raise typer.Exit(1)
+
     console.print(f"[bold green]대상: {cfg.record_name}[/bold green]")
     console.print(
         f"[dim]Zone: {cfg.hosted_zone_id} | TPS: {cfg.tps} | HTTP: {cfg.http_enabled}[/dim]"
     )
+    if cfg.http_enabled and not cfg.http_verify:
+        console.print("[yellow]HTTP probe의 TLS 인증서 검증을 생략합니다 (--insecure).[/yellow]")
+    if cfg.auto_stop:
+        console.print(
+            f"[dim]Auto-stop: ±{cfg.tolerance * 100:.1f}% @ {cfg.confidence * 100:.0f}% 신뢰수준[/dim]"
+        )
 
-    # AWS 자격증명 사전 검증
-    with console.status("[bold green]AWS 자격증명 확인 중..."):
-        try:
-            validate_credentials()
-        except AwsAuthError as e:
-            console.print(f"[red]AWS 인증 오류: {e}[/red]")
-            raise typer.Exit(1) from e
-
-    # Route53 가중치 레코드 조회
-    with console.status("[bold green]Route53 가중치 레코드 조회 중..."):
+    # 서로 독립적인 사전 조회(자격증명 검증 / 가중치 레코드 / NS)는 동시에 실행한다
+    profile = StartupProfile()
+    with console.status("[bold green]AWS 자격증명 확인 / Route53 레코드 및 NS 조회 중..."):
         try:
-            records = get_weighted_records(cfg.hosted_zone_id, cfg.record_name)
+            preflight = run_concurrently(
+                {
+                    "자격증명 검증": validate_credentials,
+                    "가중치 레코드 조회": partial(
+                        get_weighted_records, cfg.hosted_zone_id, cfg.record_name
+                    ),
+                    "Hosted Zone NS 조회": partial(get_zone_nameservers, cfg.hosted_zone_id),
+                },
+                profile,
+            )
         except AwsAuthError as e:
             console.print(f"[red]AWS 인증 오류: {e}[/red]")
             raise typer.Exit(1) from e
         except Route53ApiError as e:
             console.print(f"[red]Route53 API 오류: {e}[/red]")
             raise typer.Exit(1) from e
+    records: list[WeightedRecord] = preflight["가중치 레코드 조회"]
+    nameservers: list[str] = preflight["Hosted Zone NS 조회"]
 
     if not records:
         console.print("[red]가중치 레코드를 찾을 수 없습니다.[/red]")
@@ -136,33 +301,33 @@ def watch(
         console.print(
             f"  [cyan]{rec.set_identifier}[/cyan]: weight={rec.weight}, type={rec.record_type}"
         )
+    if cfg.auto_stop or timeline is not None:
+        _warn_slow_convergence(cfg.tolerance, cfg.confidence, cfg.tps, len(records))
 
-    # NS 조회
-    with console.status("[bold green]Hosted Zone NS 조회 중..."):
-        try:
-            nameservers = get_zone_nameservers(cfg.hosted_zone_id)
-        except AwsAuthError as e:
-            console.print(f"[red]AWS 인증 오류: {e}[/red]")
-            raise typer.Exit(1) from e
-        except Route53ApiError as e:
-            console.print(f"[red]NS 조회 실패: {e}[/red]")
-            raise typer.Exit(1) from e
+    # 권한 NS IP 해석과 ALIAS 대상 해석은 동시에 실행한다
+    has_alias = any(r.record_type == "ALIAS" for r in records)
+    steps = {"권한 NS IP 해석": partial(resolve_nameserver_ips, nameservers)}
+    if has_alias:
+        steps["ALIAS 대상 IP 해석"] = partial(resolve_alias_targets, records)
+    with console.status("[bold green]권한 NS / ALIAS 대상 IP 해석 중..."):
+        resolved = run_concurrently(steps, profile)
+    alias_resolution: AliasResolution = resolved.get("ALIAS 대상 IP 해석", AliasResolution())
 
     # DNS Resolver 초기화
     record_type = records[0].record_type
     try:
-        resolver = WeightedResolver(nameservers, cfg.record_name, record_type)
+        resolver = WeightedResolver(
+            nameservers, cfg.record_name, record_type, ns_ips=resolved["권한 NS IP 해석"]
+        )
     except ValueError as e:
         console.print(f"[red]DNS Resolver 초기화 실패: {e}[/red]")
         raise typer.Exit(1) from e
+    console.print(
+        f"[dim]권한 NS {len(resolver.nameserver_ips)}개 ({cfg.ns_schedule}): "
+        f"{', '.join(resolver.nameserver_ips)}[/dim]"
+    )
 
-    # ALIAS 레코드 해석
-    alias_resolution = AliasResolution()
-    has_alias = any(r.record_type == "ALIAS" for r in records)
     if has_alias:
-        with console.status("[bold green]ALIAS 대상 IP 해석 중..."):
-            alias_resolution = resolve_alias_targets(records)
-
         console.print("[bold]ALIAS 대상 해석 결과:[/bold]")
         for sid, target in alias_resolution.targets.items():
             ips_str = ", ".join(target.ips) if target.ips else "[red]해석 실패[/red]"
@@ -183,30 +348,19 @@ def watch(
             )
             raise typer.Exit(1)
 
-    # 시작 전 권한 NS 테스트 조회 (10회)
+    # 시작 전 권한 NS 테스트 조회 (10회, 동시 전송 후 순서대로 출력)
     console.print("[bold]권한 NS 테스트 조회 (10회):[/bold]")
     test_hits: dict[str, int] = {}
     test_unknown: list[str] = []
-    from .aws import build_value_to_identifier_map
-
-    value_map = build_value_to_identifier_map(records)
-    for _ in range(10):
-        ips = resolver.resolve_once()
+    classifier = AnswerClassifier(records, alias_resolution)
+    with profile.phase("테스트 조회 10회"), ThreadPoolExecutor(max_workers=10) as pool:
+        test_answers = list(pool.map(lambda _: resolver.resolve_once(), range(10)))
+    for ips in test_answers:
         if not ips:
             test_unknown.append("(조회 실패)")
             continue
         ips_str = ", ".join(ips)
-        # 매핑 시도
-        matched = None
-        first_ip = ips[0]
-        if first_ip in value_map:
-            matched = value_map[first_ip]
-        elif has_alias:
-            ip_set = frozenset(ips)
-            if ip_set in alias_resolution.ip_set_map:
-                matched = alias_resolution.ip_set_map[ip_set]
-            elif first_ip in alias_resolution.ip_map:
-                matched = alias_resolution.ip_map[first_ip]
+        matched = classifier.classify(ips)
         if matched:
             test_hits[matched] = test_hits.get(matched, 0) + 1
             console.print(f"  [{ips_str}] → [cyan]{matched}[/cyan]")
@@ -220,37 +374,772 @@ def watch(
         console.print(f"  [yellow]매핑 실패 {len(test_unknown)}건[/yellow]")
         console.print("  [dim]권한 NS 응답 IP가 ALIAS 대상 해석 IP와 다를 수 있습니다.[/dim]")
 
+    if profile_startup:
+        _print_startup_profile(profile)
+
     console.print("[green]모니터링을 시작합니다...[/green]\n")
 
     # 비동기 이벤트 루프 실행
     stats = Stats()
+    log_writer: SampleLogWriter | None = None
+    if sample_log is not None:
+        try:
+            log_writer = SampleLogWriter(
+                sample_log,
+                SampleLogHeader(
+                    record_name=cfg.record_name,
+                    start_wall_time=stats.start_wall_time,
+                    records=records,
+                ),
+                overwrite=overwrite,
+            )
+        except FileExistsError as e:
+            # 시작 준비 중에 다른 실행이 같은 경로에 로그를 만든 경우
+            console.print(
+                f"[red]샘플 로그 파일이 이미 있습니다: {sample_log} (덮어쓰려면 --overwrite)[/red]"
+            )
+            raise typer.Exit(1) from e
+        except OSError as e:
+            console.print(f"[red]샘플 로그 파일을 열 수 없습니다: {e}[/red]")
+            raise typer.Exit(1) from e
+        stats.set_sample_log(log_writer)
     records_ref: list[list[WeightedRecord]] = [records]
     sender = TrafficSender(cfg, stats, records, resolver, alias_resolution)
 
-    async def _run():
+    async def _run() -> ConvergenceReport | None:
+        metrics_server: MetricsServer | None = None
+        if cfg.metrics_port is not None:
+            metrics_server = MetricsServer(
+                lambda: render_watch_metrics(cfg.record_name, records_ref[0], stats),
+                host=cfg.metrics_host,
+                port=cfg.metrics_port,
+            )
+            await _start_metrics_server(metrics_server, cfg.metrics_host)
+
         tasks = [
             asyncio.create_task(sender.run()),
-            asyncio.create_task(poll_route53(cfg, sender, records_ref)),
-            asyncio.create_task(run_display(cfg.record_name, records_ref, stats)),
+            asyncio.create_task(Route53Refresher(cfg, sender, stats, records_ref).run()),
+            asyncio.create_task(AliasRefresher(sender).run()),
         ]
+        if metrics_server is not None:
+            tasks.append(asyncio.create_task(metrics_server.run()))
+        if not cfg.headless:
+            tasks.append(
+                asyncio.create_task(
+                    run_display(
+                        cfg.record_name,
+                        records_ref,
+                        stats,
+                        tolerance=cfg.tolerance,
+                        confidence=cfg.confidence,
+                    )
+                )
+            )
+        convergence_task: asyncio.Task | None = None
+        if cfg.auto_stop:
+            convergence_task = asyncio.create_task(
+                wait_for_convergence(
+                    stats, records_ref, tolerance=cfg.tolerance, confidence=cfg.confidence
+                )
+            )
+            tasks.append(convergence_task)
         try:
-            await asyncio.gather(*tasks)
+            # 수렴 판정 태스크가 끝나면 나머지 태스크를 정리하고 종료
+            await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
         except asyncio.CancelledError:
             pass
+        finally:
+            sender.stop()
+            for t in tasks:
+                t.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        if convergence_task is not None and not convergence_task.cancelled():
+            return convergence_task.result()
+        return None
 
+    converged: ConvergenceReport | None = None
     try:
-        asyncio.run(_run())
+        converged = asyncio.run(_run())
     except KeyboardInterrupt:
         sender.stop()
-        # 최종 통계 출력
-        snapshot = stats.get_snapshot()
-        console.print("\n[bold]최종 통계[/bold]")
-        console.print(f"  총 요청: {snapshot.total_requests:,}")
-        console.print(f"  에러: {snapshot.errors}")
-        total = snapshot.total_requests - snapshot.errors
-        for sid, count in sorted(snapshot.distribution.items()):
-            ratio = count / total * 100 if total > 0 else 0
-            console.print(f"  [cyan]{sid}[/cyan]: {count:,} ({ratio:.1f}%)")
+    finally:
+        if log_writer is not None:
+            stats.set_sample_log(None)
+            log_writer.close()
+
+    # 최종 통계 출력
+    snapshot = stats.get_snapshot()
+    if converged is not None:
+        console.print(
+            f"\n[bold green]분포 수렴 완료 ({_format_elapsed(snapshot.elapsed_seconds)})[/bold green]"
+        )
+    _print_summary(
+        stats,
+        snapshot,
+        records_ref[0],
+        records,
+        tolerance=cfg.tolerance,
+        confidence=cfg.confidence,
+        timeline=timeline,
+        converged=converged,
+    )
+    if sample_log is not None:
+        console.print(f"  [dim]샘플 로그 저장: {sample_log}[/dim]")
+
+
+@app.command("watch-many")
+def watch_many(
+    record: Annotated[
+        list[str] | None,
+        typer.Option(
+            "--record",
+            "-r",
+            help="감시할 레코드 `[ZONE_ID:]이름` (여러 번 지정 가능, Zone 생략 시 --zone-id)",
+        ),
+    ] = None,
+    records_file: Annotated[
+        Path | None,
+        typer.Option("--records-file", help="감시할 레코드 목록 파일 (한 줄에 하나)"),
+    ] = None,
+    zone_id: Annotated[
+        str | None,
+        typer.Option("--zone-id", "-z", help="Zone을 생략한 레코드의 기본 Route53 Hosted Zone ID"),
+    ] = None,
+    tps: Annotated[
+        int,
+        typer.Option("--tps", "-t", help="레코드별 초당 DNS 조회 횟수"),
+    ] = 5,
+    ns_schedule: Annotated[
+        str,
+        typer.Option("--ns-schedule", help="권한 NS 질의 스케줄 (round-robin, per-ns)"),
+    ] = "round-robin",
+    auto_stop: Annotated[
+        bool,
+        typer.Option("--auto-stop", help="모든 레코드의 분포가 설정 가중치에 수렴하면 자동 종료"),
+    ] = False,
+    tolerance: Annotated[
+        float,
+        typer.Option("--tolerance", help="수렴 판정 허용 오차 (비율)"),
+    ] = DEFAULT_TOLERANCE,
+    confidence: Annotated[
+        float,
+        typer.Option("--confidence", help="수렴 판정 신뢰수준"),
+    ] = DEFAULT_CONFIDENCE,
+    headless: Annotated[
+        bool,
+        typer.Option("--headless", help="대시보드 없이 실행 (metrics 엔드포인트로만 관측)"),
+    ] = False,
+    metrics_host: Annotated[
+        str,
+        typer.Option("--metrics-host", help="metrics 엔드포인트 바인딩 주소"),
+    ] = "127.0.0.1",
+    metrics_port: Annotated[
+        int | None,
+        typer.Option(
+            "--metrics-port",
+            help=f"Prometheus metrics 엔드포인트 포트 (--headless 기본: {DEFAULT_METRICS_PORT})",
+        ),
+    ] = None,
+):
+    """여러 Route53 가중치 레코드를 하나의 프로세스에서 동시에 모니터링합니다 (DNS 전용)."""
+    specs = list(record or [])
+    try:
+        if records_file is not None:
+            specs += load_targets(records_file)
+        targets = parse_targets(specs, zone_id)
+        configs = {
+            t: MonitorConfig(
+                endpoint=f"https://{t.record_name}",
+                hosted_zone_id=t.zone_id,
+                record_name=t.record_name,
+                tps=tps,
+                http_enabled=False,
+                tolerance=tolerance,
+                confidence=confidence,
+                ns_schedule=ns_schedule,
+            )
+            for t in targets
+        }
+    except OSError as e:
+        console.print(f"[red]레코드 목록 파일을 읽을 수 없습니다: {e}[/red]")
+        raise typer.Exit(1) from e
+    except ValueError as e:
+        console.print(f"[red]설정 오류: {e}[/red]")
+        raise typer.Exit(1) from e
+    if headless and metrics_port is None:
+        metrics_port = DEFAULT_METRICS_PORT
+
+    zones = group_by_zone(targets)
+    console.print(
+        f"[bold green]대상: 레코드 {len(targets)}개 / Hosted Zone {len(zones)}개[/bold green]"
+    )
+    console.print(f"[dim]레코드별 TPS: {tps} (합계 {tps * len(targets)}) | HTTP: False[/dim]")
+
+    # 자격증명 검증과 Zone별 1회 조회(가중치 레코드 페이지네이션 / 권한 NS)를 동시에 실행
+    steps = {"credentials": validate_credentials}
+    for zone, zone_targets in zones.items():
+        names = [t.record_name for t in zone_targets]
+        steps[f"{zone}:records"] = partial(get_zone_weighted_records, zone, names)
+        steps[f"{zone}:ns"] = partial(get_zone_nameservers, zone)
+    with console.status("[bold green]AWS 자격증명 확인 / 가중치 레코드 / 권한 NS 조회 중..."):
+        try:
+            preflight = run_concurrently(steps)
+        except AwsAuthError as e:
+            console.print(f"[red]AWS 인증 오류: {e}[/red]")
+            raise typer.Exit(1) from e
+        except Route53ApiError as e:
+            console.print(f"[red]Route53 API 오류: {e}[/red]")
+            raise typer.Exit(1) from e
+        ns_ips_by_zone = run_concurrently(
+            {zone: partial(resolve_nameserver_ips, preflight[f"{zone}:ns"]) for zone in zones}
+        )
+
+    records_by_target: dict[WatchTarget, list[WeightedRecord]] = {}
+    missing: list[str] = []
+    for zone, zone_targets in zones.items():
+        by_name = preflight[f"{zone}:records"]
+        nameservers = preflight[f"{zone}:ns"]
+        if not ns_ips_by_zone[zone]:
+            console.print(f"[red]{zone}: 권한 NS IP를 해석할 수 없습니다: {nameservers}[/red]")
+            raise typer.Exit(1)
+        console.print(f"[dim]{zone}: 권한 NS {len(ns_ips_by_zone[zone])}개 ({ns_schedule})[/dim]")
+        for target in zone_targets:
+            records = by_name.get(target.record_name, [])
+            if records:
+                records_by_target[target] = records
+            else:
+                missing.append(f"{zone}:{target.record_name}")
+
+    if missing:
+        console.print("[red]가중치 레코드를 찾을 수 없습니다:[/red]")
+        for name in missing:
+            console.print(f"  [red]{name}[/red]")
+        raise typer.Exit(1)
+
+    # ALIAS 대상은 레코드 수와 무관하게 한 번에 동시에 해석 (watch의 시작 준비 단계와 동일)
+    alias_steps = {
+        f"{target.zone_id}:{target.record_name}": partial(resolve_alias_targets, records)
+        for target, records in records_by_target.items()
+        if any(r.record_type == "ALIAS" for r in records)
+    }
+    alias_by_target: dict[str, AliasResolution] = {}
+    if alias_steps:
+        with console.status(f"[bold green]ALIAS 대상 IP 해석 중... (레코드 {len(alias_steps)}개)"):
+            alias_by_target = run_concurrently(alias_steps)
+
+    dns_client = AsyncDnsClient()
+    watches: list[RecordWatch] = []
+    for target, records in records_by_target.items():
+        alias_resolution = alias_by_target.get(
+            f"{target.zone_id}:{target.record_name}", AliasResolution()
+        )
+        for warning in alias_resolution.warnings:
+            console.print(f"  [yellow]WARNING: {target.record_name}: {warning}[/yellow]")
+        weights = ", ".join(f"{r.set_identifier}={r.weight}" for r in records)
+        console.print(f"  [cyan]{target.record_name}[/cyan]: {weights}")
+        zone = target.zone_id
+        watches.append(
+            make_watch(
+                target,
+                records,
+                preflight[f"{zone}:ns"],
+                ns_ips_by_zone[zone],
+                configs[target],
+                dns_client,
+                alias_resolution,
+            )
+        )
+
+    if auto_stop:
+        _warn_slow_convergence(
+            tolerance, confidence, tps, max(len(w.initial_records) for w in watches)
+        )
+
+    console.print("[green]모니터링을 시작합니다...[/green]\n")
+    display_targets = [(w.record_name, w.records_ref, w.stats) for w in watches]
+
+    async def _run() -> dict[str, ConvergenceReport] | None:
+        tasks = [asyncio.create_task(w.sender.run()) for w in watches]
+        tasks += [asyncio.create_task(AliasRefresher(w.sender).run()) for w in watches]
+        tasks += [asyncio.create_task(z.run()) for z in zone_refreshers(watches)]
+        if metrics_port is not None:
+            metrics_server = MetricsServer(
+                lambda: render_multi_watch_metrics(
+                    [(w.record_name, w.records_ref[0], w.stats) for w in watches]
+                ),
+                host=metrics_host,
+                port=metrics_port,
+            )
+            await _start_metrics_server(metrics_server, metrics_host)
+            tasks.append(asyncio.create_task(metrics_server.run()))
+        if not headless:
+            tasks.append(
+                asyncio.create_task(
+                    run_multi_display(display_targets, tolerance=tolerance, confidence=confidence)
+                )
+            )
+        convergence_task: asyncio.Task | None = None
+        if auto_stop:
+            convergence_task = asyncio.create_task(
+                wait_for_all_convergence(watches, tolerance=tolerance, confidence=confidence)
+            )
+            tasks.append(convergence_task)
+        try:
+            await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        except asyncio.CancelledError:
+            pass
+        finally:
+            for w in watches:
+                w.sender.stop()
+            for t in tasks:
+                t.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            dns_client.close()
+        if convergence_task is not None and not convergence_task.cancelled():
+            return convergence_task.result()
+        return None
+
+    converged: dict[str, ConvergenceReport] | None = None
+    try:
+        converged = asyncio.run(_run())
+    except KeyboardInterrupt:
+        for w in watches:
+            w.sender.stop()
+
+    console.print(render_multi_dashboard(display_targets, tolerance, confidence))
+    if converged is not None:
+        elapsed = max(w.stats.get_snapshot().elapsed_seconds for w in watches)
+        console.print(
+            f"\n[bold green]모든 레코드 분포 수렴 완료 ({_format_elapsed(elapsed)})[/bold green]"
+        )
+    for w in watches:
+        events = w.stats.get_snapshot().events
+        if events:
+            console.print(f"  [cyan]{w.record_name}[/cyan]: 가중치 변경 {len(events)}회 감지")
+
+
+@app.command()
+def replay(
+    log_path: Annotated[
+        Path,
+        typer.Argument(help="watch --sample-log 로 저장한 샘플 로그 경로"),
+    ],
+    until: Annotated[
+        float | None,
+        typer.Option("--until", help="이 경과 초까지만 재생 (해당 시점의 대시보드/통계)"),
+    ] = None,
+    tolerance: Annotated[
+        float,
+        typer.Option("--tolerance", help="수렴 판정 허용 오차 (비율)"),
+    ] = DEFAULT_TOLERANCE,
+    confidence: Annotated[
+        float,
+        typer.Option("--confidence", help="수렴 판정 신뢰수준"),
+    ] = DEFAULT_CONFIDENCE,
+    timeline: Annotated[
+        Path | None,
+        typer.Option(
+            "--timeline", help="초 단위 분포/가중치 변경 수렴 타임라인 저장 (.csv 또는 .jsonl)"
+        ),
+    ] = None,
+):
+    """샘플 로그를 재생하여 대시보드와 통계를 오프라인으로 다시 구성합니다."""
+    if timeline is not None and timeline.suffix.lower() not in TIMELINE_FORMATS:
+        console.print("[red]설정 오류: --timeline 파일은 .csv 또는 .jsonl 이어야 합니다.[/red]")
+        raise typer.Exit(1)
+    if not (0 < tolerance < 1) or not (0 < confidence < 1):
+        console.print("[red]설정 오류: tolerance와 confidence는 0과 1 사이여야 합니다.[/red]")
+        raise typer.Exit(1)
+
+    try:
+        header, stats, last = replay_sample_log(log_path, until=until)
+    except OSError as e:
+        console.print(f"[red]샘플 로그를 읽을 수 없습니다: {e}[/red]")
+        raise typer.Exit(1) from e
+    except ValueError as e:
+        console.print(f"[red]샘플 로그 오류: {e}[/red]")
+        raise typer.Exit(1) from e
+
+    snapshot = stats.get_snapshot(now=until if until is not None else last)
+    records = records_at(header, snapshot.events)
+    console.print(
+        render_dashboard(header.record_name, records, stats, snapshot, tolerance, confidence)
+    )
+    _print_summary(
+        stats,
+        snapshot,
+        records,
+        header.records,
+        tolerance=tolerance,
+        confidence=confidence,
+        timeline=timeline,
+    )
+
+
+@app.command()
+def bench(
+    mode: Annotated[
+        str,
+        typer.Option("--mode", help="벤치마크 대상 (watch, propagation, all)"),
+    ] = "all",
+    tps: Annotated[
+        int,
+        typer.Option("--tps", "-t", help="sender / 리졸버 루프당 초당 질의 수 (1~100)"),
+    ] = 100,
+    parallel: Annotated[
+        int,
+        typer.Option(
+            "--parallel", "-p", help="동시 sender 수 (watch) / 리졸버 라벨 수 (propagation)"
+        ),
+    ] = 5,
+    duration: Annotated[
+        float,
+        typer.Option("--duration", "-d", help="모드별 실행 시간(초)"),
+    ] = 5.0,
+    latency_ms: Annotated[
+        float,
+        typer.Option("--latency-ms", help="stub 서버 응답 지연(ms)"),
+    ] = 0.0,
+    jitter_ms: Annotated[
+        float,
+        typer.Option("--jitter-ms", help="stub 서버 응답 지연에 더할 최대 무작위 지연(ms)"),
+    ] = 0.0,
+    loss: Annotated[
+        float,
+        typer.Option("--loss", help="stub 서버 응답 손실 확률 (0~1)"),
+    ] = 0.0,
+    seed: Annotated[
+        int,
+        typer.Option("--seed", help="stub 서버 레코드 선택 / 손실 난수 seed"),
+    ] = 0,
+    max_cpu_us: Annotated[
+        float | None,
+        typer.Option("--max-cpu-us", help="probe당 CPU(µs)가 이 값을 넘으면 실패 처리"),
+    ] = None,
+    output: Annotated[
+        Path | None,
+        typer.Option("--output", "-o", help="결과를 JSON으로 저장"),
+    ] = None,
+):
+    """로컬 stub 권한 DNS 서버를 대상으로 sender / propagation prober 처리량과 분포를 측정합니다."""
+    modes = BENCH_MODES if mode == "all" else (mode,)
+    if mode != "all" and mode not in BENCH_MODES:
+        console.print(
+            f"[red]설정 오류: --mode는 {', '.join(BENCH_MODES)}, all 중 하나여야 합니다.[/red]"
+        )
+        raise typer.Exit(1)
+    if parallel < 1 or duration <= 0:
+        console.print("[red]설정 오류: --parallel은 1 이상, --duration은 0보다 커야 합니다.[/red]")
+        raise typer.Exit(1)
+
+    options = {
+        "tps": tps,
+        "duration": duration,
+        "latency": latency_ms / 1000,
+        "jitter": jitter_ms / 1000,
+        "loss": loss,
+        "seed": seed,
+    }
+    results: list[BenchResult] = []
+    try:
+        for m in modes:
+            with console.status(f"[bold green]{m} 벤치마크 실행 중 ({duration:.0f}초)..."):
+                if m == "watch":
+                    results.append(asyncio.run(bench_watch(senders=parallel, **options)))
+                else:
+                    results.append(asyncio.run(bench_propagation(resolvers=parallel, **options)))
+    except ValueError as e:
+        console.print(f"[red]설정 오류: {e}[/red]")
+        raise typer.Exit(1) from e
+
+    table = Table(title=f"stub 벤치마크 (seed={seed}, loss={loss}, latency={latency_ms}ms)")
+    table.add_column("모드", style="cyan")
+    table.add_column("목표 TPS", justify="right")
+    table.add_column("달성 TPS", justify="right")
+    table.add_column("CPU/probe", justify="right")
+    table.add_column("에러", justify="right")
+    table.add_column("손실", justify="right")
+    table.add_column("최대 오차", justify="right")
+    table.add_column("χ² p", justify="right")
+    table.add_column("오분류", justify="right")
+    table.add_column("판정")
+    failed = False
+    for r in results:
+        cpu_ok = max_cpu_us is None or r.cpu_per_probe_us <= max_cpu_us
+        ok = r.passed and cpu_ok
+        failed |= not ok
+        table.add_row(
+            r.mode,
+            str(r.target_tps),
+            f"{r.achieved_tps:.1f}",
+            f"{r.cpu_per_probe_us:.0f}µs" if cpu_ok else f"[red]{r.cpu_per_probe_us:.0f}µs[/red]",
+            str(r.errors),
+            str(r.stub_dropped),
+            f"{r.max_error * 100:.2f}%",
+            f"{r.p_value:.3f}" if r.p_value is not None else "-",
+            str(r.misclassified),
+            "[green]PASS[/green]" if ok else "[red]FAIL[/red]",
+        )
+    console.print(table)
+
+    if output is not None:
+        try:
+            output.write_text(
+                json.dumps([r.to_dict() for r in results], indent=2, ensure_ascii=False) + "\n",
+                encoding="utf-8",
+            )
+        except OSError as e:
+            console.print(f"[red]결과 파일을 저장할 수 없습니다: {e}[/red]")
+            raise typer.Exit(1) from e
+        console.print(f"[dim]결과 저장: {output}[/dim]")
+    if failed:
+        raise typer.Exit(1)
+
+
+@app.command("ecs-sweep")
+def ecs_sweep(
+    zone_id: Annotated[
+        str,
+        typer.Option("--zone-id", "-z", help="Route53 Hosted Zone ID"),
+    ],
+    record_name: Annotated[
+        str,
+        typer.Option("--record-name", "-r", help="조회할 레코드 이름"),
+    ],
+    subnet: Annotated[
+        list[str] | None,
+        typer.Option(
+            "--subnet", "-s", help="ECS 클라이언트 서브넷 `CIDR[=라벨]` (여러 번 지정 가능)"
+        ),
+    ] = None,
+    subnets_file: Annotated[
+        Path | None,
+        typer.Option("--subnets-file", help="서브넷 목록 파일 (한 줄에 `CIDR [라벨]`)"),
+    ] = None,
+    queries: Annotated[
+        int,
+        typer.Option("--queries", "-n", help="서브넷별 질의 횟수"),
+    ] = DEFAULT_QUERIES_PER_SUBNET,
+    concurrency: Annotated[
+        int,
+        typer.Option("--concurrency", "-c", help="동시에 응답을 기다리는 최대 질의 수"),
+    ] = DEFAULT_CONCURRENCY,
+    output: Annotated[
+        Path | None,
+        typer.Option("--output", "-o", help="서브넷별 결과를 JSON으로 저장"),
+    ] = None,
+):
+    """EDNS Client Subnet으로 서브넷별 권한 NS 응답(SetIdentifier) 분포를 조사합니다."""
+    try:
+        subnets = []
+        for spec in subnet or []:
+            cidr, _, label = spec.partition("=")
+            subnets.append(parse_subnet(cidr, label or None))
+        if subnets_file is not None:
+            subnets += load_subnets(subnets_file)
+        subnets = dedupe_subnets(subnets)
+        if not subnets:
+            raise ValueError("--subnet 또는 --subnets-file로 서브넷을 지정하세요.")
+        if queries < 1 or concurrency < 1:
+            raise ValueError("--queries와 --concurrency는 1 이상이어야 합니다.")
+    except OSError as e:
+        console.print(f"[red]서브넷 목록 파일을 읽을 수 없습니다: {e}[/red]")
+        raise typer.Exit(1) from e
+    except ValueError as e:
+        console.print(f"[red]설정 오류: {e}[/red]")
+        raise typer.Exit(1) from e
+
+    console.print(f"[bold green]대상: {record_name}[/bold green]")
+    console.print(
+        f"[dim]Zone: {zone_id} | 서브넷 {len(subnets)}개 × {queries}회 | "
+        f"동시 질의 ≤ {concurrency}[/dim]"
+    )
+
+    with console.status("[bold green]AWS 자격증명 확인 / Route53 레코드 및 NS 조회 중..."):
+        try:
+            preflight = run_concurrently(
+                {
+                    "credentials": validate_credentials,
+                    "records": partial(get_routed_records, zone_id, record_name),
+                    "ns": partial(get_zone_nameservers, zone_id),
+                }
+            )
+        except AwsAuthError as e:
+            console.print(f"[red]AWS 인증 오류: {e}[/red]")
+            raise typer.Exit(1) from e
+        except Route53ApiError as e:
+            console.print(f"[red]Route53 API 오류: {e}[/red]")
+            raise typer.Exit(1) from e
+    records: list[WeightedRecord] = preflight["records"]
+    nameservers: list[str] = preflight["ns"]
+    if not records:
+        console.print("[red]SetIdentifier가 있는 레코드를 찾을 수 없습니다.[/red]")
+        raise typer.Exit(1)
+    console.print(f"[green]{len(records)}개 라우팅 레코드 발견[/green]")
+    for rec in records:
+        console.print(f"  [cyan]{rec.set_identifier}[/cyan]: {rec.policy}, type={rec.record_type}")
+
+    steps = {"ns_ips": partial(resolve_nameserver_ips, nameservers)}
+    if any(r.record_type == "ALIAS" for r in records):
+        steps["alias"] = partial(resolve_alias_targets, records)
+    with console.status("[bold green]권한 NS / ALIAS 대상 IP 해석 중..."):
+        resolved = run_concurrently(steps)
+    alias_resolution: AliasResolution = resolved.get("alias", AliasResolution())
+    for warning in alias_resolution.warnings:
+        console.print(f"[yellow]⚠ {warning}[/yellow]")
+    try:
+        resolver = WeightedResolver(
+            nameservers, record_name, records[0].record_type, ns_ips=resolved["ns_ips"]
+        )
+    except ValueError as e:
+        console.print(f"[red]DNS Resolver 초기화 실패: {e}[/red]")
+        raise typer.Exit(1) from e
+    classifier = AnswerClassifier(records, alias_resolution)
+
+    total = len(subnets) * queries
+    with console.status(f"[bold green]ECS 질의 중... 0/{total}") as status:
+        results = asyncio.run(
+            sweep_subnets(
+                resolver,
+                classifier,
+                subnets,
+                queries=queries,
+                concurrency=concurrency,
+                on_progress=lambda done: status.update(
+                    f"[bold green]ECS 질의 중... {done}/{total}"
+                ),
+            )
+        )
+    console.print(build_ecs_matrix(record_name, records, results))
+    if all(not r.scopes for r in results if r.answered):
+        console.print(
+            "[yellow]응답에 ECS 옵션이 없습니다. 권한 NS가 Client Subnet을 무시했을 수 있습니다.[/yellow]"
+        )
+
+    if output is not None:
+        try:
+            output.write_text(
+                json.dumps([r.to_dict() for r in results], indent=2, ensure_ascii=False) + "\n",
+                encoding="utf-8",
+            )
+        except OSError as e:
+            console.print(f"[red]결과 파일을 저장할 수 없습니다: {e}[/red]")
+            raise typer.Exit(1) from e
+        console.print(f"[dim]결과 저장: {output}[/dim]")
+
+
+def _print_summary(
+    stats: Stats,
+    snapshot: StatsSnapshot,
+    records: list[WeightedRecord],
+    initial_records: list[WeightedRecord],
+    tolerance: float,
+    confidence: float,
+    timeline: Path | None = None,
+    converged: ConvergenceReport | None = None,
+) -> None:
+    """최종 통계(분포, NS별 분포, 수렴 판정, 가중치 변경 수렴)를 출력한다."""
+    console.print("\n[bold]최종 통계[/bold]")
+    console.print(f"  총 요청: {snapshot.total_requests:,}")
+    console.print(f"  에러: {snapshot.errors}")
+    total = snapshot.total_requests - snapshot.errors
+    for sid, count in sorted(snapshot.distribution.items()):
+        ratio = count / total * 100 if total > 0 else 0
+        console.print(f"  [cyan]{sid}[/cyan]: {count:,} ({ratio:.1f}%)")
+    if snapshot.http_failures:
+        console.print("[bold]  HTTP 실패:[/bold]")
+        for sid, failures in sorted(snapshot.http_failures.items()):
+            parts = ", ".join(f"{kind} {count:,}" for kind, count in sorted(failures.items()))
+            console.print(f"    [cyan]{sid}[/cyan]: {parts}")
+    if snapshot.nameserver_distribution:
+        console.print("[bold]  권한 NS별 분포:[/bold]")
+        for ns_ip, counts in sorted(snapshot.nameserver_distribution.items()):
+            ns_total = sum(counts.values())
+            parts = ", ".join(
+                f"{sid} {count / ns_total * 100:.1f}%" for sid, count in sorted(counts.items())
+            )
+            errors = snapshot.nameserver_errors.get(ns_ip, 0)
+            console.print(f"    [green]{ns_ip}[/green]: {ns_total:,}건 ({parts}), 에러 {errors}")
+
+    report = converged or evaluate_convergence(
+        snapshot.distribution,
+        records,
+        tolerance=tolerance,
+        confidence=confidence,
+    )
+    if report.total > 0:
+        p_str = f"{report.p_value:.3f}" if report.p_value is not None else "N/A"
+        console.print(
+            f"  [dim]χ²={report.chi_square:.2f} (p={p_str}), "
+            f"{report.confidence * 100:.0f}% CI ±{report.tolerance * 100:.1f}% "
+            f"수렴: {'예' if report.converged else '아니오'}[/dim]"
+        )
+
+    if snapshot.events or timeline is not None:
+        result = build_timeline(
+            stats.get_time_buckets(),
+            snapshot.events,
+            {r.set_identifier: r.weight for r in initial_records},
+            stats.start_time,
+            stats.start_wall_time,
+            tolerance=tolerance,
+            confidence=confidence,
+        )
+        if result.changes:
+            console.print("[bold]  가중치 변경 수렴:[/bold]")
+        for change in result.changes:
+            desc = ", ".join(change.event.changes)
+            if change.converged_second is None:
+                console.print(f"    [magenta]{desc}[/magenta]: [yellow]미수렴[/yellow]")
+            else:
+                console.print(
+                    f"    [magenta]{desc}[/magenta]: 감지 후 {change.seconds_since_detected}초 "
+                    f"(변경 가능 시점 기준 최대 {change.seconds_upper_bound}초, "
+                    f"감지 후 {change.confirmed_second - change.detected_second}초에 확인)"
+                )
+        if timeline is not None:
+            write_timeline(result, timeline)
+            console.print(f"  [dim]타임라인 저장: {timeline}[/dim]")
+
+
+def _warn_slow_convergence(tolerance: float, confidence: float, tps: int, identifiers: int) -> None:
+    """tolerance / TPS 조합으로 수렴 확인에 오래 걸리면 경고한다."""
+    seconds = seconds_to_converge(tolerance, confidence, tps, identifiers + 1)
+    if seconds is not None and seconds <= CONVERGENCE_WARN_SECONDS:
+        return
+    if seconds is None:
+        needed = "24시간 안에 확인할 수 없습니다"
+    else:
+        needed = f"TPS {tps} 기준 최소 {_format_elapsed(seconds)}가 걸립니다"
+    console.print(
+        f"[yellow]WARNING: ±{tolerance * 100:.1f}% @ {confidence * 100:.0f}% 신뢰수준 "
+        f"수렴 확인은 {needed}. --tps를 높이거나 --tolerance를 늘리세요.[/yellow]"
+    )
+
+
+def _rcode_text(rcode: int) -> str:
+    """RCODE 이름 (예: NXDOMAIN)."""
+    import dns.rcode
+
+    return dns.rcode.to_text(rcode)
+
+
+def _print_startup_profile(profile: StartupProfile) -> None:
+    """시작 준비 단계별 시작 시점 / 소요 시간 표를 출력한다."""
+    table = Table(title="시작 준비 단계 (--profile-startup)", title_justify="left")
+    table.add_column("단계", style="cyan")
+    table.add_column("시작", justify="right")
+    table.add_column("소요", justify="right")
+    for phase in profile.phases:
+        table.add_row(phase.name, f"+{phase.start * 1000:.0f}ms", f"{phase.duration * 1000:.0f}ms")
+    table.add_row("[bold]합계[/bold]", "", f"[bold]{profile.elapsed() * 1000:.0f}ms[/bold]")
+    console.print(table)
+
+
+def _format_elapsed(seconds: float) -> str:
+    """경과 시간을 사람이 읽기 쉬운 문자열로 변환한다."""
+    m, s = divmod(int(seconds), 60)
+    return f"{m}분 {s}초" if m else f"{s}초"
 
 
 @app.command()
@@ -263,6 +1152,13 @@ def propagation(
         str | None,
         typer.Option("--resolvers", help="리졸버 IP (쉼표 구분, 예: 8.8.8.8,1.1.1.1)"),
     ] = None,
+    resolvers_file: Annotated[
+        Path | None,
+        typer.Option(
+            "--resolvers-file",
+            help="리졸버 목록 파일 (한 줄에 'IP [라벨]', # 주석 허용). --resolvers와 함께 쓰면 합침",
+        ),
+    ] = None,
     tps: Annotated[
         int,
         typer.Option("--tps", "-t", help="초당 조회 횟수 (1~100)"),
@@ -271,13 +1167,78 @@ def propagation(
         str,
         typer.Option("--type", help="레코드 타입 (A, CNAME)"),
     ] = "A",
+    expect: Annotated[
+        str | None,
+        typer.Option(
+            "--expect",
+            help="전파 완료 후 기대 값 (쉼표 구분). 모든 리졸버가 이 값만 응답하면 자동 종료",
+        ),
+    ] = None,
+    confirm: Annotated[
+        int,
+        typer.Option("--confirm", help="전파 완료로 확정하는 연속 기대 값 응답 수"),
+    ] = DEFAULT_CONFIRM,
+    ttl_aware: Annotated[
+        bool,
+        typer.Option(
+            "--ttl-aware/--fixed-rate",
+            help="응답 TTL 만료 직후로 다음 질의를 예약 (--fixed-rate: 항상 TPS 간격)",
+        ),
+    ] = True,
+    max_interval: Annotated[
+        float,
+        typer.Option("--max-interval", help="TTL 기반 스케줄의 리졸버별 최대 질의 간격(초)"),
+    ] = DEFAULT_MAX_INTERVAL,
+    timeout: Annotated[
+        float | None,
+        typer.Option(
+            "--timeout",
+            help="최대 모니터링 시간(초). 도달하면 현재 전파 상태를 출력하고 종료 "
+            "(--expect 미완료 시 종료 코드 1)",
+        ),
+    ] = None,
+    headless: Annotated[
+        bool,
+        typer.Option("--headless", help="대시보드 없이 실행 (metrics 엔드포인트로만 관측)"),
+    ] = False,
+    metrics_host: Annotated[
+        str,
+        typer.Option("--metrics-host", help="metrics 엔드포인트 바인딩 주소"),
+    ] = "127.0.0.1",
+    metrics_port: Annotated[
+        int | None,
+        typer.Option(
+            "--metrics-port",
+            help=f"Prometheus metrics 엔드포인트 포트 (--headless 기본: {DEFAULT_METRICS_PORT})",
+        ),
+    ] = None,
 ):
     """여러 공용 DNS 리졸버에 질의하여 DNS 전파 상태를 실시간 모니터링합니다."""
     # 리졸버 파싱
-    resolver_list: list[tuple[str, str]]
+    resolver_list: list[tuple[str, str]] = []
+    if resolvers_file is not None:
+        try:
+            resolver_list = load_resolvers(resolvers_file)
+        except OSError as e:
+            console.print(f"[red]리졸버 목록 파일을 읽을 수 없습니다: {e}[/red]")
+            raise typer.Exit(1) from e
+        except ValueError as e:
+            console.print(f"[red]설정 오류: {e}[/red]")
+            raise typer.Exit(1) from e
     if resolvers:
-        resolver_list = [(ip.strip(), ip.strip()) for ip in resolvers.split(",") if ip.strip()]
-    else:
+        known = {ip for ip, _ in resolver_list}
+        labels = {label for _, label in resolver_list}
+        for ip in (ip.strip() for ip in resolvers.split(",")):
+            if not ip or ip in known:
+                continue
+            if ip in labels:
+                console.print(
+                    f"[red]설정 오류: --resolvers의 {ip}가 리졸버 목록 파일의 라벨과 겹칩니다.[/red]"
+                )
+                raise typer.Exit(1)
+            known.add(ip)
+            resolver_list.append((ip, ip))
+    if not resolver_list:
         resolver_list = list(DEFAULT_RESOLVERS)
 
     try:
@@ -286,67 +1247,182 @@ def propagation(
             resolvers=resolver_list,
             tps=tps,
             record_type=record_type.upper(),
+            ttl_aware=ttl_aware,
+            max_interval=max_interval,
         )
     except ValueError as e:
         console.print(f"[red]설정 오류: {e}[/red]")
         raise typer.Exit(1) from e
 
     console.print(f"[bold green]대상: {cfg.record_name} ({cfg.record_type})[/bold green]")
-    console.print(f"[dim]TPS: {cfg.tps} | Resolvers: {len(cfg.resolvers)}[/dim]")
+    schedule = f"TTL 기반 (최대 {cfg.max_interval:g}초)" if cfg.ttl_aware else "고정"
+    console.print(
+        f"[dim]TPS: {cfg.tps} | Resolvers: {len(cfg.resolvers)} | 스케줄: {schedule}[/dim]"
+    )
+
+    expected_values = [v.strip() for v in (expect or "").split(",") if v.strip()]
+    if expect is not None and not expected_values:
+        console.print("[red]설정 오류: 기대 값(expect)이 비어 있습니다.[/red]")
+        raise typer.Exit(1)
+    if confirm < 1 or (timeout is not None and timeout <= 0):
+        console.print("[red]설정 오류: --confirm은 1 이상, --timeout은 0보다 커야 합니다.[/red]")
+        raise typer.Exit(1)
 
     resolver = PropagationResolver(cfg.record_name, cfg.record_type)
 
-    # 테스트 질의 (각 리졸버 1회)
+    # 테스트 질의 (각 리졸버 1회, 동시 질의)
     console.print("[bold]리졸버 테스트 질의:[/bold]")
     ok_count = 0
+    test_results = asyncio.run(check_resolvers(resolver, cfg.resolvers))
     for ip, label in cfg.resolvers:
-        values = resolver.resolve_one(ip)
-        if values:
+        values, rcode = test_results[ip]
+        if is_answering(values, rcode):
             ok_count += 1
+        if values:
             console.print(f"  [green]{label} ({ip})[/green]: {', '.join(values)}")
-        else:
+        elif is_answering(values, rcode):
+            # 아직 레코드가 없는 리졸버도 전파 대상이다
+            console.print(f"  [yellow]{label} ({ip})[/yellow]: 값 없음 ({_rcode_text(rcode)})")
+        elif rcode == RCODE_NO_RESPONSE:
             console.print(f"  [red]{label} ({ip})[/red]: 응답 없음")
+        else:
+            console.print(f"  [red]{label} ({ip})[/red]: {_rcode_text(rcode)}")
 
     if ok_count == 0:
         console.print("[red]모든 리졸버에서 응답을 받지 못했습니다.[/red]")
         raise typer.Exit(1)
 
     console.print(f"[green]{ok_count}/{len(cfg.resolvers)} 리졸버 정상[/green]")
+
+    # 테스트 질의에 응답한 리졸버만 전파 완료 판정 대상으로 추적
+    tracker: PropagationTracker | None = None
+    if expected_values:
+        tracker = PropagationTracker(
+            expected_values,
+            [label for ip, label in cfg.resolvers if is_answering(*test_results[ip])],
+            confirm=confirm,
+        )
+        console.print(
+            f"[dim]기대 값: {', '.join(sorted(tracker.expected))} (연속 {confirm}회 확인)[/dim]"
+        )
+        if ok_count < len(cfg.resolvers):
+            console.print(
+                f"[dim]응답 없는 리졸버 {len(cfg.resolvers) - ok_count}개는 "
+                "전파 완료 판정에서 제외합니다.[/dim]"
+            )
     console.print("[green]모니터링을 시작합니다...[/green]\n")
 
     # 비동기 이벤트 루프
-    stats = PropagationStats()
+    stats = PropagationStats(tracker)
     prober = PropagationProber(cfg, stats, resolver)
 
-    async def _run():
-        tasks = [
-            asyncio.create_task(prober.run()),
-            asyncio.create_task(
-                run_propagation_display(cfg.record_name, cfg.record_type, stats, len(cfg.resolvers))
-            ),
-        ]
+    if headless and metrics_port is None:
+        metrics_port = DEFAULT_METRICS_PORT
+
+    timed_out = False
+
+    async def _run() -> float | None:
+        nonlocal timed_out
+        tasks = [asyncio.create_task(prober.run())]
+        if metrics_port is not None:
+            metrics_server = MetricsServer(
+                lambda: render_propagation_metrics(cfg.record_name, stats),
+                host=metrics_host,
+                port=metrics_port,
+            )
+            await _start_metrics_server(metrics_server, metrics_host)
+            tasks.append(asyncio.create_task(metrics_server.run()))
+        if not headless:
+            tasks.append(
+                asyncio.create_task(
+                    run_propagation_display(
+                        cfg.record_name, cfg.record_type, stats, len(cfg.resolvers)
+                    )
+                )
+            )
+        completion_task: asyncio.Task | None = None
+        if tracker is not None:
+            completion_task = asyncio.create_task(wait_for_propagation(stats))
+            tasks.append(completion_task)
+        timeout_task: asyncio.Task | None = None
+        if timeout is not None:
+            timeout_task = asyncio.create_task(asyncio.sleep(timeout))
+            tasks.append(timeout_task)
         try:
-            await asyncio.gather(*tasks)
+            # 전파 완료 판정 / 시간 제한 태스크가 끝나면 나머지 태스크를 정리하고 종료
+            await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
         except asyncio.CancelledError:
             pass
+        finally:
+            prober.stop()
+            for t in tasks:
+                t.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        if completion_task is not None and not completion_task.cancelled():
+            return completion_task.result()
+        if timeout_task is not None and not timeout_task.cancelled():
+            timed_out = True
+        return None
 
+    completed_at: float | None = None
     try:
-        asyncio.run(_run())
+        completed_at = asyncio.run(_run())
     except KeyboardInterrupt:
         prober.stop()
-        # 최종 통계 출력
-        snapshot = stats.get_snapshot()
-        console.print("\n[bold]최종 통계[/bold]")
-        console.print(f"  총 질의: {snapshot.total_queries:,}")
-        console.print(f"  에러: {snapshot.errors}")
-        total = snapshot.total_queries - snapshot.errors
-        if snapshot.overall_distribution:
-            console.print("[bold]  전체 분포:[/bold]")
-            for ip, count in sorted(
-                snapshot.overall_distribution.items(), key=lambda x: x[1], reverse=True
-            ):
-                ratio = count / total * 100 if total > 0 else 0
-                console.print(f"    [cyan]{ip}[/cyan]: {count:,} ({ratio:.1f}%)")
+
+    # 최종 통계 출력
+    snapshot = stats.get_snapshot()
+    if completed_at is not None:
+        console.print(f"\n[bold green]전파 완료 ({_format_elapsed(completed_at)})[/bold green]")
+    elif timed_out:
+        console.print(f"\n[yellow]시간 제한 도달 ({_format_elapsed(timeout)})[/yellow]")
+    console.print("\n[bold]최종 통계[/bold]")
+    console.print(f"  총 질의: {snapshot.total_queries:,}")
+    console.print(f"  에러: {snapshot.errors}")
+    if snapshot.queries_saved:
+        baseline = snapshot.probes_sent + snapshot.queries_saved
+        console.print(
+            f"  TTL 기반 스케줄로 생략한 질의: {snapshot.queries_saved:,} "
+            f"(고정 TPS 대비 {snapshot.queries_saved / baseline * 100:.0f}%)"
+        )
+    total = snapshot.total_queries - snapshot.errors
+    if snapshot.overall_distribution:
+        console.print("[bold]  전체 분포:[/bold]")
+        for ip, count in sorted(
+            snapshot.overall_distribution.items(), key=lambda x: x[1], reverse=True
+        ):
+            ratio = count / total * 100 if total > 0 else 0
+            console.print(f"    [cyan]{ip}[/cyan]: {count:,} ({ratio:.1f}%)")
+    if snapshot.resolver_progress:
+        done = propagated_count(snapshot.resolver_progress)
+        unreachable = unreachable_count(snapshot.resolver_progress)
+        reachable = len(snapshot.resolver_progress) - unreachable
+        suffix = f" (응답 없음 {unreachable}개 제외)" if unreachable else ""
+        console.print(f"[bold]  전파 상태: {done}/{reachable}{suffix}[/bold]")
+        for label, progress in sorted(snapshot.resolver_progress.items()):
+            first_new = _format_offset(progress.first_new_at)
+            last_old = _format_offset(progress.last_old_at)
+            console.print(
+                f"    [green]{label}[/green]: {progress.state.value} "
+                f"(첫 새 값 {first_new}, 마지막 이전 값 {last_old})"
+            )
+    if timed_out and tracker is not None:
+        raise typer.Exit(1)
+
+
+async def _start_metrics_server(server: MetricsServer, host: str) -> None:
+    """metrics 서버 소켓을 열고 주소를 출력한다. 바인딩 실패 시 종료."""
+    try:
+        await server.start()
+    except OSError as e:
+        console.print(f"[red]metrics 엔드포인트를 열 수 없습니다: {e}[/red]")
+        raise typer.Exit(1) from e
+    console.print(f"[dim]metrics: http://{host}:{server.port}/metrics[/dim]")
+
+
+def _format_offset(seconds: float | None) -> str:
+    """시작 이후 경과 초를 '+12.3초' 형식으로 변환한다."""
+    return f"+{seconds:.1f}초" if seconds is not None else "-"
 
 
 if __name__ == "__main__":
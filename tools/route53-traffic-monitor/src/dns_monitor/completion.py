@@ -0,0 +1,208 @@
+"""DNS 전파 완료 판정 모듈.
+
+리졸버마다 응답이 기대 값(--expect)으로 바뀌는 과정을 상태 머신으로 추적한다.
+
+- PENDING: 아직 응답 없음
+- OLD: 이전 값만 응답
+- MIXED: 새 값을 응답한 적이 있지만, 이전 값이 섞여 나오거나 아직 확정 전
+- NEW: 마지막 confirm회 응답이 모두 새 값 (전파 완료)
+- UNREACHABLE: 연속 unreachable_after회 응답 없음/타임아웃 (완료 판정에서 제외)
+
+애니캐스트 리졸버는 여러 캐시 인스턴스가 서로 다른 값을 가질 수 있으므로, 새 값을
+한 번 응답한 것만으로는 완료로 보지 않고 confirm회 연속으로 확인한다. NEW 이후
+이전 값이 다시 나오면 MIXED로 되돌린다. UNREACHABLE 리졸버가 다시 응답하면 응답 값에
+따라 상태를 다시 판정한다.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterable
+from dataclasses import dataclass, replace
+from enum import Enum
+
+DEFAULT_CONFIRM = 3
+DEFAULT_UNREACHABLE_AFTER = 5
+
+
+class ResolverState(Enum):
+    """리졸버 전파 상태."""
+
+    PENDING = "pending"
+    OLD = "old"
+    MIXED = "mixed"
+    NEW = "new"
+    UNREACHABLE = "unreachable"
+
+
+@dataclass
+class ResolverProgress:
+    """리졸버 1개의 전파 진행 상태. 시각은 모니터링 시작 이후 경과 초."""
+
+    state: ResolverState = ResolverState.PENDING
+    # 새 값을 처음 응답한 시각
+    first_new_at: float | None = None
+    # 이전 값을 마지막으로 응답한 시각
+    last_old_at: float | None = None
+    # NEW 상태로 확정된 시각 (이후 이전 값이 다시 나오면 None)
+    propagated_at: float | None = None
+    # 연속 새 값 응답 수
+    new_streak: int = 0
+    # 연속 응답 없음/타임아웃 수
+    error_streak: int = 0
+
+
+def normalize_value(value: str) -> str:
+    """응답/기대 값 비교용 정규화 (도메인 이름은 대소문자/끝의 '.' 무시)."""
+    return value.rstrip(".").lower()
+
+
+class PropagationTracker:
+    """리졸버별 전파 상태 머신.
+
+    Args:
+        expected: 전파 완료 후 기대하는 응답 값 (IP 또는 CNAME 대상)
+        resolver_labels: 추적할 리졸버 라벨 (완료 판정 대상)
+        confirm: NEW로 확정하는 데 필요한 연속 새 값 응답 수
+        unreachable_after: UNREACHABLE로 보는 연속 응답 없음 수
+    """
+
+    def __init__(
+        self,
+        expected: Iterable[str],
+        resolver_labels: Iterable[str],
+        confirm: int = DEFAULT_CONFIRM,
+        unreachable_after: int = DEFAULT_UNREACHABLE_AFTER,
+    ):
+        self.expected = frozenset(normalize_value(v) for v in expected)
+        if not self.expected:
+            raise ValueError("기대 값(expect)이 비어 있습니다.")
+        if confirm < 1:
+            raise ValueError("confirm은 1 이상이어야 합니다.")
+        if unreachable_after < 1:
+            raise ValueError("unreachable_after는 1 이상이어야 합니다.")
+        self._confirm = confirm
+        self._unreachable_after = unreachable_after
+        self._lock = threading.Lock()
+        self._progress: dict[str, ResolverProgress] = {
+            label: ResolverProgress() for label in resolver_labels
+        }
+        # 갱신 순서대로 정렬된 리졸버별 마지막 갱신 버전 (증분 snapshot용)
+        self._version = 0
+        self._versions: dict[str, int] = {}
+
+    def is_new(self, values: Iterable[str]) -> bool:
+        """응답 값이 모두 기대 값이면 새 값 응답으로 본다."""
+        normalized = {normalize_value(v) for v in values}
+        return bool(normalized) and normalized <= self.expected
+
+    def observe(
+        self, resolver_label: str, values: list[str], elapsed: float
+    ) -> ResolverState | None:
+        """리졸버 응답 1건을 반영하고 갱신된 상태를 반환한다 (추적하지 않는 라벨이면 None).
+
+        값이 없는 응답(NOERROR 빈 응답 / NXDOMAIN)은 아직 새 값이 아닌 응답으로 본다.
+        """
+        is_new = self.is_new(values)
+        with self._lock:
+            progress = self._touch(resolver_label)
+            if progress is None:
+                return None
+            progress.error_streak = 0
+            if is_new:
+                progress.new_streak += 1
+                if progress.first_new_at is None:
+                    progress.first_new_at = elapsed
+                if progress.new_streak >= self._confirm:
+                    if progress.propagated_at is None:
+                        progress.propagated_at = elapsed
+                    progress.state = ResolverState.NEW
+                else:
+                    progress.state = ResolverState.MIXED
+            else:
+                progress.new_streak = 0
+                progress.last_old_at = elapsed
+                progress.propagated_at = None
+                progress.state = (
+                    ResolverState.OLD if progress.first_new_at is None else ResolverState.MIXED
+                )
+            return progress.state
+
+    def observe_error(self, resolver_label: str) -> ResolverState | None:
+        """리졸버 응답 없음/타임아웃 1건을 반영하고 갱신된 상태를 반환한다.
+
+        연속 unreachable_after회 실패하면 UNREACHABLE로 바꾼다. 그 전까지는 상태를 유지한다.
+        추적하지 않는 라벨이면 무시하고 None을 반환한다.
+        """
+        with self._lock:
+            progress = self._touch(resolver_label)
+            if progress is None:
+                return None
+            progress.error_streak += 1
+            if progress.error_streak >= self._unreachable_after:
+                progress.state = ResolverState.UNREACHABLE
+            return progress.state
+
+    def _touch(self, resolver_label: str) -> ResolverProgress | None:
+        """리졸버의 갱신 버전을 올리고 진행 상태를 반환한다 (락 안에서 호출).
+
+        추적하지 않는 라벨이면 완료 판정 대상이 늘어나지 않도록 None을 반환한다.
+        """
+        progress = self._progress.get(resolver_label)
+        if progress is None:
+            return None
+        self._version += 1
+        # 가장 최근에 갱신된 리졸버가 맨 뒤에 오도록 다시 삽입
+        self._versions.pop(resolver_label, None)
+        self._versions[resolver_label] = self._version
+        return progress
+
+    @property
+    def version(self) -> int:
+        """observe()마다 증가하는 갱신 버전."""
+        return self._version
+
+    def snapshot(self) -> dict[str, ResolverProgress]:
+        """리졸버별 진행 상태의 복사본을 반환한다."""
+        with self._lock:
+            return {label: replace(p) for label, p in self._progress.items()}
+
+    def changes_since(self, version: int) -> tuple[int, dict[str, ResolverProgress]]:
+        """version 이후 갱신된 리졸버의 진행 상태 복사본만 반환한다.
+
+        락 안에서는 최근 갱신분만 역순으로 훑으므로 비용이 바뀐 리졸버 수에 비례한다.
+
+        Returns:
+            (현재 버전, 리졸버 라벨 → 진행 상태)
+        """
+        changed: dict[str, ResolverProgress] = {}
+        with self._lock:
+            for label in reversed(self._versions):
+                if self._versions[label] <= version:
+                    break
+                changed[label] = replace(self._progress[label])
+            return self._version, changed
+
+
+def propagated_count(progress: dict[str, ResolverProgress]) -> int:
+    """NEW 상태인 리졸버 수."""
+    return sum(1 for p in progress.values() if p.state is ResolverState.NEW)
+
+
+def unreachable_count(progress: dict[str, ResolverProgress]) -> int:
+    """UNREACHABLE 상태인 리졸버 수."""
+    return sum(1 for p in progress.values() if p.state is ResolverState.UNREACHABLE)
+
+
+def is_complete(progress: dict[str, ResolverProgress]) -> bool:
+    """UNREACHABLE을 제외한 모든 리졸버가 NEW 상태이면 True (응답하는 리졸버가 없으면 False)."""
+    reachable = len(progress) - unreachable_count(progress)
+    return reachable > 0 and propagated_count(progress) == reachable
+
+
+def completed_at(progress: dict[str, ResolverProgress]) -> float:
+    """NEW 리졸버 중 가장 늦게 전파된 시각 (전파 완료 시점)."""
+    return max(
+        (p.propagated_at or 0.0 for p in progress.values() if p.state is ResolverState.NEW),
+        default=0.0,
+    )
@@ -13,6 +13,14 @@ from urllib.parse import urlparse
 
 from dotenv import load_dotenv
 
+# 권한 NS 질의 스케줄링 방식
+# - round-robin: 단일 루프가 TPS 속도로 NS를 순환하며 질의
+# - per-ns: NS별 독립 루프가 각각 TPS / NS 수 속도로 질의 (느린 NS가 다른 NS를 지연시키지 않음)
+NS_SCHEDULES = ("round-robin", "per-ns")
+
+# headless 모드에서 metrics_port를 지정하지 않았을 때 사용하는 포트
+DEFAULT_METRICS_PORT = 9180
+
 
 @dataclass
 class MonitorConfig:
@@ -23,12 +31,32 @@ class MonitorConfig:
     record_name: str
     tps: int = 10
     http_enabled: bool = True
+    # HTTP probe의 TLS 인증서 검증 여부 (자체 서명 / 사설 CA endpoint는 False)
+    http_verify: bool = True
+    auto_stop: bool = False
+    tolerance: float = 0.02
+    confidence: float = 0.95
+    ns_schedule: str = "round-robin"
+    # headless: Rich 대시보드 없이 실행 (metrics 엔드포인트로만 관측)
+    headless: bool = False
+    metrics_host: str = "127.0.0.1"
+    metrics_port: int | None = None
 
     def __post_init__(self):
         if self.tps < 1:
             raise ValueError("TPS must be >= 1")
         if self.tps > 100:
             raise ValueError("TPS must be <= 100")
+        if not 0 < self.tolerance < 1:
+            raise ValueError("tolerance must be between 0 and 1")
+        if not 0 < self.confidence < 1:
+            raise ValueError("confidence must be between 0 and 1")
+        if self.ns_schedule not in NS_SCHEDULES:
+            raise ValueError(f"ns_schedule must be one of {', '.join(NS_SCHEDULES)}")
+        if self.headless and self.metrics_port is None:
+            self.metrics_port = DEFAULT_METRICS_PORT
+        if self.metrics_port is not None and not 0 <= self.metrics_port <= 65535:
+            raise ValueError("metrics_port must be between 0 and 65535")
 
 
 @dataclass
@@ -64,6 +92,14 @@ class ConfigSources:
             record_name=record_name,
             tps=int(m.get("tps", 10)),
             http_enabled=bool(m.get("http_enabled", True)),
+            http_verify=bool(m.get("http_verify", True)),
+            auto_stop=bool(m.get("auto_stop", False)),
+            tolerance=float(m.get("tolerance", 0.02)),
+            confidence=float(m.get("confidence", 0.95)),
+            ns_schedule=str(m.get("ns_schedule", "round-robin")),
+            headless=bool(m.get("headless", False)),
+            metrics_host=str(m.get("metrics_host", "127.0.0.1")),
+            metrics_port=int(m["metrics_port"]) if m.get("metrics_port") is not None else None,
         )
 
 
@@ -76,19 +112,38 @@ def load_env_vars() -> dict[str, object]:
         "DNSMON_RECORD_NAME": "record_name",
         "DNSMON_TPS": "tps",
         "DNSMON_NO_HTTP": "no_http",
+        "DNSMON_INSECURE": "insecure",
+        "DNSMON_AUTO_STOP": "auto_stop",
+        "DNSMON_TOLERANCE": "tolerance",
+        "DNSMON_CONFIDENCE": "confidence",
+        "DNSMON_NS_SCHEDULE": "ns_schedule",
+        "DNSMON_HEADLESS": "headless",
+        "DNSMON_METRICS_HOST": "metrics_host",
+        "DNSMON_METRICS_PORT": "metrics_port",
     }
     for env_key, config_key in mapping.items():
         val = os.environ.get(env_key)
         if val is not None:
-            if config_key == "tps":
+            if config_key in ("tps", "metrics_port"):
                 try:
                     result[config_key] = int(val)
                 except ValueError as exc:
                     raise ValueError(
                         f"Invalid value for {env_key}: '{val}' is not a valid integer"
                     ) from exc
+            elif config_key in ("tolerance", "confidence"):
+                try:
+                    result[config_key] = float(val)
+                except ValueError as exc:
+                    raise ValueError(
+                        f"Invalid value for {env_key}: '{val}' is not a valid number"
+                    ) from exc
             elif config_key == "no_http":
                 result["http_enabled"] = val.lower() not in ("true", "1", "yes")
+            elif config_key == "insecure":
+                result["http_verify"] = val.lower() not in ("true", "1", "yes")
+            elif config_key in ("auto_stop", "headless"):
+                result[config_key] = val.lower() in ("true", "1", "yes")
             else:
                 result[config_key] = val
     return result
@@ -109,12 +164,22 @@ def load_toml_file(path: Path) -> dict[str, object]:
         "tps": "tps",
         "no_http": "no_http",
         "http_enabled": "http_enabled",
+        "insecure": "insecure",
+        "auto_stop": "auto_stop",
+        "tolerance": "tolerance",
+        "confidence": "confidence",
+        "ns_schedule": "ns_schedule",
+        "headless": "headless",
+        "metrics_host": "metrics_host",
+        "metrics_port": "metrics_port",
     }
     for toml_key, config_key in key_map.items():
         if toml_key in section:
             val = section[toml_key]
             if toml_key == "no_http":
                 result["http_enabled"] = not bool(val)
+            elif toml_key == "insecure":
+                result["http_verify"] = not bool(val)
             else:
                 result[config_key] = val
     return result
@@ -127,6 +192,14 @@ def build_config(
     record_name: str | None = None,
     tps: int | None = None,
     no_http: bool = False,
+    insecure: bool = False,
+    auto_stop: bool = False,
+    tolerance: float | None = None,
+    confidence: float | None = None,
+    ns_schedule: str | None = None,
+    headless: bool = False,
+    metrics_host: str | None = None,
+    metrics_port: int | None = None,
     config_file: Path | None = None,
     env_file: Path | None = None,
 ) -> MonitorConfig:
@@ -158,6 +231,22 @@ def build_config(
         cli["tps"] = tps
     if no_http:
         cli["http_enabled"] = False
+    if insecure:
+        cli["http_verify"] = False
+    if auto_stop:
+        cli["auto_stop"] = True
+    if tolerance is not None:
+        cli["tolerance"] = tolerance
+    if confidence is not None:
+        cli["confidence"] = confidence
+    if ns_schedule is not None:
+        cli["ns_schedule"] = ns_schedule
+    if headless:
+        cli["headless"] = True
+    if metrics_host is not None:
+        cli["metrics_host"] = metrics_host
+    if metrics_port is not None:
+        cli["metrics_port"] = metrics_port
     sources.cli = cli
 
     return sources.build()
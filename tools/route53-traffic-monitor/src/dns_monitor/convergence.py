@@ -0,0 +1,273 @@
+"""가중치 분포 통계적 수렴 판정 모듈.
+
+관측된 SetIdentifier별 응답 수를 Route53 설정 가중치 비율과 비교한다.
+
+- SetIdentifier별 Wilson score 신뢰구간 (Bonferroni 보정으로 동시 신뢰수준 보장)
+- 전체 분포에 대한 Pearson 카이제곱 적합도 검정 (p-value)
+- 모든 신뢰구간이 설정 비율 ± tolerance 안에 들어오면 수렴으로 판정
+- 반복 판정(auto-stop)은 판정 횟수에 따라 유의수준을 나눠 쓰고(alpha spending),
+  가중치 변경이 감지되면 변경 이후 표본으로 다시 판정한다
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+from dataclasses import dataclass, field
+from statistics import NormalDist
+
+from .aws import WeightedRecord
+from .stats import Stats
+
+DEFAULT_TOLERANCE = 0.02
+DEFAULT_CONFIDENCE = 0.95
+DEFAULT_MIN_SAMPLES = 30
+
+
+@dataclass
+class ShareEstimate:
+    """SetIdentifier 하나의 관측 비율 추정치."""
+
+    set_identifier: str
+    count: int
+    observed: float
+    expected: float
+    ci_low: float
+    ci_high: float
+    within_tolerance: bool
+
+
+@dataclass
+class ConvergenceReport:
+    """분포 수렴 판정 결과."""
+
+    total: int
+    tolerance: float
+    confidence: float
+    shares: list[ShareEstimate] = field(default_factory=list)
+    chi_square: float = 0.0
+    p_value: float | None = None
+    converged: bool = False
+
+
+def expected_shares(records: list[WeightedRecord]) -> dict[str, float]:
+    """SetIdentifier별 설정 가중치 비율을 계산한다.
+
+    Route53은 모든 가중치가 0이면 각 레코드를 동일 비율로 응답하므로 이를 반영한다.
+    """
+    total_weight = sum(r.weight for r in records)
+    if total_weight == 0:
+        return {r.set_identifier: 1 / len(records) for r in records} if records else {}
+    return {r.set_identifier: r.weight / total_weight for r in records}
+
+
+def wilson_interval(count: int, total: int, z: float) -> tuple[float, float]:
+    """이항 비율의 Wilson score 신뢰구간을 반환한다."""
+    if total <= 0:
+        return 0.0, 1.0
+    p = count / total
+    z2 = z * z
+    denom = 1 + z2 / total
+    center = (p + z2 / (2 * total)) / denom
+    half = z * math.sqrt(p * (1 - p) / total + z2 / (4 * total * total)) / denom
+    return max(0.0, center - half), min(1.0, center + half)
+
+
+def simultaneous_z(confidence: float, comparisons: int) -> float:
+    """comparisons개 신뢰구간이 동시에 confidence 수준을 만족하는 z 값 (Bonferroni 보정)."""
+    alpha = (1 - confidence) / max(1, comparisons)
+    return NormalDist().inv_cdf(1 - alpha / 2)
+
+
+def spent_alpha(confidence: float, look: int | None = None) -> float:
+    """look번째 반복 판정에 쓰는 유의수준.
+
+    look번째 판정에 (1 - confidence) * 6 / (π² * look²)를 배정하면 무한히 반복해도
+    합이 1 - confidence를 넘지 않으므로, 몇 번째 판정에서 멈추든 confidence가 유지된다.
+    look이 None이면 한 번만 판정하는 것으로 보고 보정하지 않는다.
+    """
+    alpha = 1 - confidence
+    if look is None:
+        return alpha
+    return alpha * 6 / (math.pi**2 * look**2)
+
+
+def seconds_to_converge(
+    tolerance: float, confidence: float, tps: float, comparisons: int, limit: int = 86400
+) -> int | None:
+    """매초 반복 판정할 때 수렴을 확인할 수 있는 가장 이른 경과 초 (limit 초 안에 불가능하면 None).
+
+    관측 비율이 설정 비율과 정확히 같고 비율이 0.5(신뢰구간이 가장 넓음)인 경우를 가정한
+    하한이다. look초째 누적 표본 tps * look개의 신뢰구간 반폭이 tolerance 이하여야 한다.
+    """
+    for look in range(1, limit + 1):
+        z = simultaneous_z(1 - spent_alpha(confidence, look), comparisons)
+        if tps * look >= (z * 0.5 / tolerance) ** 2:
+            return look
+    return None
+
+
+def chi_square_p_value(statistic: float, dof: int) -> float:
+    """카이제곱 분포의 상측 확률 P(X >= statistic)을 계산한다."""
+    if dof <= 0:
+        return 1.0
+    if statistic <= 0:
+        return 1.0
+    return _regularized_gamma_q(dof / 2, statistic / 2)
+
+
+def _regularized_gamma_q(a: float, x: float) -> float:
+    """정규화 상측 불완전 감마 함수 Q(a, x).
+
+    x < a + 1 이면 급수 전개, 그 외에는 연분수(Lentz) 전개를 사용한다.
+    """
+    log_prefix = -x + a * math.log(x) - math.lgamma(a)
+    if x < a + 1:
+        term = total = 1 / a
+        n = a
+        for _ in range(500):
+            n += 1
+            term *= x / n
+            total += term
+            if abs(term) < abs(total) * 1e-15:
+                break
+        return max(0.0, 1 - total * math.exp(log_prefix))
+
+    tiny = 1e-300
+    b = x + 1 - a
+    c = 1 / tiny
+    d = 1 / b
+    h = d
+    for i in range(1, 500):
+        an = -i * (i - a)
+        b += 2
+        d = an * d + b
+        d = tiny if abs(d) < tiny else d
+        c = b + an / c
+        c = tiny if abs(c) < tiny else c
+        d = 1 / d
+        delta = d * c
+        h *= delta
+        if abs(delta - 1) < 1e-15:
+            break
+    return min(1.0, math.exp(log_prefix) * h)
+
+
+def evaluate_convergence(
+    distribution: dict[str, int],
+    records: list[WeightedRecord],
+    tolerance: float = DEFAULT_TOLERANCE,
+    confidence: float = DEFAULT_CONFIDENCE,
+    min_samples: int = DEFAULT_MIN_SAMPLES,
+    look: int | None = None,
+) -> ConvergenceReport:
+    """관측 분포가 설정 가중치에 수렴했는지 판정한다.
+
+    각 SetIdentifier의 신뢰구간이 [설정 비율 - tolerance, 설정 비율 + tolerance]
+    안에 완전히 포함되어야 수렴으로 본다. 신뢰구간은 SetIdentifier 수로
+    Bonferroni 보정하여 모든 비율이 동시에 confidence 수준을 만족하도록 한다.
+    look을 지정하면 반복 판정 중 look번째 판정으로 보고 유의수준을 spent_alpha로 줄인다.
+    """
+    expected = expected_shares(records)
+    total = sum(distribution.get(sid, 0) for sid in expected)
+    report = ConvergenceReport(total=total, tolerance=tolerance, confidence=confidence)
+    if not expected:
+        return report
+
+    z = simultaneous_z(1 - spent_alpha(confidence, look), len(expected))
+
+    chi_square = 0.0
+    dof = -1
+    for sid, exp_ratio in expected.items():
+        count = distribution.get(sid, 0)
+        observed = count / total if total > 0 else 0.0
+        low, high = wilson_interval(count, total, z)
+        within = total > 0 and low >= exp_ratio - tolerance and high <= exp_ratio + tolerance
+        report.shares.append(
+            ShareEstimate(
+                set_identifier=sid,
+                count=count,
+                observed=observed,
+                expected=exp_ratio,
+                ci_low=low,
+                ci_high=high,
+                within_tolerance=within,
+            )
+        )
+        # 가중치 0인 레코드는 적합도 검정 대상에서 제외 (기대 빈도 0)
+        if exp_ratio > 0 and total > 0:
+            expected_count = exp_ratio * total
+            chi_square += (count - expected_count) ** 2 / expected_count
+            dof += 1
+
+    if total > 0 and dof > 0:
+        report.chi_square = chi_square
+        report.p_value = chi_square_p_value(chi_square, dof)
+
+    report.converged = total >= min_samples and all(s.within_tolerance for s in report.shares)
+    return report
+
+
+class SequentialConvergence:
+    """Stats를 반복 판정하는 auto-stop용 판정기.
+
+    판정할 때마다 look을 하나씩 올려 spent_alpha로 유의수준을 줄이고, 새 변경 이벤트가
+    보이면 감지 시각 이후의 초별 표본만으로 판정을 다시 시작한다 (변경 전 표본 제외).
+    """
+
+    def __init__(
+        self,
+        stats: Stats,
+        tolerance: float = DEFAULT_TOLERANCE,
+        confidence: float = DEFAULT_CONFIDENCE,
+        min_samples: int = DEFAULT_MIN_SAMPLES,
+    ):
+        self._stats = stats
+        self._tolerance = tolerance
+        self._confidence = confidence
+        self._min_samples = min_samples
+        self._events = 0
+        # 판정에 쓰는 표본의 시작 경과 초 (None이면 전체 누적 분포)
+        self._since: int | None = None
+        self._look = 0
+
+    def check(self, records: list[WeightedRecord]) -> ConvergenceReport:
+        """현재까지의 표본으로 한 번 판정한다."""
+        snapshot = self._stats.get_snapshot()
+        if len(snapshot.events) != self._events:
+            self._events = len(snapshot.events)
+            detected = snapshot.events[-1].detected_at - self._stats.start_time
+            self._since = math.ceil(detected)
+            self._look = 0
+        self._look += 1
+
+        distribution = snapshot.distribution
+        if self._since is not None:
+            distribution = {}
+            for bucket in self._stats.get_time_buckets(since_second=self._since).values():
+                for sid, count in bucket.items():
+                    distribution[sid] = distribution.get(sid, 0) + count
+        return evaluate_convergence(
+            distribution,
+            records,
+            tolerance=self._tolerance,
+            confidence=self._confidence,
+            min_samples=self._min_samples,
+            look=self._look,
+        )
+
+
+async def wait_for_convergence(
+    stats: Stats,
+    records_ref: list[list[WeightedRecord]],
+    tolerance: float = DEFAULT_TOLERANCE,
+    confidence: float = DEFAULT_CONFIDENCE,
+    check_interval: float = 1.0,
+) -> ConvergenceReport:
+    """분포가 수렴할 때까지 주기적으로 판정하고, 수렴 시 결과를 반환한다."""
+    judge = SequentialConvergence(stats, tolerance=tolerance, confidence=confidence)
+    while True:
+        await asyncio.sleep(check_interval)
+        report = judge.check(records_ref[0])
+        if report.converged:
+            return report
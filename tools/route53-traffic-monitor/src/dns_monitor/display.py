@@ -3,16 +3,86 @@
 from __future__ import annotations
 
 import asyncio
+import time
+from collections.abc import Callable
 
-from rich.console import Group
+from rich.console import Group, RenderableType
 from rich.live import Live
 from rich.table import Table
 from rich.text import Text
 
 from .aws import WeightedRecord
+from .completion import ResolverProgress, ResolverState, propagated_count, unreachable_count
+from .convergence import (
+    DEFAULT_CONFIDENCE,
+    DEFAULT_TOLERANCE,
+    ConvergenceReport,
+    evaluate_convergence,
+)
+from .ecs import SubnetResult
+from .histogram import LATENCY_WINDOWS, LatencyPercentiles
 from .stats import PropagationSnapshot, PropagationStats, Stats, StatsSnapshot
+from .timeline import ChangeConvergence, measure_change
 
 BAR_WIDTH = 25
+# 전파 진행 테이블 최대 행 수 (수백 개 리졸버를 감시할 때 미완료 리졸버 위주로 표시)
+PROGRESS_ROWS = 20
+# 대시보드 렌더링(스냅샷 + 레이아웃 + 출력)에 쓸 수 있는 갱신 간격 대비 시간 비율
+RENDER_BUDGET = 0.2
+# 렌더링 비용이 커져도 넘지 않는 최대 갱신 간격(초)
+MAX_REFRESH_INTERVAL = 5.0
+
+
+class AdaptiveRefresh:
+    """렌더링 비용에 맞춰 대시보드 갱신 간격을 조절한다.
+
+    대시보드는 probe 루프와 같은 이벤트 루프에서 그려지므로, 렌더링 시간이 갱신 간격의
+    budget 비율을 넘으면 그 비율이 유지되도록 간격을 바로 늘린다. 비용이 줄면 한 번에
+    20%씩 기본 간격으로 되돌린다.
+    """
+
+    def __init__(
+        self,
+        interval: float,
+        budget: float = RENDER_BUDGET,
+        max_interval: float = MAX_REFRESH_INTERVAL,
+    ):
+        if not 0 < budget <= 1:
+            raise ValueError("budget은 0보다 크고 1 이하여야 합니다.")
+        self.base_interval = interval
+        self.interval = interval
+        self._budget = budget
+        self._max_interval = max(max_interval, interval)
+
+    def next_delay(self, render_seconds: float) -> float:
+        """이번 렌더링 시간을 반영하여 다음 렌더링까지 기다릴 시간(초)을 반환한다."""
+        target = render_seconds / self._budget
+        if target > self.interval:
+            self.interval = min(self._max_interval, target)
+        else:
+            self.interval = max(self.base_interval, target, self.interval * 0.8)
+        return max(0.0, self.interval - render_seconds)
+
+
+async def _run_live(build: Callable[[], RenderableType], refresh_interval: float) -> None:
+    """build() 결과로 Rich Live 화면을 갱신한다.
+
+    스냅샷 병합 / 수렴 계산 / 렌더링은 워커 스레드(asyncio.to_thread)에서 수행하여 이벤트
+    루프의 probe 스케줄을 지연시키지 않는다 (Stats는 다른 스레드에서 읽어도 안전).
+    자동 갱신 스레드를 쓰지 않고 렌더링 비용을 직접 측정하여 AdaptiveRefresh로 다음 갱신
+    시점을 정한다. 종료 시 Live.stop()은 진행 중인 렌더링이 끝날 때까지 기다린다.
+    """
+    pacer = AdaptiveRefresh(refresh_interval)
+
+    def render(live: Live) -> float:
+        t0 = time.perf_counter()
+        live.update(build(), refresh=True)
+        return time.perf_counter() - t0
+
+    with Live(auto_refresh=False, screen=False) as live:
+        while True:
+            elapsed = await asyncio.to_thread(render, live)
+            await asyncio.sleep(pacer.next_delay(elapsed))
 
 
 def _format_duration(seconds: float) -> str:
@@ -34,6 +104,8 @@ def build_dashboard(
     record_name: str,
     records: list[WeightedRecord],
     snapshot: StatsSnapshot,
+    report: ConvergenceReport | None = None,
+    last_change: ChangeConvergence | None = None,
 ) -> Group:
     """대시보드 레이아웃을 구성한다."""
     total_weight = sum(r.weight for r in records)
@@ -77,8 +149,12 @@ def build_dashboard(
     traffic_table.add_column("Count", justify="right")
     traffic_table.add_column("Ratio", justify="right")
     traffic_table.add_column("Diff", justify="right")
+    if report is not None:
+        traffic_table.add_column(f"{report.confidence * 100:.0f}% CI", justify="right")
     traffic_table.add_column("Distribution")
 
+    estimates = {s.set_identifier: s for s in report.shares} if report is not None else {}
+
     total = snapshot.total_requests - snapshot.errors
     for rec in records:
         count = snapshot.distribution.get(rec.set_identifier, 0)
@@ -95,34 +171,206 @@ def build_dashboard(
 
         bar = _make_bar(actual_ratio)
 
-        traffic_table.add_row(
+        cells: list[str | Text] = [
             rec.set_identifier,
             f"{count:,}",
             f"{actual_ratio * 100:.1f}%",
             diff_text,
-            bar,
-        )
+        ]
+        if report is not None:
+            est = estimates.get(rec.set_identifier)
+            if est is None or report.total == 0:
+                cells.append(Text("-", style="dim"))
+            else:
+                cells.append(
+                    Text(
+                        f"{est.ci_low * 100:.1f}\u2013{est.ci_high * 100:.1f}%",
+                        style="green" if est.within_tolerance else "yellow",
+                    )
+                )
+        cells.append(bar)
+        traffic_table.add_row(*cells)
 
     # 상태 바
     latency_str = f"{snapshot.avg_latency_ms:.0f}ms" if snapshot.avg_latency_ms else "N/A"
+    http_failures = sum(sum(f.values()) for f in snapshot.http_failures.values())
     status_line = Text(
         f"\u23f1  TPS: {snapshot.current_tps:.1f}  \u2502  "
         f"Uptime: {_format_duration(snapshot.elapsed_seconds)}  \u2502  "
         f"Errors: {snapshot.errors}  \u2502  "
-        f"Avg Latency: {latency_str}",
+        + (f"HTTP Failures: {http_failures}  \u2502  " if http_failures else "")
+        + f"Avg Latency: {latency_str}",
         style="dim",
     )
 
-    return Group(
-        title,
-        separator,
-        Text(),
-        weight_table,
-        Text(),
-        traffic_table,
-        Text(),
-        status_line,
-        separator,
+    parts = [title, separator, Text(), weight_table, Text(), traffic_table, Text()]
+    ns_table = _build_nameserver_table(records, snapshot)
+    if ns_table is not None:
+        parts.extend([ns_table, Text()])
+    latency_table = _build_latency_table(records, snapshot)
+    if latency_table is not None:
+        parts.extend([latency_table, Text()])
+    if snapshot.events:
+        parts.append(_last_change_line(snapshot, last_change))
+    if report is not None:
+        parts.append(_convergence_line(report))
+    parts.extend([status_line, separator])
+    return Group(*parts)
+
+
+def _build_nameserver_table(records: list[WeightedRecord], snapshot: StatsSnapshot) -> Table | None:
+    """권한 NS별 SetIdentifier 분포 매트릭스 테이블을 구성한다."""
+    ns_ips = sorted(set(snapshot.nameserver_distribution) | set(snapshot.nameserver_errors))
+    if not ns_ips:
+        return None
+
+    table = Table(
+        title="\U0001f5a7 Per-Nameserver Distribution",
+        show_header=True,
+        header_style="bold",
+        padding=(0, 1),
+    )
+    table.add_column("Nameserver", style="green")
+    sids = [r.set_identifier for r in records]
+    for sid in sids:
+        table.add_column(sid, justify="right", style="cyan")
+    table.add_column("Total", justify="right")
+    table.add_column("Errors", justify="right")
+
+    for ns_ip in ns_ips:
+        counts = snapshot.nameserver_distribution.get(ns_ip, {})
+        ns_total = sum(counts.values())
+        cells = []
+        for sid in sids:
+            count = counts.get(sid, 0)
+            ratio = count / ns_total if ns_total > 0 else 0
+            cells.append(f"{count:,} ({ratio * 100:.1f}%)")
+        errors = snapshot.nameserver_errors.get(ns_ip, 0)
+        table.add_row(
+            ns_ip,
+            *cells,
+            f"{ns_total:,}",
+            Text(str(errors), style="red" if errors else "dim"),
+        )
+    return table
+
+
+def _format_percentiles(pcts: LatencyPercentiles | None) -> str:
+    """p50 / p95 / p99 (ms) 문자열."""
+    if pcts is None or pcts.count == 0:
+        return "-"
+    values = [pcts.p50_ms, pcts.p95_ms, pcts.p99_ms]
+    return " / ".join(f"{v:.0f}" if v is not None else "-" for v in values) + " ms"
+
+
+def _build_latency_table(records: list[WeightedRecord], snapshot: StatsSnapshot) -> Table | None:
+    """SetIdentifier별(DNS / HTTP) / 권한 NS별 latency 백분위수 테이블을 구성한다."""
+    if not snapshot.latency_by_identifier and not snapshot.latency_by_nameserver:
+        return None
+
+    table = Table(
+        title="\u23f1 Latency Percentiles (p50 / p95 / p99)",
+        show_header=True,
+        header_style="bold",
+        padding=(0, 1),
+    )
+    table.add_column("Target", style="cyan")
+    for label, _ in LATENCY_WINDOWS:
+        table.add_column(label, justify="right")
+    table.add_column("Samples", justify="right")
+
+    rows: list[tuple[str, dict[str, LatencyPercentiles]]] = []
+    known = [r.set_identifier for r in records]
+    for sid in known + sorted(set(snapshot.latency_by_identifier) - set(known)):
+        if sid in snapshot.latency_by_identifier:
+            rows.append((f"{sid} DNS", snapshot.latency_by_identifier[sid]))
+        if sid in snapshot.http_latency_by_identifier:
+            rows.append((f"{sid} HTTP", snapshot.http_latency_by_identifier[sid]))
+    for ns_ip in sorted(snapshot.latency_by_nameserver):
+        rows.append((f"NS {ns_ip}", snapshot.latency_by_nameserver[ns_ip]))
+
+    for name, windows in rows:
+        total = windows.get("total")
+        table.add_row(
+            name,
+            *(_format_percentiles(windows.get(label)) for label, _ in LATENCY_WINDOWS),
+            f"{total.count:,}" if total else "0",
+        )
+    return table
+
+
+def _last_change_line(snapshot: StatsSnapshot, change: ChangeConvergence | None) -> Text:
+    """마지막 Route53 레코드 변경 이벤트 줄을 구성한다."""
+    event = snapshot.events[-1]
+    if change is not None and change.event is event:
+        # 스냅샷 시점 기준 (로그 재생 시에도 올바른 경과 시간)
+        ago = _format_duration(max(0.0, snapshot.elapsed_seconds - change.detected_second))
+    else:
+        ago = _format_duration(time.monotonic() - event.detected_at)
+    changes = ", ".join(event.changes) if event.changes else "-"
+    line = Text(
+        f"\U0001f504 Last change: {ago} ago ({len(snapshot.events)} total)  \u2502  {changes}",
+        style="magenta",
+    )
+    if change is not None and change.event is event:
+        if change.converged_second is None:
+            line.append("  \u2502  converging\u2026", style="yellow")
+        else:
+            line.append(
+                f"  \u2502  converged in \u2264{change.seconds_upper_bound}s", style="bold green"
+            )
+    return line
+
+
+def _convergence_line(report: ConvergenceReport) -> Text:
+    """수렴 판정 상태 줄을 구성한다."""
+    p_str = f"{report.p_value:.3f}" if report.p_value is not None else "N/A"
+    if report.converged:
+        state = Text("Converged \u2713", style="bold green")
+    else:
+        state = Text("Sampling\u2026", style="yellow")
+    line = Text(
+        f"🎯 Tolerance: \u00b1{report.tolerance * 100:.1f}%  \u2502  "
+        f"\u03c7\u00b2: {report.chi_square:.2f} (p={p_str})  \u2502  ",
+        style="dim",
+    )
+    line.append_text(state)
+    return line
+
+
+def render_dashboard(
+    record_name: str,
+    records: list[WeightedRecord],
+    stats: Stats,
+    snapshot: StatsSnapshot,
+    tolerance: float = DEFAULT_TOLERANCE,
+    confidence: float = DEFAULT_CONFIDENCE,
+) -> Group:
+    """스냅샷으로 수렴 판정/마지막 변경 수렴 시간을 계산하여 대시보드를 구성한다."""
+    report = evaluate_convergence(
+        snapshot.distribution, records, tolerance=tolerance, confidence=confidence
+    )
+    last_change = _measure_last_change(stats, snapshot, tolerance, confidence)
+    return build_dashboard(record_name, records, snapshot, report, last_change)
+
+
+def _measure_last_change(
+    stats: Stats, snapshot: StatsSnapshot, tolerance: float, confidence: float
+) -> ChangeConvergence | None:
+    """마지막 레코드 변경 이후의 수렴 시간을 계산한다 (변경 이벤트가 없으면 None)."""
+    if not snapshot.events:
+        return None
+    # 마지막 변경 이후 구간의 초별 버킷만 조회하여 수렴 시간을 계산
+    event = snapshot.events[-1]
+    since = max(0, int(event.last_unchanged_at - stats.start_time))
+    buckets = stats.get_time_buckets(since_second=since)
+    return measure_change(
+        buckets,
+        event,
+        stats.start_time,
+        int(snapshot.elapsed_seconds),
+        tolerance=tolerance,
+        confidence=confidence,
     )
 
 
@@ -131,14 +379,198 @@ async def run_display(
     records_ref: list[list[WeightedRecord]],
     stats: Stats,
     refresh_interval: float = 0.5,
+    tolerance: float = DEFAULT_TOLERANCE,
+    confidence: float = DEFAULT_CONFIDENCE,
 ) -> None:
-    """Rich Live 대시보드를 주기적으로 갱신한다."""
-    with Live(refresh_per_second=2, screen=False) as live:
-        while True:
-            snapshot = stats.get_snapshot()
-            dashboard = build_dashboard(record_name, records_ref[0], snapshot)
-            live.update(dashboard)
-            await asyncio.sleep(refresh_interval)
+    """Rich Live 대시보드를 주기적으로 갱신한다 (렌더링 비용이 크면 간격을 늘림)."""
+
+    def build() -> Group:
+        snapshot = stats.get_snapshot()
+        return render_dashboard(record_name, records_ref[0], stats, snapshot, tolerance, confidence)
+
+    await _run_live(build, refresh_interval)
+
+
+def build_multi_dashboard(
+    rows: list[tuple[str, list[WeightedRecord], StatsSnapshot, ChangeConvergence | None]],
+    tolerance: float = DEFAULT_TOLERANCE,
+    confidence: float = DEFAULT_CONFIDENCE,
+) -> Group:
+    """여러 레코드의 분포/수렴 상태를 한 테이블로 구성한다.
+
+    Args:
+        rows: (레코드 이름, 현재 가중치 레코드, 스냅샷, 마지막 변경 수렴 정보) 목록
+    """
+    title = Text(
+        f"\n\U0001f680 Route53 Weighted Traffic Monitor \u2014 {len(rows)} records", style="bold"
+    )
+    separator = Text("\u2501" * 64, style="dim")
+
+    table = Table(
+        title="\U0001f4ca Per-Record Distribution (observed / configured)",
+        show_header=True,
+        header_style="bold",
+        padding=(0, 1),
+    )
+    table.add_column("Record", style="cyan")
+    table.add_column("Samples", justify="right")
+    table.add_column("TPS", justify="right")
+    table.add_column("Errors", justify="right")
+    table.add_column("Distribution")
+    table.add_column("Max Diff", justify="right")
+    table.add_column("p", justify="right")
+    table.add_column("Last change")
+    table.add_column("Status")
+
+    converged = 0
+    total_tps = 0.0
+    elapsed = 0.0
+    for record_name, records, snapshot, last_change in rows:
+        report = evaluate_convergence(
+            snapshot.distribution, records, tolerance=tolerance, confidence=confidence
+        )
+        converged += report.converged
+        total_tps += snapshot.current_tps
+        elapsed = max(elapsed, snapshot.elapsed_seconds)
+
+        distribution = Text()
+        max_diff = 0.0
+        for share in report.shares:
+            if report.total:
+                max_diff = max(max_diff, abs(share.observed - share.expected))
+            if distribution:
+                distribution.append("\n")
+            distribution.append(
+                f"{share.set_identifier} {share.observed * 100:.1f}% / {share.expected * 100:.1f}%",
+                style=None if share.within_tolerance else "yellow",
+            )
+
+        p_str = f"{report.p_value:.3f}" if report.p_value is not None else "-"
+        if report.converged:
+            status = Text("Converged \u2713", style="bold green")
+        else:
+            status = Text("Sampling\u2026", style="yellow")
+        table.add_row(
+            record_name,
+            f"{snapshot.total_requests:,}",
+            f"{snapshot.current_tps:.1f}",
+            Text(str(snapshot.errors), style="red" if snapshot.errors else "dim"),
+            distribution,
+            Text(
+                f"{max_diff * 100:.1f}%",
+                style="green" if max_diff <= tolerance else "red",
+            ),
+            p_str,
+            _multi_change_cell(snapshot, last_change),
+            status,
+        )
+
+    status_line = Text(
+        f"\u23f1  TPS: {total_tps:.1f}  \u2502  "
+        f"Uptime: {_format_duration(elapsed)}  \u2502  "
+        f"Converged: {converged}/{len(rows)}  \u2502  "
+        f"Tolerance: \u00b1{tolerance * 100:.1f}%",
+        style="dim",
+    )
+    return Group(title, separator, Text(), table, Text(), status_line, separator)
+
+
+def _multi_change_cell(snapshot: StatsSnapshot, change: ChangeConvergence | None) -> Text:
+    """multi 대시보드의 마지막 변경 셀 (경과 시간 + 수렴 여부)."""
+    if not snapshot.events or change is None:
+        return Text("-", style="dim")
+    ago = _format_duration(max(0.0, snapshot.elapsed_seconds - change.detected_second))
+    cell = Text(f"{ago} ago", style="magenta")
+    if change.converged_second is None:
+        cell.append(" converging\u2026", style="yellow")
+    else:
+        cell.append(f" \u2264{change.seconds_upper_bound}s", style="green")
+    return cell
+
+
+def render_multi_dashboard(
+    targets: list[tuple[str, list[list[WeightedRecord]], Stats]],
+    tolerance: float = DEFAULT_TOLERANCE,
+    confidence: float = DEFAULT_CONFIDENCE,
+) -> Group:
+    """레코드별 스냅샷을 만들어 multi 대시보드를 구성한다."""
+    rows = []
+    for record_name, records_ref, stats in targets:
+        snapshot = stats.get_snapshot()
+        rows.append(
+            (
+                record_name,
+                records_ref[0],
+                snapshot,
+                _measure_last_change(stats, snapshot, tolerance, confidence),
+            )
+        )
+    return build_multi_dashboard(rows, tolerance, confidence)
+
+
+async def run_multi_display(
+    targets: list[tuple[str, list[list[WeightedRecord]], Stats]],
+    refresh_interval: float = 1.0,
+    tolerance: float = DEFAULT_TOLERANCE,
+    confidence: float = DEFAULT_CONFIDENCE,
+) -> None:
+    """multi 대시보드를 주기적으로 갱신한다.
+
+    Args:
+        targets: (레코드 이름, 현재 레코드 참조, Stats) 목록
+    """
+    await _run_live(
+        lambda: render_multi_dashboard(targets, tolerance, confidence), refresh_interval
+    )
+
+
+class ResolverRowCache:
+    """Per-Resolver Breakdown 테이블 행을 리졸버별로 캐시한다.
+
+    증분 snapshot(changed_resolvers)에서 바뀐 리졸버의 행만 다시 정렬/포맷한다.
+    """
+
+    def __init__(self):
+        self._rows: dict[str, list[tuple[str, str, str, str, str]]] = {}
+        self._order: list[str] = []
+
+    def rows(self, snapshot: PropagationSnapshot) -> list[tuple[str, str, str, str, str]]:
+        """리졸버 라벨 순서로 정렬된 테이블 행 목록."""
+        distribution = snapshot.resolver_distribution
+        changed = snapshot.changed_resolvers
+        if changed is None:
+            changed = distribution.keys()
+        new_labels = False
+        for label in changed:
+            ip_counts = distribution.get(label)
+            if ip_counts is None:
+                continue
+            new_labels |= label not in self._rows
+            self._rows[label] = _resolver_rows(label, ip_counts, snapshot.resolver_ttl.get(label))
+        if new_labels:
+            self._order = sorted(self._rows)
+        return [row for label in self._order for row in self._rows[label]]
+
+
+def _resolver_rows(
+    resolver_label: str, ip_counts: dict[str, int], ttl: int | None
+) -> list[tuple[str, str, str, str, str]]:
+    """리졸버 1개의 응답 값별 행 (첫 행에만 리졸버 라벨 / TTL 표시)."""
+    resolver_total = sum(ip_counts.values())
+    rows = []
+    for ip, count in sorted(ip_counts.items(), key=lambda x: x[1], reverse=True):
+        ratio = count / resolver_total if resolver_total > 0 else 0
+        first = not rows
+        rows.append(
+            (
+                resolver_label if first else "",
+                ip,
+                f"{count:,}",
+                f"{ratio * 100:.1f}%",
+                f"{ttl}s" if first and ttl is not None else "",
+            )
+        )
+    return rows
 
 
 def build_propagation_dashboard(
@@ -146,8 +578,12 @@ def build_propagation_dashboard(
     record_type: str,
     snapshot: PropagationSnapshot,
     resolver_count: int,
+    row_cache: ResolverRowCache | None = None,
 ) -> Group:
-    """Propagation 모드 대시보드 레이아웃을 구성한다."""
+    """Propagation 모드 대시보드 레이아웃을 구성한다.
+
+    row_cache를 넘기면 증분 snapshot에서 바뀐 리졸버의 행만 다시 구성한다.
+    """
     # 제목
     title = Text(
         f"\n\U0001f30d DNS Propagation Monitor \u2014 {record_name} ({record_type})",
@@ -186,16 +622,10 @@ def build_propagation_dashboard(
     resolver_table.add_column("Response", style="cyan")
     resolver_table.add_column("Count", justify="right")
     resolver_table.add_column("Ratio", justify="right")
+    resolver_table.add_column("TTL", justify="right")
 
-    for resolver_label in sorted(snapshot.resolver_distribution.keys()):
-        ip_counts = snapshot.resolver_distribution[resolver_label]
-        resolver_total = sum(ip_counts.values())
-        first = True
-        for ip, count in sorted(ip_counts.items(), key=lambda x: x[1], reverse=True):
-            ratio = count / resolver_total if resolver_total > 0 else 0
-            label = resolver_label if first else ""
-            resolver_table.add_row(label, ip, f"{count:,}", f"{ratio * 100:.1f}%")
-            first = False
+    for row in (row_cache or ResolverRowCache()).rows(snapshot):
+        resolver_table.add_row(*row)
 
     # 상태 바
     status_line = Text(
@@ -205,18 +635,85 @@ def build_propagation_dashboard(
         f"Resolvers: {resolver_count}",
         style="dim",
     )
-
-    return Group(
-        title,
-        separator,
-        Text(),
-        overall_table,
-        Text(),
-        resolver_table,
-        Text(),
-        status_line,
-        separator,
+    if snapshot.queries_saved:
+        status_line.append(f"  \u2502  Saved: {_format_saved(snapshot)}", style="dim")
+
+    parts = [title, separator, Text(), overall_table, Text(), resolver_table, Text()]
+    if snapshot.resolver_progress:
+        parts.extend([_build_progress_table(snapshot.resolver_progress), Text()])
+        parts.append(_propagated_line(snapshot.resolver_progress))
+    parts.extend([status_line, separator])
+    return Group(*parts)
+
+
+_STATE_STYLES = {
+    ResolverState.PENDING: "dim",
+    ResolverState.OLD: "red",
+    ResolverState.MIXED: "yellow",
+    ResolverState.NEW: "green",
+    ResolverState.UNREACHABLE: "red dim",
+}
+_STATE_ORDER = {
+    ResolverState.OLD: 0,
+    ResolverState.MIXED: 1,
+    ResolverState.PENDING: 2,
+    ResolverState.NEW: 3,
+    ResolverState.UNREACHABLE: 4,
+}
+
+
+def _format_saved(snapshot: PropagationSnapshot) -> str:
+    """TTL 기반 스케줄로 생략한 질의 수와 고정 TPS 대비 비율."""
+    baseline = snapshot.probes_sent + snapshot.queries_saved
+    ratio = snapshot.queries_saved / baseline if baseline else 0.0
+    return f"{snapshot.queries_saved:,} ({ratio * 100:.0f}%)"
+
+
+def _format_elapsed_at(seconds: float | None) -> str:
+    return f"+{seconds:.1f}s" if seconds is not None else "-"
+
+
+def _build_progress_table(progress: dict[str, ResolverProgress]) -> Table:
+    """리졸버별 전파 상태 테이블을 구성한다 (미완료 리졸버 우선, 최대 PROGRESS_ROWS행)."""
+    table = Table(
+        title="\U0001f6a6 Propagation Progress",
+        show_header=True,
+        header_style="bold",
+        padding=(0, 1),
+    )
+    table.add_column("Resolver", style="green")
+    table.add_column("State")
+    table.add_column("First new", justify="right")
+    table.add_column("Last old", justify="right")
+    table.add_column("Propagated", justify="right")
+
+    ordered = sorted(progress.items(), key=lambda x: (_STATE_ORDER[x[1].state], x[0]))
+    for label, p in ordered[:PROGRESS_ROWS]:
+        table.add_row(
+            label,
+            Text(p.state.value, style=_STATE_STYLES[p.state]),
+            _format_elapsed_at(p.first_new_at),
+            _format_elapsed_at(p.last_old_at),
+            _format_elapsed_at(p.propagated_at),
+        )
+    if len(ordered) > PROGRESS_ROWS:
+        table.add_row(f"\u2026 {len(ordered) - PROGRESS_ROWS} more", "", "", "", "", style="dim")
+    return table
+
+
+def _propagated_line(progress: dict[str, ResolverProgress]) -> Text:
+    """전파 완료 리졸버 비율 줄을 구성한다 (UNREACHABLE 리졸버는 분모에서 제외)."""
+    done = propagated_count(progress)
+    unreachable = unreachable_count(progress)
+    total = len(progress) - unreachable
+    ratio = done / total if total else 0.0
+    line = Text(
+        f"\u2705 Propagated: {done}/{total} ({ratio * 100:.1f}%)  {_make_bar(ratio)}",
+        style="bold green" if total and done == total else "bold",
     )
+    if unreachable:
+        line.append(f"  \u2502  Unreachable: {unreachable}", style="red")
+    return line
 
 
 async def run_propagation_display(
@@ -226,12 +723,75 @@ async def run_propagation_display(
     resolver_count: int,
     refresh_interval: float = 0.5,
 ) -> None:
-    """Propagation 모드 대시보드를 주기적으로 갱신한다."""
-    with Live(refresh_per_second=2, screen=False) as live:
-        while True:
-            snapshot = stats.get_snapshot()
-            dashboard = build_propagation_dashboard(
-                record_name, record_type, snapshot, resolver_count
-            )
-            live.update(dashboard)
-            await asyncio.sleep(refresh_interval)
+    """Propagation 모드 대시보드를 주기적으로 갱신한다.
+
+    증분 snapshot으로 바뀐 리졸버만 다시 병합/포맷하고, 렌더링 비용이 크면 간격을 늘린다.
+    """
+    view = stats.view()
+    row_cache = ResolverRowCache()
+
+    def build() -> Group:
+        return build_propagation_dashboard(
+            record_name, record_type, view.refresh(), resolver_count, row_cache
+        )
+
+    await _run_live(build, refresh_interval)
+
+
+def build_ecs_matrix(
+    record_name: str, records: list[WeightedRecord], results: list[SubnetResult]
+) -> Group:
+    """ECS 스윕 결과를 서브넷 × SetIdentifier 응답 비율 매트릭스로 구성한다.
+
+    서브넷별로 가장 많이 응답한 SetIdentifier는 굵게 표시하고, 레코드에 매칭되지 않은
+    응답은 기타 열에 모은다. Scope 열은 응답 ECS scope prefix 길이(여러 값이면 모두).
+    """
+    title = Text(f"\n\U0001f310 ECS Sweep — {record_name} ({len(results)} subnets)", style="bold")
+    table = Table(
+        title="\U0001f4ca Subnet × SetIdentifier (share of answers)",
+        show_header=True,
+        header_style="bold",
+        padding=(0, 1),
+    )
+    table.add_column("Subnet", style="cyan")
+    table.add_column("Label")
+    for record in records:
+        header = record.set_identifier
+        if record.policy != "weighted":
+            header += f"\n[dim]{record.policy}[/dim]"
+        else:
+            header += f"\n[dim]w={record.weight}[/dim]"
+        table.add_column(header, justify="right")
+    table.add_column("기타", justify="right")
+    table.add_column("Errors", justify="right")
+    table.add_column("Scope", justify="right")
+
+    for result in results:
+        answered = result.answered
+        dominant = result.dominant
+        cells: list[Text] = []
+        for record in records:
+            count = result.distribution.get(record.set_identifier, 0)
+            if not count:
+                cells.append(Text("-", style="dim"))
+                continue
+            style = "bold green" if record.set_identifier == dominant else None
+            cells.append(Text(f"{count / answered * 100:.0f}%", style=style))
+        other = sum(result.unmatched.values())
+        cells.append(
+            Text(f"{other / answered * 100:.0f}%", style="yellow")
+            if other
+            else Text("-", style="dim")
+        )
+        cells.append(Text(str(result.errors), style="red" if result.errors else "dim"))
+        scopes = ",".join(f"/{s}" for s in sorted(result.scopes)) or "-"
+        table.add_row(str(result.subnet.network), result.subnet.label, *cells, scopes)
+
+    distinct = {r.dominant for r in results if r.dominant is not None}
+    summary = Text(
+        f"Answered: {sum(r.answered for r in results):,}  │  "
+        f"Errors: {sum(r.errors for r in results):,}  │  "
+        f"Distinct dominant answers: {len(distinct)}",
+        style="dim",
+    )
+    return Group(title, Text(), table, Text(), summary)
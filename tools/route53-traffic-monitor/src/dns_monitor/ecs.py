@@ -0,0 +1,203 @@
+"""EDNS Client Subnet(ECS) 스윕 모듈.
+
+지연 시간 / 지리적 위치 라우팅이 섞인 레코드는 질의하는 위치에 따라 응답이 달라지므로,
+이 머신의 위치만으로는 다른 지역 사용자가 받는 응답을 볼 수 없다. 권한 NS에 ECS 옵션
+(RFC 7871)으로 클라이언트 서브넷을 지정해 질의하면, Route53은 그 서브넷에서 온 질의로
+보고 라우팅을 결정한다.
+
+서브넷 목록의 각 서브넷에 N회씩 질의하여 서브넷별 SetIdentifier 응답 분포를 구한다.
+질의는 watch와 같은 공유 UDP 소켓(AsyncDnsClient)으로 파이프라이닝하고, 동시에 응답을
+기다리는 질의 수는 concurrency개로 제한한다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import ipaddress
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from .classifier import AnswerClassifier
+from .resolver import ClientNetwork, WeightedResolver
+from .udp import AsyncDnsClient
+
+DEFAULT_QUERIES_PER_SUBNET = 20
+DEFAULT_CONCURRENCY = 64
+
+
+@dataclass(frozen=True)
+class ClientSubnet:
+    """ECS로 지정할 클라이언트 서브넷."""
+
+    network: ClientNetwork
+    label: str
+
+
+@dataclass
+class SubnetResult:
+    """서브넷 1개의 스윕 결과."""
+
+    subnet: ClientSubnet
+    # SetIdentifier → 응답 수
+    distribution: dict[str, int] = field(default_factory=dict)
+    # 매칭되지 않은 응답 값(쉼표 연결) → 응답 수
+    unmatched: dict[str, int] = field(default_factory=dict)
+    # 응답 없음 / NOERROR가 아닌 응답 수
+    errors: int = 0
+    # 응답 ECS scope prefix 길이 → 응답 수
+    scopes: dict[int, int] = field(default_factory=dict)
+
+    @property
+    def answered(self) -> int:
+        """정상 응답 수 (매칭 실패 포함)."""
+        return sum(self.distribution.values()) + sum(self.unmatched.values())
+
+    def share(self, set_identifier: str) -> float:
+        """정상 응답 중 set_identifier 비율."""
+        answered = self.answered
+        return self.distribution.get(set_identifier, 0) / answered if answered else 0.0
+
+    @property
+    def dominant(self) -> str | None:
+        """가장 많이 응답한 SetIdentifier."""
+        if not self.distribution:
+            return None
+        return max(self.distribution, key=lambda sid: self.distribution[sid])
+
+    def to_dict(self) -> dict:
+        """JSON 기록용 dict."""
+        return {
+            "subnet": str(self.subnet.network),
+            "label": self.subnet.label,
+            "answered": self.answered,
+            "errors": self.errors,
+            "distribution": dict(self.distribution),
+            "unmatched": dict(self.unmatched),
+            "scopes": {str(k): v for k, v in sorted(self.scopes.items())},
+        }
+
+
+def parse_subnet(text: str, label: str | None = None) -> ClientSubnet:
+    """서브넷 문자열을 ClientSubnet으로 변환한다.
+
+    호스트 비트는 버리고(예: 203.0.113.7/24 → 203.0.113.0/24), prefix를 생략한
+    주소는 IPv4 /24, IPv6 /56으로 간주한다 (공개 리졸버가 보내는 ECS 길이).
+
+    Raises:
+        ValueError: 서브넷 형식이 잘못된 경우
+    """
+    text = text.strip()
+    try:
+        if "/" not in text:
+            address = ipaddress.ip_address(text)
+            text = f"{address}/{24 if address.version == 4 else 56}"
+        network = ipaddress.ip_network(text, strict=False)
+    except ValueError as e:
+        raise ValueError(f"잘못된 서브넷입니다: {text}") from e
+    return ClientSubnet(network=network, label=label or str(network))
+
+
+def load_subnets(path: Path) -> list[ClientSubnet]:
+    """서브넷 목록 파일을 읽는다.
+
+    한 줄에 서브넷 하나씩 `서브넷 [라벨]` 또는 `서브넷,라벨` 형식으로 적는다
+    (예: `1.208.0.0/16 seoul`). 빈 줄과 `#` 이후 주석은 무시하며, 라벨을 생략하면
+    서브넷을 라벨로 사용한다.
+
+    Raises:
+        ValueError: 서브넷 형식이 잘못되었거나 서브넷이 하나도 없는 경우
+    """
+    subnets: list[ClientSubnet] = []
+    with open(path, encoding="utf-8") as f:
+        for lineno, raw in enumerate(f, start=1):
+            line = raw.split("#", 1)[0].strip()
+            if not line:
+                continue
+            spec, _, label = line.replace(",", " ", 1).partition(" ")
+            try:
+                subnets.append(parse_subnet(spec, label.strip() or None))
+            except ValueError as e:
+                raise ValueError(f"{path}:{lineno}: {e}") from e
+    subnets = dedupe_subnets(subnets)
+    if not subnets:
+        raise ValueError(f"{path}: 서브넷이 없습니다.")
+    return subnets
+
+
+def dedupe_subnets(subnets: list[ClientSubnet]) -> list[ClientSubnet]:
+    """같은 네트워크는 처음 나온 것만 남긴다 (순서 유지)."""
+    seen: dict[ClientNetwork, ClientSubnet] = {}
+    for subnet in subnets:
+        seen.setdefault(subnet.network, subnet)
+    return list(seen.values())
+
+
+async def sweep_subnets(
+    resolver: WeightedResolver,
+    classifier: AnswerClassifier,
+    subnets: list[ClientSubnet],
+    queries: int = DEFAULT_QUERIES_PER_SUBNET,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    client: AsyncDnsClient | None = None,
+    on_progress: Callable[[int], None] | None = None,
+) -> list[SubnetResult]:
+    """서브넷마다 queries회씩 ECS 질의를 보내 서브넷별 응답 분포를 구한다.
+
+    질의는 서브넷을 번갈아 가며(라운드 1의 모든 서브넷 → 라운드 2 ...) 보내므로, 중간에
+    중단해도 서브넷마다 비슷한 수의 표본이 모인다. 권한 NS는 질의마다 라운드로빈으로
+    고른다. concurrency개의 worker가 질의를 하나씩 꺼내 보내므로 동시에 응답을 기다리는
+    질의는 최대 concurrency개다.
+
+    Args:
+        client: 공유 UDP 소켓. 지정하지 않으면 스윕 동안만 쓸 소켓을 새로 연다
+        on_progress: 질의 1건이 끝날 때마다 완료된 질의 수로 호출된다
+    """
+    if queries < 1:
+        raise ValueError("queries는 1 이상이어야 합니다.")
+    if concurrency < 1:
+        raise ValueError("concurrency는 1 이상이어야 합니다.")
+    if client is None:
+        async with AsyncDnsClient() as own_client:
+            return await sweep_subnets(
+                resolver, classifier, subnets, queries, concurrency, own_client, on_progress
+            )
+
+    results = [SubnetResult(subnet=s) for s in subnets]
+    pending = iter([r for _ in range(queries) for r in results])
+    done = 0
+
+    async def worker() -> None:
+        nonlocal done
+        # 단일 이벤트 루프에서 공유 iterator를 꺼내므로 질의가 중복되지 않는다
+        for result in pending:
+            ns_ip = resolver.next_nameserver()
+            answer = await resolver.query_async(client, ns_ip, result.subnet.network)
+            _record(result, classifier, answer.values, answer.rcode, answer.scope_prefix)
+            done += 1
+            if on_progress is not None:
+                on_progress(done)
+
+    workers = min(concurrency, len(results) * queries)
+    await asyncio.gather(*(worker() for _ in range(workers)))
+    return results
+
+
+def _record(
+    result: SubnetResult,
+    classifier: AnswerClassifier,
+    values: list[str],
+    rcode: int,
+    scope: int | None,
+) -> None:
+    if rcode != 0 or not values:
+        result.errors += 1
+        return
+    if scope is not None:
+        result.scopes[scope] = result.scopes.get(scope, 0) + 1
+    sid = classifier.classify(values)
+    if sid is None:
+        key = ",".join(values)
+        result.unmatched[key] = result.unmatched.get(key, 0) + 1
+    else:
+        result.distribution[sid] = result.distribution.get(sid, 0) + 1
@@ -0,0 +1,170 @@
+"""고정 메모리 latency 히스토그램 모듈.
+
+로그 스케일 버킷(상대 오차 ~1%)에 latency를 누적하여 메모리 사용량을 고정한 채로
+p50/p95/p99 등 백분위수를 계산한다. 시간 윈도우(최근 10초, 1분)는 1초 단위
+히스토그램 링 버퍼로, 전체 구간은 누적 히스토그램으로 관리한다.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+
+# 버킷 범위: 10us ~ 120s, 버킷 간 비율 1.02 (대표값 상대 오차 ~1%)
+MIN_LATENCY = 1e-5
+MAX_LATENCY = 120.0
+BUCKET_RATIO = 1.02
+_LOG_RATIO = math.log(BUCKET_RATIO)
+BUCKET_COUNT = math.ceil(math.log(MAX_LATENCY / MIN_LATENCY) / _LOG_RATIO) + 1
+
+# (라벨, 윈도우 길이 초). None은 전체 구간
+LATENCY_WINDOWS: tuple[tuple[str, int | None], ...] = (("10s", 10), ("1m", 60), ("total", None))
+RING_SECONDS = 60
+
+PERCENTILES = (0.50, 0.95, 0.99)
+
+
+def bucket_index(value: float) -> int:
+    """latency(초)를 버킷 인덱스로 변환한다."""
+    if value <= MIN_LATENCY:
+        return 0
+    idx = int(math.log(value / MIN_LATENCY) / _LOG_RATIO) + 1
+    return min(idx, BUCKET_COUNT - 1)
+
+
+def bucket_value(index: int) -> float:
+    """버킷의 대표값(초)을 반환한다 (버킷 경계의 기하 평균)."""
+    if index <= 0:
+        return MIN_LATENCY
+    return MIN_LATENCY * BUCKET_RATIO ** (index - 0.5)
+
+
+class LatencyHistogram:
+    """로그 스케일 버킷 기반 latency 히스토그램.
+
+    버킷은 sparse dict로 보관하므로 크기는 BUCKET_COUNT로 상한이 고정된다.
+    """
+
+    __slots__ = ("buckets", "count", "total")
+
+    def __init__(self):
+        self.buckets: dict[int, int] = {}
+        self.count: int = 0
+        self.total: float = 0.0
+
+    def record(self, value: float) -> None:
+        """latency(초) 1건을 기록한다."""
+        idx = bucket_index(value)
+        self.buckets[idx] = self.buckets.get(idx, 0) + 1
+        self.count += 1
+        self.total += value
+
+    def merge(self, other: LatencyHistogram) -> None:
+        """다른 히스토그램의 값을 합산한다."""
+        for idx, n in dict(other.buckets).items():
+            self.buckets[idx] = self.buckets.get(idx, 0) + n
+        self.count += other.count
+        self.total += other.total
+
+    def clear(self) -> None:
+        """모든 값을 초기화한다."""
+        self.buckets.clear()
+        self.count = 0
+        self.total = 0.0
+
+    def mean(self) -> float | None:
+        """평균 latency(초)를 반환한다."""
+        if self.count == 0:
+            return None
+        return self.total / self.count
+
+    def cumulative(self, bounds: tuple[float, ...]) -> list[int]:
+        """오름차순 상한(초) 목록별 누적 개수를 반환한다 (Prometheus histogram의 le 버킷).
+
+        버킷 대표값으로 비교하므로 경계 근처 값은 ~1% 오차 내에서 인접 구간에 속할 수 있다.
+        """
+        counts = [0] * len(bounds)
+        for idx, n in dict(self.buckets).items():
+            value = bucket_value(idx)
+            for i, bound in enumerate(bounds):
+                if value <= bound:
+                    counts[i] += n
+                    break
+        for i in range(1, len(counts)):
+            counts[i] += counts[i - 1]
+        return counts
+
+    def percentiles(self, quantiles: tuple[float, ...] = PERCENTILES) -> list[float | None]:
+        """quantile(0~1) 목록에 대한 latency(초)를 반환한다."""
+        count = sum(self.buckets.values())
+        if count == 0:
+            return [None] * len(quantiles)
+        ranks = [max(1, math.ceil(q * count)) for q in quantiles]
+        results: list[float | None] = [None] * len(quantiles)
+        order = sorted(range(len(quantiles)), key=lambda i: ranks[i])
+        cumulative = 0
+        pos = 0
+        for idx in sorted(self.buckets):
+            cumulative += self.buckets[idx]
+            while pos < len(order) and cumulative >= ranks[order[pos]]:
+                results[order[pos]] = bucket_value(idx)
+                pos += 1
+            if pos == len(order):
+                break
+        return results
+
+
+class WindowedLatency:
+    """최근 RING_SECONDS초의 1초 단위 히스토그램 + 전체 누적 히스토그램."""
+
+    __slots__ = ("_slots", "_slot_seconds", "total")
+
+    def __init__(self):
+        self._slots = [LatencyHistogram() for _ in range(RING_SECONDS)]
+        self._slot_seconds = [-1] * RING_SECONDS
+        self.total = LatencyHistogram()
+
+    def record(self, value: float, now: float) -> None:
+        """latency(초)를 now 시각의 1초 슬롯과 누적 히스토그램에 기록한다."""
+        second = int(now)
+        slot = second % RING_SECONDS
+        hist = self._slots[slot]
+        if self._slot_seconds[slot] != second:
+            hist.clear()
+            self._slot_seconds[slot] = second
+        hist.record(value)
+        self.total.record(value)
+
+    def merge_window_into(self, target: LatencyHistogram, seconds: int | None, now: float) -> None:
+        """최근 seconds초(None이면 전체) 구간의 값을 target에 합산한다."""
+        if seconds is None:
+            target.merge(self.total)
+            return
+        oldest = int(now) - min(seconds, RING_SECONDS) + 1
+        for slot, second in enumerate(list(self._slot_seconds)):
+            if second >= oldest:
+                target.merge(self._slots[slot])
+
+
+@dataclass
+class LatencyPercentiles:
+    """윈도우 하나의 latency 요약 (ms)."""
+
+    count: int
+    p50_ms: float | None
+    p95_ms: float | None
+    p99_ms: float | None
+
+
+def summarize_windows(sources: list[WindowedLatency], now: float) -> dict[str, LatencyPercentiles]:
+    """여러 WindowedLatency를 병합하여 윈도우별 백분위수를 계산한다."""
+    result: dict[str, LatencyPercentiles] = {}
+    for label, seconds in LATENCY_WINDOWS:
+        merged = LatencyHistogram()
+        for source in sources:
+            source.merge_window_into(merged, seconds, now)
+        p50, p95, p99 = (
+            v * 1000 if v is not None else None for v in merged.percentiles(PERCENTILES)
+        )
+        result[label] = LatencyPercentiles(count=merged.count, p50_ms=p50, p95_ms=p95, p99_ms=p99)
+    return result
@@ -0,0 +1,120 @@
+"""해석된 IP로 직접 연결하는 HTTP probe 모듈.
+
+DNS 응답으로 받은 IP에 직접 연결하되, TLS SNI와 Host 헤더에는 레코드 이름을 사용한다.
+httpx 연결 풀은 origin(scheme, 호스트, 포트) 단위이므로 URL 호스트를 IP로 두면
+해석된 IP마다 별도의 keep-alive 풀이 유지된다. 같은 IP로 가는 이후 probe는 TLS
+핸드셰이크 없이 기존 연결을 재사용하므로 backend 응답 시간을 측정한다.
+
+인증서는 레코드 이름(SNI) 기준으로 검증한다 (--insecure로 끌 수 있다).
+실패한 요청은 버리지 않고 종류(TLS / 연결 / 타임아웃 / 그 외)를 돌려주어 집계한다.
+"""
+
+from __future__ import annotations
+
+import ssl
+import time
+from dataclasses import dataclass
+
+import httpx
+
+DEFAULT_TIMEOUT = 10.0
+# probe 간격(1 / TPS × 해석된 IP 수)보다 충분히 길게 유지하여 연결을 재사용한다
+DEFAULT_KEEPALIVE_EXPIRY = 60.0
+DEFAULT_MAX_CONNECTIONS = 256
+
+# HTTP probe 실패 종류 (샘플 로그에는 1부터 시작하는 순번으로 기록)
+FAILURE_TLS = "tls"
+FAILURE_CONNECT = "connect"
+FAILURE_TIMEOUT = "timeout"
+FAILURE_HTTP = "http"
+HTTP_FAILURES = (FAILURE_TLS, FAILURE_CONNECT, FAILURE_TIMEOUT, FAILURE_HTTP)
+
+
+@dataclass
+class ProbeResult:
+    """HTTP probe 1회 결과. 성공하면 latency, 실패하면 failure(실패 종류)만 채운다."""
+
+    latency: float | None = None
+    failure: str | None = None
+
+
+def classify_failure(exc: httpx.HTTPError) -> str:
+    """httpx 예외를 실패 종류로 분류한다.
+
+    인증서 검증 실패 등 TLS 오류는 httpx.ConnectError로 전달되므로 예외 체인에서
+    ssl.SSLError를 찾아 연결 실패와 구분한다.
+    """
+    if isinstance(exc, httpx.TimeoutException):
+        return FAILURE_TIMEOUT
+    cause: BaseException | None = exc
+    while cause is not None:
+        if isinstance(cause, ssl.SSLError):
+            return FAILURE_TLS
+        cause = cause.__cause__ or cause.__context__
+    if isinstance(exc, httpx.ConnectError):
+        return FAILURE_CONNECT
+    return FAILURE_HTTP
+
+
+class HttpProber:
+    """해석된 IP별 연결 풀을 유지하며 HTTP 요청 latency를 측정한다.
+
+    Args:
+        endpoint: 요청할 URL (scheme/포트/경로를 사용하고 호스트는 해석된 IP로 교체)
+        record_name: SNI / Host 헤더 / 인증서 검증에 사용할 이름
+        timeout: 요청 타임아웃(초)
+        verify: TLS 인증서 검증 여부 (False면 자체 서명 / 사설 CA 인증서도 허용)
+    """
+
+    def __init__(
+        self,
+        endpoint: str,
+        record_name: str,
+        timeout: float = DEFAULT_TIMEOUT,
+        verify: bool = True,
+        keepalive_expiry: float = DEFAULT_KEEPALIVE_EXPIRY,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+    ):
+        url = httpx.URL(endpoint)
+        if url.scheme not in ("http", "https"):
+            raise ValueError(f"HTTP probe는 http/https endpoint만 지원합니다: {endpoint}")
+        self._url = url
+        self._headers = {"Host": record_name if url.port is None else f"{record_name}:{url.port}"}
+        self._extensions = {"sni_hostname": record_name} if url.scheme == "https" else {}
+        # 리다이렉트는 IP 고정 연결을 벗어나므로 따라가지 않고 3xx 응답 시간을 측정한다
+        self._client = httpx.AsyncClient(
+            timeout=httpx.Timeout(timeout),
+            verify=verify,
+            follow_redirects=False,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+                keepalive_expiry=keepalive_expiry,
+            ),
+        )
+
+    def url_for(self, ip: str) -> httpx.URL:
+        """endpoint의 호스트를 ip로 교체한 URL."""
+        return self._url.copy_with(host=ip)
+
+    async def probe(self, ip: str) -> ProbeResult:
+        """ip로 요청 1회를 보내고 latency(초) 또는 실패 종류를 반환한다."""
+        t0 = time.monotonic()
+        try:
+            # 본문까지 읽은 뒤 연결이 풀로 반환된다
+            await self._client.get(
+                self.url_for(ip), headers=self._headers, extensions=self._extensions
+            )
+        except httpx.HTTPError as e:
+            return ProbeResult(failure=classify_failure(e))
+        return ProbeResult(latency=time.monotonic() - t0)
+
+    async def aclose(self) -> None:
+        """연결 풀을 닫는다."""
+        await self._client.aclose()
+
+    async def __aenter__(self) -> HttpProber:
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
@@ -0,0 +1,415 @@
+"""Prometheus 텍스트 형식 metrics 엔드포인트 모듈.
+
+headless 모드(또는 대시보드와 함께)에서 Stats / PropagationStats의 카운터와 latency
+히스토그램을 로컬 HTTP 엔드포인트(`/metrics`)로 노출한다.
+
+스크레이프 비용을 줄이기 위해 렌더링 결과를 cache_ttl초 동안 캐시한다. 캐시 유효
+기간 안의 요청은 스냅샷을 새로 만들지 않고 직전 렌더링 결과(bytes)를 그대로 반환한다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from .aws import WeightedRecord
+from .completion import ResolverState, propagated_count
+from .convergence import expected_shares
+from .histogram import LatencyHistogram
+from .stats import PropagationStats, Stats, StatsSnapshot
+
+DEFAULT_CACHE_TTL = 1.0
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Prometheus histogram 버킷 상한(초)
+LATENCY_BOUNDS: tuple[float, ...] = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+_MAX_REQUEST_BYTES = 8192
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(labels: dict[str, str]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in labels.items()) + "}"
+
+
+def _number(value: float) -> str:
+    if isinstance(value, int):
+        return str(value)
+    return repr(float(value))
+
+
+class _MetricWriter:
+    """Prometheus 텍스트 형식 줄을 누적한다."""
+
+    def __init__(self):
+        self._lines: list[str] = []
+
+    def metric(
+        self,
+        name: str,
+        kind: str,
+        help_text: str,
+        samples: list[tuple[dict[str, str], float]],
+    ) -> None:
+        self._lines.append(f"# HELP {name} {help_text}")
+        self._lines.append(f"# TYPE {name} {kind}")
+        for labels, value in samples:
+            self._lines.append(f"{name}{_labels(labels)} {_number(value)}")
+
+    def histogram(
+        self,
+        name: str,
+        help_text: str,
+        series: list[tuple[dict[str, str], LatencyHistogram]],
+    ) -> None:
+        self._lines.append(f"# HELP {name} {help_text}")
+        self._lines.append(f"# TYPE {name} histogram")
+        for labels, hist in series:
+            counts = hist.cumulative(LATENCY_BOUNDS)
+            for bound, count in zip(LATENCY_BOUNDS, counts, strict=True):
+                self._lines.append(f"{name}_bucket{_labels({**labels, 'le': repr(bound)})} {count}")
+            self._lines.append(f"{name}_bucket{_labels({**labels, 'le': '+Inf'})} {hist.count}")
+            self._lines.append(f"{name}_sum{_labels(labels)} {_number(hist.total)}")
+            self._lines.append(f"{name}_count{_labels(labels)} {hist.count}")
+
+    def render(self) -> str:
+        return "\n".join(self._lines) + "\n"
+
+
+@dataclass
+class _WatchView:
+    """레코드 1개의 렌더링 입력."""
+
+    base: dict[str, str]
+    records: list[WeightedRecord]
+    snapshot: StatsSnapshot
+    latency_by_sid: dict[str, LatencyHistogram]
+    latency_by_ns: dict[str, LatencyHistogram]
+    http_latency_by_sid: dict[str, LatencyHistogram]
+
+
+def render_watch_metrics(record_name: str, records: list[WeightedRecord], stats: Stats) -> str:
+    """watch 모드 Stats를 Prometheus 텍스트 형식으로 렌더링한다."""
+    return render_multi_watch_metrics([(record_name, records, stats)])
+
+
+def render_multi_watch_metrics(
+    targets: list[tuple[str, list[WeightedRecord], Stats]],
+) -> str:
+    """여러 레코드의 watch Stats를 하나의 Prometheus 텍스트로 렌더링한다 (record 라벨로 구분)."""
+    views: list[_WatchView] = []
+    for record_name, records, stats in targets:
+        by_sid, by_ns = stats.get_latency_histograms()
+        views.append(
+            _WatchView(
+                base={"record": record_name},
+                records=records,
+                snapshot=stats.get_snapshot(),
+                latency_by_sid=by_sid,
+                latency_by_ns=by_ns,
+                http_latency_by_sid=stats.get_http_latency_histograms(),
+            )
+        )
+    w = _MetricWriter()
+
+    w.metric(
+        "dnsmon_requests_total",
+        "counter",
+        "DNS probes sent to authoritative nameservers.",
+        [(v.base, v.snapshot.total_requests) for v in views],
+    )
+    w.metric(
+        "dnsmon_errors_total",
+        "counter",
+        "DNS probes that failed or could not be mapped to a SetIdentifier.",
+        [(v.base, v.snapshot.errors) for v in views],
+    )
+    w.metric(
+        "dnsmon_http_failures_total",
+        "counter",
+        "HTTP probes that failed, per SetIdentifier and reason (tls, connect, timeout, http).",
+        [
+            ({**v.base, "set_identifier": sid, "reason": reason}, n)
+            for v in views
+            for sid, failures in sorted(v.snapshot.http_failures.items())
+            for reason, n in sorted(failures.items())
+        ],
+    )
+    w.metric(
+        "dnsmon_responses_total",
+        "counter",
+        "DNS answers mapped to each SetIdentifier.",
+        [
+            ({**v.base, "set_identifier": sid}, n)
+            for v in views
+            for sid, n in sorted(v.snapshot.distribution.items())
+        ],
+    )
+    w.metric(
+        "dnsmon_expected_share",
+        "gauge",
+        "Configured Route53 weight share of each SetIdentifier (0-1).",
+        [
+            ({**v.base, "set_identifier": sid}, share)
+            for v in views
+            for sid, share in sorted(expected_shares(v.records).items())
+        ],
+    )
+    w.metric(
+        "dnsmon_nameserver_responses_total",
+        "counter",
+        "DNS answers per authoritative nameserver and SetIdentifier.",
+        [
+            ({**v.base, "nameserver": ns, "set_identifier": sid}, n)
+            for v in views
+            for ns, counts in sorted(v.snapshot.nameserver_distribution.items())
+            for sid, n in sorted(counts.items())
+        ],
+    )
+    w.metric(
+        "dnsmon_nameserver_errors_total",
+        "counter",
+        "Failed DNS probes per authoritative nameserver.",
+        [
+            ({**v.base, "nameserver": ns}, n)
+            for v in views
+            for ns, n in sorted(v.snapshot.nameserver_errors.items())
+        ],
+    )
+    w.metric(
+        "dnsmon_record_changes_total",
+        "counter",
+        "Route53 weighted record changes detected.",
+        [(v.base, len(v.snapshot.events)) for v in views],
+    )
+    w.metric(
+        "dnsmon_current_tps",
+        "gauge",
+        "Recent probe rate.",
+        [(v.base, v.snapshot.current_tps) for v in views],
+    )
+    w.metric(
+        "dnsmon_uptime_seconds",
+        "gauge",
+        "Seconds since monitoring started.",
+        [(v.base, v.snapshot.elapsed_seconds) for v in views],
+    )
+    w.histogram(
+        "dnsmon_latency_seconds",
+        "DNS response latency per SetIdentifier.",
+        [
+            ({**v.base, "set_identifier": sid}, hist)
+            for v in views
+            for sid, hist in sorted(v.latency_by_sid.items())
+        ],
+    )
+    w.histogram(
+        "dnsmon_http_latency_seconds",
+        "HTTP request latency per SetIdentifier over a pooled connection to the resolved IP.",
+        [
+            ({**v.base, "set_identifier": sid}, hist)
+            for v in views
+            for sid, hist in sorted(v.http_latency_by_sid.items())
+        ],
+    )
+    w.histogram(
+        "dnsmon_dns_latency_seconds",
+        "DNS response latency per authoritative nameserver.",
+        [
+            ({**v.base, "nameserver": ns}, hist)
+            for v in views
+            for ns, hist in sorted(v.latency_by_ns.items())
+        ],
+    )
+    return w.render()
+
+
+def render_propagation_metrics(record_name: str, stats: PropagationStats) -> str:
+    """propagation 모드 PropagationStats를 Prometheus 텍스트 형식으로 렌더링한다."""
+    snapshot = stats.get_snapshot()
+    base = {"record": record_name}
+    w = _MetricWriter()
+
+    w.metric(
+        "dnsmon_propagation_probes_total",
+        "counter",
+        "DNS queries sent to public resolvers.",
+        [(base, snapshot.probes_sent)],
+    )
+    w.metric(
+        "dnsmon_propagation_errors_total",
+        "counter",
+        "Resolver queries that failed or returned an empty answer.",
+        [(base, snapshot.errors)],
+    )
+    w.metric(
+        "dnsmon_propagation_queries_saved_total",
+        "counter",
+        "Queries skipped by TTL-aware scheduling compared with a fixed rate.",
+        [(base, snapshot.queries_saved)],
+    )
+    w.metric(
+        "dnsmon_propagation_responses_total",
+        "counter",
+        "Answer values returned per resolver.",
+        [
+            ({**base, "resolver": label, "value": value}, n)
+            for label, counts in sorted(snapshot.resolver_distribution.items())
+            for value, n in sorted(counts.items())
+        ],
+    )
+    w.metric(
+        "dnsmon_propagation_resolver_ttl_seconds",
+        "gauge",
+        "Remaining TTL in the last answer from each resolver.",
+        [
+            ({**base, "resolver": label}, ttl)
+            for label, ttl in sorted(snapshot.resolver_ttl.items())
+        ],
+    )
+    if snapshot.resolver_progress:
+        w.metric(
+            "dnsmon_propagation_resolver_state",
+            "gauge",
+            "Propagation state of each resolver (1 for the current state).",
+            [
+                ({**base, "resolver": label, "state": state.value}, int(p.state is state))
+                for label, p in sorted(snapshot.resolver_progress.items())
+                for state in ResolverState
+            ],
+        )
+        w.metric(
+            "dnsmon_propagation_resolvers_propagated",
+            "gauge",
+            "Resolvers confirmed on the expected value.",
+            [(base, propagated_count(snapshot.resolver_progress))],
+        )
+        w.metric(
+            "dnsmon_propagation_resolvers",
+            "gauge",
+            "Resolvers tracked for propagation.",
+            [(base, len(snapshot.resolver_progress))],
+        )
+    w.metric(
+        "dnsmon_uptime_seconds",
+        "gauge",
+        "Seconds since monitoring started.",
+        [(base, snapshot.elapsed_seconds)],
+    )
+    w.histogram(
+        "dnsmon_propagation_latency_seconds",
+        "Resolver response latency.",
+        [(base, stats.get_latency_histogram())],
+    )
+    return w.render()
+
+
+class MetricsServer:
+    """`GET /metrics`에 Prometheus 텍스트를 응답하는 최소 HTTP 서버.
+
+    render는 이벤트 루프 스레드에서 호출되며, 결과는 cache_ttl초 동안 재사용한다.
+    """
+
+    def __init__(
+        self,
+        render: Callable[[], str],
+        host: str = "127.0.0.1",
+        port: int = 0,
+        cache_ttl: float = DEFAULT_CACHE_TTL,
+    ):
+        self._render = render
+        self._host = host
+        self._port = port
+        self._cache_ttl = cache_ttl
+        self._cached: bytes = b""
+        self._cached_at: float | None = None
+        self._server: asyncio.Server | None = None
+
+    @property
+    def port(self) -> int:
+        """실제 바인딩된 포트 (port=0으로 시작한 경우 OS가 할당한 포트)."""
+        if self._server is not None and self._server.sockets:
+            return self._server.sockets[0].getsockname()[1]
+        return self._port
+
+    async def start(self) -> None:
+        """서버 소켓을 연다."""
+        self._server = await asyncio.start_server(self._handle, self._host, self._port)
+
+    async def run(self) -> None:
+        """서버를 시작하고 취소될 때까지 요청을 처리한다."""
+        if self._server is None:
+            await self.start()
+        try:
+            await self._server.serve_forever()
+        except asyncio.CancelledError:
+            pass
+        finally:
+            self._server.close()
+            await self._server.wait_closed()
+
+    def body(self) -> bytes:
+        """캐시된(또는 새로 렌더링한) metrics 본문."""
+        now = time.monotonic()
+        if self._cached_at is None or now - self._cached_at >= self._cache_ttl:
+            self._cached = self._render().encode("utf-8")
+            self._cached_at = now
+        return self._cached
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            try:
+                head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), timeout=5.0)
+            except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, TimeoutError):
+                return
+            if len(head) > _MAX_REQUEST_BYTES:
+                return
+            parts = head.split(b"\r\n", 1)[0].split()
+            method = parts[0] if parts else b""
+            path = parts[1].split(b"?", 1)[0] if len(parts) > 1 else b""
+
+            if method not in (b"GET", b"HEAD"):
+                self._respond(writer, b"405 Method Not Allowed", b"method not allowed\n")
+            elif path != b"/metrics":
+                self._respond(writer, b"404 Not Found", b"not found\n")
+            else:
+                body = self.body()
+                self._respond(writer, b"200 OK", body, head_only=method == b"HEAD")
+            await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    def _respond(
+        writer: asyncio.StreamWriter, status: bytes, body: bytes, head_only: bool = False
+    ) -> None:
+        headers = (
+            b"HTTP/1.1 " + status + b"\r\n"
+            b"Content-Type: " + CONTENT_TYPE.encode() + b"\r\n"
+            b"Content-Length: " + str(len(body)).encode() + b"\r\n"
+            b"Connection: close\r\n\r\n"
+        )
+        writer.write(headers if head_only else headers + body)
@@ -0,0 +1,188 @@
+"""여러 가중치 레코드 동시 감시(watch-many) 모듈.
+
+리전 failover 검증처럼 수십 개의 레코드를 동시에 확인할 때, 레코드마다 프로세스를
+띄우지 않고 하나의 이벤트 루프에서 감시한다.
+
+- Route53 조회: Hosted Zone별 한 번의 페이지네이션 조회로 모든 대상 레코드를 갱신
+- 권한 NS: Zone별로 NS IP를 한 번만 해석하고, 모든 레코드가 하나의 UDP 소켓
+  (AsyncDnsClient)을 공유하여 질의
+- 통계: 레코드마다 독립된 Stats (대시보드/metrics에서 레코드별로 표시)
+"""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from pathlib import Path
+
+from .aws import WeightedRecord
+from .config import MonitorConfig
+from .convergence import (
+    DEFAULT_CONFIDENCE,
+    DEFAULT_TOLERANCE,
+    ConvergenceReport,
+    SequentialConvergence,
+    evaluate_convergence,
+)
+from .refresh import Route53Refresher, ZoneRefresher
+from .resolver import AliasResolution, WeightedResolver
+from .sender import TrafficSender
+from .stats import Stats
+from .udp import AsyncDnsClient
+
+
+@dataclass(frozen=True)
+class WatchTarget:
+    """감시 대상 레코드."""
+
+    zone_id: str
+    record_name: str
+
+
+@dataclass
+class RecordWatch:
+    """감시 중인 레코드 1개의 구성 요소."""
+
+    target: WatchTarget
+    stats: Stats
+    records_ref: list[list[WeightedRecord]]
+    initial_records: list[WeightedRecord]
+    sender: TrafficSender
+    refresher: Route53Refresher
+
+    @property
+    def record_name(self) -> str:
+        return self.target.record_name
+
+
+def parse_target(spec: str, default_zone: str | None = None) -> WatchTarget:
+    """`[ZONE_ID:]record_name` 형식의 대상 지정을 해석한다.
+
+    Raises:
+        ValueError: 레코드 이름이 비어 있거나 Zone을 알 수 없는 경우
+    """
+    zone, sep, name = spec.strip().rpartition(":")
+    zone = zone.strip() if sep else (default_zone or "")
+    name = name.strip().rstrip(".")
+    if not name:
+        raise ValueError(f"레코드 이름이 비어 있습니다: {spec!r}")
+    if not zone:
+        raise ValueError(f"Hosted Zone을 알 수 없습니다: {spec!r} (--zone-id 또는 ZONE_ID:이름)")
+    return WatchTarget(zone_id=zone, record_name=name)
+
+
+def parse_targets(specs: list[str], default_zone: str | None = None) -> list[WatchTarget]:
+    """대상 지정 목록을 해석한다. 같은 Zone의 같은 이름(대소문자 무시)은 한 번만 포함한다.
+
+    Raises:
+        ValueError: 대상이 없거나 형식이 잘못된 경우
+    """
+    targets: list[WatchTarget] = []
+    seen: set[tuple[str, str]] = set()
+    for spec in specs:
+        target = parse_target(spec, default_zone)
+        key = (target.zone_id, target.record_name.lower())
+        if key in seen:
+            continue
+        seen.add(key)
+        targets.append(target)
+    if not targets:
+        raise ValueError("감시할 레코드가 없습니다 (--record 또는 --records-file).")
+    return targets
+
+
+def load_targets(path: Path) -> list[str]:
+    """대상 목록 파일을 읽는다.
+
+    한 줄에 `[ZONE_ID:]record_name` 하나씩 적는다. 빈 줄과 `#` 이후 주석은 무시한다.
+    """
+    specs: list[str] = []
+    with open(path, encoding="utf-8") as f:
+        for raw in f:
+            line = raw.split("#", 1)[0].strip()
+            if line:
+                specs.append(line)
+    return specs
+
+
+def group_by_zone(targets: list[WatchTarget]) -> dict[str, list[WatchTarget]]:
+    """대상을 Hosted Zone별로 묶는다 (입력 순서 유지)."""
+    zones: dict[str, list[WatchTarget]] = {}
+    for target in targets:
+        zones.setdefault(target.zone_id, []).append(target)
+    return zones
+
+
+def make_watch(
+    target: WatchTarget,
+    records: list[WeightedRecord],
+    nameservers: list[str],
+    ns_ips: list[str],
+    config: MonitorConfig,
+    dns_client: AsyncDnsClient,
+    alias_resolution: AliasResolution | None = None,
+) -> RecordWatch:
+    """레코드 1개의 Stats / TrafficSender / Route53Refresher를 구성한다.
+
+    권한 NS IP는 같은 Zone의 레코드끼리 공유하고, 질의는 공유 UDP 소켓으로 보낸다.
+    """
+    resolver = WeightedResolver(
+        nameservers, target.record_name, records[0].record_type, ns_ips=ns_ips
+    )
+    stats = Stats()
+    records_ref = [records]
+    sender = TrafficSender(config, stats, records, resolver, alias_resolution, dns_client)
+    return RecordWatch(
+        target=target,
+        stats=stats,
+        records_ref=records_ref,
+        initial_records=records,
+        sender=sender,
+        refresher=Route53Refresher(config, sender, stats, records_ref),
+    )
+
+
+def zone_refreshers(watches: list[RecordWatch]) -> list[ZoneRefresher]:
+    """Hosted Zone별 ZoneRefresher를 구성한다."""
+    by_zone: dict[str, dict[str, Route53Refresher]] = {}
+    for watch in watches:
+        by_zone.setdefault(watch.target.zone_id, {})[watch.record_name] = watch.refresher
+    return [ZoneRefresher(zone_id, refreshers) for zone_id, refreshers in by_zone.items()]
+
+
+def evaluate_all(
+    watches: list[RecordWatch],
+    tolerance: float = DEFAULT_TOLERANCE,
+    confidence: float = DEFAULT_CONFIDENCE,
+) -> dict[str, ConvergenceReport]:
+    """레코드별 현재 분포의 수렴 판정 결과."""
+    return {
+        w.record_name: evaluate_convergence(
+            w.stats.get_snapshot().distribution,
+            w.records_ref[0],
+            tolerance=tolerance,
+            confidence=confidence,
+        )
+        for w in watches
+    }
+
+
+async def wait_for_all_convergence(
+    watches: list[RecordWatch],
+    tolerance: float = DEFAULT_TOLERANCE,
+    confidence: float = DEFAULT_CONFIDENCE,
+    check_interval: float = 1.0,
+) -> dict[str, ConvergenceReport]:
+    """모든 레코드의 분포가 수렴할 때까지 주기적으로 판정하고, 수렴 시 결과를 반환한다.
+
+    레코드마다 SequentialConvergence로 판정한다 (반복 판정 보정, 변경 이후 표본만 사용).
+    """
+    judges = {
+        w.record_name: SequentialConvergence(w.stats, tolerance=tolerance, confidence=confidence)
+        for w in watches
+    }
+    while True:
+        await asyncio.sleep(check_interval)
+        reports = {w.record_name: judges[w.record_name].check(w.records_ref[0]) for w in watches}
+        if all(r.converged for r in reports.values()):
+            return reports
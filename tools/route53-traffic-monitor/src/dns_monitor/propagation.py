@@ -7,15 +7,19 @@ Route53 가중치 모니터링(watch)과 달리 AWS 자격증명이 불필요하
 from __future__ import annotations
 
 import asyncio
+import ipaddress
 import time
 from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING
 
-import dns.message
-import dns.name
-import dns.query
-import dns.rdatatype
-
+from .completion import completed_at, is_complete
+from .resolver import RCODE_NO_RESPONSE
 from .stats import PropagationStats
+from .udp import AsyncDnsClient
+
+if TYPE_CHECKING:
+    import dns.message
 
 DEFAULT_RESOLVERS: list[tuple[str, str]] = [
     ("8.8.8.8", "Google"),
@@ -24,6 +28,13 @@ DEFAULT_RESOLVERS: list[tuple[str, str]] = [
     ("208.67.222.222", "OpenDNS"),
 ]
 
+# 값 없이 응답해도 리졸버에 아직 새 값이 없는 것으로 보는 RCODE (NOERROR, NXDOMAIN)
+NOT_YET_RCODES = frozenset({0, 3})
+
+# TTL 기반 스케줄: 응답 TTL 만료 후 TTL_GRACE초 뒤에 다음 질의 (TTL은 초 단위 내림 값)
+TTL_GRACE = 1.0
+DEFAULT_MAX_INTERVAL = 30.0
+
 
 @dataclass
 class PropagationConfig:
@@ -33,12 +44,22 @@ class PropagationConfig:
     resolvers: list[tuple[str, str]] = field(default_factory=lambda: list(DEFAULT_RESOLVERS))
     tps: int = 2
     record_type: str = "A"
+    # 응답 TTL 만료 시점에 맞춰 다음 질의를 예약 (False면 항상 TPS 간격)
+    ttl_aware: bool = True
+    # TTL 기반 스케줄의 최대 질의 간격(초). 긴 TTL에서도 다른 캐시 인스턴스를 관측
+    max_interval: float = DEFAULT_MAX_INTERVAL
 
     def __post_init__(self):
+        if not self.resolvers:
+            raise ValueError("At least one resolver is required")
+        if len({label for _, label in self.resolvers}) < len(self.resolvers):
+            raise ValueError("Resolver labels must be unique")
         if self.tps < 1:
             raise ValueError("TPS must be >= 1")
         if self.tps > 100:
             raise ValueError("TPS must be <= 100")
+        if self.max_interval < 1.0 / self.tps:
+            raise ValueError("max_interval must be >= 1 / TPS")
 
 
 class PropagationResolver:
@@ -52,77 +73,244 @@ class PropagationResolver:
         self._record_name = record_name
         self._query_type = record_type
 
+    def make_request(self) -> dns.message.Message:
+        """RD=1 질의 메시지를 생성한다 (메시지 ID는 매번 새로 할당)."""
+        import dns.flags
+        import dns.message
+        import dns.name
+        import dns.rdatatype
+
+        qname = dns.name.from_text(self._record_name)
+        rdtype = dns.rdatatype.from_text(self._query_type)
+        request = dns.message.make_query(qname, rdtype)
+        # RD=1: 공용 리졸버에 재귀 질의 요청
+        request.flags |= dns.flags.RD
+        return request
+
+    @staticmethod
+    def answer_values(response: dns.message.Message) -> list[str]:
+        """응답 메시지의 answer 섹션 값(IP 또는 CNAME)을 반환한다."""
+        values: list[str] = []
+        for rrset in response.answer:
+            for rdata in rrset:
+                values.append(str(rdata).rstrip("."))
+        return values
+
     def resolve_one(self, resolver_ip: str, timeout: float = 5.0) -> list[str]:
         """단일 리졸버에 1회 질의하고 응답 값을 반환한다.
 
         Returns:
             응답 값 리스트 (IP 또는 CNAME). 실패 시 빈 리스트.
         """
+        import dns.query
+
         try:
-            qname = dns.name.from_text(self._record_name)
-            rdtype = dns.rdatatype.from_text(self._query_type)
-            request = dns.message.make_query(qname, rdtype)
-            # RD=1: 공용 리졸버에 재귀 질의 요청
-            request.flags |= dns.flags.RD
-
-            response = dns.query.udp(request, resolver_ip, timeout=timeout)
-
-            values: list[str] = []
-            for rrset in response.answer:
-                for rdata in rrset:
-                    values.append(str(rdata).rstrip("."))
-            return values
+            response = dns.query.udp(self.make_request(), resolver_ip, timeout=timeout)
+            return self.answer_values(response)
         except Exception:
             return []
 
+    async def resolve_async(
+        self, client: AsyncDnsClient, resolver_ip: str, timeout: float = 5.0
+    ) -> list[str]:
+        """resolve_one()의 비동기 버전. client의 공유 UDP 소켓으로 질의한다."""
+        values, _, _ = await self.query_async(client, resolver_ip, timeout)
+        return values
+
+    async def query_async(
+        self, client: AsyncDnsClient, resolver_ip: str, timeout: float = 5.0
+    ) -> tuple[list[str], int | None, int]:
+        """resolve_async()와 동일하되, answer 섹션의 최소 잔여 TTL(초)과 RCODE를 함께 반환한다.
+
+        Returns:
+            (응답 값 리스트, 최소 TTL, RCODE). 빈 응답이면 TTL은 None,
+            타임아웃/소켓 오류로 응답을 받지 못하면 ([], None, RCODE_NO_RESPONSE).
+        """
+        import dns.exception
+
+        try:
+            response = await client.query(self.make_request(), resolver_ip, timeout=timeout)
+        except (dns.exception.DNSException, OSError, ValueError):
+            return [], None, RCODE_NO_RESPONSE
+        ttl = min((rrset.ttl for rrset in response.answer), default=None)
+        return self.answer_values(response), ttl, response.rcode()
+
+
+def next_probe_delay(
+    ttl: int | None, interval: float, max_interval: float = DEFAULT_MAX_INTERVAL
+) -> float:
+    """응답 TTL로 다음 질의까지의 대기 시간(초)을 계산한다.
+
+    리졸버 캐시가 만료되기 전의 질의는 같은 캐시 값을 돌려받을 뿐이므로, TTL 만료
+    직후로 다음 질의를 미룬다. TTL이 없으면(실패/빈 응답) 기본 간격을 사용한다.
+    """
+    if ttl is None:
+        return interval
+    return min(max(ttl + TTL_GRACE, interval), max_interval)
+
+
+def load_resolvers(path: Path) -> list[tuple[str, str]]:
+    """리졸버 목록 파일을 읽는다.
+
+    한 줄에 리졸버 하나씩 `IP [라벨]` 또는 `IP,라벨` 형식으로 적는다.
+    빈 줄과 `#` 이후 주석은 무시하며, 라벨을 생략하면 IP를 라벨로 사용한다.
+    같은 IP가 다시 나오면 건너뛴다. 라벨은 리졸버별 통계의 키이므로 중복될 수 없다.
+
+    Raises:
+        ValueError: IP 형식이 잘못되었거나, 다른 IP에 같은 라벨을 썼거나,
+            리졸버가 하나도 없는 경우
+    """
+    resolvers: list[tuple[str, str]] = []
+    seen: set[str] = set()
+    labels: set[str] = set()
+    with open(path, encoding="utf-8") as f:
+        for lineno, raw in enumerate(f, start=1):
+            line = raw.split("#", 1)[0].strip()
+            if not line:
+                continue
+            ip, _, label = line.replace(",", " ", 1).partition(" ")
+            try:
+                ip = str(ipaddress.ip_address(ip))
+            except ValueError as e:
+                raise ValueError(f"{path}:{lineno}: 잘못된 리졸버 IP입니다: {ip}") from e
+            if ip in seen:
+                continue
+            label = label.strip() or ip
+            if label in labels:
+                raise ValueError(f"{path}:{lineno}: 중복된 리졸버 라벨입니다: {label}")
+            seen.add(ip)
+            labels.add(label)
+            resolvers.append((ip, label))
+    if not resolvers:
+        raise ValueError(f"{path}: 리졸버가 없습니다.")
+    return resolvers
+
+
+async def check_resolvers(
+    resolver: PropagationResolver,
+    resolvers: list[tuple[str, str]],
+    timeout: float = 3.0,
+) -> dict[str, tuple[list[str], int]]:
+    """모든 리졸버에 동시에 1회씩 질의하여 리졸버 IP → (응답 값, RCODE)를 반환한다."""
+    async with AsyncDnsClient() as client:
+        results = await asyncio.gather(
+            *(resolver.query_async(client, ip, timeout) for ip, _ in resolvers)
+        )
+    return {
+        ip: (values, rcode) for (ip, _), (values, _, rcode) in zip(resolvers, results, strict=True)
+    }
+
+
+def is_answering(values: list[str], rcode: int) -> bool:
+    """값을 응답했거나 아직 새 값이 없다고 응답(NOERROR 빈 응답 / NXDOMAIN)했는지."""
+    return bool(values) or rcode in NOT_YET_RCODES
+
+
+async def wait_for_propagation(stats: PropagationStats, check_interval: float = 0.5) -> float:
+    """응답하는 모든 리졸버가 기대 값으로 전파될 때까지 대기하고 완료 시점의 경과 초를 반환한다.
+
+    UNREACHABLE 리졸버는 기다리지 않는다.
+    """
+    while True:
+        snapshot = stats.get_snapshot()
+        if is_complete(snapshot.resolver_progress):
+            return completed_at(snapshot.resolver_progress)
+        await asyncio.sleep(check_interval)
+
 
 class PropagationProber:
-    """TPS 속도로 모든 리졸버에 병렬 질의를 수행한다."""
+    """리졸버별 독립 스케줄로 TPS 속도의 비동기 질의를 수행한다.
+
+    모든 질의는 하나의 AsyncDnsClient 소켓으로 다중화되며, 리졸버마다 별도 루프가
+    돌기 때문에 느린 리졸버가 다른 리졸버의 질의를 지연시키지 않는다.
+    ttl_aware 설정 시 응답 TTL 만료 직후로 해당 리졸버의 다음 질의를 예약한다.
+    """
 
     def __init__(
         self,
         config: PropagationConfig,
         stats: PropagationStats,
         resolver: PropagationResolver,
+        timeout: float = 5.0,
+        dns_client: AsyncDnsClient | None = None,
     ):
         self._config = config
         self._stats = stats
         self._resolver = resolver
+        self._timeout = timeout
+        # 외부에서 받은 클라이언트는 닫지 않는다 (없으면 run()에서 생성)
+        self._dns_client = dns_client
         self._running = False
 
     async def run(self) -> None:
-        """TPS 속도로 질의 루프를 실행한다."""
+        """리졸버별 질의 루프를 실행한다."""
         self._running = True
         interval = 1.0 / self._config.tps
-        loop = asyncio.get_event_loop()
+        count = len(self._config.resolvers)
 
+        client = self._dns_client or AsyncDnsClient()
         try:
-            while self._running:
-                start = time.monotonic()
-                # 모든 리졸버에 병렬 질의
-                tasks = [
-                    loop.run_in_executor(None, self._probe_resolver, ip, label)
-                    for ip, label in self._config.resolvers
-                ]
-                await asyncio.gather(*tasks)
-                elapsed = time.monotonic() - start
-                sleep_time = max(0, interval - elapsed)
-                await asyncio.sleep(sleep_time)
+            # 시작 시점을 interval 안에 고르게 분산하여 질의가 한 순간에 몰리지 않도록 함
+            await asyncio.gather(
+                *(
+                    self._schedule(client, ip, label, interval, offset=i * interval / count)
+                    for i, (ip, label) in enumerate(self._config.resolvers)
+                )
+            )
         except asyncio.CancelledError:
             pass
+        finally:
+            if client is not self._dns_client:
+                client.close()
+
+    async def _schedule(
+        self,
+        client: AsyncDnsClient,
+        resolver_ip: str,
+        resolver_label: str,
+        interval: float,
+        offset: float = 0.0,
+    ) -> None:
+        """단일 리졸버에 interval 간격으로 질의한다.
+
+        응답이 interval보다 늦으면 해당 리졸버의 다음 질의만 늦어진다.
+        """
+        if offset > 0:
+            await asyncio.sleep(offset)
+        while self._running:
+            start = time.monotonic()
+            ttl = await self._probe_resolver(client, resolver_ip, resolver_label)
+            delay = interval
+            if self._config.ttl_aware:
+                delay = next_probe_delay(ttl, interval, self._config.max_interval)
+                if delay > interval:
+                    # 고정 TPS 스케줄이었다면 이 구간에 보냈을 질의 수
+                    self._stats.record_skipped(delay / interval - 1)
+            elapsed = time.monotonic() - start
+            await asyncio.sleep(max(0, delay - elapsed))
 
-    def _probe_resolver(self, resolver_ip: str, resolver_label: str) -> None:
-        """단일 리졸버에 질의하고 결과를 stats에 기록한다."""
+    async def _probe_resolver(
+        self, client: AsyncDnsClient, resolver_ip: str, resolver_label: str
+    ) -> int | None:
+        """단일 리졸버에 질의하고 결과를 stats에 기록한다. 응답 TTL을 반환한다.
+
+        NOERROR 빈 응답 / NXDOMAIN은 아직 새 값이 없는 응답으로 기록하고, 응답을 받지
+        못한 경우만 리졸버 오류(UNREACHABLE 판정 대상)로 기록한다. SERVFAIL 등 다른
+        RCODE는 에러 수에만 반영한다.
+        """
         t0 = time.monotonic()
-        values = self._resolver.resolve_one(resolver_ip)
+        values, ttl, rcode = await self._resolver.query_async(client, resolver_ip, self._timeout)
         latency = time.monotonic() - t0
 
-        if not values:
+        if rcode == RCODE_NO_RESPONSE:
+            self._stats.record_error(resolver_label)
+            return None
+        if not is_answering(values, rcode):
             self._stats.record_error()
-            return
+            return None
 
-        for value in values:
-            self._stats.record_response(resolver_label, value, latency)
+        self._stats.record_answer(resolver_label, values, latency, ttl=ttl)
+        return ttl
 
     def stop(self) -> None:
         """루프 중단."""
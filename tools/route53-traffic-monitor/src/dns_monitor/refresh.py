@@ -0,0 +1,233 @@
+"""Route53 가중치 레코드 변경 감지 및 ALIAS IP 갱신 모듈.
+
+주기적으로 가중치 레코드를 조회하여 이전 상태와 비교(diff)하고, 변경된 부분만
+TrafficSender에 반영한다. 변경이 감지되면 타임스탬프가 포함된 이벤트를 Stats에
+기록하여 가중치 변경 이후의 수렴 시간을 측정할 수 있게 한다.
+
+ALIAS 대상(ELB 등)의 IP는 응답 TTL이 만료될 때마다 백그라운드에서 재해석하여
+TrafficSender의 IP 매핑에 병합한다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+
+from .aws import WeightedRecord, get_weighted_records, get_zone_weighted_records
+from .config import MonitorConfig
+from .resolver import MAX_ALIAS_TTL, MIN_ALIAS_TTL, next_alias_expiry, refresh_alias_targets
+from .sender import TrafficSender
+from .stats import RecordChangeEvent, Stats
+
+DEFAULT_INTERVAL = 30.0
+# 변경 감지 직후에는 연속 변경(단계적 가중치 조정)을 빠르게 잡기 위해 짧은 주기로 조회
+FAST_INTERVAL = 5.0
+FAST_WINDOW = 120.0
+
+
+@dataclass
+class RecordDiff:
+    """두 가중치 레코드 목록의 차이."""
+
+    added: list[WeightedRecord] = field(default_factory=list)
+    removed: list[WeightedRecord] = field(default_factory=list)
+    # (이전, 이후) 쌍
+    weight_changed: list[tuple[WeightedRecord, WeightedRecord]] = field(default_factory=list)
+    values_changed: list[tuple[WeightedRecord, WeightedRecord]] = field(default_factory=list)
+
+    @property
+    def changed(self) -> bool:
+        """변경 사항이 하나라도 있는지 여부."""
+        return bool(self.added or self.removed or self.weight_changed or self.values_changed)
+
+    @property
+    def remapped_identifiers(self) -> set[str]:
+        """값(IP/DNS) 매핑을 다시 구성해야 하는 SetIdentifier."""
+        sids = {r.set_identifier for r in self.added}
+        sids.update(new.set_identifier for _, new in self.values_changed)
+        return sids
+
+    def describe(self) -> list[str]:
+        """사람이 읽을 수 있는 변경 내역."""
+        lines = [f"+ {r.set_identifier} (weight={r.weight})" for r in self.added]
+        lines += [f"- {r.set_identifier}" for r in self.removed]
+        lines += [
+            f"{new.set_identifier}: weight {old.weight} → {new.weight}"
+            for old, new in self.weight_changed
+        ]
+        lines += [
+            f"{new.set_identifier}: {', '.join(old.values)} → {', '.join(new.values)}"
+            for old, new in self.values_changed
+        ]
+        return lines
+
+
+def diff_records(old: list[WeightedRecord], new: list[WeightedRecord]) -> RecordDiff:
+    """SetIdentifier 기준으로 두 레코드 목록을 비교한다."""
+    old_map = {r.set_identifier: r for r in old}
+    new_map = {r.set_identifier: r for r in new}
+    diff = RecordDiff()
+    for sid, rec in new_map.items():
+        prev = old_map.get(sid)
+        if prev is None:
+            diff.added.append(rec)
+            continue
+        if prev.weight != rec.weight:
+            diff.weight_changed.append((prev, rec))
+        if prev.record_type != rec.record_type or sorted(prev.values) != sorted(rec.values):
+            diff.values_changed.append((prev, rec))
+    diff.removed = [rec for sid, rec in old_map.items() if sid not in new_map]
+    return diff
+
+
+class Route53Refresher:
+    """Route53 가중치 레코드를 주기적으로 조회하여 변경분만 반영한다."""
+
+    def __init__(
+        self,
+        config: MonitorConfig,
+        sender: TrafficSender,
+        stats: Stats,
+        records_ref: list[list[WeightedRecord]],
+        interval: float = DEFAULT_INTERVAL,
+        fast_interval: float = FAST_INTERVAL,
+        fast_window: float = FAST_WINDOW,
+    ):
+        self._config = config
+        self._sender = sender
+        self._stats = stats
+        self._records_ref = records_ref
+        self._interval = interval
+        self._fast_interval = min(fast_interval, interval)
+        self._fast_window = fast_window
+        self._last_poll_at = time.monotonic()
+        self._last_change_at: float | None = None
+
+    def next_interval(self) -> float:
+        """최근 변경이 있었으면 짧은 주기, 아니면 기본 주기."""
+        if self._last_change_at is not None:
+            if time.monotonic() - self._last_change_at < self._fast_window:
+                return self._fast_interval
+        return self._interval
+
+    async def run(self) -> None:
+        """조회 루프를 실행한다. 조회 실패는 무시하고 기존 데이터를 유지한다."""
+        while True:
+            await asyncio.sleep(self.next_interval())
+            try:
+                await self.refresh_once()
+            except Exception:
+                pass  # 갱신 실패는 무시, 기존 데이터 유지
+
+    async def refresh_once(self) -> RecordDiff | None:
+        """레코드를 1회 조회하여 변경 사항이 있으면 반영하고 diff를 반환한다."""
+        loop = asyncio.get_running_loop()
+        new_records = await loop.run_in_executor(
+            None,
+            get_weighted_records,
+            self._config.hosted_zone_id,
+            self._config.record_name,
+        )
+        return await self.apply(new_records, time.monotonic())
+
+    async def apply(self, new_records: list[WeightedRecord], polled_at: float) -> RecordDiff | None:
+        """조회한 레코드를 이전 상태와 비교하여 변경 사항이 있으면 반영하고 diff를 반환한다.
+
+        레코드가 비어 있으면(일시적 조회 이상) 기존 데이터를 유지한다.
+        """
+        if not new_records:
+            return None
+
+        old_records = self._records_ref[0]
+        diff = diff_records(old_records, new_records)
+        if not diff.changed:
+            self._last_poll_at = polled_at
+            return None
+
+        self._stats.record_event(
+            RecordChangeEvent(
+                detected_at=polled_at,
+                wall_time=time.time(),
+                last_unchanged_at=self._last_poll_at,
+                weights={r.set_identifier: r.weight for r in new_records},
+                previous_weights={r.set_identifier: r.weight for r in old_records},
+                changes=diff.describe(),
+            )
+        )
+        self._last_poll_at = polled_at
+        self._last_change_at = polled_at
+
+        # 가중치만 바뀐 경우 매핑은 그대로, 값이 바뀐 경우 해당 SetIdentifier만 재구성
+        await self._sender.apply_diff(new_records, diff.remapped_identifiers)
+        self._records_ref[0] = new_records
+        return diff
+
+
+class ZoneRefresher:
+    """Hosted Zone 하나의 여러 레코드를 zone 단위 조회 한 번으로 갱신한다.
+
+    레코드별 Route53Refresher는 변경 감지/반영만 담당하고, 조회 주기는 레코드 중
+    가장 짧은 주기(최근 변경이 있으면 짧은 주기)를 따른다.
+    """
+
+    def __init__(self, zone_id: str, refreshers: dict[str, Route53Refresher]):
+        self._zone_id = zone_id
+        self._refreshers = refreshers
+
+    async def run(self) -> None:
+        """조회 루프를 실행한다. 조회 실패는 무시하고 기존 데이터를 유지한다."""
+        while True:
+            await asyncio.sleep(min(r.next_interval() for r in self._refreshers.values()))
+            try:
+                await self.refresh_once()
+            except Exception:
+                pass  # 갱신 실패는 무시, 기존 데이터 유지
+
+    async def refresh_once(self) -> dict[str, RecordDiff]:
+        """zone을 1회 조회하여 레코드별 변경 사항을 반영하고, 변경된 레코드의 diff를 반환한다."""
+        loop = asyncio.get_running_loop()
+        by_name = await loop.run_in_executor(
+            None, get_zone_weighted_records, self._zone_id, list(self._refreshers)
+        )
+        polled_at = time.monotonic()
+        diffs: dict[str, RecordDiff] = {}
+        for name, refresher in self._refreshers.items():
+            diff = await refresher.apply(by_name.get(name, []), polled_at)
+            if diff is not None:
+                diffs[name] = diff
+        return diffs
+
+
+class AliasRefresher:
+    """ALIAS 대상 IP를 TTL 만료 시점마다 재해석하여 TrafficSender 매핑에 병합한다."""
+
+    def __init__(self, sender: TrafficSender, idle_interval: float = MAX_ALIAS_TTL):
+        self._sender = sender
+        self._idle_interval = idle_interval
+
+    async def run(self) -> None:
+        """갱신 루프를 실행한다. 재해석 실패는 무시하고 기존 매핑을 유지한다."""
+        while True:
+            expiry = next_alias_expiry(self._sender.alias_resolution)
+            if expiry is None:
+                await asyncio.sleep(self._idle_interval)
+                continue
+            delay = min(max(expiry - time.monotonic(), 0.0), MAX_ALIAS_TTL)
+            await asyncio.sleep(max(delay, MIN_ALIAS_TTL / 5))
+            try:
+                await self.refresh_once()
+            except Exception:
+                pass  # 갱신 실패는 무시, 기존 매핑 유지
+
+    async def refresh_once(self) -> bool:
+        """만료된 ALIAS 대상을 재해석한다. 매핑을 교체했으면 True."""
+        base = self._sender.alias_resolution
+        loop = asyncio.get_running_loop()
+        refreshed = await loop.run_in_executor(None, refresh_alias_targets, base)
+        # 재해석 도중 레코드 변경(apply_diff)으로 매핑이 교체되었다면 이번 결과는 버리고
+        # 다음 만료 시점에 새 매핑 기준으로 다시 해석한다
+        if self._sender.alias_resolution is not base:
+            return False
+        self._sender.set_alias_resolution(refreshed)
+        return True
@@ -2,18 +2,29 @@
 
 권한 NS에 직접 질의하여 Route53 가중치 라우팅 분포를 측정한다.
 dns.query.udp()로 직접 패킷을 보내 resolver 캐시를 완전히 우회한다.
+
+dnspython은 시작 시간을 줄이기 위해 처음 질의할 때 import한다.
 """
 
 from __future__ import annotations
 
-import random
+import ipaddress
+import itertools
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import dns.message
+
+    from .udp import AsyncDnsClient
 
-import dns.exception
-import dns.message
-import dns.query
-import dns.rdatatype
-import dns.resolver
+ClientNetwork = ipaddress.IPv4Network | ipaddress.IPv6Network
+
+# 응답을 받지 못한 경우의 RCODE (DNS RCODE 범위 0~23 밖의 값)
+RCODE_NO_RESPONSE = 255
+QUERY_TIMEOUT = 5.0
 
 
 class WeightedResolver:
@@ -28,52 +39,143 @@ class WeightedResolver:
         nameservers: list[str],
         record_name: str,
         record_type: str,
+        ns_ips: list[str] | None = None,
     ):
+        """ns_ips를 지정하면 NS 이름을 다시 해석하지 않는다 (같은 Zone의 레코드끼리 공유)."""
         self._record_name = record_name
         self._query_type = "A" if record_type in ("A", "ALIAS") else record_type
 
-        # 권한 NS IP 주소 리졸브
-        ns_ips: list[str] = []
-        default_resolver = dns.resolver.Resolver()
-        for ns in nameservers:
-            try:
-                answers = default_resolver.resolve(ns, "A")
-                for rdata in answers:
-                    ns_ips.append(str(rdata))
-            except dns.exception.DNSException:
-                continue
-
+        if ns_ips is None:
+            ns_ips = resolve_nameserver_ips(nameservers)
         if not ns_ips:
             raise ValueError(f"Failed to resolve any nameserver IPs from: {nameservers}")
 
-        self._ns_ips = ns_ips
+        self._ns_ips = list(ns_ips)
+        # 라운드로빈 NS 선택 (itertools.cycle의 next()는 GIL 하에서 원자적)
+        self._ns_cycle = itertools.cycle(ns_ips)
+
+    @property
+    def nameserver_ips(self) -> list[str]:
+        """질의 대상 권한 NS IP 목록."""
+        return list(self._ns_ips)
 
     def resolve_once(self) -> list[str]:
         """DNS 조회를 1회 수행하고 모든 응답 IP를 반환한다.
 
         매 호출마다 새로운 UDP 패킷을 전송하여 캐시 영향을 완전히 배제한다.
-        권한 NS를 랜덤 선택하여 부하를 분산한다.
+        권한 NS를 라운드로빈으로 선택하여 모든 NS가 동일한 횟수로 질의되도록 한다.
 
         Returns:
             IP 주소 리스트. 실패 시 빈 리스트.
         """
+        _, ips = self.resolve_tagged()
+        return ips
+
+    def resolve_tagged(self) -> tuple[str, list[str]]:
+        """resolve_once()와 동일하되, 질의한 권한 NS IP를 함께 반환한다.
+
+        Returns:
+            (권한 NS IP, 응답 IP 리스트). 실패 시 응답 IP 리스트는 비어 있다.
+        """
+        ns_ip = self.next_nameserver()
+        return ns_ip, self.resolve_from(ns_ip)
+
+    def next_nameserver(self) -> str:
+        """라운드로빈 순서상 다음 권한 NS IP를 반환한다."""
+        return next(self._ns_cycle)
+
+    def resolve_from(self, ns_ip: str) -> list[str]:
+        """지정한 권한 NS에 DNS 조회를 1회 수행한다.
+
+        Returns:
+            IP 주소 리스트. 실패 시 빈 리스트.
+        """
+        return self.query_from(ns_ip).values
+
+    def query_from(self, ns_ip: str) -> DnsAnswer:
+        """resolve_from()과 동일하되, 응답 RCODE를 함께 반환한다.
+
+        타임아웃/네트워크 오류로 응답을 받지 못하면 rcode는 RCODE_NO_RESPONSE.
+        """
+        import dns.exception
+        import dns.query
+
         try:
-            qname = dns.name.from_text(self._record_name)
-            rdtype = dns.rdatatype.from_text(self._query_type)
-            request = dns.message.make_query(qname, rdtype)
-            # RD(Recursion Desired) 비활성화 - 권한 NS에 직접 질의
-            request.flags &= ~dns.flags.RD
+            response = dns.query.udp(self.make_request(), ns_ip, timeout=QUERY_TIMEOUT)
+        except (dns.exception.DNSException, OSError):
+            return DnsAnswer(values=[], rcode=RCODE_NO_RESPONSE)
+        return _to_answer(response)
+
+    async def query_async(
+        self, client: AsyncDnsClient, ns_ip: str, client_subnet: ClientNetwork | None = None
+    ) -> DnsAnswer:
+        """query_from()과 동일하되, 공유 UDP 소켓(AsyncDnsClient)으로 질의한다.
 
-            ns_ip = random.choice(self._ns_ips)
-            response = dns.query.udp(request, ns_ip, timeout=5.0)
+        client_subnet을 지정하면 EDNS Client Subnet 옵션을 붙여 질의한다.
+        """
+        import dns.exception
 
-            ips: list[str] = []
-            for rrset in response.answer:
-                for rdata in rrset:
-                    ips.append(str(rdata).rstrip("."))
-            return ips
+        request = self.make_request(client_subnet)
+        try:
+            response = await client.query(request, ns_ip, timeout=QUERY_TIMEOUT)
         except (dns.exception.DNSException, OSError):
-            return []
+            return DnsAnswer(values=[], rcode=RCODE_NO_RESPONSE)
+        return _to_answer(response)
+
+    def make_request(self, client_subnet: ClientNetwork | None = None) -> dns.message.Message:
+        """권한 NS 질의 메시지를 만든다 (RD 비활성화).
+
+        client_subnet을 지정하면 EDNS0 Client Subnet(RFC 7871) 옵션을 붙인다.
+        """
+        import dns.edns
+        import dns.flags
+        import dns.message
+        import dns.name
+        import dns.rdatatype
+
+        qname = dns.name.from_text(self._record_name)
+        rdtype = dns.rdatatype.from_text(self._query_type)
+        if client_subnet is None:
+            request = dns.message.make_query(qname, rdtype)
+        else:
+            option = dns.edns.ECSOption(str(client_subnet.network_address), client_subnet.prefixlen)
+            request = dns.message.make_query(qname, rdtype, use_edns=0, options=[option])
+        # RD(Recursion Desired) 비활성화 - 권한 NS에 직접 질의
+        request.flags &= ~dns.flags.RD
+        return request
+
+
+def resolve_nameserver_ips(nameservers: list[str]) -> list[str]:
+    """권한 NS 이름을 IPv4 주소로 동시에 해석한다. 해석에 실패한 NS는 건너뛴다."""
+    resolved = _resolve_many(nameservers)
+    return [ip for ns in dict.fromkeys(nameservers) for ip in (resolved[ns][0] or [])]
+
+
+def _to_answer(response: dns.message.Message) -> DnsAnswer:
+    ips: list[str] = []
+    for rrset in response.answer:
+        for rdata in rrset:
+            ips.append(str(rdata).rstrip("."))
+    return DnsAnswer(values=ips, rcode=response.rcode(), scope_prefix=_ecs_scope(response))
+
+
+def _ecs_scope(response: dns.message.Message) -> int | None:
+    """응답의 EDNS Client Subnet scope prefix 길이. ECS 옵션이 없으면 None."""
+    for option in response.options:
+        scope = getattr(option, "scopelen", None)
+        if scope is not None:
+            return scope
+    return None
+
+
+@dataclass
+class DnsAnswer:
+    """권한 NS 응답 1건."""
+
+    values: list[str]
+    rcode: int
+    # EDNS Client Subnet 응답의 scope prefix 길이 (ECS 질의가 아니면 None)
+    scope_prefix: int | None = None
 
 
 @dataclass
@@ -99,6 +201,20 @@ class AliasTarget:
     set_identifier: str
     alias_dns: str
     ips: list[str] = field(default_factory=list)
+    # 다음 재해석 시각 (time.monotonic, 응답 TTL 기준)
+    expires_at: float = 0.0
+    # IP / IP set → 마지막으로 응답에 포함된 시각 (time.monotonic)
+    ip_last_seen: dict[str, float] = field(default_factory=dict)
+    set_last_seen: dict[frozenset[str], float] = field(default_factory=dict)
+
+
+# TTL을 알 수 없을 때의 재해석 주기와 TTL 하한/상한 (초)
+DEFAULT_ALIAS_TTL = 60
+MIN_ALIAS_TTL = 5
+MAX_ALIAS_TTL = 300
+# 응답에서 사라진 ALIAS IP를 매핑에 유지하는 시간 (초). ELB IP 교체 중 응답 캐시 대비
+ALIAS_IP_RETENTION = 900.0
+ALIAS_RESOLVE_WORKERS = 16
 
 
 def resolve_alias_targets(
@@ -115,31 +231,160 @@ def resolve_alias_targets(
         AliasResolution with mappings and diagnostics.
     """
     result = AliasResolution()
-    resolver = dns.resolver.Resolver()
+    _resolve_into(result, records)
+    _build_alias_maps(result)
+    return result
+
+
+def update_alias_targets(
+    previous: AliasResolution,
+    records: list,  # list[WeightedRecord] - 순환 import 방지
+    changed: set[str],
+) -> AliasResolution:
+    """변경된 SetIdentifier의 ALIAS 대상만 다시 해석한 새 AliasResolution을 반환한다.
+
+    changed에 포함되지 않은 ALIAS 대상은 이전 해석 결과를 재사용하고,
+    records에 없는 SetIdentifier(삭제되었거나 ALIAS가 아니게 된 레코드)는 제외한다.
+    """
+    result = AliasResolution()
+    alias_sids = {r.set_identifier for r in records if r.record_type == "ALIAS"}
+    for sid, target in previous.targets.items():
+        if sid in alias_sids and sid not in changed:
+            result.targets[sid] = target
+    _resolve_into(result, [r for r in records if r.set_identifier in changed])
+    _build_alias_maps(result)
+    return result
 
-    # 각 ALIAS 대상 리졸브
-    for rec in records:
-        if rec.record_type != "ALIAS":
+
+def refresh_alias_targets(
+    previous: AliasResolution,
+    now: float | None = None,
+    retention: float = ALIAS_IP_RETENTION,
+) -> AliasResolution:
+    """TTL이 만료된 ALIAS 대상만 동시에 재해석하고 새 IP를 기존 매핑에 병합한다.
+
+    재해석에 실패한 대상은 이전 IP를 유지한다. 응답에서 사라진 IP도 retention 동안은
+    매핑에 남겨두어, ELB IP 교체 직후 권한 NS 응답을 계속 분류할 수 있게 한다.
+    """
+    now = time.monotonic() if now is None else now
+    expired = [t for t in previous.targets.values() if t.expires_at <= now]
+    resolved = _resolve_many([t.alias_dns for t in expired])
+
+    result = AliasResolution()
+    for sid, target in previous.targets.items():
+        result.targets[sid] = target
+    for target in expired:
+        ips, ttl = resolved[target.alias_dns]
+        if ips is None:
+            # 실패 시 기존 IP 유지, 짧은 주기로 재시도
+            result.targets[target.set_identifier] = AliasTarget(
+                set_identifier=target.set_identifier,
+                alias_dns=target.alias_dns,
+                ips=list(target.ips),
+                expires_at=now + MIN_ALIAS_TTL,
+                ip_last_seen=dict(target.ip_last_seen),
+                set_last_seen=dict(target.set_last_seen),
+            )
             continue
+        result.targets[target.set_identifier] = _merge_target(target, ips, ttl, now, retention)
+    _build_alias_maps(result)
+    return result
+
+
+def next_alias_expiry(resolution: AliasResolution) -> float | None:
+    """가장 먼저 만료되는 ALIAS 대상의 만료 시각 (time.monotonic)."""
+    return min((t.expires_at for t in resolution.targets.values()), default=None)
+
+
+def _merge_target(
+    previous: AliasTarget, ips: list[str], ttl: int | None, now: float, retention: float
+) -> AliasTarget:
+    """재해석 결과를 이전 대상 정보와 병합한다."""
+    ip_last_seen = {
+        ip: seen for ip, seen in previous.ip_last_seen.items() if now - seen < retention
+    }
+    set_last_seen = {
+        ip_set: seen for ip_set, seen in previous.set_last_seen.items() if now - seen < retention
+    }
+    for ip in ips:
+        ip_last_seen[ip] = now
+    if ips:
+        set_last_seen[frozenset(ips)] = now
+    return AliasTarget(
+        set_identifier=previous.set_identifier,
+        alias_dns=previous.alias_dns,
+        ips=sorted(ip_last_seen),
+        expires_at=now + _clamp_ttl(ttl),
+        ip_last_seen=ip_last_seen,
+        set_last_seen=set_last_seen,
+    )
+
+
+def _clamp_ttl(ttl: int | None) -> int:
+    if not isinstance(ttl, int):
+        return DEFAULT_ALIAS_TTL
+    return max(MIN_ALIAS_TTL, min(MAX_ALIAS_TTL, ttl))
+
+
+def _resolve_many(names: list[str]) -> dict[str, tuple[list[str] | None, int | None]]:
+    """여러 DNS 이름을 동시에 A 레코드로 해석한다.
+
+    Returns:
+        이름 → (IP 리스트, TTL). 해석 실패 시 IP 리스트는 None.
+    """
+    unique = list(dict.fromkeys(names))
+    if not unique:
+        return {}
+    import dns.exception
+    import dns.resolver
+
+    resolver = dns.resolver.Resolver()
+
+    def resolve(name: str) -> tuple[list[str] | None, int | None]:
+        try:
+            answers = resolver.resolve(name, "A")
+        except dns.exception.DNSException:
+            return None, None
+        ips = [str(rdata) for rdata in answers]
+        ttl = getattr(getattr(answers, "rrset", None), "ttl", None)
+        return ips, ttl
+
+    workers = min(ALIAS_RESOLVE_WORKERS, len(unique))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="alias-resolve") as pool:
+        return dict(zip(unique, pool.map(resolve, unique), strict=True))
+
+
+def _resolve_into(result: AliasResolution, records: list) -> None:
+    """ALIAS 레코드의 대상 DNS를 동시에 리졸브하여 result.targets에 기록한다."""
+    alias_records = [r for r in records if r.record_type == "ALIAS"]
+    resolved = _resolve_many([alias_dns for rec in alias_records for alias_dns in rec.values])
+    now = time.monotonic()
+
+    for rec in alias_records:
         for alias_dns in rec.values:
-            ips: list[str] = []
-            try:
-                answers = resolver.resolve(alias_dns, "A")
-                ips = [str(rdata) for rdata in answers]
-            except dns.exception.DNSException:
+            ips, ttl = resolved[alias_dns]
+            if ips is None:
                 result.warnings.append(f"{rec.set_identifier}: {alias_dns} 리졸브 실패")
+                ips = []
             result.targets[rec.set_identifier] = AliasTarget(
                 set_identifier=rec.set_identifier,
                 alias_dns=alias_dns,
                 ips=ips,
+                expires_at=now + (_clamp_ttl(ttl) if ips else MIN_ALIAS_TTL),
+                ip_last_seen={ip: now for ip in ips},
+                set_last_seen={frozenset(ips): now} if ips else {},
             )
 
+
+def _build_alias_maps(result: AliasResolution) -> None:
+    """result.targets로부터 IP 매핑을 구성하고 겹침을 감지한다."""
     # IP → SetIdentifier 매핑 구성 + 겹침 감지
     overlap_ips: set[str] = set()
     for sid, target in result.targets.items():
-        ip_set = frozenset(target.ips)
-        if ip_set:
-            result.ip_set_map[ip_set] = sid
+        ip_sets = set(target.set_last_seen) or {frozenset(target.ips)}
+        for ip_set in ip_sets:
+            if ip_set:
+                result.ip_set_map[ip_set] = sid
         for ip in target.ips:
             if ip in result.ip_map and result.ip_map[ip] != sid:
                 overlap_ips.add(ip)
@@ -167,5 +412,3 @@ def resolve_alias_targets(
                 f"일부 IP가 겹칩니다: {', '.join(sorted(overlapping_sids))}. "
                 "분포 측정이 부정확할 수 있습니다."
             )
-
-    return result
@@ -0,0 +1,366 @@
+"""probe 샘플 바이너리 로그 모듈.
+
+watch 실행 중 probe 결과를 고정 폭 바이너리 레코드로 파일에 추가(append-only)하고,
+종료 후 로그를 재생(replay)하여 Stats를 다시 구성한다. 장시간 실행에서도 샘플을
+메모리에 보관하지 않고 대시보드/통계/타임라인을 오프라인으로 재현할 수 있다.
+
+파일 구조:
+    MAGIC(8) + 헤더 길이(u32) + 헤더(JSON) + 프레임...
+
+프레임은 첫 바이트(kind)로 구분한다.
+    - 샘플(KIND_HIT / KIND_ERROR): SAMPLE 구조체 (28바이트 고정 폭, 버전 1은 24바이트)
+    - 메타(KIND_META): META 구조체 + JSON 페이로드.
+      NS/SetIdentifier 인덱스 정의와 레코드 변경 이벤트를 기록한다.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import struct
+import threading
+from collections.abc import Iterator
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+from .aws import WeightedRecord
+from .httpprobe import HTTP_FAILURES
+from .stats import RecordChangeEvent, Stats
+
+MAGIC = b"DNSMLOG\x01"
+FORMAT_VERSION = 2
+DEFAULT_BUFFER_SIZE = 64 * 1024
+
+KIND_META = 0
+KIND_HIT = 1
+KIND_ERROR = 2
+
+# kind(u8) rcode(u8) ns(u16) sid(u16) http_failure(u8) pad(1) 경과 초(f64)
+# latency(f32) dns_latency(f32) http_latency(f32)
+# http_failure는 이전에 0으로 채우던 padding 자리이므로 기존 로그는 "실패 없음"으로 읽힌다
+SAMPLE = struct.Struct("<BBHHBxdfff")
+# 버전 1: http_latency 없음
+SAMPLE_V1 = struct.Struct("<BBHHBxdff")
+_SAMPLE_FORMATS = {1: SAMPLE_V1, 2: SAMPLE}
+# kind(u8) pad(3) 페이로드 길이(u32)
+META = struct.Struct("<BxxxI")
+_HEADER_LEN = struct.Struct("<I")
+
+# 인덱스/값이 없음을 나타내는 값
+NO_INDEX = 0xFFFF
+NO_RCODE = 0xFF
+NO_LATENCY = math.nan
+NO_HTTP_FAILURE = 0
+
+# HTTP 실패 종류 ↔ 코드 (1부터)
+_HTTP_FAILURE_CODES = {name: code for code, name in enumerate(HTTP_FAILURES, start=1)}
+_HTTP_FAILURE_NAMES = {code: name for name, code in _HTTP_FAILURE_CODES.items()}
+
+_READ_CHUNK = 1 << 20
+
+
+@dataclass
+class SampleLogHeader:
+    """샘플 로그 헤더."""
+
+    record_name: str
+    start_wall_time: float
+    records: list[WeightedRecord] = field(default_factory=list)
+    version: int = FORMAT_VERSION
+
+
+@dataclass
+class Sample:
+    """probe 샘플 1건."""
+
+    # Stats 시작 이후 경과 초
+    t: float
+    kind: int
+    set_identifier: str | None
+    nameserver: str | None
+    latency: float | None
+    dns_latency: float | None
+    rcode: int | None
+    http_latency: float | None = None
+    http_failure: str | None = None
+
+
+class SampleLogWriter:
+    """probe 샘플을 버퍼를 거쳐 바이너리 로그에 추가한다.
+
+    Stats의 기록 경로에서 호출되므로 프레임 단위로 락을 잡아 스레드 간 프레임이
+    섞이지 않도록 한다. NS/SetIdentifier 문자열은 처음 등장할 때 메타 프레임으로
+    인덱스를 정의하고, 이후 샘플에는 인덱스만 기록한다.
+
+    path가 이미 있으면 overwrite=True일 때만 덮어쓴다.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        header: SampleLogHeader,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+        overwrite: bool = False,
+    ):
+        # 이전 실행의 로그를 실수로 덮어쓰지 않도록 기본은 새 파일만 생성 (있으면 FileExistsError)
+        self._file = open(path, "wb" if overwrite else "xb", buffering=buffer_size)
+        self._lock = threading.Lock()
+        self._ns_index: dict[str, int] = {}
+        self._sid_index: dict[str, int] = {}
+        self._closed = False
+
+        payload = json.dumps(asdict(header), ensure_ascii=False).encode("utf-8")
+        self._file.write(MAGIC + _HEADER_LEN.pack(len(payload)) + payload)
+
+    def write_hit(
+        self,
+        t: float,
+        set_identifier: str,
+        latency: float | None,
+        nameserver: str | None,
+        dns_latency: float | None,
+        http_latency: float | None = None,
+        http_failure: str | None = None,
+    ) -> None:
+        """매핑 성공 샘플을 기록한다 (RCODE는 NOERROR)."""
+        with self._lock:
+            if self._closed:
+                return
+            sid = self._intern(self._sid_index, "sid", set_identifier)
+            ns = self._intern(self._ns_index, "ns", nameserver)
+            self._file.write(
+                SAMPLE.pack(
+                    KIND_HIT,
+                    0,
+                    ns,
+                    sid,
+                    NO_HTTP_FAILURE if http_failure is None else _HTTP_FAILURE_CODES[http_failure],
+                    t,
+                    NO_LATENCY if latency is None else latency,
+                    NO_LATENCY if dns_latency is None else dns_latency,
+                    NO_LATENCY if http_latency is None else http_latency,
+                )
+            )
+
+    def write_error(self, t: float, nameserver: str | None, rcode: int | None) -> None:
+        """조회 실패/매핑 실패 샘플을 기록한다."""
+        with self._lock:
+            if self._closed:
+                return
+            ns = self._intern(self._ns_index, "ns", nameserver)
+            code = NO_RCODE if rcode is None else min(rcode, NO_RCODE)
+            self._file.write(
+                SAMPLE.pack(
+                    KIND_ERROR,
+                    code,
+                    ns,
+                    NO_INDEX,
+                    NO_HTTP_FAILURE,
+                    t,
+                    NO_LATENCY,
+                    NO_LATENCY,
+                    NO_LATENCY,
+                )
+            )
+
+    def write_event(self, event: RecordChangeEvent, start_time: float) -> None:
+        """레코드 변경 이벤트를 기록한다 (시각은 start_time 기준 경과 초로 변환)."""
+        payload = asdict(event)
+        payload["detected_at"] = event.detected_at - start_time
+        payload["last_unchanged_at"] = event.last_unchanged_at - start_time
+        with self._lock:
+            if self._closed:
+                return
+            self._write_meta({"type": "event", "event": payload})
+
+    def flush(self) -> None:
+        """버퍼의 내용을 파일에 기록한다."""
+        with self._lock:
+            if not self._closed:
+                self._file.flush()
+
+    def close(self) -> None:
+        """버퍼를 비우고 파일을 닫는다."""
+        with self._lock:
+            if not self._closed:
+                self._closed = True
+                self._file.close()
+
+    def __enter__(self) -> SampleLogWriter:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _intern(self, table: dict[str, int], kind: str, value: str | None) -> int:
+        if value is None:
+            return NO_INDEX
+        index = table.get(value)
+        if index is None:
+            index = len(table)
+            if index >= NO_INDEX:
+                raise ValueError(f"샘플 로그의 {kind} 인덱스가 상한({NO_INDEX})을 초과했습니다.")
+            table[value] = index
+            self._write_meta({"type": kind, "index": index, "value": value})
+        return index
+
+    def _write_meta(self, payload: dict) -> None:
+        data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self._file.write(META.pack(KIND_META, len(data)) + data)
+
+
+def read_header(path: Path) -> SampleLogHeader:
+    """샘플 로그 헤더만 읽는다."""
+    with open(path, "rb") as f:
+        return _read_header(f)
+
+
+def _read_header(f) -> SampleLogHeader:
+    magic = f.read(len(MAGIC))
+    if magic != MAGIC:
+        raise ValueError("샘플 로그 파일이 아닙니다.")
+    raw_len = f.read(_HEADER_LEN.size)
+    if len(raw_len) < _HEADER_LEN.size:
+        raise ValueError("샘플 로그 헤더가 손상되었습니다.")
+    (length,) = _HEADER_LEN.unpack(raw_len)
+    try:
+        data = json.loads(f.read(length).decode("utf-8"))
+    except (UnicodeDecodeError, json.JSONDecodeError) as e:
+        raise ValueError("샘플 로그 헤더가 손상되었습니다.") from e
+    if data.get("version") not in _SAMPLE_FORMATS:
+        raise ValueError(f"지원하지 않는 샘플 로그 버전입니다: {data.get('version')}")
+    data["records"] = [WeightedRecord(**r) for r in data.get("records", [])]
+    return SampleLogHeader(**data)
+
+
+def iter_samples(path: Path) -> Iterator[Sample | RecordChangeEvent]:
+    """샘플 로그의 프레임을 순서대로 읽는다.
+
+    파일을 청크 단위로 읽으므로 로그 크기와 무관하게 메모리 사용량이 일정하다.
+    비정상 종료로 마지막 프레임이 잘린 경우 그 직전까지만 반환한다.
+    이벤트 시각(detected_at 등)은 Stats 시작 이후 경과 초이다.
+    """
+    ns_names: dict[int, str] = {}
+    sid_names: dict[int, str] = {}
+    with open(path, "rb") as f:
+        sample = _SAMPLE_FORMATS[_read_header(f).version]
+        buf = b""
+        pos = 0
+        eof = False
+        while True:
+            if len(buf) - pos < sample.size and not eof:
+                chunk = f.read(_READ_CHUNK)
+                eof = not chunk
+                buf = buf[pos:] + chunk
+                pos = 0
+            if pos >= len(buf):
+                return
+
+            kind = buf[pos]
+            if kind == KIND_META:
+                if len(buf) - pos < META.size:
+                    if eof:
+                        return
+                    continue
+                _, length = META.unpack_from(buf, pos)
+                end = pos + META.size + length
+                if end > len(buf):
+                    if eof:
+                        return
+                    more = f.read(max(_READ_CHUNK, end - pos))
+                    eof = not more
+                    buf = buf[pos:] + more
+                    pos = 0
+                    continue
+                meta = json.loads(buf[pos + META.size : end].decode("utf-8"))
+                pos = end
+                if meta["type"] == "ns":
+                    ns_names[meta["index"]] = meta["value"]
+                elif meta["type"] == "sid":
+                    sid_names[meta["index"]] = meta["value"]
+                elif meta["type"] == "event":
+                    yield RecordChangeEvent(**meta["event"])
+                continue
+
+            if kind not in (KIND_HIT, KIND_ERROR):
+                raise ValueError(f"알 수 없는 샘플 로그 프레임입니다: {kind}")
+            if len(buf) - pos < sample.size:
+                if eof:
+                    return
+                continue
+            _, rcode, ns, sid, failure, t, latency, dns_latency, *extra = sample.unpack_from(
+                buf, pos
+            )
+            http_latency = extra[0] if extra else NO_LATENCY
+            pos += sample.size
+            yield Sample(
+                t=t,
+                kind=kind,
+                set_identifier=sid_names.get(sid),
+                nameserver=ns_names.get(ns),
+                latency=None if math.isnan(latency) else latency,
+                dns_latency=None if math.isnan(dns_latency) else dns_latency,
+                rcode=None if rcode == NO_RCODE else rcode,
+                http_latency=None if math.isnan(http_latency) else http_latency,
+                http_failure=_HTTP_FAILURE_NAMES.get(failure),
+            )
+
+
+def replay(path: Path, until: float | None = None) -> tuple[SampleLogHeader, Stats, float]:
+    """샘플 로그를 재생하여 Stats를 다시 구성한다.
+
+    Args:
+        path: 샘플 로그 경로
+        until: 이 경과 초까지만 재생 (생략 시 전체)
+
+    Returns:
+        (헤더, 재구성된 Stats, 마지막 샘플의 경과 초).
+        Stats의 start_time은 0이며, 스냅샷은 get_snapshot(now=마지막 경과 초)로 얻는다.
+    """
+    header = read_header(path)
+    stats = Stats(start_time=0.0, start_wall_time=header.start_wall_time)
+    last = 0.0
+    for item in iter_samples(path):
+        if isinstance(item, RecordChangeEvent):
+            if until is not None and item.detected_at > until:
+                break
+            stats.record_event(item)
+            last = max(last, item.detected_at)
+            continue
+        if until is not None and item.t > until:
+            break
+        if item.kind == KIND_HIT:
+            stats.record_hit(
+                item.set_identifier,
+                item.latency,
+                nameserver=item.nameserver,
+                dns_latency=item.dns_latency,
+                now=item.t,
+                http_latency=item.http_latency,
+                http_failure=item.http_failure,
+            )
+        else:
+            stats.record_error(nameserver=item.nameserver, rcode=item.rcode, now=item.t)
+        last = item.t
+    return header, stats, last
+
+
+def records_at(header: SampleLogHeader, events: list[RecordChangeEvent]) -> list[WeightedRecord]:
+    """헤더의 초기 레코드에 변경 이벤트의 가중치를 순서대로 적용한다.
+
+    로그에는 변경 이벤트의 가중치만 기록되므로, 실행 중 추가된 SetIdentifier는
+    값(values) 없이 구성된다.
+    """
+    records = list(header.records)
+    for event in events:
+        by_sid = {r.set_identifier: r for r in records}
+        records = [
+            WeightedRecord(
+                set_identifier=sid,
+                weight=weight,
+                record_type=by_sid[sid].record_type if sid in by_sid else "-",
+                values=list(by_sid[sid].values) if sid in by_sid else [],
+            )
+            for sid, weight in event.weights.items()
+        ]
+    return records
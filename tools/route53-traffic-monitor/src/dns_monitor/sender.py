@@ -5,12 +5,18 @@ from __future__ import annotations
 import asyncio
 import time
 
-import httpx
-
-from .aws import WeightedRecord, build_value_to_identifier_map, get_weighted_records
+from .aws import WeightedRecord
+from .classifier import AnswerClassifier
 from .config import MonitorConfig
-from .resolver import AliasResolution, WeightedResolver, resolve_alias_targets
+from .httpprobe import HttpProber, ProbeResult
+from .resolver import (
+    AliasResolution,
+    WeightedResolver,
+    resolve_alias_targets,
+    update_alias_targets,
+)
 from .stats import Stats
+from .udp import AsyncDnsClient
 
 
 class TrafficSender:
@@ -23,65 +29,52 @@ class TrafficSender:
         records: list[WeightedRecord],
         resolver: WeightedResolver,
         alias_resolution: AliasResolution | None = None,
+        dns_client: AsyncDnsClient | None = None,
     ):
         self._config = config
         self._stats = stats
         self._records = records
         self._resolver = resolver
+        # 여러 레코드를 감시할 때 공유하는 UDP 소켓 (없으면 executor에서 블로킹 질의)
+        self._dns_client = dns_client
         self._running = False
         self._pending_tasks: set[asyncio.Task] = set()
 
-        # value → SetIdentifier 매핑 (A/CNAME 직접 매칭)
-        self._value_map = build_value_to_identifier_map(records)
-
         # ALIAS 레코드: IP 기반 매핑
         self._alias_resolution = alias_resolution or AliasResolution()
 
+        # 응답 → SetIdentifier 분류기 (레코드/ALIAS 매핑이 바뀔 때마다 재구성)
+        self._classifier = AnswerClassifier(records, self._alias_resolution)
+
     def _identify(self, resolved_ips: list[str]) -> str | None:
         """DNS 응답 IP를 SetIdentifier로 매핑한다."""
-        if not resolved_ips:
-            return None
-
-        first_ip = resolved_ips[0]
-
-        # 1. 직접 매칭 (A, CNAME - value가 IP/DNS인 경우)
-        if first_ip in self._value_map:
-            return self._value_map[first_ip]
-
-        # 2. ALIAS: IP-set 매칭 (겹침에 강건)
-        response_set = frozenset(resolved_ips)
-        if response_set in self._alias_resolution.ip_set_map:
-            return self._alias_resolution.ip_set_map[response_set]
-
-        # 3. ALIAS: 개별 IP 매칭 (fallback)
-        if first_ip in self._alias_resolution.ip_map:
-            return self._alias_resolution.ip_map[first_ip]
-
-        return None
+        return self._classifier.classify(resolved_ips)
 
     async def run(self) -> None:
         """TPS 속도로 DNS 조회 루프를 실행한다."""
         self._running = True
-        interval = 1.0 / self._config.tps
-        http_client: httpx.AsyncClient | None = None
+        http_prober: HttpProber | None = None
 
         if self._config.http_enabled:
-            http_client = httpx.AsyncClient(
-                timeout=httpx.Timeout(10.0),
-                follow_redirects=True,
-                verify=False,
+            http_prober = HttpProber(
+                self._config.endpoint, self._config.record_name, verify=self._config.http_verify
             )
 
         try:
-            while self._running:
-                start = time.monotonic()
-                task = asyncio.ensure_future(self._probe_once(http_client))
-                task.set_name("probe_once")
-                self._pending_tasks.add(task)
-                task.add_done_callback(self._pending_tasks.discard)
-                elapsed = time.monotonic() - start
-                sleep_time = max(0, interval - elapsed)
-                await asyncio.sleep(sleep_time)
+            if self._config.ns_schedule == "per-ns":
+                # NS별 독립 스케줄: 각 NS를 TPS / NS 수 속도로 질의
+                ns_ips = self._resolver.nameserver_ips
+                interval = len(ns_ips) / self._config.tps
+                await asyncio.gather(
+                    *(
+                        self._schedule(
+                            http_prober, interval, ns_ip, offset=i * interval / len(ns_ips)
+                        )
+                        for i, ns_ip in enumerate(ns_ips)
+                    )
+                )
+            else:
+                await self._schedule(http_prober, 1.0 / self._config.tps)
         except asyncio.CancelledError:
             pass
         finally:
@@ -91,71 +84,108 @@ class TrafficSender:
                     t.cancel()
                 await asyncio.gather(*tasks, return_exceptions=True)
                 self._pending_tasks.clear()
-            if http_client:
-                await http_client.aclose()
+            if http_prober:
+                await http_prober.aclose()
 
-    async def _probe_once(self, http_client: httpx.AsyncClient | None) -> None:
-        """DNS 조회 1회 + 선택적 HTTP 요청."""
+    async def _schedule(
+        self,
+        http_prober: HttpProber | None,
+        interval: float,
+        ns_ip: str | None = None,
+        offset: float = 0.0,
+    ) -> None:
+        """interval 간격으로 probe 태스크를 생성한다.
+
+        ns_ip를 지정하면 해당 NS에만 질의하고, 생략하면 라운드로빈으로 NS를 선택한다.
+        """
+        if offset > 0:
+            await asyncio.sleep(offset)
+        while self._running:
+            start = time.monotonic()
+            task = asyncio.ensure_future(self._probe_once(http_prober, ns_ip))
+            task.set_name("probe_once")
+            self._pending_tasks.add(task)
+            task.add_done_callback(self._pending_tasks.discard)
+            elapsed = time.monotonic() - start
+            sleep_time = max(0, interval - elapsed)
+            await asyncio.sleep(sleep_time)
+
+    async def _probe_once(self, http_prober: HttpProber | None, ns_ip: str | None = None) -> None:
+        """DNS 조회 1회 + 선택적 HTTP 요청.
+
+        DNS latency와 HTTP latency는 SetIdentifier별로 따로 기록한다.
+        HTTP 요청은 응답의 첫 번째 IP로 직접 연결한다 (SNI/Host는 레코드 이름).
+        """
+        if ns_ip is None:
+            ns_ip = self._resolver.next_nameserver()
         t0 = time.monotonic()
-        resolved_ips = self._resolver.resolve_once()
+        if self._dns_client is not None:
+            answer = await self._resolver.query_async(self._dns_client, ns_ip)
+        else:
+            # 블로킹 UDP 질의는 executor에서 수행하여 다른 NS의 probe를 지연시키지 않는다
+            loop = asyncio.get_running_loop()
+            answer = await loop.run_in_executor(None, self._resolver.query_from, ns_ip)
         dns_latency = time.monotonic() - t0
+        resolved_ips = answer.values
 
         if not resolved_ips:
-            self._stats.record_error()
+            self._stats.record_error(nameserver=ns_ip, rcode=answer.rcode)
             return
 
         identifier = self._identify(resolved_ips)
         if identifier is None:
-            self._stats.record_error()
+            self._stats.record_error(nameserver=ns_ip, rcode=answer.rcode)
             return
 
-        latency: float = dns_latency
-
-        if http_client is not None:
-            try:
-                url = f"https://{resolved_ips[0]}"
-                t0 = time.monotonic()
-                await http_client.get(
-                    url,
-                    headers={"Host": self._config.record_name},
-                )
-                latency = time.monotonic() - t0
-            except httpx.HTTPError:
-                pass  # HTTP 실패는 무시, DNS 매핑은 유효
+        # HTTP 실패는 latency 대신 실패 종류로 기록, DNS 매핑은 유효
+        http = await http_prober.probe(resolved_ips[0]) if http_prober else ProbeResult()
 
-        self._stats.record_hit(identifier, latency)
+        self._stats.record_hit(
+            identifier,
+            dns_latency,
+            nameserver=ns_ip,
+            dns_latency=dns_latency,
+            http_latency=http.latency,
+            http_failure=http.failure,
+        )
 
     def stop(self) -> None:
         """루프 중단."""
         self._running = False
 
+    @property
+    def alias_resolution(self) -> AliasResolution:
+        """현재 사용 중인 ALIAS 해석 결과."""
+        return self._alias_resolution
+
+    def set_alias_resolution(self, alias_resolution: AliasResolution) -> None:
+        """ALIAS 해석 결과를 교체한다 (참조 교체이므로 probe 루프를 블로킹하지 않음)."""
+        self._classifier = AnswerClassifier(self._records, alias_resolution)
+        self._alias_resolution = alias_resolution
+
     def update_records(self, records: list[WeightedRecord]) -> None:
         """Route53 가중치 레코드 갱신 시 매핑을 업데이트한다."""
         self._records = records
-        self._value_map = build_value_to_identifier_map(records)
         has_alias = any(r.record_type == "ALIAS" for r in records)
         if has_alias:
             self._alias_resolution = resolve_alias_targets(records)
-
-
-async def poll_route53(
-    config: MonitorConfig,
-    sender: TrafficSender,
-    records_ref: list[list[WeightedRecord]],
-    interval: float = 30.0,
-) -> None:
-    """주기적으로 Route53 가중치 레코드를 갱신한다."""
-    while True:
-        await asyncio.sleep(interval)
-        try:
-            new_records = await asyncio.get_event_loop().run_in_executor(
-                None,
-                get_weighted_records,
-                config.hosted_zone_id,
-                config.record_name,
+        self._classifier = AnswerClassifier(records, self._alias_resolution)
+
+    async def apply_diff(self, records: list[WeightedRecord], remapped: set[str]) -> None:
+        """변경된 SetIdentifier의 매핑만 갱신한다.
+
+        ALIAS 대상은 DNS 이름이 바뀐 SetIdentifier만 executor에서 다시 해석하여
+        probe 루프를 블로킹하지 않는다. 분류기는 새 레코드/ALIAS 매핑으로 재구성한다.
+        """
+        alias_resolution = self._alias_resolution
+        alias_sids = {r.set_identifier for r in records if r.record_type == "ALIAS"}
+        stale_alias = set(alias_resolution.targets) - alias_sids
+        if (alias_sids & remapped) or stale_alias:
+            loop = asyncio.get_running_loop()
+            alias_resolution = await loop.run_in_executor(
+                None, update_alias_targets, alias_resolution, records, remapped & alias_sids
             )
-            if new_records:
-                records_ref[0] = new_records
-                sender.update_records(new_records)
-        except Exception:
-            pass  # 갱신 실패는 무시, 기존 데이터 유지
+
+        self._records = records
+        self._alias_resolution = alias_resolution
+        self._classifier = AnswerClassifier(records, alias_resolution)
@@ -0,0 +1,81 @@
+"""시작 준비(preflight) 단계 실행 및 소요 시간 측정 모듈.
+
+자격증명 검증, 가중치 레코드 조회, NS 조회처럼 서로 의존하지 않는 단계는 스레드 풀에서
+동시에 실행하고, 단계별 시작 시점/소요 시간을 기록한다 (--profile-startup).
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(frozen=True)
+class StartupPhase:
+    """시작 단계 1개의 측정 결과. 시각은 측정 시작 이후 경과 초."""
+
+    name: str
+    start: float
+    duration: float
+
+    @property
+    def end(self) -> float:
+        return self.start + self.duration
+
+
+class StartupProfile:
+    """시작 단계별 소요 시간 기록기 (스레드 안전)."""
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter):
+        self._clock = clock
+        self._origin = clock()
+        self._lock = threading.Lock()
+        self._phases: list[StartupPhase] = []
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """with 블록 실행 시간을 name 단계로 기록한다 (예외가 나도 기록)."""
+        start = self._clock()
+        try:
+            yield
+        finally:
+            end = self._clock()
+            with self._lock:
+                self._phases.append(StartupPhase(name, start - self._origin, end - start))
+
+    @property
+    def phases(self) -> list[StartupPhase]:
+        """기록된 단계 목록 (시작 시점 순)."""
+        with self._lock:
+            return sorted(self._phases, key=lambda p: p.start)
+
+    def elapsed(self) -> float:
+        """측정 시작 이후 경과 초."""
+        return self._clock() - self._origin
+
+
+def run_concurrently(
+    steps: dict[str, Callable[[], Any]], profile: StartupProfile | None = None
+) -> dict[str, Any]:
+    """서로 독립적인 단계를 동시에 실행하고 이름별 결과를 반환한다.
+
+    모든 단계가 끝날 때까지 기다린 뒤, 실패한 단계가 있으면 steps 순서상 가장 앞선
+    단계의 예외를 다시 발생시킨다 (예: 자격증명 오류를 API 오류보다 먼저 보고).
+    """
+    profile = profile or StartupProfile()
+
+    def _timed(name: str, step: Callable[[], Any]) -> Any:
+        with profile.phase(name):
+            return step()
+
+    if len(steps) <= 1:
+        return {name: _timed(name, step) for name, step in steps.items()}
+    with ThreadPoolExecutor(max_workers=len(steps), thread_name_prefix="preflight") as pool:
+        futures = {name: pool.submit(_timed, name, step) for name, step in steps.items()}
+    # with 블록을 벗어나면 모든 단계가 끝난 상태
+    return {name: future.result() for name, future in futures.items()}
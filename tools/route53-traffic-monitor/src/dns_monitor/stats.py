@@ -5,7 +5,31 @@ from __future__ import annotations
 import threading
 import time
 from collections import deque
-from dataclasses import dataclass
+from collections.abc import Callable
+from dataclasses import dataclass, field, replace
+from typing import TYPE_CHECKING, Generic, TypeVar
+
+from .completion import PropagationTracker, ResolverProgress
+from .histogram import LatencyHistogram, LatencyPercentiles, WindowedLatency, summarize_windows
+
+if TYPE_CHECKING:
+    from .samplelog import SampleLogWriter
+
+T = TypeVar("T")
+
+
+@dataclass
+class RecordChangeEvent:
+    """Route53 가중치 레코드 변경 이벤트."""
+
+    # 변경을 감지한 시각 (time.monotonic / time.time)
+    detected_at: float
+    wall_time: float
+    # 변경 전 상태를 마지막으로 확인한 시각 (time.monotonic). 실제 변경은 이 시각 이후 발생
+    last_unchanged_at: float
+    weights: dict[str, int]
+    previous_weights: dict[str, int]
+    changes: list[str] = field(default_factory=list)
 
 
 @dataclass
@@ -18,60 +42,348 @@ class StatsSnapshot:
     elapsed_seconds: float
     avg_latency_ms: float | None
     current_tps: float
+    # SetIdentifier → {윈도우 라벨("10s", "1m", "total") → DNS latency 백분위수}
+    latency_by_identifier: dict[str, dict[str, LatencyPercentiles]] = field(default_factory=dict)
+    # SetIdentifier → {윈도우 라벨 → HTTP 요청 latency 백분위수}
+    http_latency_by_identifier: dict[str, dict[str, LatencyPercentiles]] = field(
+        default_factory=dict
+    )
+    # SetIdentifier → {HTTP 실패 종류(tls / connect / timeout / http) → count}
+    http_failures: dict[str, dict[str, int]] = field(default_factory=dict)
+    # 권한 NS IP → {윈도우 라벨 → 백분위수}
+    latency_by_nameserver: dict[str, dict[str, LatencyPercentiles]] = field(default_factory=dict)
+    # 권한 NS IP → {SetIdentifier → count}
+    nameserver_distribution: dict[str, dict[str, int]] = field(default_factory=dict)
+    # 권한 NS IP → 에러 수
+    nameserver_errors: dict[str, int] = field(default_factory=dict)
+    # Route53 레코드 변경 이벤트 (시간순)
+    events: list[RecordChangeEvent] = field(default_factory=list)
 
 
-class Stats:
-    """Thread-safe 통계 컨테이너."""
+class _ShardRegistry(Generic[T]):
+    """스레드별 shard를 생성/보관한다.
 
-    def __init__(self):
+    각 스레드는 자신의 shard에만 기록하므로 기록 경로에서 락이 필요 없다.
+    락은 스레드가 처음 기록할 때 shard를 등록하는 순간과 snapshot 시 shard 목록을
+    복사하는 순간에만 사용한다.
+    """
+
+    def __init__(self, factory: Callable[[], T]):
+        self._factory = factory
+        self._local = threading.local()
         self._lock = threading.Lock()
-        self._total_requests: int = 0
-        self._distribution: dict[str, int] = {}
-        self._errors: int = 0
-        self._start_time: float = time.monotonic()
-        self._latencies: deque[float] = deque(maxlen=200)
-        self._recent_timestamps: deque[float] = deque(maxlen=100)
+        self._shards: list[T] = []
 
-    def record_hit(self, set_identifier: str, latency: float | None = None) -> None:
-        """DNS 조회 결과를 기록한다."""
-        now = time.monotonic()
-        with self._lock:
-            self._total_requests += 1
-            self._distribution[set_identifier] = self._distribution.get(set_identifier, 0) + 1
-            self._recent_timestamps.append(now)
-            if latency is not None:
-                self._latencies.append(latency)
-
-    def record_error(self) -> None:
-        """에러를 기록한다."""
-        with self._lock:
-            self._errors += 1
-            self._total_requests += 1
+    def local(self) -> T:
+        """현재 스레드의 shard를 반환한다 (없으면 생성)."""
+        try:
+            return self._local.shard
+        except AttributeError:
+            shard = self._factory()
+            with self._lock:
+                self._shards.append(shard)
+            self._local.shard = shard
+            return shard
 
-    def get_snapshot(self) -> StatsSnapshot:
-        """현재 상태의 스냅샷을 반환한다."""
-        now = time.monotonic()
+    def all(self) -> list[T]:
+        """등록된 모든 shard 목록을 반환한다."""
         with self._lock:
-            elapsed = now - self._start_time
-            avg_latency = None
-            if self._latencies:
-                avg_latency = sum(self._latencies) / len(self._latencies) * 1000  # ms
-
-            # 최근 TPS 계산 (최근 타임스탬프 기반)
-            current_tps = 0.0
-            if len(self._recent_timestamps) >= 2:
-                window = now - self._recent_timestamps[0]
-                if window > 0:
-                    current_tps = len(self._recent_timestamps) / window
-
-            return StatsSnapshot(
-                total_requests=self._total_requests,
-                distribution=dict(self._distribution),
-                errors=self._errors,
-                elapsed_seconds=elapsed,
-                avg_latency_ms=avg_latency,
-                current_tps=current_tps,
+            return list(self._shards)
+
+
+def _merge_tps(now: float, timestamp_deques: list[deque[float]], maxlen: int = 100) -> float:
+    """shard별 최근 타임스탬프를 병합하여 최근 TPS를 계산한다."""
+    merged = sorted(ts for d in timestamp_deques for ts in list(d))[-maxlen:]
+    if len(merged) >= 2:
+        window = now - merged[0]
+        if window > 0:
+            return len(merged) / window
+    return 0.0
+
+
+def _merge_avg_latency_ms(windows: list[WindowedLatency]) -> float | None:
+    """shard별 누적 latency 히스토그램의 평균을 ms 단위로 계산한다."""
+    merged = LatencyHistogram()
+    for w in windows:
+        merged.merge(w.total)
+    mean = merged.mean()
+    return mean * 1000 if mean is not None else None
+
+
+def _merge_nested(target: dict[str, dict[str, int]], source: dict[str, dict[str, int]]) -> None:
+    """2차원 카운터(key → {sub_key → count})를 target에 합산한다."""
+    for key, bucket in list(source.items()):
+        merged = target.setdefault(key, {})
+        for sub_key, count in dict(bucket).items():
+            merged[sub_key] = merged.get(sub_key, 0) + count
+
+
+def _record_latency(
+    table: dict[str, WindowedLatency], key: str, latency: float, now: float
+) -> None:
+    """키별 WindowedLatency에 latency를 기록한다."""
+    window = table.get(key)
+    if window is None:
+        window = table[key] = WindowedLatency()
+    window.record(latency, now)
+
+
+def _summarize_keyed(
+    tables: list[dict[str, WindowedLatency]], now: float
+) -> dict[str, dict[str, LatencyPercentiles]]:
+    """shard별 키→WindowedLatency 테이블을 병합하여 키별 백분위수를 계산한다."""
+    grouped: dict[str, list[WindowedLatency]] = {}
+    for table in tables:
+        for key, window in list(table.items()):
+            grouped.setdefault(key, []).append(window)
+    return {key: summarize_windows(windows, now) for key, windows in grouped.items()}
+
+
+def _merge_totals(tables: list[dict[str, WindowedLatency]]) -> dict[str, LatencyHistogram]:
+    """shard별 키→WindowedLatency 테이블의 누적 히스토그램을 키별로 병합한다."""
+    merged: dict[str, LatencyHistogram] = {}
+    for table in tables:
+        for key, window in list(table.items()):
+            target = merged.get(key)
+            if target is None:
+                target = merged[key] = LatencyHistogram()
+            target.merge(window.total)
+    return merged
+
+
+class _StatsShard:
+    """Stats의 스레드별 카운터."""
+
+    __slots__ = (
+        "total_requests",
+        "errors",
+        "distribution",
+        "ns_distribution",
+        "ns_errors",
+        "latency",
+        "latency_by_sid",
+        "http_latency_by_sid",
+        "http_failures",
+        "latency_by_ns",
+        "timestamps",
+        "seconds",
+    )
+
+    def __init__(self):
+        self.total_requests: int = 0
+        self.errors: int = 0
+        self.distribution: dict[str, int] = {}
+        self.ns_distribution: dict[str, dict[str, int]] = {}
+        self.ns_errors: dict[str, int] = {}
+        self.latency = WindowedLatency()
+        self.latency_by_sid: dict[str, WindowedLatency] = {}
+        self.http_latency_by_sid: dict[str, WindowedLatency] = {}
+        self.http_failures: dict[str, dict[str, int]] = {}
+        self.latency_by_ns: dict[str, WindowedLatency] = {}
+        self.timestamps: deque[float] = deque(maxlen=100)
+        # 시작 이후 경과 초 → {SetIdentifier → count}
+        self.seconds: dict[int, dict[str, int]] = {}
+
+
+class Stats:
+    """Thread-safe 통계 컨테이너.
+
+    기록은 스레드별 shard에 락 없이 수행하고, get_snapshot()에서 shard를 병합한다.
+    shard마다 기록하는 스레드가 하나뿐이므로 GIL 하에서 카운터 갱신이 안전하며,
+    병합 시의 dict/deque 복사는 C 레벨 단일 연산이라 기록 도중에도 일관된 값을 읽는다.
+
+    샘플 로그가 연결되어 있으면 모든 기록을 로그에도 추가한다. 로그 재생(replay) 시에는
+    start_time을 0으로 두고 기록 시각(now)을 로그의 경과 초로 지정한다.
+    """
+
+    def __init__(self, start_time: float | None = None, start_wall_time: float | None = None):
+        self._shards: _ShardRegistry[_StatsShard] = _ShardRegistry(_StatsShard)
+        self._start_time: float = time.monotonic() if start_time is None else start_time
+        self._start_wall_time: float = time.time() if start_wall_time is None else start_wall_time
+        # 변경 이벤트는 드물게 발생하므로 단일 리스트 + 락으로 관리
+        self._events_lock = threading.Lock()
+        self._events: list[RecordChangeEvent] = []
+        self._sample_log: SampleLogWriter | None = None
+
+    @property
+    def start_time(self) -> float:
+        """통계 수집 시작 시각 (time.monotonic)."""
+        return self._start_time
+
+    @property
+    def start_wall_time(self) -> float:
+        """통계 수집 시작 시각 (time.time)."""
+        return self._start_wall_time
+
+    def set_sample_log(self, sample_log: SampleLogWriter | None) -> None:
+        """이후의 모든 기록을 추가할 샘플 로그를 연결한다 (None이면 해제)."""
+        self._sample_log = sample_log
+
+    def record_event(self, event: RecordChangeEvent) -> None:
+        """Route53 레코드 변경 이벤트를 기록한다."""
+        with self._events_lock:
+            self._events.append(event)
+        if self._sample_log is not None:
+            self._sample_log.write_event(event, self._start_time)
+
+    def record_hit(
+        self,
+        set_identifier: str,
+        latency: float | None = None,
+        nameserver: str | None = None,
+        dns_latency: float | None = None,
+        now: float | None = None,
+        http_latency: float | None = None,
+        http_failure: str | None = None,
+    ) -> None:
+        """DNS 조회 결과를 기록한다.
+
+        Args:
+            set_identifier: 매핑된 SetIdentifier
+            latency: SetIdentifier별 DNS latency(초). SetIdentifier별 히스토그램에 기록
+            nameserver: 응답한 권한 NS IP
+            dns_latency: 권한 NS 응답 시간(초). NS별 히스토그램에 기록
+            now: 기록 시각 (time.monotonic 기준, 생략 시 현재 시각)
+            http_latency: HTTP 요청 latency(초). SetIdentifier별 HTTP 히스토그램에 기록
+            http_failure: HTTP 요청 실패 종류. SetIdentifier별 실패 수에 기록
+        """
+        if now is None:
+            now = time.monotonic()
+        if self._sample_log is not None:
+            self._sample_log.write_hit(
+                now - self._start_time,
+                set_identifier,
+                latency,
+                nameserver,
+                dns_latency,
+                http_latency,
+                http_failure,
             )
+        shard = self._shards.local()
+        shard.total_requests += 1
+        dist = shard.distribution
+        dist[set_identifier] = dist.get(set_identifier, 0) + 1
+        shard.timestamps.append(now)
+        second = int(now - self._start_time)
+        bucket = shard.seconds.get(second)
+        if bucket is None:
+            bucket = shard.seconds[second] = {}
+        bucket[set_identifier] = bucket.get(set_identifier, 0) + 1
+        if latency is not None:
+            shard.latency.record(latency, now)
+            _record_latency(shard.latency_by_sid, set_identifier, latency, now)
+        if http_latency is not None:
+            _record_latency(shard.http_latency_by_sid, set_identifier, http_latency, now)
+        if http_failure is not None:
+            failures = shard.http_failures.get(set_identifier)
+            if failures is None:
+                failures = shard.http_failures[set_identifier] = {}
+            failures[http_failure] = failures.get(http_failure, 0) + 1
+        if nameserver is not None:
+            bucket = shard.ns_distribution.get(nameserver)
+            if bucket is None:
+                bucket = shard.ns_distribution[nameserver] = {}
+            bucket[set_identifier] = bucket.get(set_identifier, 0) + 1
+            if dns_latency is not None:
+                _record_latency(shard.latency_by_ns, nameserver, dns_latency, now)
+
+    def record_error(
+        self, nameserver: str | None = None, rcode: int | None = None, now: float | None = None
+    ) -> None:
+        """에러를 기록한다.
+
+        Args:
+            nameserver: 질의한 권한 NS IP
+            rcode: 응답 RCODE (샘플 로그에만 기록)
+            now: 기록 시각 (time.monotonic 기준, 생략 시 현재 시각)
+        """
+        if self._sample_log is not None:
+            if now is None:
+                now = time.monotonic()
+            self._sample_log.write_error(now - self._start_time, nameserver, rcode)
+        shard = self._shards.local()
+        shard.errors += 1
+        shard.total_requests += 1
+        if nameserver is not None:
+            shard.ns_errors[nameserver] = shard.ns_errors.get(nameserver, 0) + 1
+
+    def get_snapshot(self, now: float | None = None) -> StatsSnapshot:
+        """현재 상태(또는 재생 시 now 시각)의 스냅샷을 반환한다."""
+        if now is None:
+            now = time.monotonic()
+        shards = self._shards.all()
+
+        total_requests = 0
+        errors = 0
+        distribution: dict[str, int] = {}
+        ns_distribution: dict[str, dict[str, int]] = {}
+        http_failures: dict[str, dict[str, int]] = {}
+        ns_errors: dict[str, int] = {}
+        for shard in shards:
+            total_requests += shard.total_requests
+            errors += shard.errors
+            for sid, count in dict(shard.distribution).items():
+                distribution[sid] = distribution.get(sid, 0) + count
+            _merge_nested(ns_distribution, shard.ns_distribution)
+            _merge_nested(http_failures, shard.http_failures)
+            for ns_ip, count in dict(shard.ns_errors).items():
+                ns_errors[ns_ip] = ns_errors.get(ns_ip, 0) + count
+
+        return StatsSnapshot(
+            total_requests=total_requests,
+            distribution=distribution,
+            errors=errors,
+            elapsed_seconds=now - self._start_time,
+            avg_latency_ms=_merge_avg_latency_ms([s.latency for s in shards]),
+            current_tps=_merge_tps(now, [s.timestamps for s in shards]),
+            latency_by_identifier=_summarize_keyed([s.latency_by_sid for s in shards], now),
+            http_latency_by_identifier=_summarize_keyed(
+                [s.http_latency_by_sid for s in shards], now
+            ),
+            http_failures=http_failures,
+            latency_by_nameserver=_summarize_keyed([s.latency_by_ns for s in shards], now),
+            nameserver_distribution=ns_distribution,
+            nameserver_errors=ns_errors,
+            events=self._copy_events(),
+        )
+
+    def get_time_buckets(self, since_second: int = 0) -> dict[int, dict[str, int]]:
+        """시작 이후 경과 초별 SetIdentifier 분포를 반환한다.
+
+        Args:
+            since_second: 이 경과 초 이후의 버킷만 반환 (대시보드 갱신 시 비용 절감)
+        """
+        merged: dict[int, dict[str, int]] = {}
+        for shard in self._shards.all():
+            for second, bucket in list(shard.seconds.items()):
+                if second < since_second:
+                    continue
+                target = merged.setdefault(second, {})
+                for sid, count in dict(bucket).items():
+                    target[sid] = target.get(sid, 0) + count
+        return merged
+
+    def get_latency_histograms(
+        self,
+    ) -> tuple[dict[str, LatencyHistogram], dict[str, LatencyHistogram]]:
+        """전체 구간 누적 latency 히스토그램을 반환한다.
+
+        Returns:
+            (SetIdentifier → 샘플 latency 히스토그램, 권한 NS IP → DNS latency 히스토그램)
+        """
+        shards = self._shards.all()
+        return (
+            _merge_totals([s.latency_by_sid for s in shards]),
+            _merge_totals([s.latency_by_ns for s in shards]),
+        )
+
+    def get_http_latency_histograms(self) -> dict[str, LatencyHistogram]:
+        """SetIdentifier별 전체 구간 누적 HTTP latency 히스토그램을 반환한다."""
+        return _merge_totals([s.http_latency_by_sid for s in self._shards.all()])
+
+    def _copy_events(self) -> list[RecordChangeEvent]:
+        with self._events_lock:
+            return list(self._events)
 
 
 @dataclass
@@ -85,71 +397,287 @@ class PropagationSnapshot:
     elapsed_seconds: float
     avg_latency_ms: float | None
     current_tps: float
+    # resolver_label → 전파 진행 상태 (기대 값이 지정된 경우에만)
+    resolver_progress: dict[str, ResolverProgress] = field(default_factory=dict)
+    # resolver_label → 마지막 응답의 잔여 TTL(초)
+    resolver_ttl: dict[str, int] = field(default_factory=dict)
+    # 실제로 보낸 질의 수 (응답 값 수와 무관하게 질의 1건당 1)
+    probes_sent: int = 0
+    # TTL 기반 스케줄로 생략한 질의 수 (고정 TPS 스케줄 대비)
+    queries_saved: int = 0
+    # 기록 버전 (기록할 때마다 증가). 같으면 내용도 같다
+    version: int = 0
+    # 직전 증분 snapshot 이후 바뀐 리졸버 라벨 (None이면 전체 snapshot)
+    changed_resolvers: frozenset[str] | None = None
+
+
+class _PropagationShard:
+    """PropagationStats의 스레드별 카운터."""
+
+    __slots__ = (
+        "total_queries",
+        "errors",
+        "overall",
+        "per_resolver",
+        "latency",
+        "timestamps",
+        "ttl",
+        "probes",
+        "skipped",
+        "version",
+        "resolver_versions",
+    )
+
+    def __init__(self):
+        self.total_queries: int = 0
+        self.errors: int = 0
+        # 전체 IP 분포
+        self.overall: dict[str, int] = {}
+        # 리졸버별 IP 분포
+        self.per_resolver: dict[str, dict[str, int]] = {}
+        self.latency = WindowedLatency()
+        self.timestamps: deque[float] = deque(maxlen=100)
+        # 리졸버별 마지막 응답 (응답 시각(time.monotonic), TTL). 시각은 shard 간 비교용
+        self.ttl: dict[str, tuple[float, int]] = {}
+        self.probes: int = 0
+        # 고정 TPS 대비 생략한 질의 수
+        self.skipped: float = 0.0
+        # 기록할 때마다 증가하는 버전과, 리졸버별 마지막 기록 버전
+        self.version: int = 0
+        self.resolver_versions: dict[str, int] = {}
+
+    def touch(self, resolver_label: str | None = None) -> None:
+        """기록 버전을 올린다 (리졸버를 지정하면 해당 리졸버의 버전도 갱신)."""
+        self.version += 1
+        if resolver_label is not None:
+            self.resolver_versions[resolver_label] = self.version
 
 
 class PropagationStats:
     """Propagation 모드 전용 Thread-safe 통계 컨테이너.
 
     리졸버별 × 응답 IP별 2차원 분포를 추적한다.
+    Stats와 동일하게 스레드별 shard에 락 없이 기록하고 snapshot 시 병합한다.
+    tracker를 지정하면 리졸버별 전파 상태(old/mixed/new)도 함께 추적한다.
     """
 
-    def __init__(self):
-        self._lock = threading.Lock()
-        self._total_queries: int = 0
-        self._errors: int = 0
+    def __init__(self, tracker: PropagationTracker | None = None):
+        self._shards: _ShardRegistry[_PropagationShard] = _ShardRegistry(_PropagationShard)
         self._start_time: float = time.monotonic()
-        self._latencies: deque[float] = deque(maxlen=200)
-        self._recent_timestamps: deque[float] = deque(maxlen=100)
-        # 전체 IP 분포
-        self._overall: dict[str, int] = {}
-        # 리졸버별 IP 분포
-        self._per_resolver: dict[str, dict[str, int]] = {}
+        self._tracker = tracker
+
+    def record_answer(
+        self,
+        resolver_label: str,
+        values: list[str],
+        latency: float | None = None,
+        ttl: int | None = None,
+    ) -> None:
+        """리졸버 응답 1건(값 목록)을 기록하고 전파 상태를 갱신한다."""
+        for value in values:
+            self.record_response(resolver_label, value, latency)
+        shard = self._shards.local()
+        shard.probes += 1
+        if ttl is not None:
+            shard.ttl[resolver_label] = (time.monotonic(), ttl)
+        shard.touch(resolver_label)
+        if self._tracker is not None:
+            self._tracker.observe(resolver_label, values, time.monotonic() - self._start_time)
 
     def record_response(
         self, resolver_label: str, response_ip: str, latency: float | None = None
     ) -> None:
         """DNS 응답을 기록한다."""
         now = time.monotonic()
-        with self._lock:
-            self._total_queries += 1
-            self._recent_timestamps.append(now)
-            if latency is not None:
-                self._latencies.append(latency)
-            # overall
-            self._overall[response_ip] = self._overall.get(response_ip, 0) + 1
-            # per-resolver
-            if resolver_label not in self._per_resolver:
-                self._per_resolver[resolver_label] = {}
-            bucket = self._per_resolver[resolver_label]
-            bucket[response_ip] = bucket.get(response_ip, 0) + 1
-
-    def record_error(self) -> None:
-        """에러를 기록한다."""
-        with self._lock:
-            self._errors += 1
-            self._total_queries += 1
+        shard = self._shards.local()
+        shard.total_queries += 1
+        shard.timestamps.append(now)
+        if latency is not None:
+            shard.latency.record(latency, now)
+        # overall
+        shard.overall[response_ip] = shard.overall.get(response_ip, 0) + 1
+        # per-resolver
+        bucket = shard.per_resolver.get(resolver_label)
+        if bucket is None:
+            bucket = shard.per_resolver[resolver_label] = {}
+        bucket[response_ip] = bucket.get(response_ip, 0) + 1
+        shard.touch(resolver_label)
+
+    def record_error(self, resolver_label: str | None = None) -> None:
+        """에러를 기록한다. resolver_label을 지정하면 전파 상태에도 반영한다."""
+        shard = self._shards.local()
+        shard.errors += 1
+        shard.total_queries += 1
+        shard.probes += 1
+        shard.touch()
+        if self._tracker is not None and resolver_label is not None:
+            self._tracker.observe_error(resolver_label)
+
+    def get_latency_histogram(self) -> LatencyHistogram:
+        """전체 구간 누적 응답 latency 히스토그램을 반환한다."""
+        merged = LatencyHistogram()
+        for shard in self._shards.all():
+            merged.merge(shard.latency.total)
+        return merged
+
+    def record_skipped(self, count: float) -> None:
+        """TTL 기반 스케줄로 생략한 질의 수를 기록한다."""
+        self._shards.local().skipped += count
 
     def get_snapshot(self) -> PropagationSnapshot:
         """현재 상태의 스냅샷을 반환한다."""
         now = time.monotonic()
-        with self._lock:
-            elapsed = now - self._start_time
-            avg_latency = None
-            if self._latencies:
-                avg_latency = sum(self._latencies) / len(self._latencies) * 1000
-
-            current_tps = 0.0
-            if len(self._recent_timestamps) >= 2:
-                window = now - self._recent_timestamps[0]
-                if window > 0:
-                    current_tps = len(self._recent_timestamps) / window
-
-            return PropagationSnapshot(
-                total_queries=self._total_queries,
-                overall_distribution=dict(self._overall),
-                resolver_distribution={k: dict(v) for k, v in self._per_resolver.items()},
-                errors=self._errors,
-                elapsed_seconds=elapsed,
-                avg_latency_ms=avg_latency,
-                current_tps=current_tps,
+        shards = self._shards.all()
+
+        total_queries = 0
+        errors = 0
+        overall: dict[str, int] = {}
+        per_resolver: dict[str, dict[str, int]] = {}
+        newest_ttl: dict[str, tuple[float, int]] = {}
+        probes = 0
+        skipped = 0.0
+        version = 0
+        for shard in shards:
+            version += shard.version
+            probes += shard.probes
+            total_queries += shard.total_queries
+            errors += shard.errors
+            for label, observed in dict(shard.ttl).items():
+                if label not in newest_ttl or observed > newest_ttl[label]:
+                    newest_ttl[label] = observed
+            skipped += shard.skipped
+            for ip, count in dict(shard.overall).items():
+                overall[ip] = overall.get(ip, 0) + count
+            _merge_nested(per_resolver, shard.per_resolver)
+
+        return PropagationSnapshot(
+            total_queries=total_queries,
+            overall_distribution=overall,
+            resolver_distribution=per_resolver,
+            errors=errors,
+            elapsed_seconds=now - self._start_time,
+            avg_latency_ms=_merge_avg_latency_ms([s.latency for s in shards]),
+            current_tps=_merge_tps(now, [s.timestamps for s in shards]),
+            resolver_progress=self._tracker.snapshot() if self._tracker is not None else {},
+            resolver_ttl={label: ttl for label, (_, ttl) in newest_ttl.items()},
+            probes_sent=probes,
+            queries_saved=int(skipped),
+            version=version,
+        )
+
+    def view(self) -> PropagationView:
+        """증분 snapshot을 만드는 view를 반환한다 (대시보드처럼 주기적으로 읽는 쪽용)."""
+        return PropagationView(self)
+
+
+class PropagationView:
+    """PropagationStats의 증분 snapshot.
+
+    refresh()는 직전 호출 이후 기록이 있는 리졸버의 분포/TTL만 shard에서 다시 병합하고,
+    나머지 리졸버는 이전 병합 결과를 그대로 재사용한다. 전파 진행 상태도 바뀐 리졸버만
+    tracker에서 복사한다. 리졸버가 수백 개여도 TTL 기반 스케줄에서는 갱신 주기마다 일부만
+    응답하므로 병합/복사 비용이 그만큼 줄어든다.
+
+    반환하는 snapshot의 dict는 다음 refresh()에서 재사용되므로 읽기 전용으로 다룬다.
+    """
+
+    def __init__(self, stats: PropagationStats):
+        self._stats = stats
+        # shard 순번 → 마지막으로 반영한 shard 버전 (shard 목록은 추가만 됨)
+        self._seen: list[int] = []
+        self._per_resolver: dict[str, dict[str, int]] = {}
+        self._ttl: dict[str, int] = {}
+        self._progress: dict[str, ResolverProgress] = {}
+        self._progress_version: int | None = None
+        self._last: PropagationSnapshot | None = None
+
+    def refresh(self, now: float | None = None) -> PropagationSnapshot:
+        """바뀐 리졸버만 다시 병합한 snapshot을 반환한다."""
+        stats = self._stats
+        if now is None:
+            now = time.monotonic()
+        shards = stats._shards.all()
+        self._seen.extend([-1] * (len(shards) - len(self._seen)))
+
+        changed: set[str] = set()
+        dirty = False
+        for i, shard in enumerate(shards):
+            seen = self._seen[i]
+            version = shard.version
+            if version == seen:
+                continue
+            dirty = True
+            changed.update(label for label, v in list(shard.resolver_versions.items()) if v > seen)
+            self._seen[i] = version
+
+        for label in changed:
+            merged: dict[str, int] = {}
+            newest: tuple[float, int] | None = None
+            for shard in shards:
+                for ip, count in dict(shard.per_resolver.get(label) or {}).items():
+                    merged[ip] = merged.get(ip, 0) + count
+                observed = shard.ttl.get(label)
+                if observed is not None and (newest is None or observed > newest):
+                    newest = observed
+            if merged:
+                self._per_resolver[label] = merged
+            if newest is not None:
+                self._ttl[label] = newest[1]
+
+        tracker = stats._tracker
+        if tracker is not None:
+            if self._progress_version is None:
+                # 버전을 먼저 읽어, 사이에 갱신된 리졸버는 다음 refresh에서 다시 복사되게 한다
+                self._progress_version = tracker.version
+                self._progress = tracker.snapshot()
+                changed.update(self._progress)
+            else:
+                self._progress_version, progress = tracker.changes_since(self._progress_version)
+                self._progress.update(progress)
+                changed.update(progress)
+
+        last = self._last
+        if last is not None and not dirty:
+            # 기록이 없으면 카운터는 그대로 두고 시간 기반 값만 갱신
+            snapshot = replace(
+                last,
+                elapsed_seconds=now - stats._start_time,
+                current_tps=_merge_tps(now, [s.timestamps for s in shards]),
+                resolver_progress=self._progress,
+                changed_resolvers=frozenset(changed),
             )
+        else:
+            snapshot = self._full_counters(shards, now, changed)
+        self._last = snapshot
+        return snapshot
+
+    def _full_counters(
+        self, shards: list[_PropagationShard], now: float, changed: set[str]
+    ) -> PropagationSnapshot:
+        """리졸버별 분포를 제외한 합계 카운터를 병합한다 (shard 수 × 응답 값 수)."""
+        total_queries = errors = probes = version = 0
+        skipped = 0.0
+        overall: dict[str, int] = {}
+        for shard in shards:
+            version += shard.version
+            total_queries += shard.total_queries
+            errors += shard.errors
+            probes += shard.probes
+            skipped += shard.skipped
+            for ip, count in dict(shard.overall).items():
+                overall[ip] = overall.get(ip, 0) + count
+        return PropagationSnapshot(
+            total_queries=total_queries,
+            overall_distribution=overall,
+            resolver_distribution=self._per_resolver,
+            errors=errors,
+            elapsed_seconds=now - self._stats._start_time,
+            avg_latency_ms=_merge_avg_latency_ms([s.latency for s in shards]),
+            current_tps=_merge_tps(now, [s.timestamps for s in shards]),
+            resolver_progress=self._progress,
+            resolver_ttl=self._ttl,
+            probes_sent=probes,
+            queries_saved=int(skipped),
+            version=version,
+            changed_resolvers=frozenset(changed),
+        )
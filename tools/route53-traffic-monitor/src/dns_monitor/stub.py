@@ -0,0 +1,228 @@
+"""로컬 UDP stub 권한 DNS 서버 모듈.
+
+AWS 없이 sender / propagation prober의 처리량과 분포 계산을 검증하기 위한 테스트용
+서버. 가중치 레코드 목록을 받아 Route53 가중치 라우팅처럼 질의마다 레코드 하나를
+가중치 비율로 골라 응답한다.
+
+- 선택 순서는 seed로 고정되므로 같은 seed / 같은 질의 수면 응답 분포가 같다
+- latency(+ jitter)만큼 늦게 응답하고, loss 확률로 응답을 버린다 (패킷 손실)
+- 응답 answer 섹션은 레코드별로 미리 인코딩해 두고 질의의 ID / question만 복사하므로,
+  같은 프로세스에서 돌려도 stub 자체의 CPU 사용이 측정값에 주는 영향이 작다
+  (처리 시간은 busy_seconds로 따로 집계)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import bisect
+import ipaddress
+import random
+import struct
+import time
+from dataclasses import dataclass, field
+
+from .aws import WeightedRecord
+
+_HEADER = struct.Struct("!HHHHHH")
+_RR_FIXED = struct.Struct("!HHIH")
+# 응답 플래그: QR | AA, 질의의 RD 비트는 그대로 복사
+_FLAG_QR_AA = 0x8400
+_FLAG_RD = 0x0100
+_RCODE_NXDOMAIN = 3
+_TYPE_A = 1
+_TYPE_CNAME = 5
+_CLASS_IN = 1
+# question 섹션의 질의 이름을 가리키는 압축 포인터 (헤더 12바이트 직후)
+_QNAME_POINTER = b"\xc0\x0c"
+
+
+@dataclass
+class StubStats:
+    """stub 서버 처리 통계."""
+
+    queries: int = 0
+    # SetIdentifier → 응답 수 (손실로 버린 응답 제외)
+    served: dict[str, int] = field(default_factory=dict)
+    dropped: int = 0
+    nxdomain: int = 0
+    malformed: int = 0
+    # datagram 처리에 쓴 시간(초). 벤치마크에서 프로세스 CPU 시간에서 제외한다
+    busy_seconds: float = 0.0
+
+
+def _encode_name(name: str) -> bytes:
+    """도메인 이름을 DNS wire 형식(압축 없음, 소문자)으로 인코딩한다."""
+    labels = [label for label in name.rstrip(".").lower().split(".") if label]
+    wire = bytearray()
+    for label in labels:
+        raw = label.encode("idna")
+        if not 0 < len(raw) < 64:
+            raise ValueError(f"잘못된 레이블: {label!r}")
+        wire += bytes([len(raw)]) + raw
+    return bytes(wire) + b"\x00"
+
+
+def _encode_answers(record: WeightedRecord, ttl: int) -> tuple[int, bytes]:
+    """레코드의 answer 섹션(RR 수, wire)을 인코딩한다. 소유자 이름은 질의 이름 포인터."""
+    if record.record_type == "A":
+        rdatas = [(_TYPE_A, ipaddress.IPv4Address(v).packed) for v in record.values]
+    elif record.record_type == "CNAME":
+        rdatas = [(_TYPE_CNAME, _encode_name(v)) for v in record.values[:1]]
+    else:
+        raise ValueError(f"stub 서버는 A / CNAME 레코드만 지원합니다: {record.record_type}")
+    if not rdatas:
+        raise ValueError(f"레코드 값이 비어 있습니다: {record.set_identifier}")
+    wire = b"".join(
+        _QNAME_POINTER + _RR_FIXED.pack(rtype, _CLASS_IN, ttl, len(rdata)) + rdata
+        for rtype, rdata in rdatas
+    )
+    return len(rdatas), wire
+
+
+class StubAuthoritativeServer(asyncio.DatagramProtocol):
+    """가중치 비율로 응답하는 UDP stub 권한 DNS 서버.
+
+    Args:
+        record_name: 응답할 레코드 이름 (다른 이름은 NXDOMAIN)
+        records: 가중치 레코드 (A / CNAME)
+        ttl: 응답 TTL(초)
+        latency: 응답 지연(초)
+        jitter: 응답 지연에 더할 균등 분포 [0, jitter) 추가 지연(초)
+        loss: 응답을 버릴 확률 (0~1)
+        seed: 레코드 선택 / 손실 난수 seed
+    """
+
+    def __init__(
+        self,
+        record_name: str,
+        records: list[WeightedRecord],
+        ttl: int = 60,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        loss: float = 0.0,
+        seed: int = 0,
+    ):
+        if not 0 <= loss < 1:
+            raise ValueError("loss는 0 이상 1 미만이어야 합니다.")
+        if latency < 0 or jitter < 0:
+            raise ValueError("latency / jitter는 0 이상이어야 합니다.")
+        self._qname = _encode_name(record_name)
+        self._ttl = ttl
+        self._latency = latency
+        self._jitter = jitter
+        self._loss = loss
+        # 레코드 선택과 손실/지연 난수를 분리하여, loss 설정과 무관하게 선택 순서를 고정
+        self._choice_rng = random.Random(seed)
+        self._fault_rng = random.Random(seed + 1)
+        self.stats = StubStats()
+        self._transport: asyncio.DatagramTransport | None = None
+        self.set_records(records)
+
+    def set_records(self, records: list[WeightedRecord]) -> None:
+        """응답할 가중치 레코드를 교체한다 (가중치 변경 시나리오)."""
+        if not records:
+            raise ValueError("레코드가 없습니다.")
+        answers = [_encode_answers(r, self._ttl) for r in records]
+        weights = [max(r.weight, 0) for r in records]
+        # Route53과 동일하게 모든 가중치가 0이면 균등하게 응답
+        if sum(weights) == 0:
+            weights = [1] * len(records)
+        cumulative: list[int] = []
+        total = 0
+        for w in weights:
+            total += w
+            cumulative.append(total)
+        self._answers = [(r.set_identifier, *a) for r, a in zip(records, answers, strict=True)]
+        self._cumulative = cumulative
+        self._total_weight = total
+
+    def reset_stats(self) -> None:
+        """처리 통계를 초기화한다 (워밍업 질의 제외용)."""
+        self.stats = StubStats()
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> int:
+        """host:port에 바인딩하고 실제 포트를 반환한다 (port=0이면 임의 포트)."""
+        loop = asyncio.get_running_loop()
+        transport, _ = await loop.create_datagram_endpoint(lambda: self, local_addr=(host, port))
+        return transport.get_extra_info("sockname")[1]
+
+    def close(self) -> None:
+        """소켓을 닫는다."""
+        if self._transport is not None:
+            self._transport.close()
+            self._transport = None
+
+    async def __aenter__(self) -> StubAuthoritativeServer:
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self.close()
+
+    def connection_made(self, transport) -> None:
+        self._transport = transport
+
+    def datagram_received(self, data: bytes, addr) -> None:
+        t0 = time.perf_counter()
+        try:
+            self._handle(data, addr)
+        finally:
+            self.stats.busy_seconds += time.perf_counter() - t0
+
+    def _handle(self, data: bytes, addr) -> None:
+        stats = self.stats
+        stats.queries += 1
+        question = self._question(data)
+        if question is None:
+            stats.malformed += 1
+            return
+        qid, flags = struct.unpack_from("!HH", data)
+        flags = _FLAG_QR_AA | (flags & _FLAG_RD)
+
+        qname = question[:-4]
+        if qname.lower() != self._qname:
+            stats.nxdomain += 1
+            header = _HEADER.pack(qid, flags | _RCODE_NXDOMAIN, 1, 0, 0, 0)
+            self._send(header + question, addr)
+            return
+
+        index = bisect.bisect_right(
+            self._cumulative, self._choice_rng.random() * self._total_weight
+        )
+        set_identifier, count, answers = self._answers[index]
+        if self._loss and self._fault_rng.random() < self._loss:
+            stats.dropped += 1
+            return
+        stats.served[set_identifier] = stats.served.get(set_identifier, 0) + 1
+        self._send(_HEADER.pack(qid, flags, 1, count, 0, 0) + question + answers, addr)
+
+    @staticmethod
+    def _question(data: bytes) -> bytes | None:
+        """질의의 question 섹션(이름 + type + class)을 반환한다. 형식 오류이면 None."""
+        if len(data) < _HEADER.size or data[2] & 0x80:
+            return None
+        if struct.unpack_from("!H", data, 4)[0] != 1:
+            return None
+        pos = _HEADER.size
+        while pos < len(data):
+            length = data[pos]
+            if length == 0:
+                end = pos + 5
+                return data[_HEADER.size : end] if end <= len(data) else None
+            if length & 0xC0:
+                return None
+            pos += length + 1
+        return None
+
+    def _send(self, wire: bytes, addr) -> None:
+        delay = self._latency
+        if self._jitter:
+            delay += self._fault_rng.random() * self._jitter
+        if delay > 0:
+            asyncio.get_running_loop().call_later(delay, self._sendto, wire, addr)
+        else:
+            self._sendto(wire, addr)
+
+    def _sendto(self, wire: bytes, addr) -> None:
+        # 지연 응답 예약 후 서버가 닫혔으면 버린다
+        if self._transport is not None:
+            self._transport.sendto(wire, addr)
@@ -0,0 +1,334 @@
+"""가중치 변경 수렴 타임라인 모듈.
+
+초 단위 SetIdentifier 분포와 Route53 변경 이벤트를 결합하여 타임라인을 구성한다.
+
+- 초별 SetIdentifier 비율과 그 시점에 유효한 설정 비율
+- 가중치 변경 시점
+- 변경 이후 누적 관측 비율의 신뢰구간이 새 설정 비율 ± tolerance 안에 들어오기까지 걸린 시간
+  (다음 변경 전까지의 표본만 사용)
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+
+from .convergence import (
+    DEFAULT_CONFIDENCE,
+    DEFAULT_MIN_SAMPLES,
+    DEFAULT_TOLERANCE,
+    simultaneous_z,
+    spent_alpha,
+    wilson_interval,
+)
+from .stats import RecordChangeEvent
+
+TIMELINE_FORMATS = (".csv", ".jsonl")
+
+
+def _shares(weights: dict[str, int]) -> dict[str, float]:
+    """가중치 → 설정 비율 (모든 가중치가 0이면 균등 분배)."""
+    total = sum(weights.values())
+    if total == 0:
+        return {sid: 1 / len(weights) for sid in weights} if weights else {}
+    return {sid: w / total for sid, w in weights.items()}
+
+
+@dataclass
+class TimelineRow:
+    """타임라인의 1초 구간."""
+
+    second: int
+    wall_time: float
+    counts: dict[str, int]
+    expected: dict[str, float]
+    event: RecordChangeEvent | None = None
+
+    @property
+    def total(self) -> int:
+        return sum(self.counts.values())
+
+    def share(self, sid: str) -> float | None:
+        total = self.total
+        return self.counts.get(sid, 0) / total if total > 0 else None
+
+
+@dataclass
+class ChangeConvergence:
+    """가중치 변경 1건의 수렴 결과."""
+
+    event: RecordChangeEvent
+    # 이벤트 감지 / 직전 조회 시점의 경과 초
+    detected_second: int
+    earliest_second: int
+    # 이 초부터 누적한 표본의 신뢰구간이 새 설정 비율 ± tolerance 안에 들어온 경우 그 시작 초
+    converged_second: int | None = None
+    # 수렴이 확인된(누적 표본이 판정을 통과한) 경과 초
+    confirmed_second: int | None = None
+
+    @property
+    def seconds_since_detected(self) -> int | None:
+        """감지 시점 기준 수렴 시간. 음수면 감지 전에 이미 수렴한 것."""
+        if self.converged_second is None:
+            return None
+        return self.converged_second - self.detected_second
+
+    @property
+    def seconds_upper_bound(self) -> int | None:
+        """실제 변경 가능 시점(직전 조회) 기준 수렴 시간 (상한)."""
+        if self.converged_second is None:
+            return None
+        return self.converged_second - self.earliest_second
+
+
+@dataclass
+class Timeline:
+    """초 단위 타임라인과 변경별 수렴 결과."""
+
+    identifiers: list[str]
+    rows: list[TimelineRow] = field(default_factory=list)
+    changes: list[ChangeConvergence] = field(default_factory=list)
+
+
+def build_timeline(
+    buckets: dict[int, dict[str, int]],
+    events: list[RecordChangeEvent],
+    initial_weights: dict[str, int],
+    start_time: float,
+    start_wall_time: float,
+    tolerance: float = DEFAULT_TOLERANCE,
+    confidence: float = DEFAULT_CONFIDENCE,
+    min_samples: int = DEFAULT_MIN_SAMPLES,
+) -> Timeline:
+    """초별 분포와 변경 이벤트로 타임라인을 구성한다.
+
+    Args:
+        buckets: Stats.get_time_buckets() 결과 (경과 초 → SetIdentifier 분포)
+        events: Stats 스냅샷의 변경 이벤트 (시간순)
+        initial_weights: 첫 이벤트 이전에 유효한 가중치
+        start_time: Stats 시작 시각 (time.monotonic)
+        start_wall_time: Stats 시작 시각 (time.time)
+    """
+    identifiers: list[str] = list(initial_weights)
+    for ev in events:
+        identifiers.extend(sid for sid in ev.weights if sid not in identifiers)
+    for bucket in buckets.values():
+        identifiers.extend(sid for sid in bucket if sid not in identifiers)
+
+    timeline = Timeline(identifiers=identifiers)
+    event_seconds = [int(ev.detected_at - start_time) for ev in events]
+    last_second = max([*buckets, *event_seconds], default=-1)
+
+    expected = _shares(initial_weights)
+    event_idx = 0
+    for second in range(last_second + 1):
+        event = None
+        while event_idx < len(events) and event_seconds[event_idx] <= second:
+            event = events[event_idx]
+            expected = _shares(event.weights)
+            event_idx += 1
+        timeline.rows.append(
+            TimelineRow(
+                second=second,
+                wall_time=start_wall_time + second,
+                counts=dict(buckets.get(second, {})),
+                expected=expected,
+                event=event,
+            )
+        )
+
+    for idx, ev in enumerate(events):
+        # 다음 변경은 그 직전 조회 이후 언제든 발생했을 수 있으므로 그 전 초까지만 판정한다
+        end_second = last_second
+        if idx + 1 < len(events):
+            end_second = int(events[idx + 1].last_unchanged_at - start_time) - 1
+        timeline.changes.append(
+            measure_change(
+                buckets,
+                ev,
+                start_time,
+                end_second,
+                tolerance=tolerance,
+                confidence=confidence,
+                min_samples=min_samples,
+            )
+        )
+    return timeline
+
+
+def measure_change(
+    buckets: dict[int, dict[str, int]],
+    event: RecordChangeEvent,
+    start_time: float,
+    end_second: int,
+    tolerance: float = DEFAULT_TOLERANCE,
+    confidence: float = DEFAULT_CONFIDENCE,
+    min_samples: int = DEFAULT_MIN_SAMPLES,
+) -> ChangeConvergence:
+    """변경 이벤트 1건의 수렴 시점을 계산한다 (end_second까지의 표본만 사용).
+
+    실제 변경은 직전 조회(last_unchanged_at) 이후에 발생했으므로 그 시점부터 초별 표본을
+    누적하고, 매초 누적 표본의 SetIdentifier별 Wilson 신뢰구간(Bonferroni 보정)이 모두 새
+    설정 비율 ± tolerance 안에 들어오는지 판정한다. 반복 판정이므로 판정마다 유의수준을
+    나눠 쓴다(alpha spending). 신뢰구간이 허용 범위를 완전히 벗어나면 아직 수렴하지 않은
+    것이므로 다음 초부터 다시 누적하며, 판정을 통과한 누적 구간의 시작 초를 수렴 시점으로
+    본다. 감지 전 표본은 이전 설정 비율과 통계적으로 구분될 때만 인정한다.
+    """
+    detected = int(event.detected_at - start_time)
+    earliest = max(0, int(event.last_unchanged_at - start_time))
+    change = ChangeConvergence(event=event, detected_second=detected, earliest_second=earliest)
+    target = _shares(event.weights)
+    previous = _shares(event.previous_weights)
+
+    start = earliest
+    counts: dict[str, int] = {}
+    total = 0
+    # 누적 구간 중 감지 전 표본
+    before: dict[str, int] = {}
+    before_total = 0
+    look = 0
+    for second in range(earliest, end_second + 1):
+        if second < start:
+            continue
+        for sid, count in buckets.get(second, {}).items():
+            counts[sid] = counts.get(sid, 0) + count
+            total += count
+            if second < detected:
+                before[sid] = before.get(sid, 0) + count
+                before_total += count
+        if total < min_samples:
+            continue
+
+        look += 1
+        # 새 가중치에 없는 SetIdentifier 응답 비율도 함께 검정한다
+        z = simultaneous_z(1 - spent_alpha(confidence, look), len(target) + 1)
+        if _outside(counts, total, target, tolerance, z):
+            # 아직 새 비율에 도달하지 않았으므로 다음 초부터 다시 누적한다
+            start = second + 1
+            counts, total, before, before_total = {}, 0, {}, 0
+            continue
+        if not _within(counts, total, target, tolerance, z):
+            continue
+        if before_total and not _differs(before, before_total, previous, z):
+            # 감지 전 표본이 이전 비율과 구분되지 않으면 감지 시점부터의 표본만 남긴다
+            start = max(start, detected)
+            counts = {sid: c - before.get(sid, 0) for sid, c in counts.items()}
+            total -= before_total
+            before, before_total = {}, 0
+            continue
+        change.converged_second = start
+        change.confirmed_second = second
+        break
+    return change
+
+
+def _within(
+    counts: dict[str, int], total: int, target: dict[str, float], tolerance: float, z: float
+) -> bool:
+    """모든 신뢰구간이 설정 비율 ± tolerance 안에 있는지 (새 가중치에 없는 응답은 tolerance 이하)."""
+    for sid, share in target.items():
+        low, high = wilson_interval(counts.get(sid, 0), total, z)
+        if low < share - tolerance or high > share + tolerance:
+            return False
+    stray = sum(c for sid, c in counts.items() if sid not in target)
+    return wilson_interval(stray, total, z)[1] <= tolerance
+
+
+def _outside(
+    counts: dict[str, int], total: int, target: dict[str, float], tolerance: float, z: float
+) -> bool:
+    """신뢰구간 전체가 설정 비율 ± tolerance 밖에 있는 SetIdentifier가 있는지."""
+    for sid, share in target.items():
+        low, high = wilson_interval(counts.get(sid, 0), total, z)
+        if high < share - tolerance or low > share + tolerance:
+            return True
+    stray = sum(c for sid, c in counts.items() if sid not in target)
+    return wilson_interval(stray, total, z)[0] > tolerance
+
+
+def _differs(counts: dict[str, int], total: int, previous: dict[str, float], z: float) -> bool:
+    """신뢰구간이 이전 설정 비율을 벗어나는 SetIdentifier가 있는지."""
+    if not previous:
+        return False
+    for sid in previous.keys() | counts.keys():
+        low, high = wilson_interval(counts.get(sid, 0), total, z)
+        if not low <= previous.get(sid, 0.0) <= high:
+            return True
+    return False
+
+
+def write_timeline(timeline: Timeline, path: Path) -> None:
+    """타임라인을 파일 확장자에 따라 CSV 또는 JSONL로 저장한다."""
+    suffix = path.suffix.lower()
+    if suffix == ".csv":
+        _write_csv(timeline, path)
+    elif suffix == ".jsonl":
+        _write_jsonl(timeline, path)
+    else:
+        raise ValueError(f"지원하지 않는 타임라인 형식입니다: {suffix} (.csv 또는 .jsonl)")
+
+
+def _iso(wall_time: float) -> str:
+    return datetime.fromtimestamp(wall_time, tz=UTC).isoformat(timespec="seconds")
+
+
+def _write_csv(timeline: Timeline, path: Path) -> None:
+    header = ["second", "time", "total"]
+    for sid in timeline.identifiers:
+        header += [f"{sid}_count", f"{sid}_share", f"{sid}_expected"]
+    header.append("event")
+
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        for row in timeline.rows:
+            line: list[object] = [row.second, _iso(row.wall_time), row.total]
+            for sid in timeline.identifiers:
+                share = row.share(sid)
+                line += [
+                    row.counts.get(sid, 0),
+                    f"{share:.4f}" if share is not None else "",
+                    f"{row.expected.get(sid, 0.0):.4f}",
+                ]
+            line.append("; ".join(row.event.changes) if row.event else "")
+            writer.writerow(line)
+
+
+def _write_jsonl(timeline: Timeline, path: Path) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        for row in timeline.rows:
+            record: dict[str, object] = {
+                "type": "second",
+                "second": row.second,
+                "time": _iso(row.wall_time),
+                "total": row.total,
+                "counts": row.counts,
+                "shares": {sid: row.share(sid) for sid in timeline.identifiers},
+                "expected": row.expected,
+            }
+            if row.event:
+                record["event"] = row.event.changes
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        for change in timeline.changes:
+            f.write(
+                json.dumps(
+                    {
+                        "type": "change",
+                        "time": _iso(change.event.wall_time),
+                        "detected_second": change.detected_second,
+                        "earliest_second": change.earliest_second,
+                        "converged_second": change.converged_second,
+                        "confirmed_second": change.confirmed_second,
+                        "seconds_since_detected": change.seconds_since_detected,
+                        "seconds_upper_bound": change.seconds_upper_bound,
+                        "previous_weights": change.event.previous_weights,
+                        "weights": change.event.weights,
+                        "changes": change.event.changes,
+                    },
+                    ensure_ascii=False,
+                )
+                + "\n"
+            )
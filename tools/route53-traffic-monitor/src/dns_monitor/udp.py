@@ -0,0 +1,125 @@
+"""asyncio 기반 DNS over UDP 클라이언트 모듈.
+
+주소 체계(IPv4/IPv6)별 UDP 소켓 하나로 여러 대상에 동시에 질의하고, 응답은
+(송신자 IP, DNS 메시지 ID)로 대기 중인 질의와 매칭한다. 스레드 풀을 사용하지 않으므로
+수백 개의 리졸버에 동시에 질의해도 스레드 수가 늘어나지 않는다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import ipaddress
+import random
+import socket
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import dns.message
+
+DEFAULT_TIMEOUT = 5.0
+
+
+class _DnsProtocol(asyncio.DatagramProtocol):
+    """수신한 응답을 대기 중인 Future에 전달한다."""
+
+    def __init__(self, pending: dict[tuple[str, int], asyncio.Future]):
+        self._pending = pending
+
+    def datagram_received(self, data: bytes, addr) -> None:
+        if len(data) < 2:
+            return
+        key = (addr[0], int.from_bytes(data[:2], "big"))
+        future = self._pending.get(key)
+        if future is not None and not future.done():
+            future.set_result(data)
+
+    def error_received(self, exc: Exception) -> None:
+        # ICMP port unreachable 등: 대상을 특정할 수 없으므로 해당 질의는 타임아웃 처리
+        pass
+
+
+class AsyncDnsClient:
+    """여러 DNS 서버에 UDP 질의를 다중화하는 비동기 클라이언트.
+
+    async with 블록 또는 close()로 소켓을 정리한다. 동일 이벤트 루프에서만 사용한다.
+    """
+
+    def __init__(self, port: int = 53):
+        self._port = port
+        self._pending: dict[tuple[str, int], asyncio.Future] = {}
+        self._transports: dict[int, asyncio.DatagramTransport] = {}
+        self._lock = asyncio.Lock()
+
+    async def __aenter__(self) -> AsyncDnsClient:
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self.close()
+
+    async def query(
+        self, request: dns.message.Message, server_ip: str, timeout: float = DEFAULT_TIMEOUT
+    ) -> dns.message.Message:
+        """server_ip에 request를 전송하고 응답 메시지를 반환한다.
+
+        Raises:
+            dns.exception.Timeout: timeout 내에 응답이 없는 경우
+            dns.exception.DNSException: 응답을 해석할 수 없는 경우
+            OSError: 전송 실패
+        """
+        import dns.exception
+        import dns.message
+
+        server_ip = str(ipaddress.ip_address(server_ip))
+        transport = await self._transport(server_ip)
+        loop = asyncio.get_running_loop()
+
+        key = self._allocate(server_ip, request)
+        future: asyncio.Future[bytes] = loop.create_future()
+        self._pending[key] = future
+        try:
+            transport.sendto(request.to_wire(), (server_ip, self._port))
+            try:
+                wire = await asyncio.wait_for(future, timeout)
+            except TimeoutError as e:
+                raise dns.exception.Timeout(timeout=timeout) from e
+        finally:
+            self._pending.pop(key, None)
+
+        response = dns.message.from_wire(wire)
+        if not request.is_response(response):
+            raise dns.exception.FormError("응답이 질의와 일치하지 않습니다.")
+        return response
+
+    def close(self) -> None:
+        """소켓을 닫고 대기 중인 질의를 취소한다."""
+        for transport in self._transports.values():
+            transport.close()
+        self._transports.clear()
+        for future in self._pending.values():
+            future.cancel()
+        self._pending.clear()
+
+    def _allocate(self, server_ip: str, request: dns.message.Message) -> tuple[str, int]:
+        """같은 서버에 대기 중인 질의와 겹치지 않는 메시지 ID를 할당한다."""
+        key = (server_ip, request.id)
+        while key in self._pending:
+            request.id = random.getrandbits(16)
+            key = (server_ip, request.id)
+        return key
+
+    async def _transport(self, server_ip: str) -> asyncio.DatagramTransport:
+        """대상 주소 체계의 UDP 소켓을 반환한다 (처음 사용할 때 생성)."""
+        family = socket.AF_INET6 if ":" in server_ip else socket.AF_INET
+        transport = self._transports.get(family)
+        if transport is not None:
+            return transport
+        async with self._lock:
+            transport = self._transports.get(family)
+            if transport is None:
+                loop = asyncio.get_running_loop()
+                local = ("::", 0) if family == socket.AF_INET6 else ("0.0.0.0", 0)
+                transport, _ = await loop.create_datagram_endpoint(
+                    lambda: _DnsProtocol(self._pending), local_addr=local, family=family
+                )
+                self._transports[family] = transport
+            return transport
@@ -0,0 +1,68 @@
+"""dns_monitor.bench 단위 테스트."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from dns_monitor.aws import WeightedRecord
+from dns_monitor.bench import BenchResult, bench_propagation, bench_watch
+
+# ---------------------------------------------------------------------------
+# stub 서버 대상 실행
+# ---------------------------------------------------------------------------
+
+
+def test_bench_watch_measures_distribution_and_throughput():
+    """sender가 stub 응답을 빠짐없이 올바른 SetIdentifier로 분류한다."""
+    result = asyncio.run(bench_watch(tps=100, senders=2, duration=0.5))
+
+    assert result.probes > 0
+    assert result.misclassified == 0
+    assert result.passed
+    assert sum(result.measured.values()) <= sum(result.served.values())
+    assert 0 < result.achieved_tps <= result.target_tps * 1.1
+    assert result.cpu_per_probe_us > 0
+    assert result.to_dict()["passed"] is True
+
+
+def test_bench_propagation_measures_distribution():
+    """propagation prober 응답 값을 SetIdentifier별로 집계한다."""
+    result = asyncio.run(bench_propagation(tps=50, resolvers=2, duration=0.5))
+
+    assert result.mode == "propagation"
+    assert result.target_tps == 100
+    assert result.probes > 0
+    assert result.passed
+
+
+def test_bench_propagation_requires_distinct_values():
+    """레코드 값이 겹치면 SetIdentifier로 대응시킬 수 없으므로 ValueError."""
+    records = [
+        WeightedRecord("a", 1, "A", ["10.0.0.1"]),
+        WeightedRecord("b", 1, "A", ["10.0.0.1"]),
+    ]
+    with pytest.raises(ValueError, match="서로 다른 값"):
+        asyncio.run(bench_propagation(records, duration=0.1))
+
+
+def test_bench_result_fails_on_misclassification_or_bad_fit():
+    """stub 응답 수보다 많이 집계되거나 χ² 검정에서 벗어나면 실패."""
+    base = dict(
+        mode="watch",
+        target_tps=10,
+        duration=1.0,
+        probes=10,
+        errors=0,
+        achieved_tps=10.0,
+        cpu_per_probe_us=1.0,
+        stub_queries=10,
+        stub_dropped=0,
+    )
+    ok = BenchResult(**base, measured={"a": 5}, served={"a": 5}, p_value=0.5)
+    wrong = BenchResult(**base, measured={"a": 6}, served={"a": 5}, p_value=0.5)
+    skewed = BenchResult(**base, measured={"a": 5}, served={"a": 5}, p_value=0.001)
+    assert ok.passed
+    assert wrong.misclassified == 1 and not wrong.passed
+    assert not skewed.distribution_ok and not skewed.passed
@@ -0,0 +1,69 @@
+"""dns_monitor.classifier 단위 테스트."""
+
+from __future__ import annotations
+
+from dns_monitor.aws import WeightedRecord
+from dns_monitor.classifier import AnswerClassifier
+from dns_monitor.resolver import AliasResolution
+
+
+def _rec(sid: str, *values: str, record_type: str = "A") -> WeightedRecord:
+    return WeightedRecord(
+        set_identifier=sid, weight=50, record_type=record_type, values=list(values)
+    )
+
+
+def _alias() -> AliasResolution:
+    return AliasResolution(
+        ip_map={"10.1.0.1": "blue", "10.1.0.2": "blue", "10.2.0.1": "green", "10.9.0.1": "green"},
+        ip_set_map={
+            frozenset({"10.1.0.1", "10.1.0.2"}): "blue",
+            frozenset({"10.2.0.1"}): "green",
+        },
+    )
+
+
+def test_classify_single_value_direct_match():
+    """A 레코드 값과 일치하는 단일 응답을 분류해야 한다."""
+    classifier = AnswerClassifier([_rec("blue", "10.0.0.1"), _rec("green", "10.0.0.2")])
+    assert classifier.classify(["10.0.0.1"]) == "blue"
+    assert classifier.classify(["10.0.0.2"]) == "green"
+    assert classifier.classify(["10.0.0.3"]) is None
+    assert classifier.classify([]) is None
+
+
+def test_classify_precedence_value_map_over_alias():
+    """A/CNAME 값 매칭이 ALIAS IP 매칭보다 우선해야 한다."""
+    classifier = AnswerClassifier([_rec("canary", "10.2.0.1")], _alias())
+    assert classifier.classify(["10.2.0.1"]) == "canary"
+    assert classifier.classify(["10.2.0.1", "10.1.0.1"]) == "canary"
+
+
+def test_classify_multi_value_ip_set_and_fallback():
+    """여러 IP 응답은 IP 집합 매칭 후 첫 IP fallback으로 분류해야 한다."""
+    classifier = AnswerClassifier([], _alias())
+    assert classifier.classify(["10.1.0.2", "10.1.0.1"]) == "blue"
+    # 집합은 일치하지 않지만 첫 IP가 green 대상 IP
+    assert classifier.classify(["10.9.0.1", "10.1.0.1"]) == "green"
+    assert classifier.classify(["10.8.0.1", "10.8.0.2"]) is None
+
+
+def test_classify_caches_multi_value_answers_and_bounds_cache():
+    """여러 값 응답은 캐시하고, 상한에 도달하면 캐시를 비워야 한다."""
+    classifier = AnswerClassifier([], _alias(), cache_size=2)
+    classifier.classify(["10.1.0.1", "10.1.0.2"])
+    classifier.classify(["10.9.0.1", "10.1.0.1"])
+    assert len(classifier._cache) == 2
+
+    assert classifier.classify(["10.8.0.2", "10.8.0.1"]) is None
+    assert list(classifier._cache) == [("10.8.0.1", "10.8.0.2")]
+
+
+def test_classify_caches_rotated_answers_once():
+    """레코드 순서만 다른 응답은 캐시 항목 하나를 공유하고, 첫 IP 규칙은 순서를 따른다."""
+    classifier = AnswerClassifier([], _alias())
+    ips = ["10.1.0.1", "10.8.0.1", "10.2.0.1"]
+    results = [classifier.classify(ips[i:] + ips[:i]) for i in range(len(ips))]
+
+    assert results == ["blue", None, "green"]
+    assert list(classifier._cache) == [("10.1.0.1", "10.2.0.1", "10.8.0.1")]
@@ -0,0 +1,161 @@
+"""dns_monitor.completion 단위 테스트."""
+
+from __future__ import annotations
+
+import pytest
+
+from dns_monitor.completion import (
+    PropagationTracker,
+    ResolverState,
+    completed_at,
+    is_complete,
+    propagated_count,
+    unreachable_count,
+)
+from dns_monitor.stats import PropagationStats
+
+OLD = ["10.0.0.1"]
+NEW = ["10.0.0.2"]
+
+
+def _tracker(confirm: int = 2) -> PropagationTracker:
+    return PropagationTracker(["10.0.0.2"], ["Google", "Cloudflare"], confirm=confirm)
+
+
+def test_state_transitions_old_mixed_new():
+    """이전 값 → 새 값 연속 confirm회 응답 시 OLD → MIXED → NEW로 전이해야 한다."""
+    tracker = _tracker()
+
+    assert tracker.snapshot()["Google"].state is ResolverState.PENDING
+    assert tracker.observe("Google", OLD, 1.0) is ResolverState.OLD
+    assert tracker.observe("Google", NEW, 2.0) is ResolverState.MIXED
+    assert tracker.observe("Google", OLD, 3.0) is ResolverState.MIXED
+    assert tracker.observe("Google", NEW, 4.0) is ResolverState.MIXED
+    assert tracker.observe("Google", NEW, 5.0) is ResolverState.NEW
+
+    progress = tracker.snapshot()["Google"]
+    assert progress.first_new_at == 2.0
+    assert progress.last_old_at == 3.0
+    assert progress.propagated_at == 5.0
+
+
+def test_regression_after_new_resets_propagated_at():
+    """NEW 이후 이전 값이 다시 나오면 MIXED로 돌아가야 한다."""
+    tracker = _tracker(confirm=1)
+    tracker.observe("Google", NEW, 1.0)
+    tracker.observe("Google", NEW, 2.0)
+    assert tracker.snapshot()["Google"].propagated_at == 1.0
+
+    assert tracker.observe("Google", OLD, 3.0) is ResolverState.MIXED
+    assert tracker.snapshot()["Google"].propagated_at is None
+
+
+def test_partial_answer_counts_as_old():
+    """기대 값과 이전 값이 섞인 응답은 이전 값 응답으로 봐야 한다."""
+    tracker = PropagationTracker(["new-alb.example.com."], ["Google"], confirm=1)
+    assert tracker.is_new(["NEW-ALB.example.com"])
+    assert not tracker.is_new(["new-alb.example.com", "old-alb.example.com"])
+    assert not tracker.is_new([])
+
+
+def test_is_complete_requires_all_resolvers():
+    """모든 리졸버가 NEW여야 전파 완료로 판정해야 한다."""
+    tracker = _tracker(confirm=1)
+    tracker.observe("Google", NEW, 1.0)
+    assert propagated_count(tracker.snapshot()) == 1
+    assert not is_complete(tracker.snapshot())
+
+    tracker.observe("Cloudflare", NEW, 2.0)
+    assert is_complete(tracker.snapshot())
+
+
+def test_unreachable_resolver_is_excluded_from_completion():
+    """연속 응답 없음이 unreachable_after회면 UNREACHABLE로 보고 완료 판정에서 제외해야 한다."""
+    tracker = PropagationTracker(["10.0.0.2"], ["Google", "Cloudflare"], unreachable_after=3)
+    for elapsed in (1.0, 2.0, 3.0):
+        tracker.observe("Google", NEW, elapsed)
+    assert tracker.observe_error("Cloudflare") is ResolverState.PENDING
+    tracker.observe_error("Cloudflare")
+    assert not is_complete(tracker.snapshot())
+
+    assert tracker.observe_error("Cloudflare") is ResolverState.UNREACHABLE
+    progress = tracker.snapshot()
+    assert unreachable_count(progress) == 1
+    assert is_complete(progress)
+    assert completed_at(progress) == 3.0
+
+    # 다시 응답하면 응답 값으로 상태를 판정한다
+    assert tracker.observe("Cloudflare", OLD, 4.0) is ResolverState.OLD
+    assert not is_complete(tracker.snapshot())
+
+
+def test_all_unreachable_is_not_complete():
+    """모든 리졸버가 UNREACHABLE이면 전파 완료가 아니다."""
+    tracker = PropagationTracker(["10.0.0.2"], ["Google"], unreachable_after=1)
+    tracker.observe_error("Google")
+    assert not is_complete(tracker.snapshot())
+
+
+def test_untracked_label_is_ignored():
+    """추적하지 않는 라벨의 응답/오류는 무시하여 완료 판정 대상이 늘어나지 않는다."""
+    tracker = PropagationTracker(["10.0.0.2"], ["Google"], confirm=1)
+    assert tracker.observe("Unknown", OLD, 1.0) is None
+    assert tracker.observe_error("Unknown") is None
+    tracker.observe("Google", NEW, 2.0)
+
+    progress = tracker.snapshot()
+    assert list(progress) == ["Google"]
+    assert is_complete(progress)
+
+
+def test_tracker_rejects_empty_expected():
+    """기대 값이 비어 있으면 ValueError가 발생해야 한다."""
+    with pytest.raises(ValueError, match="기대 값"):
+        PropagationTracker([], ["Google"])
+
+
+def test_propagation_stats_reports_progress():
+    """PropagationStats 스냅샷에 리졸버별 전파 상태가 포함되어야 한다."""
+    stats = PropagationStats(_tracker(confirm=1))
+    stats.record_answer("Google", NEW, 0.01)
+    stats.record_answer("Cloudflare", OLD, 0.01)
+
+    snapshot = stats.get_snapshot()
+    assert snapshot.resolver_distribution == {
+        "Google": {"10.0.0.2": 1},
+        "Cloudflare": {"10.0.0.1": 1},
+    }
+    assert snapshot.resolver_progress["Google"].state is ResolverState.NEW
+    assert snapshot.resolver_progress["Cloudflare"].state is ResolverState.OLD
+
+
+def test_propagation_view_tracks_progress_incrementally():
+    """증분 snapshot은 처음에 전체 진행 상태를, 이후에는 바뀐 리졸버만 다시 복사한다."""
+    stats = PropagationStats(_tracker(confirm=1))
+    view = stats.view()
+    first = view.refresh()
+    assert {p.state for p in first.resolver_progress.values()} == {ResolverState.PENDING}
+    assert first.changed_resolvers == {"Google", "Cloudflare"}
+
+    stats.record_answer("Google", NEW, 0.01)
+    second = view.refresh()
+    assert second.changed_resolvers == {"Google"}
+    assert second.resolver_progress["Google"].state is ResolverState.NEW
+    assert second.resolver_progress["Cloudflare"].state is ResolverState.PENDING
+
+
+def test_tracker_changes_since_returns_only_updated_resolvers():
+    """version 이후 갱신된 리졸버의 진행 상태만 반환한다."""
+    tracker = _tracker(confirm=1)
+    tracker.observe("Google", OLD, 1.0)
+    version = tracker.version
+    tracker.observe("Cloudflare", NEW, 2.0)
+
+    current, changed = tracker.changes_since(version)
+    assert current == tracker.version == version + 1
+    assert list(changed) == ["Cloudflare"]
+    assert changed["Cloudflare"].state is ResolverState.NEW
+    assert tracker.changes_since(current) == (current, {})
+    # 다시 갱신된 리졸버는 최근 갱신분으로 반환
+    tracker.observe("Google", NEW, 3.0)
+    assert list(tracker.changes_since(current)[1]) == ["Google"]
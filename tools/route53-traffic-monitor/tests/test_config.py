@@ -4,7 +4,12 @@ from __future__ import annotations
 
 import pytest
 
-from dns_monitor.config import ConfigSources, MonitorConfig, load_env_vars
+from dns_monitor.config import (
+    DEFAULT_METRICS_PORT,
+    ConfigSources,
+    MonitorConfig,
+    load_env_vars,
+)
 
 # ---------------------------------------------------------------------------
 # MonitorConfig 생성
@@ -154,3 +159,72 @@ def test_load_env_vars_no_http_false_enables_http(monkeypatch):
 
     result = load_env_vars()
     assert result["http_enabled"] is True
+
+
+def test_load_env_vars_insecure_disables_tls_verify(monkeypatch):
+    """DNSMON_INSECURE=true이면 http_verify가 False여야 한다."""
+    monkeypatch.setenv("DNSMON_INSECURE", "true")
+
+    result = load_env_vars()
+    assert result["http_verify"] is False
+    assert (
+        ConfigSources(cli={"endpoint": "https://a.example.com", "hosted_zone_id": "Z1"}, env=result)
+        .build()
+        .http_verify
+        is False
+    )
+
+
+def test_load_env_vars_convergence_settings(monkeypatch):
+    """수렴 판정 관련 환경변수가 올바른 타입으로 파싱돼야 한다."""
+    monkeypatch.setenv("DNSMON_AUTO_STOP", "true")
+    monkeypatch.setenv("DNSMON_TOLERANCE", "0.01")
+    monkeypatch.setenv("DNSMON_CONFIDENCE", "0.99")
+
+    result = load_env_vars()
+    assert result["auto_stop"] is True
+    assert result["tolerance"] == 0.01
+    assert result["confidence"] == 0.99
+
+
+def test_monitor_config_invalid_tolerance_raises():
+    """tolerance가 (0, 1) 범위를 벗어나면 ValueError가 발생해야 한다."""
+    with pytest.raises(ValueError, match="tolerance"):
+        MonitorConfig(
+            endpoint="https://api.example.com",
+            hosted_zone_id="Z001",
+            record_name="api.example.com",
+            tolerance=0,
+        )
+
+
+def test_monitor_config_headless_defaults_metrics_port():
+    """headless 모드에서 포트를 지정하지 않으면 기본 metrics 포트를 사용해야 한다."""
+    cfg = MonitorConfig(
+        endpoint="https://api.example.com",
+        hosted_zone_id="Z001",
+        record_name="api.example.com",
+        headless=True,
+    )
+    assert cfg.metrics_port == DEFAULT_METRICS_PORT
+
+
+def test_monitor_config_invalid_metrics_port_raises():
+    """metrics_port가 0~65535 범위를 벗어나면 ValueError가 발생해야 한다."""
+    with pytest.raises(ValueError, match="metrics_port"):
+        MonitorConfig(
+            endpoint="https://api.example.com",
+            hosted_zone_id="Z001",
+            record_name="api.example.com",
+            metrics_port=70000,
+        )
+
+
+def test_load_env_vars_metrics_settings(monkeypatch):
+    """headless/metrics 환경변수가 올바른 타입으로 파싱돼야 한다."""
+    monkeypatch.setenv("DNSMON_HEADLESS", "1")
+    monkeypatch.setenv("DNSMON_METRICS_PORT", "9300")
+
+    result = load_env_vars()
+    assert result["headless"] is True
+    assert result["metrics_port"] == 9300
@@ -0,0 +1,185 @@
+"""dns_monitor.convergence 단위 테스트."""
+
+from __future__ import annotations
+
+import math
+import random
+
+import pytest
+
+from dns_monitor.aws import WeightedRecord
+from dns_monitor.convergence import (
+    SequentialConvergence,
+    chi_square_p_value,
+    evaluate_convergence,
+    expected_shares,
+    seconds_to_converge,
+    spent_alpha,
+    wilson_interval,
+)
+from dns_monitor.stats import RecordChangeEvent, Stats
+
+
+def _records(*weights: tuple[str, int]) -> list[WeightedRecord]:
+    return [
+        WeightedRecord(set_identifier=sid, weight=w, record_type="A", values=[f"10.0.0.{i}"])
+        for i, (sid, w) in enumerate(weights, start=1)
+    ]
+
+
+# ---------------------------------------------------------------------------
+# expected_shares / wilson_interval / chi_square_p_value
+# ---------------------------------------------------------------------------
+
+
+def test_expected_shares_uses_weight_ratio():
+    """가중치 비율대로 기대 비율을 계산해야 한다."""
+    shares = expected_shares(_records(("blue", 180), ("green", 70)))
+    assert shares["blue"] == pytest.approx(0.72)
+    assert shares["green"] == pytest.approx(0.28)
+
+
+def test_expected_shares_all_zero_weights_are_equal():
+    """모든 가중치가 0이면 Route53과 동일하게 균등 분배로 간주해야 한다."""
+    shares = expected_shares(_records(("blue", 0), ("green", 0)))
+    assert shares == {"blue": 0.5, "green": 0.5}
+
+
+def test_wilson_interval_contains_observed_ratio():
+    """Wilson 구간은 관측 비율을 포함하고 [0, 1] 범위 안에 있어야 한다."""
+    low, high = wilson_interval(72, 100, 1.96)
+    assert 0.0 <= low < 0.72 < high <= 1.0
+    assert low == pytest.approx(0.6251, abs=1e-3)
+    assert high == pytest.approx(0.7986, abs=1e-3)
+
+
+def test_wilson_interval_no_samples_is_uninformative():
+    """표본이 없으면 [0, 1] 전체 구간을 반환해야 한다."""
+    assert wilson_interval(0, 0, 1.96) == (0.0, 1.0)
+
+
+@pytest.mark.parametrize(
+    ("statistic", "dof", "expected"),
+    [(3.841, 1, 0.05), (5.991, 2, 0.05), (20.0, 10, 0.0293), (0.5, 3, 0.9189)],
+)
+def test_chi_square_p_value_matches_reference_table(statistic, dof, expected):
+    """카이제곱 상측 확률이 분포표 값과 일치해야 한다."""
+    assert chi_square_p_value(statistic, dof) == pytest.approx(expected, abs=1e-3)
+
+
+# ---------------------------------------------------------------------------
+# evaluate_convergence
+# ---------------------------------------------------------------------------
+
+
+def test_evaluate_convergence_converges_with_enough_samples():
+    """충분한 표본이 설정 비율과 일치하면 수렴으로 판정해야 한다."""
+    records = _records(("blue", 180), ("green", 70))
+    report = evaluate_convergence({"blue": 7200, "green": 2800}, records, tolerance=0.02)
+
+    assert report.total == 10000
+    assert report.converged is True
+    assert all(s.within_tolerance for s in report.shares)
+    assert report.p_value == pytest.approx(1.0)
+
+
+def test_evaluate_convergence_not_converged_with_few_samples():
+    """표본이 적어 신뢰구간이 넓으면 수렴하지 않아야 한다."""
+    records = _records(("blue", 50), ("green", 50))
+    report = evaluate_convergence({"blue": 50, "green": 50}, records, tolerance=0.02)
+
+    assert report.converged is False
+
+
+def test_evaluate_convergence_detects_skewed_distribution():
+    """관측 비율이 설정과 다르면 수렴하지 않고 p-value가 작아야 한다."""
+    records = _records(("blue", 50), ("green", 50))
+    report = evaluate_convergence({"blue": 7000, "green": 3000}, records, tolerance=0.02)
+
+    assert report.converged is False
+    assert report.p_value is not None and report.p_value < 1e-6
+
+
+def test_evaluate_convergence_missing_identifier_counts_as_zero():
+    """관측되지 않은 SetIdentifier도 0건으로 리포트에 포함돼야 한다."""
+    records = _records(("blue", 50), ("green", 50))
+    report = evaluate_convergence({"blue": 100}, records)
+
+    green = next(s for s in report.shares if s.set_identifier == "green")
+    assert green.count == 0
+    assert green.observed == 0.0
+    assert report.converged is False
+
+
+# ---------------------------------------------------------------------------
+# 반복 판정 (auto-stop)
+# ---------------------------------------------------------------------------
+
+
+def test_spent_alpha_sums_within_confidence():
+    """반복 판정의 유의수준 합이 1 - confidence를 넘지 않아야 한다."""
+    assert spent_alpha(0.95) == pytest.approx(0.05)
+    assert sum(spent_alpha(0.95, look) for look in range(1, 10_000)) < 0.05
+
+
+def test_seconds_to_converge_depends_on_tolerance_and_tps():
+    """tolerance가 좁거나 TPS가 낮을수록 수렴 확인에 오래 걸리고, 불가능하면 None."""
+    slow = seconds_to_converge(0.02, 0.95, 10, 3)
+    fast = seconds_to_converge(0.02, 0.95, 100, 3)
+    assert fast is not None and slow is not None
+    assert fast < 600 < slow
+    assert seconds_to_converge(0.05, 0.95, 10, 3) < slow
+    assert seconds_to_converge(0.001, 0.99, 1, 3, limit=3600) is None
+
+
+def test_repeated_looks_do_not_inflate_false_convergence():
+    """실제 비율이 허용 오차 경계(52:48 vs 50:50)면 반복 판정해도 잘못 수렴하는 비율이 5% 이하."""
+    records = _records(("blue", 50), ("green", 50))
+    sd = math.sqrt(100 * 0.52 * 0.48)
+    naive = sequential = 0
+    for run in range(100):
+        rng = random.Random(run)
+        blue = total = 0
+        naive_stopped = sequential_stopped = False
+        for look in range(1, 201):
+            blue += round(rng.gauss(52, sd))
+            total += 100
+            distribution = {"blue": blue, "green": total - blue}
+            naive_stopped = naive_stopped or evaluate_convergence(distribution, records).converged
+            sequential_stopped = (
+                sequential_stopped
+                or evaluate_convergence(distribution, records, look=look).converged
+            )
+        naive += naive_stopped
+        sequential += sequential_stopped
+
+    assert sequential <= 5
+    assert naive > sequential
+
+
+def test_sequential_convergence_uses_samples_after_change():
+    """변경 이벤트가 감지되면 감지 이후 표본만으로 판정을 다시 시작해야 한다."""
+    stats = Stats(start_time=0.0, start_wall_time=0.0)
+    judge = SequentialConvergence(stats, tolerance=0.05)
+    for second in range(10):
+        for _ in range(500):
+            stats.record_hit("blue", now=second + 0.5)
+    old = _records(("blue", 100), ("green", 0))
+    assert judge.check(old).converged
+
+    stats.record_event(
+        RecordChangeEvent(
+            detected_at=9.5,
+            wall_time=9.5,
+            last_unchanged_at=5.0,
+            weights={"blue": 50, "green": 50},
+            previous_weights={"blue": 100, "green": 0},
+        )
+    )
+    for second in range(10, 20):
+        for sid in ("blue", "green") * 250:
+            stats.record_hit(sid, now=second + 0.5)
+    report = judge.check(_records(("blue", 50), ("green", 50)))
+
+    assert report.total == 5000
+    assert report.converged
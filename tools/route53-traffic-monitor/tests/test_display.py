@@ -0,0 +1,104 @@
+"""dns_monitor.display 단위 테스트."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+
+import pytest
+from rich.console import Console
+from rich.text import Text
+
+from dns_monitor.display import (
+    AdaptiveRefresh,
+    ResolverRowCache,
+    _run_live,
+    build_propagation_dashboard,
+)
+from dns_monitor.stats import PropagationStats
+
+# ---------------------------------------------------------------------------
+# AdaptiveRefresh
+# ---------------------------------------------------------------------------
+
+
+def test_adaptive_refresh_keeps_base_interval_when_cheap():
+    """렌더링이 budget 안이면 기본 간격에서 렌더링 시간을 뺀 만큼 기다린다."""
+    pacer = AdaptiveRefresh(0.5, budget=0.2)
+    assert pacer.next_delay(0.05) == pytest.approx(0.45)
+    assert pacer.interval == 0.5
+
+
+def test_adaptive_refresh_slows_down_and_recovers():
+    """렌더링이 budget을 넘으면 간격을 늘리고(최대값 제한), 비용이 줄면 서서히 되돌린다."""
+    pacer = AdaptiveRefresh(0.5, budget=0.2, max_interval=3.0)
+    pacer.next_delay(0.3)
+    assert pacer.interval == pytest.approx(1.5)
+    pacer.next_delay(2.0)
+    assert pacer.interval == 3.0
+
+    pacer.next_delay(0.01)
+    assert pacer.interval == pytest.approx(2.4)
+    for _ in range(20):
+        pacer.next_delay(0.01)
+    assert pacer.interval == 0.5
+
+
+def test_adaptive_refresh_rejects_invalid_budget():
+    with pytest.raises(ValueError, match="budget"):
+        AdaptiveRefresh(0.5, budget=0)
+
+
+def test_run_live_renders_off_event_loop_thread():
+    """대시보드 구성/렌더링은 이벤트 루프가 아닌 워커 스레드에서 수행해야 한다."""
+    threads: list[int] = []
+
+    def build() -> Text:
+        threads.append(threading.get_ident())
+        return Text("ok")
+
+    async def scenario() -> int:
+        task = asyncio.create_task(_run_live(build, 0.01))
+        while len(threads) < 2:
+            await asyncio.sleep(0.01)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        return threading.get_ident()
+
+    loop_thread = asyncio.run(scenario())
+    assert len(threads) >= 2
+    assert loop_thread not in threads
+
+
+# ---------------------------------------------------------------------------
+# Propagation 대시보드
+# ---------------------------------------------------------------------------
+
+
+def _render(group) -> str:
+    console = Console(width=120, record=True)
+    with console.capture() as capture:
+        console.print(group)
+    return capture.get()
+
+
+def test_resolver_row_cache_rebuilds_only_changed_rows():
+    """캐시한 행은 바뀐 리졸버만 다시 만들고, 결과는 캐시 없이 만든 대시보드와 같다."""
+    stats = PropagationStats()
+    view = stats.view()
+    cache = ResolverRowCache()
+    stats.record_answer("Google", ["10.0.0.1"], ttl=30)
+    stats.record_answer("Cloudflare", ["10.0.0.2"])
+    cache.rows(view.refresh())
+    cloudflare_rows = cache._rows["Cloudflare"]
+
+    stats.record_answer("Google", ["10.0.0.3"], ttl=29)
+    snapshot = view.refresh()
+    rows = cache.rows(snapshot)
+    assert cache._rows["Cloudflare"] is cloudflare_rows
+    assert [r[0] for r in rows] == ["Cloudflare", "Google", ""]
+    assert rows[1][4] == "29s"
+
+    cached = build_propagation_dashboard("a.example.com", "A", snapshot, 2, cache)
+    uncached = build_propagation_dashboard("a.example.com", "A", stats.get_snapshot(), 2)
+    assert _render(cached).split("TPS")[0] == _render(uncached).split("TPS")[0]
@@ -0,0 +1,257 @@
+"""dns_monitor.ecs 단위 테스트."""
+
+from __future__ import annotations
+
+import asyncio
+import ipaddress
+from unittest.mock import MagicMock, patch
+
+import dns.edns
+import dns.message
+import dns.rrset
+import pytest
+from rich.console import Console
+
+from dns_monitor.aws import WeightedRecord, get_routed_records, get_weighted_records
+from dns_monitor.classifier import AnswerClassifier
+from dns_monitor.display import build_ecs_matrix
+from dns_monitor.ecs import load_subnets, parse_subnet, sweep_subnets
+from dns_monitor.resolver import WeightedResolver, _to_answer
+
+RECORDS = [
+    WeightedRecord("seoul", 0, "A", ["10.0.0.1"], policy="latency:ap-northeast-2"),
+    WeightedRecord("virginia", 0, "A", ["10.0.0.2"], policy="latency:us-east-1"),
+]
+# 서브넷 → 응답 IP (가짜 권한 NS의 라우팅 규칙)
+ROUTES = {
+    ipaddress.ip_network("1.208.0.0/16"): "10.0.0.1",
+    ipaddress.ip_network("3.80.0.0/16"): "10.0.0.2",
+}
+
+
+class _FakeEcsClient:
+    """질의의 ECS 서브넷에 따라 응답하고, 동시에 대기 중인 질의 수를 기록하는 AsyncDnsClient."""
+
+    def __init__(self, scope: int = 16):
+        self.scope = scope
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.queried_ns: list[str] = []
+
+    async def query(self, request: dns.message.Message, ns_ip: str, timeout: float):
+        self.queried_ns.append(ns_ip)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.001)
+        finally:
+            self.in_flight -= 1
+        [ecs] = [o for o in request.options if isinstance(o, dns.edns.ECSOption)]
+        network = ipaddress.ip_network(f"{ecs.address}/{ecs.srclen}")
+        response = dns.message.make_response(request)
+        answer = next((ip for net, ip in ROUTES.items() if network.subnet_of(net)), "10.9.9.9")
+        response.answer.append(dns.rrset.from_text(request.question[0].name, 60, "IN", "A", answer))
+        response.use_edns(
+            0,
+            options=[dns.edns.ECSOption(ecs.address, ecs.srclen, self.scope)],
+        )
+        return response
+
+
+def _resolver() -> WeightedResolver:
+    return WeightedResolver([], "api.example.com", "A", ns_ips=["192.0.2.1", "192.0.2.2"])
+
+
+# ---------------------------------------------------------------------------
+# 서브넷 파싱
+# ---------------------------------------------------------------------------
+
+
+def test_parse_subnet_masks_host_bits_and_defaults_prefix():
+    """호스트 비트는 버리고, prefix가 없으면 IPv4 /24, IPv6 /56."""
+    assert str(parse_subnet("203.0.113.7/24").network) == "203.0.113.0/24"
+    assert str(parse_subnet(" 203.0.113.7 ").network) == "203.0.113.0/24"
+    assert str(parse_subnet("2001:db8::1").network) == "2001:db8::/56"
+    assert parse_subnet("10.0.0.0/8", "corp").label == "corp"
+    assert parse_subnet("10.0.0.0/8").label == "10.0.0.0/8"
+    with pytest.raises(ValueError, match="잘못된 서브넷"):
+        parse_subnet("seoul")
+
+
+def test_load_subnets_reads_labels_comments_and_dedupes(tmp_path):
+    """`서브넷 [라벨]` / `서브넷,라벨` 형식, 주석 무시, 같은 네트워크는 첫 줄만."""
+    path = tmp_path / "subnets.txt"
+    path.write_text(
+        "# 지역별 대표 서브넷\n1.208.0.0/16 seoul\n3.80.0.0/16,virginia  # us-east-1\n"
+        "\n1.208.1.1/16 dup\n",
+        encoding="utf-8",
+    )
+    subnets = load_subnets(path)
+    assert [(str(s.network), s.label) for s in subnets] == [
+        ("1.208.0.0/16", "seoul"),
+        ("3.80.0.0/16", "virginia"),
+    ]
+
+    path.write_text("1.2.3.0/24\nnot-a-subnet\n", encoding="utf-8")
+    with pytest.raises(ValueError, match=":2:"):
+        load_subnets(path)
+    path.write_text("# empty\n", encoding="utf-8")
+    with pytest.raises(ValueError, match="서브넷이 없습니다"):
+        load_subnets(path)
+
+
+# ---------------------------------------------------------------------------
+# ECS 질의 / 응답
+# ---------------------------------------------------------------------------
+
+
+def test_make_request_adds_client_subnet_option():
+    """client_subnet을 지정하면 EDNS0 ECS 옵션을 붙이고, 없으면 EDNS 없이 질의한다."""
+    resolver = _resolver()
+    plain = resolver.make_request()
+    assert plain.edns < 0
+
+    request = resolver.make_request(ipaddress.ip_network("1.208.0.0/16"))
+    [option] = request.options
+    assert isinstance(option, dns.edns.ECSOption)
+    assert (option.address, option.srclen) == ("1.208.0.0", 16)
+
+
+def test_to_answer_reads_ecs_scope():
+    """응답의 ECS scope prefix 길이를 DnsAnswer.scope_prefix로 돌려준다."""
+    request = _resolver().make_request(ipaddress.ip_network("1.208.0.0/16"))
+    response = dns.message.make_response(request)
+    assert _to_answer(response).scope_prefix is None
+    response.use_edns(0, options=[dns.edns.ECSOption("1.208.0.0", 16, 12)])
+    assert _to_answer(response).scope_prefix == 12
+
+
+# ---------------------------------------------------------------------------
+# sweep_subnets
+# ---------------------------------------------------------------------------
+
+
+def test_sweep_subnets_builds_per_subnet_distribution():
+    """서브넷별 응답을 SetIdentifier로 분류하고 매칭되지 않은 응답은 unmatched로 모은다."""
+    subnets = [
+        parse_subnet("1.208.0.0/16", "seoul"),
+        parse_subnet("3.80.0.0/16", "virginia"),
+        parse_subnet("198.51.100.0/24", "other"),
+    ]
+    client = _FakeEcsClient(scope=16)
+    results = asyncio.run(
+        sweep_subnets(_resolver(), AnswerClassifier(RECORDS), subnets, queries=6, client=client)
+    )
+
+    seoul, virginia, other = results
+    assert seoul.distribution == {"seoul": 6}
+    assert seoul.dominant == "seoul"
+    assert virginia.share("virginia") == 1.0
+    assert other.distribution == {}
+    assert other.unmatched == {"10.9.9.9": 6}
+    assert seoul.scopes == {16: 6}
+    assert seoul.to_dict()["scopes"] == {"16": 6}
+    # 권한 NS는 라운드로빈
+    assert client.queried_ns.count("192.0.2.1") == client.queried_ns.count("192.0.2.2") == 9
+
+
+def test_sweep_subnets_bounds_in_flight_queries():
+    """동시에 응답을 기다리는 질의 수는 concurrency를 넘지 않는다."""
+    subnets = [parse_subnet(f"10.{i}.0.0/16") for i in range(20)]
+    client = _FakeEcsClient()
+    progress: list[int] = []
+    asyncio.run(
+        sweep_subnets(
+            _resolver(),
+            AnswerClassifier(RECORDS),
+            subnets,
+            queries=5,
+            concurrency=7,
+            client=client,
+            on_progress=progress.append,
+        )
+    )
+    assert client.max_in_flight == 7
+    assert progress == list(range(1, 101))
+
+
+def test_sweep_subnets_counts_errors():
+    """응답이 없거나 NOERROR가 아닌 응답은 errors로 센다."""
+
+    class _DeadClient:
+        async def query(self, request, ns_ip, timeout):
+            raise OSError("unreachable")
+
+    [result] = asyncio.run(
+        sweep_subnets(
+            _resolver(),
+            AnswerClassifier(RECORDS),
+            [parse_subnet("1.208.0.0/16")],
+            queries=3,
+            client=_DeadClient(),
+        )
+    )
+    assert result.errors == 3
+    assert result.answered == 0
+    assert result.dominant is None
+
+
+def test_build_ecs_matrix_renders_subnet_rows():
+    """매트릭스에 서브넷 라벨, SetIdentifier / 라우팅 정책, 응답 비율이 표시된다."""
+    subnets = [parse_subnet("1.208.0.0/16", "seoul"), parse_subnet("198.51.100.0/24")]
+    results = asyncio.run(
+        sweep_subnets(
+            _resolver(), AnswerClassifier(RECORDS), subnets, queries=2, client=_FakeEcsClient()
+        )
+    )
+    console = Console(width=160, record=True)
+    console.print(build_ecs_matrix("api.example.com", RECORDS, results))
+    text = console.export_text()
+    assert "latency:ap-northeast-2" in text
+    assert "seoul" in text
+    assert "100%" in text
+    assert "198.51.100.0/24" in text
+
+
+# ---------------------------------------------------------------------------
+# 라우팅 레코드 조회
+# ---------------------------------------------------------------------------
+
+
+@patch("dns_monitor.aws.get_route53_client")
+def test_get_routed_records_includes_non_weighted_policies(mock_client):
+    """SetIdentifier가 있는 레코드는 라우팅 정책과 무관하게 조회하고 정책을 기록한다."""
+
+    def rrs(sid: str, value: str, **policy) -> dict:
+        return {
+            "Name": "api.example.com.",
+            "Type": "A",
+            "SetIdentifier": sid,
+            "ResourceRecords": [{"Value": value}],
+            **policy,
+        }
+
+    paginator = MagicMock()
+    paginator.paginate.return_value = [
+        {
+            "ResourceRecordSets": [
+                rrs("w", "10.0.0.1", Weight=5),
+                rrs("lat", "10.0.0.2", Region="us-east-1"),
+                rrs("kr", "10.0.0.3", GeoLocation={"CountryCode": "KR"}),
+                rrs("eu", "10.0.0.4", GeoLocation={"ContinentCode": "EU"}),
+                rrs("primary", "10.0.0.5", Failover="PRIMARY"),
+                {"Name": "api.example.com.", "Type": "TXT", "ResourceRecords": []},
+            ]
+        }
+    ]
+    mock_client.return_value.get_paginator.return_value = paginator
+
+    routed = get_routed_records("Z1", "api.example.com")
+    assert [(r.set_identifier, r.weight, r.policy) for r in routed] == [
+        ("w", 5, "weighted"),
+        ("lat", 0, "latency:us-east-1"),
+        ("kr", 0, "geo:KR"),
+        ("eu", 0, "geo:continent-EU"),
+        ("primary", 0, "failover:PRIMARY"),
+    ]
+    assert [r.set_identifier for r in get_weighted_records("Z1", "api.example.com")] == ["w"]
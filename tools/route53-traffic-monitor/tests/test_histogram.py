@@ -0,0 +1,82 @@
+"""dns_monitor.histogram 단위 테스트."""
+
+from __future__ import annotations
+
+import pytest
+
+from dns_monitor.histogram import (
+    BUCKET_COUNT,
+    LatencyHistogram,
+    WindowedLatency,
+    bucket_index,
+    bucket_value,
+    summarize_windows,
+)
+
+# ---------------------------------------------------------------------------
+# LatencyHistogram
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize("value", [0.0005, 0.012, 0.25, 3.0])
+def test_bucket_value_relative_error_within_one_percent(value):
+    """버킷 대표값은 원래 값과 상대 오차 1% 이내여야 한다."""
+    assert bucket_value(bucket_index(value)) == pytest.approx(value, rel=0.011)
+
+
+def test_bucket_index_clamps_out_of_range_values():
+    """범위를 벗어난 값은 양 끝 버킷으로 모여야 한다 (메모리 상한 고정)."""
+    assert bucket_index(0.0) == 0
+    assert bucket_index(10_000.0) == BUCKET_COUNT - 1
+
+
+def test_histogram_percentiles_of_uniform_samples():
+    """1~100ms 균등 분포의 p50/p95/p99가 기대값 근처여야 한다."""
+    hist = LatencyHistogram()
+    for ms in range(1, 101):
+        hist.record(ms / 1000)
+
+    p50, p95, p99 = hist.percentiles()
+    assert p50 == pytest.approx(0.050, rel=0.02)
+    assert p95 == pytest.approx(0.095, rel=0.02)
+    assert p99 == pytest.approx(0.099, rel=0.02)
+    assert hist.mean() == pytest.approx(0.0505)
+
+
+def test_histogram_empty_percentiles_are_none():
+    """값이 없으면 모든 백분위수가 None이어야 한다."""
+    assert LatencyHistogram().percentiles() == [None, None, None]
+
+
+# ---------------------------------------------------------------------------
+# WindowedLatency
+# ---------------------------------------------------------------------------
+
+
+def test_windowed_latency_separates_windows():
+    """10초/1분 윈도우는 오래된 값을 제외하고, total은 모두 포함해야 한다."""
+    window = WindowedLatency()
+    window.record(0.500, now=1000.0)  # 100초 전: total에만 포함
+    window.record(0.200, now=1070.0)  # 30초 전: 1m, total
+    window.record(0.010, now=1099.5)  # 현재: 10s, 1m, total
+
+    summary = summarize_windows([window], now=1100.0)
+
+    assert summary["10s"].count == 1
+    assert summary["1m"].count == 2
+    assert summary["total"].count == 3
+    assert summary["10s"].p99_ms == pytest.approx(10, rel=0.02)
+    assert summary["total"].p99_ms == pytest.approx(500, rel=0.02)
+
+
+def test_windowed_latency_reuses_ring_slots():
+    """같은 링 슬롯이 다음 주기에 재사용되면 이전 값은 제거돼야 한다."""
+    window = WindowedLatency()
+    window.record(0.100, now=10.0)
+    window.record(0.020, now=70.0)  # 60초 후 같은 슬롯
+
+    summary = summarize_windows([window], now=70.0)
+
+    assert summary["1m"].count == 1
+    assert summary["1m"].p50_ms == pytest.approx(20, rel=0.02)
+    assert summary["total"].count == 2
@@ -0,0 +1,145 @@
+"""dns_monitor.httpprobe 단위 테스트."""
+
+from __future__ import annotations
+
+import asyncio
+import socket
+
+import pytest
+
+from dns_monitor.httpprobe import FAILURE_CONNECT, FAILURE_TLS, HttpProber
+
+
+class _StubHttpServer:
+    """keep-alive로 응답하고 연결 수와 요청 헤더를 기록하는 테스트용 HTTP 서버."""
+
+    def __init__(self):
+        self.connections = 0
+        self.requests: list[list[bytes]] = []
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                self.requests.append(head.split(b"\r\n"))
+                writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\nok")
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+# ---------------------------------------------------------------------------
+# URL / 요청 구성
+# ---------------------------------------------------------------------------
+
+
+def test_url_for_replaces_host_with_ip():
+    """endpoint의 scheme/포트/경로는 유지하고 호스트만 IP로 교체해야 한다."""
+    prober = HttpProber("https://app.example.com:8443/health?x=1", "app.example.com")
+
+    assert str(prober.url_for("10.0.0.1")) == "https://10.0.0.1:8443/health?x=1"
+    assert str(prober.url_for("2001:db8::1")) == "https://[2001:db8::1]:8443/health?x=1"
+
+
+def test_rejects_non_http_endpoint():
+    """http/https가 아닌 endpoint는 ValueError가 발생해야 한다."""
+    with pytest.raises(ValueError, match="http/https"):
+        HttpProber("ftp://app.example.com", "app.example.com")
+
+
+def test_https_probe_sends_record_name_as_sni():
+    """https 요청은 레코드 이름을 SNI 확장과 Host 헤더로 전달해야 한다."""
+    sent: list[dict] = []
+
+    async def scenario():
+        prober = HttpProber("https://app.example.com/", "app.example.com")
+
+        async def fake_get(url, headers, extensions):
+            sent.append({"url": str(url), "headers": headers, "extensions": extensions})
+
+        prober._client.get = fake_get
+        result = await prober.probe("10.0.0.1")
+        await prober.aclose()
+        return result
+
+    assert asyncio.run(scenario()).latency is not None
+    assert sent == [
+        {
+            "url": "https://10.0.0.1/",
+            "headers": {"Host": "app.example.com"},
+            "extensions": {"sni_hostname": "app.example.com"},
+        }
+    ]
+
+
+# ---------------------------------------------------------------------------
+# 연결 풀
+# ---------------------------------------------------------------------------
+
+
+def test_probe_reuses_connection_per_ip():
+    """같은 IP로의 반복 probe는 하나의 연결을 재사용해야 한다."""
+    stub = _StubHttpServer()
+
+    async def scenario():
+        server = await asyncio.start_server(stub.handle, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        try:
+            async with HttpProber(f"http://app.example.com:{port}/health", "app.example.com") as p:
+                return [await p.probe("127.0.0.1") for _ in range(3)], port
+        finally:
+            server.close()
+
+    results, port = asyncio.run(scenario())
+
+    assert all(r.latency is not None and r.failure is None for r in results)
+    assert stub.connections == 1
+    assert len(stub.requests) == 3
+    assert stub.requests[0][0] == b"GET /health HTTP/1.1"
+    assert f"Host: app.example.com:{port}".encode() in stub.requests[0]
+
+
+def test_probe_connection_failure_is_reported():
+    """연결 실패 시 latency 없이 실패 종류(connect)를 반환해야 한다."""
+
+    async def scenario():
+        async with HttpProber(f"http://app.example.com:{_free_port()}/", "app.example.com") as p:
+            return await p.probe("127.0.0.1")
+
+    result = asyncio.run(scenario())
+    assert result.latency is None
+    assert result.failure == FAILURE_CONNECT
+
+
+def test_probe_tls_failure_is_reported():
+    """TLS 핸드셰이크 실패는 연결 실패와 구분하여 tls로 반환해야 한다."""
+
+    async def plain_text(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        writer.write(b"HTTP/1.1 400 Bad Request\r\n\r\n")
+        await writer.drain()
+        writer.close()
+
+    async def scenario():
+        # ClientHello에 평문 응답을 보내는 서버에 https로 연결하면 핸드셰이크가 실패한다
+        server = await asyncio.start_server(plain_text, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        try:
+            async with HttpProber(
+                f"https://app.example.com:{port}/", "app.example.com", verify=False
+            ) as p:
+                return await p.probe("127.0.0.1")
+        finally:
+            server.close()
+
+    result = asyncio.run(scenario())
+    assert result.latency is None
+    assert result.failure == FAILURE_TLS
@@ -0,0 +1,143 @@
+"""dns_monitor.metrics 단위 테스트."""
+
+from __future__ import annotations
+
+import asyncio
+
+from dns_monitor.aws import WeightedRecord
+from dns_monitor.completion import PropagationTracker
+from dns_monitor.histogram import LatencyHistogram
+from dns_monitor.metrics import MetricsServer, render_propagation_metrics, render_watch_metrics
+from dns_monitor.stats import PropagationStats, Stats
+
+RECORDS = [
+    WeightedRecord(set_identifier="blue", weight=75, record_type="A", values=["10.0.0.1"]),
+    WeightedRecord(set_identifier="green", weight=25, record_type="A", values=["10.0.0.2"]),
+]
+
+
+def _lines(text: str) -> set[str]:
+    return set(text.splitlines())
+
+
+# ---------------------------------------------------------------------------
+# 렌더링
+# ---------------------------------------------------------------------------
+
+
+def test_histogram_cumulative_counts():
+    """le 버킷별 누적 개수는 단조 증가하고 상한 이하 값만 포함해야 한다."""
+    hist = LatencyHistogram()
+    for value in (0.002, 0.02, 0.02, 0.3):
+        hist.record(value)
+
+    assert hist.cumulative((0.01, 0.1, 1.0)) == [1, 3, 4]
+    assert hist.cumulative((0.001,)) == [0]
+
+
+def test_render_watch_metrics_counters_and_histogram():
+    """watch metrics에 카운터, 기대 비율, latency 히스토그램이 포함되어야 한다."""
+    stats = Stats(start_time=0.0)
+    for i in range(3):
+        stats.record_hit("blue", 0.02, nameserver="ns1", dns_latency=0.004, now=i * 0.1)
+    stats.record_hit("green", 0.2, nameserver="ns1", dns_latency=0.004, now=0.5)
+    stats.record_error(nameserver="ns2", rcode=2, now=0.6)
+
+    lines = _lines(render_watch_metrics("api.example.com", RECORDS, stats))
+
+    assert 'dnsmon_requests_total{record="api.example.com"} 5' in lines
+    assert 'dnsmon_errors_total{record="api.example.com"} 1' in lines
+    assert 'dnsmon_responses_total{record="api.example.com",set_identifier="blue"} 3' in lines
+    assert 'dnsmon_expected_share{record="api.example.com",set_identifier="green"} 0.25' in lines
+    assert 'dnsmon_nameserver_errors_total{record="api.example.com",nameserver="ns2"} 1' in lines
+    assert "# TYPE dnsmon_latency_seconds histogram" in lines
+    prefix = 'dnsmon_latency_seconds_bucket{record="api.example.com",set_identifier="blue"'
+    assert prefix + ',le="0.025"} 3' in lines
+    assert prefix + ',le="+Inf"} 3' in lines
+    assert 'dnsmon_dns_latency_seconds_count{record="api.example.com",nameserver="ns1"} 4' in lines
+
+
+def test_render_propagation_metrics_resolver_state():
+    """propagation metrics에 리졸버별 상태와 전파 완료 수가 포함되어야 한다."""
+    tracker = PropagationTracker(["10.0.0.2"], ["google", "cloudflare"], confirm=1)
+    stats = PropagationStats(tracker=tracker)
+    stats.record_answer("google", ["10.0.0.2"], 0.01, ttl=60)
+    stats.record_answer("cloudflare", ["10.0.0.1"], 0.02, ttl=30)
+
+    lines = _lines(render_propagation_metrics("api.example.com", stats))
+
+    base = 'record="api.example.com"'
+    assert f"dnsmon_propagation_probes_total{{{base}}} 2" in lines
+    assert f"dnsmon_propagation_resolvers_propagated{{{base}}} 1" in lines
+    assert f'dnsmon_propagation_resolver_state{{{base},resolver="google",state="new"}} 1' in lines
+    assert (
+        f'dnsmon_propagation_resolver_state{{{base},resolver="cloudflare",state="old"}} 1' in lines
+    )
+    assert f"dnsmon_propagation_latency_seconds_count{{{base}}} 2" in lines
+
+
+def test_label_values_are_escaped():
+    """라벨 값의 따옴표/역슬래시는 이스케이프되어야 한다."""
+    stats = Stats(start_time=0.0)
+    stats.record_hit('a"b\\c', 0.01, now=0.0)
+
+    text = render_watch_metrics("api.example.com", [], stats)
+
+    assert 'set_identifier="a\\"b\\\\c"' in text
+
+
+# ---------------------------------------------------------------------------
+# HTTP 서버
+# ---------------------------------------------------------------------------
+
+
+async def _get(port: int, path: str, method: str = "GET") -> tuple[str, bytes]:
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(f"{method} {path} HTTP/1.1\r\nHost: localhost\r\n\r\n".encode())
+    await writer.drain()
+    data = await reader.read()
+    writer.close()
+    head, _, body = data.partition(b"\r\n\r\n")
+    return head.split(b"\r\n", 1)[0].decode(), body
+
+
+def test_metrics_server_serves_and_caches():
+    """/metrics는 200으로 응답하고, 캐시 유효 기간 안에서는 다시 렌더링하지 않아야 한다."""
+    calls = []
+
+    def render() -> str:
+        calls.append(1)
+        return f"dnsmon_test {len(calls)}\n"
+
+    async def scenario():
+        server = MetricsServer(render, port=0, cache_ttl=60.0)
+        await server.start()
+        task = asyncio.create_task(server.run())
+        try:
+            first = await _get(server.port, "/metrics")
+            second = await _get(server.port, "/metrics?x=1")
+            missing = await _get(server.port, "/other")
+            post = await _get(server.port, "/metrics", method="POST")
+        finally:
+            task.cancel()
+            await task
+        return first, second, missing, post
+
+    first, second, missing, post = asyncio.run(scenario())
+
+    assert first == ("HTTP/1.1 200 OK", b"dnsmon_test 1\n")
+    assert second == first
+    assert len(calls) == 1
+    assert missing[0] == "HTTP/1.1 404 Not Found"
+    assert post[0] == "HTTP/1.1 405 Method Not Allowed"
+
+
+def test_metrics_server_rerenders_after_ttl():
+    """캐시 유효 기간이 지나면 다시 렌더링해야 한다."""
+    calls = []
+    server = MetricsServer(lambda: calls.append(1) or "x\n", cache_ttl=0.0)
+
+    server.body()
+    server.body()
+
+    assert len(calls) == 2
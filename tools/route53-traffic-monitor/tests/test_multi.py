@@ -0,0 +1,207 @@
+"""dns_monitor.multi 단위 테스트."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import dns.message
+import dns.rrset
+import pytest
+from rich.console import Console
+
+from dns_monitor.aws import WeightedRecord, get_zone_weighted_records
+from dns_monitor.config import MonitorConfig
+from dns_monitor.display import render_multi_dashboard
+from dns_monitor.metrics import render_multi_watch_metrics
+from dns_monitor.multi import (
+    WatchTarget,
+    group_by_zone,
+    load_targets,
+    make_watch,
+    parse_targets,
+    zone_refreshers,
+)
+from dns_monitor.resolver import WeightedResolver
+
+
+def _rec(sid: str, weight: int, value: str) -> WeightedRecord:
+    return WeightedRecord(set_identifier=sid, weight=weight, record_type="A", values=[value])
+
+
+def _watch(zone: str, name: str, records: list[WeightedRecord], dns_client=None):
+    config = MonitorConfig(
+        endpoint=f"https://{name}",
+        hosted_zone_id=zone,
+        record_name=name,
+        http_enabled=False,
+    )
+    return make_watch(
+        WatchTarget(zone, name),
+        records,
+        ["ns-1.awsdns-00.com"],
+        ["127.0.0.1"],
+        config,
+        dns_client or MagicMock(),
+    )
+
+
+# ---------------------------------------------------------------------------
+# 대상 지정
+# ---------------------------------------------------------------------------
+
+
+def test_parse_targets_uses_default_zone_and_dedupes():
+    """Zone을 생략하면 기본 Zone을 사용하고, 같은 대상은 한 번만 포함해야 한다."""
+    targets = parse_targets(
+        ["api.example.com", "Z2:web.example.org.", "API.example.com", "Z2:api.example.com"],
+        default_zone="Z1",
+    )
+
+    assert targets == [
+        WatchTarget("Z1", "api.example.com"),
+        WatchTarget("Z2", "web.example.org"),
+        WatchTarget("Z2", "api.example.com"),
+    ]
+    assert list(group_by_zone(targets)) == ["Z1", "Z2"]
+
+
+def test_parse_targets_without_zone_raises():
+    """Zone을 알 수 없으면 ValueError가 발생해야 한다."""
+    with pytest.raises(ValueError, match="Hosted Zone"):
+        parse_targets(["api.example.com"])
+    with pytest.raises(ValueError, match="감시할 레코드가 없습니다"):
+        parse_targets([], default_zone="Z1")
+
+
+def test_load_targets_skips_comments(tmp_path):
+    """빈 줄과 주석은 무시해야 한다."""
+    path = tmp_path / "records.txt"
+    path.write_text("# failover\napi.example.com  # primary\n\nZ2:web.example.org\n")
+
+    assert load_targets(path) == ["api.example.com", "Z2:web.example.org"]
+
+
+# ---------------------------------------------------------------------------
+# Route53 zone 단위 조회
+# ---------------------------------------------------------------------------
+
+
+def _rrs(name: str, sid: str | None, weight: int | None, value: str) -> dict:
+    rrs = {"Name": name, "Type": "A", "ResourceRecords": [{"Value": value}]}
+    if sid is not None:
+        rrs.update(SetIdentifier=sid, Weight=weight)
+    return rrs
+
+
+@patch("dns_monitor.aws.get_route53_client")
+def test_get_zone_weighted_records_single_pagination(mock_client):
+    """여러 이름을 한 번의 페이지네이션으로 조회하고 마지막 대상 이후에서 중단해야 한다."""
+    paginator = MagicMock()
+    paginator.paginate.return_value = [
+        {
+            "ResourceRecordSets": [
+                _rrs("api.example.com.", "blue", 90, "10.0.0.1"),
+                _rrs("api.example.com.", "green", 10, "10.0.0.2"),
+                _rrs("other.example.com.", "x", 1, "10.9.9.9"),
+            ]
+        },
+        {
+            "ResourceRecordSets": [
+                _rrs("plain.example.com.", None, None, "10.0.0.5"),
+                _rrs("web.example.com.", "a", 1, "10.1.0.1"),
+                _rrs("zzz.example.com.", "b", 1, "10.1.0.2"),
+            ]
+        },
+        {"ResourceRecordSets": [_rrs("zzzz.example.com.", "c", 1, "10.1.0.3")]},
+    ]
+    mock_client.return_value.get_paginator.return_value = paginator
+
+    result = get_zone_weighted_records(
+        "Z1", ["Web.example.com", "api.example.com", "gone.example.com"]
+    )
+
+    paginator.paginate.assert_called_once_with(
+        HostedZoneId="Z1", StartRecordName="api.example.com."
+    )
+    assert [r.set_identifier for r in result["api.example.com"]] == ["blue", "green"]
+    assert [r.set_identifier for r in result["Web.example.com"]] == ["a"]
+    assert result["gone.example.com"] == []
+
+
+@patch("dns_monitor.refresh.get_zone_weighted_records")
+def test_zone_refresher_applies_changes_per_record(mock_get):
+    """zone 조회 1회로 레코드별 변경을 반영해야 한다."""
+    api = _watch(
+        "Z1", "api.example.com", [_rec("blue", 100, "10.0.0.1"), _rec("green", 0, "10.0.0.2")]
+    )
+    web = _watch("Z1", "web.example.com", [_rec("a", 1, "10.1.0.1")])
+    mock_get.return_value = {
+        "api.example.com": [_rec("blue", 0, "10.0.0.1"), _rec("green", 100, "10.0.0.2")],
+        "web.example.com": [_rec("a", 1, "10.1.0.1")],
+    }
+    (refresher,) = zone_refreshers([api, web])
+
+    diffs = asyncio.run(refresher.refresh_once())
+
+    mock_get.assert_called_once_with("Z1", ["api.example.com", "web.example.com"])
+    assert list(diffs) == ["api.example.com"]
+    assert api.records_ref[0][1].weight == 100
+    assert len(api.stats.get_snapshot().events) == 1
+    assert web.stats.get_snapshot().events == []
+
+
+# ---------------------------------------------------------------------------
+# 공유 UDP 소켓
+# ---------------------------------------------------------------------------
+
+
+def test_query_async_uses_shared_client():
+    """공유 클라이언트로 RD=0 질의를 보내고 응답 값을 반환해야 한다."""
+    resolver = WeightedResolver([], "api.example.com", "A", ns_ips=["205.251.192.1"])
+    sent = []
+
+    class _Client:
+        async def query(self, request, ip, timeout):
+            sent.append((request, ip))
+            response = dns.message.make_response(request)
+            response.answer.append(
+                dns.rrset.from_text("api.example.com.", 60, "IN", "A", "10.0.0.1")
+            )
+            return response
+
+    answer = asyncio.run(resolver.query_async(_Client(), "205.251.192.1"))
+
+    assert answer.values == ["10.0.0.1"] and answer.rcode == 0
+    request, ip = sent[0]
+    assert ip == "205.251.192.1"
+    assert not request.flags & dns.flags.RD
+
+
+# ---------------------------------------------------------------------------
+# 대시보드 / metrics
+# ---------------------------------------------------------------------------
+
+
+def test_multi_dashboard_and_metrics_cover_all_records():
+    """대시보드와 metrics에 모든 레코드가 포함되어야 한다 (metric 헤더는 한 번)."""
+    api = _watch("Z1", "api.example.com", [_rec("blue", 1, "10.0.0.1")])
+    web = _watch("Z1", "web.example.com", [_rec("a", 1, "10.1.0.1")])
+    for _ in range(1000):
+        api.stats.record_hit("blue", 0.01)
+    web.stats.record_error()
+
+    console = Console(record=True, width=160)
+    console.print(
+        render_multi_dashboard([(w.record_name, w.records_ref, w.stats) for w in (api, web)])
+    )
+    text = console.export_text()
+    metrics = render_multi_watch_metrics(
+        [(w.record_name, w.records_ref[0], w.stats) for w in (api, web)]
+    )
+
+    assert "api.example.com" in text and "web.example.com" in text
+    assert "Converged: 1/2" in text
+    assert metrics.count("# TYPE dnsmon_requests_total counter") == 1
+    assert 'dnsmon_requests_total{record="api.example.com"} 1000' in metrics
+    assert 'dnsmon_errors_total{record="web.example.com"} 1' in metrics
@@ -0,0 +1,255 @@
+"""dns_monitor.propagation 단위 테스트."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from dns_monitor.completion import PropagationTracker, ResolverState
+from dns_monitor.propagation import (
+    PropagationConfig,
+    PropagationProber,
+    load_resolvers,
+    next_probe_delay,
+    wait_for_propagation,
+)
+from dns_monitor.resolver import RCODE_NO_RESPONSE
+from dns_monitor.stats import PropagationStats
+
+# ---------------------------------------------------------------------------
+# load_resolvers
+# ---------------------------------------------------------------------------
+
+
+def test_load_resolvers_parses_labels_and_comments(tmp_path):
+    """라벨/주석/중복을 처리하여 리졸버 목록을 읽어야 한다."""
+    path = tmp_path / "resolvers.txt"
+    path.write_text(
+        "# 공용 리졸버\n8.8.8.8 Google Public DNS\n1.1.1.1,Cloudflare\n\n9.9.9.9  # Quad9\n8.8.8.8\n",
+        encoding="utf-8",
+    )
+
+    assert load_resolvers(path) == [
+        ("8.8.8.8", "Google Public DNS"),
+        ("1.1.1.1", "Cloudflare"),
+        ("9.9.9.9", "9.9.9.9"),
+    ]
+
+
+def test_load_resolvers_rejects_invalid_ip(tmp_path):
+    """IP 형식이 잘못되면 줄 번호와 함께 ValueError가 발생해야 한다."""
+    path = tmp_path / "resolvers.txt"
+    path.write_text("8.8.8.8\ndns.google\n", encoding="utf-8")
+    with pytest.raises(ValueError, match=":2: 잘못된 리졸버 IP"):
+        load_resolvers(path)
+
+
+def test_load_resolvers_rejects_duplicate_label(tmp_path):
+    """다른 IP에 같은 라벨을 쓰면 줄 번호와 함께 ValueError가 발생해야 한다."""
+    path = tmp_path / "resolvers.txt"
+    path.write_text("8.8.8.8 Google\n1.1.1.1\n8.8.4.4 Google\n", encoding="utf-8")
+    with pytest.raises(ValueError, match=":3: 중복된 리졸버 라벨입니다: Google"):
+        load_resolvers(path)
+
+
+def test_load_resolvers_rejects_empty_file(tmp_path):
+    """리졸버가 없으면 ValueError가 발생해야 한다."""
+    path = tmp_path / "resolvers.txt"
+    path.write_text("# empty\n", encoding="utf-8")
+    with pytest.raises(ValueError, match="리졸버가 없습니다"):
+        load_resolvers(path)
+
+
+# ---------------------------------------------------------------------------
+# PropagationProber: 리졸버별 독립 스케줄
+# ---------------------------------------------------------------------------
+
+
+class _FakeResolver:
+    """slow 리졸버만 응답이 느린 가짜 PropagationResolver."""
+
+    def __init__(
+        self,
+        slow_ip: str | None = None,
+        delay: float = 0.0,
+        ttl: int | None = None,
+        value: str = "10.0.0.1",
+        dead_ip: str | None = None,
+        empty_rcodes: dict[str, int] | None = None,
+    ):
+        self._slow_ip = slow_ip
+        self._delay = delay
+        self._ttl = ttl
+        self._value = value
+        self._dead_ip = dead_ip
+        # 리졸버 IP → 값 없이 돌려줄 RCODE
+        self._empty_rcodes = empty_rcodes or {}
+        self.queries = 0
+
+    async def query_async(self, client, resolver_ip, timeout=5.0):
+        self.queries += 1
+        if resolver_ip == self._slow_ip:
+            await asyncio.sleep(self._delay)
+        if resolver_ip == self._dead_ip:
+            return [], None, RCODE_NO_RESPONSE
+        if resolver_ip in self._empty_rcodes:
+            return [], None, self._empty_rcodes[resolver_ip]
+        return [self._value], self._ttl, 0
+
+
+def _run_prober(prober: PropagationProber, seconds: float) -> None:
+    async def scenario():
+        task = asyncio.create_task(prober.run())
+        await asyncio.sleep(seconds)
+        prober.stop()
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+    asyncio.run(scenario())
+
+
+def test_slow_resolver_does_not_delay_others():
+    """느린 리졸버가 있어도 다른 리졸버는 TPS대로 질의되어야 한다."""
+    config = PropagationConfig(
+        record_name="api.example.com",
+        resolvers=[("192.0.2.1", "fast"), ("192.0.2.2", "slow")],
+        tps=20,
+    )
+    stats = PropagationStats()
+    prober = PropagationProber(config, stats, _FakeResolver("192.0.2.2", delay=10.0))
+
+    _run_prober(prober, 0.5)
+    per_resolver = stats.get_snapshot().resolver_distribution
+    assert per_resolver["fast"]["10.0.0.1"] >= 5
+    assert "slow" not in per_resolver
+
+
+# ---------------------------------------------------------------------------
+# TTL 기반 스케줄
+# ---------------------------------------------------------------------------
+
+
+def test_next_probe_delay_waits_for_ttl_expiry():
+    """TTL 만료 직후로 다음 질의를 미루고, 최소/최대 간격으로 제한해야 한다."""
+    assert next_probe_delay(None, 0.5) == 0.5
+    assert next_probe_delay(0, 0.5) == 1.0
+    assert next_probe_delay(10, 0.5) == 11.0
+    assert next_probe_delay(3600, 0.5, max_interval=30.0) == 30.0
+
+
+def test_ttl_aware_prober_skips_queries_while_cached():
+    """캐시 TTL이 남아 있는 동안에는 질의하지 않고 생략 수를 기록해야 한다."""
+    config = PropagationConfig(
+        record_name="api.example.com", resolvers=[("192.0.2.1", "a")], tps=20, max_interval=5.0
+    )
+    stats = PropagationStats()
+    resolver = _FakeResolver(ttl=60)
+    prober = PropagationProber(config, stats, resolver)
+
+    _run_prober(prober, 0.3)
+    snapshot = stats.get_snapshot()
+
+    assert resolver.queries == 1
+    assert snapshot.probes_sent == 1
+    assert snapshot.resolver_ttl == {"a": 60}
+    # 5초(max_interval) 동안 20 TPS로 보냈을 100건 중 첫 질의를 제외한 99건
+    assert snapshot.queries_saved == 99
+
+
+def test_fixed_rate_prober_ignores_ttl():
+    """ttl_aware=False면 TTL과 무관하게 TPS 간격으로 질의해야 한다."""
+    config = PropagationConfig(
+        record_name="api.example.com", resolvers=[("192.0.2.1", "a")], tps=20, ttl_aware=False
+    )
+    stats = PropagationStats()
+    resolver = _FakeResolver(ttl=60)
+
+    _run_prober(PropagationProber(config, stats, resolver), 0.3)
+
+    assert resolver.queries >= 4
+    assert stats.get_snapshot().queries_saved == 0
+
+
+def test_config_requires_resolvers():
+    """리졸버 목록이 비어 있으면 ValueError가 발생해야 한다."""
+    with pytest.raises(ValueError, match="resolver"):
+        PropagationConfig(record_name="api.example.com", resolvers=[])
+
+
+def test_config_rejects_duplicate_labels():
+    """리졸버 라벨이 겹치면 리졸버별 통계가 합쳐지므로 ValueError가 발생해야 한다."""
+    with pytest.raises(ValueError, match="unique"):
+        PropagationConfig(
+            record_name="api.example.com",
+            resolvers=[("8.8.8.8", "Google"), ("8.8.4.4", "Google")],
+        )
+
+
+# ---------------------------------------------------------------------------
+# wait_for_propagation
+# ---------------------------------------------------------------------------
+
+
+def test_wait_for_propagation_returns_when_all_resolvers_new():
+    """모든 리졸버가 NEW가 되면 완료 시점을 반환해야 한다."""
+    tracker = PropagationTracker(["10.0.0.2"], ["a", "b"], confirm=1)
+    stats = PropagationStats(tracker)
+
+    async def scenario():
+        waiter = asyncio.create_task(wait_for_propagation(stats, check_interval=0.01))
+        stats.record_answer("a", ["10.0.0.2"])
+        await asyncio.sleep(0.05)
+        assert not waiter.done()
+        stats.record_answer("b", ["10.0.0.2"])
+        return await asyncio.wait_for(waiter, 1.0)
+
+    assert asyncio.run(scenario()) >= 0
+
+
+def test_wait_for_propagation_skips_resolver_that_never_answers():
+    """응답하지 않는 리졸버가 있어도 나머지가 전파되면 완료되어야 한다."""
+    config = PropagationConfig(
+        record_name="api.example.com",
+        resolvers=[("192.0.2.1", "a"), ("192.0.2.2", "dead")],
+        tps=50,
+        ttl_aware=False,
+    )
+    tracker = PropagationTracker(["10.0.0.2"], ["a", "dead"], confirm=2, unreachable_after=3)
+    stats = PropagationStats(tracker)
+    prober = PropagationProber(config, stats, _FakeResolver(value="10.0.0.2", dead_ip="192.0.2.2"))
+
+    async def scenario():
+        task = asyncio.create_task(prober.run())
+        try:
+            return await asyncio.wait_for(wait_for_propagation(stats, check_interval=0.01), 2.0)
+        finally:
+            prober.stop()
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+    assert asyncio.run(scenario()) >= 0
+    progress = stats.get_snapshot().resolver_progress
+    assert progress["dead"].state is ResolverState.UNREACHABLE
+    assert progress["a"].state is ResolverState.NEW
+
+
+def test_prober_treats_empty_and_nxdomain_answers_as_not_yet_new():
+    """NOERROR 빈 응답 / NXDOMAIN은 OLD, SERVFAIL은 에러로만 세고 UNREACHABLE로 보지 않는다."""
+    config = PropagationConfig(
+        record_name="api.example.com",
+        resolvers=[("192.0.2.1", "empty"), ("192.0.2.2", "nx"), ("192.0.2.3", "fail")],
+        tps=50,
+        ttl_aware=False,
+    )
+    tracker = PropagationTracker(["10.0.0.2"], ["empty", "nx", "fail"], unreachable_after=3)
+    stats = PropagationStats(tracker)
+    resolver = _FakeResolver(empty_rcodes={"192.0.2.1": 0, "192.0.2.2": 3, "192.0.2.3": 2})
+    _run_prober(PropagationProber(config, stats, resolver), 0.2)
+
+    snapshot = stats.get_snapshot()
+    progress = snapshot.resolver_progress
+    assert progress["empty"].state is ResolverState.OLD
+    assert progress["nx"].state is ResolverState.OLD
+    assert progress["fail"].state is ResolverState.PENDING
+    assert snapshot.errors > 0
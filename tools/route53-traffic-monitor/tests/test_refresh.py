@@ -0,0 +1,126 @@
+"""dns_monitor.refresh 단위 테스트."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+from dns_monitor.aws import WeightedRecord
+from dns_monitor.config import MonitorConfig
+from dns_monitor.refresh import Route53Refresher, diff_records
+from dns_monitor.resolver import AliasResolution, AliasTarget
+from dns_monitor.sender import TrafficSender
+from dns_monitor.stats import Stats
+
+
+def _rec(sid: str, weight: int, *values: str, record_type: str = "A") -> WeightedRecord:
+    return WeightedRecord(
+        set_identifier=sid, weight=weight, record_type=record_type, values=list(values)
+    )
+
+
+def _make_refresher(records: list[WeightedRecord], alias_resolution=None):
+    config = MonitorConfig(
+        endpoint="https://api.example.com",
+        hosted_zone_id="Z001",
+        record_name="api.example.com",
+    )
+    stats = Stats()
+    sender = TrafficSender(config, stats, records, MagicMock(), alias_resolution)
+    records_ref = [records]
+    return Route53Refresher(config, sender, stats, records_ref), sender, stats, records_ref
+
+
+# ---------------------------------------------------------------------------
+# diff_records
+# ---------------------------------------------------------------------------
+
+
+def test_diff_records_no_change():
+    """동일한 레코드 목록은 변경 없음으로 판정해야 한다 (값 순서 무관)."""
+    old = [_rec("blue", 100, "10.0.0.1", "10.0.0.2")]
+    new = [_rec("blue", 100, "10.0.0.2", "10.0.0.1")]
+    assert diff_records(old, new).changed is False
+
+
+def test_diff_records_detects_weight_and_value_changes():
+    """가중치 변경, 값 변경, 추가, 삭제를 구분해야 한다."""
+    old = [_rec("blue", 100, "10.0.0.1"), _rec("green", 0, "10.0.0.2"), _rec("old", 1, "10.0.0.9")]
+    new = [
+        _rec("blue", 50, "10.0.0.1"),
+        _rec("green", 50, "10.0.0.3"),
+        _rec("canary", 1, "10.0.0.4"),
+    ]
+
+    diff = diff_records(old, new)
+
+    assert [(o.weight, n.weight) for o, n in diff.weight_changed] == [(100, 50), (0, 50)]
+    assert [n.set_identifier for _, n in diff.values_changed] == ["green"]
+    assert [r.set_identifier for r in diff.added] == ["canary"]
+    assert [r.set_identifier for r in diff.removed] == ["old"]
+    assert diff.remapped_identifiers == {"green", "canary"}
+    assert "blue: weight 100 → 50" in diff.describe()
+
+
+# ---------------------------------------------------------------------------
+# Route53Refresher.refresh_once
+# ---------------------------------------------------------------------------
+
+
+@patch("dns_monitor.refresh.get_weighted_records")
+def test_refresh_once_weight_change_records_event_without_remapping(mock_get):
+    """가중치만 바뀌면 이벤트를 기록하고 매핑은 그대로 유지해야 한다."""
+    old = [_rec("blue", 100, "10.0.0.1"), _rec("green", 0, "10.0.0.2")]
+    new = [_rec("blue", 50, "10.0.0.1"), _rec("green", 50, "10.0.0.2")]
+    mock_get.return_value = new
+    refresher, sender, stats, records_ref = _make_refresher(old)
+
+    diff = asyncio.run(refresher.refresh_once())
+
+    assert diff is not None and diff.changed
+    assert records_ref[0] is new
+    assert sender._identify(["10.0.0.2"]) == "green"
+    events = stats.get_snapshot().events
+    assert len(events) == 1
+    assert events[0].previous_weights == {"blue": 100, "green": 0}
+    assert events[0].weights == {"blue": 50, "green": 50}
+    assert events[0].last_unchanged_at <= events[0].detected_at
+
+
+@patch("dns_monitor.refresh.get_weighted_records")
+def test_refresh_once_no_change_records_nothing(mock_get):
+    """변경이 없으면 이벤트를 기록하지 않아야 한다."""
+    records = [_rec("blue", 100, "10.0.0.1")]
+    mock_get.return_value = [_rec("blue", 100, "10.0.0.1")]
+    refresher, _, stats, records_ref = _make_refresher(records)
+
+    assert asyncio.run(refresher.refresh_once()) is None
+    assert stats.get_snapshot().events == []
+    assert records_ref[0] is records
+
+
+@patch("dns_monitor.sender.update_alias_targets")
+@patch("dns_monitor.refresh.get_weighted_records")
+def test_refresh_once_reresolves_only_changed_alias(mock_get, mock_update):
+    """DNS 이름이 바뀐 ALIAS 대상만 다시 해석해야 한다."""
+    old = [
+        _rec("blue", 50, "blue-alb.elb.amazonaws.com", record_type="ALIAS"),
+        _rec("green", 50, "green-alb.elb.amazonaws.com", record_type="ALIAS"),
+    ]
+    new = [
+        _rec("blue", 50, "blue-alb.elb.amazonaws.com", record_type="ALIAS"),
+        _rec("green", 50, "green-v2-alb.elb.amazonaws.com", record_type="ALIAS"),
+    ]
+    alias = AliasResolution(
+        targets={"blue": AliasTarget("blue", "blue-alb.elb.amazonaws.com", ["10.1.0.1"])}
+    )
+    mock_get.return_value = new
+    mock_update.return_value = AliasResolution()
+    refresher, _, _, _ = _make_refresher(old, alias)
+
+    asyncio.run(refresher.refresh_once())
+
+    mock_update.assert_called_once()
+    _, records_arg, changed_arg = mock_update.call_args.args
+    assert records_arg is new
+    assert changed_arg == {"green"}
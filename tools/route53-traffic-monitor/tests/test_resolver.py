@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import time
 from unittest.mock import MagicMock, patch
 
 import dns.exception
@@ -9,14 +10,22 @@ import dns.resolver
 import pytest
 
 from dns_monitor.aws import WeightedRecord
-from dns_monitor.resolver import WeightedResolver, resolve_alias_targets
+from dns_monitor.resolver import (
+    AliasResolution,
+    AliasTarget,
+    WeightedResolver,
+    next_alias_expiry,
+    refresh_alias_targets,
+    resolve_alias_targets,
+    resolve_nameserver_ips,
+)
 
 # ---------------------------------------------------------------------------
 # WeightedResolver 생성
 # ---------------------------------------------------------------------------
 
 
-@patch("dns_monitor.resolver.dns.resolver.Resolver")
+@patch("dns.resolver.Resolver")
 def test_weighted_resolver_init_raises_when_no_ns_resolved(mock_resolver_cls):
     """모든 NS가 리졸브 실패이면 ValueError가 발생해야 한다."""
     mock_resolver = MagicMock()
@@ -31,7 +40,7 @@ def test_weighted_resolver_init_raises_when_no_ns_resolved(mock_resolver_cls):
         )
 
 
-@patch("dns_monitor.resolver.dns.resolver.Resolver")
+@patch("dns.resolver.Resolver")
 def test_weighted_resolver_init_skips_failed_ns(mock_resolver_cls):
     """일부 NS가 실패해도 성공한 NS가 있으면 초기화가 완료돼야 한다."""
     mock_resolver = MagicMock()
@@ -56,14 +65,36 @@ def test_weighted_resolver_init_skips_failed_ns(mock_resolver_cls):
     assert "10.0.0.53" in resolver._ns_ips
 
 
+@patch("dns.resolver.Resolver")
+def test_resolve_nameserver_ips_keeps_nameserver_order(mock_resolver_cls):
+    """NS를 동시에 해석해도 결과 IP는 NS 입력 순서를 유지한다."""
+    addresses = {"ns1.example.com": "10.0.0.1", "ns2.example.com": "10.0.0.2"}
+
+    def resolve_side_effect(ns, rdtype):
+        if ns == "ns1.example.com":
+            time.sleep(0.05)  # 먼저 요청한 NS의 응답이 늦게 도착
+        rdata = MagicMock()
+        rdata.__str__ = lambda self: addresses[ns]
+        answers = MagicMock()
+        answers.__iter__ = lambda self: iter([rdata])
+        return answers
+
+    mock_resolver_cls.return_value.resolve.side_effect = resolve_side_effect
+
+    assert resolve_nameserver_ips(["ns1.example.com", "ns2.example.com"]) == [
+        "10.0.0.1",
+        "10.0.0.2",
+    ]
+
+
 # ---------------------------------------------------------------------------
 # WeightedResolver.resolve_once
 # ---------------------------------------------------------------------------
 
 
-@patch("dns_monitor.resolver.dns.resolver.Resolver")
-@patch("dns_monitor.resolver.dns.query.udp")
-@patch("dns_monitor.resolver.dns.message.make_query")
+@patch("dns.resolver.Resolver")
+@patch("dns.query.udp")
+@patch("dns.message.make_query")
 def test_resolve_once_returns_ips_on_success(mock_make_query, mock_udp, mock_resolver_cls):
     """정상 응답이면 IP 리스트를 반환해야 한다."""
     # NS 리졸브 성공 셋업
@@ -94,9 +125,9 @@ def test_resolve_once_returns_ips_on_success(mock_make_query, mock_udp, mock_res
     assert "192.0.2.1" in ips
 
 
-@patch("dns_monitor.resolver.dns.resolver.Resolver")
-@patch("dns_monitor.resolver.dns.query.udp")
-@patch("dns_monitor.resolver.dns.message.make_query")
+@patch("dns.resolver.Resolver")
+@patch("dns.query.udp")
+@patch("dns.message.make_query")
 def test_resolve_once_returns_empty_on_dns_exception(mock_make_query, mock_udp, mock_resolver_cls):
     """DNSException 발생 시 빈 리스트를 반환해야 한다."""
     mock_resolver = MagicMock()
@@ -119,9 +150,9 @@ def test_resolve_once_returns_empty_on_dns_exception(mock_make_query, mock_udp,
     assert ips == []
 
 
-@patch("dns_monitor.resolver.dns.resolver.Resolver")
-@patch("dns_monitor.resolver.dns.query.udp")
-@patch("dns_monitor.resolver.dns.message.make_query")
+@patch("dns.resolver.Resolver")
+@patch("dns.query.udp")
+@patch("dns.message.make_query")
 def test_resolve_once_returns_empty_on_oserror(mock_make_query, mock_udp, mock_resolver_cls):
     """OSError(네트워크 오류) 발생 시 빈 리스트를 반환해야 한다."""
     mock_resolver = MagicMock()
@@ -149,7 +180,7 @@ def test_resolve_once_returns_empty_on_oserror(mock_make_query, mock_udp, mock_r
 # ---------------------------------------------------------------------------
 
 
-@patch("dns_monitor.resolver.dns.resolver.Resolver")
+@patch("dns.resolver.Resolver")
 def test_resolve_alias_targets_dns_exception_adds_warning(mock_resolver_cls):
     """ALIAS 대상 리졸브 실패 시 warnings 목록에 항목이 추가돼야 한다."""
     mock_resolver = MagicMock()
@@ -171,7 +202,7 @@ def test_resolve_alias_targets_dns_exception_adds_warning(mock_resolver_cls):
     assert any("blue" in w for w in result.warnings)
 
 
-@patch("dns_monitor.resolver.dns.resolver.Resolver")
+@patch("dns.resolver.Resolver")
 def test_resolve_alias_targets_skips_non_alias_records(mock_resolver_cls):
     """ALIAS 타입이 아닌 레코드는 리졸브 시도를 건너뛰어야 한다."""
     mock_resolver = MagicMock()
@@ -190,3 +221,127 @@ def test_resolve_alias_targets_skips_non_alias_records(mock_resolver_cls):
 
     mock_resolver.resolve.assert_not_called()
     assert result.targets == {}
+
+
+@patch("dns.resolver.Resolver")
+def test_next_nameserver_round_robin(mock_resolver_cls):
+    """권한 NS는 라운드로빈으로 균등하게 선택돼야 한다."""
+    mock_resolver = MagicMock()
+
+    def resolve_side_effect(ns, rdtype):
+        answers = MagicMock()
+        rdata = MagicMock()
+        ip = {"ns1.example.com": "10.0.0.1", "ns2.example.com": "10.0.0.2"}[ns]
+        rdata.__str__ = lambda self: ip
+        answers.__iter__ = lambda self: iter([rdata])
+        return answers
+
+    mock_resolver.resolve.side_effect = resolve_side_effect
+    mock_resolver_cls.return_value = mock_resolver
+
+    resolver = WeightedResolver(
+        nameservers=["ns1.example.com", "ns2.example.com"],
+        record_name="api.example.com",
+        record_type="A",
+    )
+    picks = [resolver.next_nameserver() for _ in range(6)]
+
+    assert picks.count("10.0.0.1") == 3
+    assert picks.count("10.0.0.2") == 3
+    assert picks[0] != picks[1]
+
+
+# ---------------------------------------------------------------------------
+# ALIAS TTL 캐시 / 백그라운드 재해석
+# ---------------------------------------------------------------------------
+
+
+def _answers(ips: list[str], ttl: int) -> MagicMock:
+    rdatas = []
+    for ip in ips:
+        rdata = MagicMock()
+        rdata.__str__ = lambda self, ip=ip: ip
+        rdatas.append(rdata)
+    answers = MagicMock()
+    answers.__iter__ = lambda self: iter(rdatas)
+    answers.rrset.ttl = ttl
+    return answers
+
+
+@patch("dns.resolver.Resolver")
+def test_resolve_alias_targets_records_ttl_expiry(mock_resolver_cls):
+    """ALIAS 대상은 응답 TTL 기준 만료 시각을 가져야 한다."""
+    mock_resolver = MagicMock()
+    mock_resolver.resolve.side_effect = lambda name, rdtype: {
+        "blue-alb.elb.amazonaws.com": _answers(["10.1.0.1"], 60),
+        "green-alb.elb.amazonaws.com": _answers(["10.2.0.1"], 30),
+    }[name]
+    mock_resolver_cls.return_value = mock_resolver
+
+    records = [
+        WeightedRecord("blue", 50, "ALIAS", ["blue-alb.elb.amazonaws.com"]),
+        WeightedRecord("green", 50, "ALIAS", ["green-alb.elb.amazonaws.com"]),
+    ]
+    result = resolve_alias_targets(records)
+
+    assert result.ip_map == {"10.1.0.1": "blue", "10.2.0.1": "green"}
+    blue, green = result.targets["blue"], result.targets["green"]
+    assert blue.expires_at - green.expires_at == pytest.approx(30, abs=1)
+    assert next_alias_expiry(result) == green.expires_at
+
+
+@patch("dns.resolver.Resolver")
+def test_refresh_alias_targets_merges_rotated_ips(mock_resolver_cls):
+    """만료된 대상만 재해석하고, 교체된 IP는 기존 IP와 함께 매핑돼야 한다."""
+    mock_resolver = MagicMock()
+    mock_resolver_cls.return_value = mock_resolver
+    previous = AliasResolution(
+        targets={
+            "blue": AliasTarget(
+                "blue",
+                "blue-alb.elb.amazonaws.com",
+                ["10.1.0.1"],
+                expires_at=100.0,
+                ip_last_seen={"10.1.0.1": 50.0},
+                set_last_seen={frozenset(["10.1.0.1"]): 50.0},
+            ),
+            "green": AliasTarget("green", "green-alb.elb.amazonaws.com", ["10.2.0.1"], 500.0),
+        }
+    )
+    mock_resolver.resolve.return_value = _answers(["10.1.0.9"], 60)
+
+    result = refresh_alias_targets(previous, now=120.0)
+
+    mock_resolver.resolve.assert_called_once_with("blue-alb.elb.amazonaws.com", "A")
+    assert result.ip_map["10.1.0.1"] == "blue"
+    assert result.ip_map["10.1.0.9"] == "blue"
+    assert result.ip_set_map[frozenset(["10.1.0.9"])] == "blue"
+    assert result.targets["blue"].expires_at == pytest.approx(180.0)
+    assert result.targets["green"] is previous.targets["green"]
+
+
+@patch("dns.resolver.Resolver")
+def test_refresh_alias_targets_keeps_ips_on_failure_and_drops_stale(mock_resolver_cls):
+    """재해석 실패 시 기존 IP를 유지하고, retention이 지난 IP는 제거돼야 한다."""
+    mock_resolver = MagicMock()
+    mock_resolver_cls.return_value = mock_resolver
+    previous = AliasResolution(
+        targets={
+            "blue": AliasTarget(
+                "blue",
+                "blue-alb.elb.amazonaws.com",
+                ["10.1.0.1"],
+                expires_at=0.0,
+                ip_last_seen={"10.1.0.1": 0.0},
+            ),
+        }
+    )
+
+    mock_resolver.resolve.side_effect = dns.resolver.NXDOMAIN
+    failed = refresh_alias_targets(previous, now=10.0)
+    assert failed.ip_map == {"10.1.0.1": "blue"}
+
+    mock_resolver.resolve.side_effect = None
+    mock_resolver.resolve.return_value = _answers(["10.1.0.2"], 60)
+    rotated = refresh_alias_targets(previous, now=10_000.0, retention=900.0)
+    assert rotated.ip_map == {"10.1.0.2": "blue"}
@@ -0,0 +1,202 @@
+"""dns_monitor.samplelog 단위 테스트."""
+
+from __future__ import annotations
+
+import json
+import struct
+
+import pytest
+
+from dns_monitor.aws import WeightedRecord
+from dns_monitor.samplelog import (
+    KIND_ERROR,
+    KIND_HIT,
+    KIND_META,
+    MAGIC,
+    META,
+    SAMPLE,
+    SAMPLE_V1,
+    SampleLogHeader,
+    SampleLogWriter,
+    iter_samples,
+    read_header,
+    records_at,
+    replay,
+)
+from dns_monitor.stats import RecordChangeEvent, Stats
+
+RECORDS = [
+    WeightedRecord(set_identifier="blue", weight=100, record_type="A", values=["10.0.0.1"]),
+    WeightedRecord(set_identifier="green", weight=0, record_type="A", values=["10.0.0.2"]),
+]
+
+
+def _write_log(path, stats: Stats) -> None:
+    """start_time=0 기준으로 고정 시각 샘플을 기록한다."""
+    header = SampleLogHeader(
+        record_name="api.example.com", start_wall_time=stats.start_wall_time, records=RECORDS
+    )
+    with SampleLogWriter(path, header) as writer:
+        stats.set_sample_log(writer)
+        for i in range(20):
+            ns = "205.251.192.1" if i % 2 else "205.251.193.1"
+            stats.record_hit(
+                "blue", 0.01, nameserver=ns, dns_latency=0.005, now=i * 0.5, http_latency=0.03
+            )
+        stats.record_error(nameserver="205.251.192.1", rcode=2, now=10.0)
+        stats.record_event(
+            RecordChangeEvent(
+                detected_at=10.5,
+                wall_time=stats.start_wall_time + 10.5,
+                last_unchanged_at=8.0,
+                weights={"blue": 50, "green": 50},
+                previous_weights={"blue": 100, "green": 0},
+                changes=["blue: weight 100 → 50"],
+            )
+        )
+        for i in range(10):
+            stats.record_hit(
+                "green", None, nameserver="205.251.192.1", now=11.0 + i * 0.1, http_failure="tls"
+            )
+        stats.set_sample_log(None)
+
+
+# ---------------------------------------------------------------------------
+# 기록 / 읽기
+# ---------------------------------------------------------------------------
+
+
+def test_samples_are_fixed_width_and_roundtrip(tmp_path):
+    """샘플은 고정 폭으로 기록되고 읽을 때 이름/값이 복원되어야 한다."""
+    path = tmp_path / "samples.bin"
+    _write_log(path, Stats(start_time=0.0))
+
+    items = list(iter_samples(path))
+    samples = [i for i in items if not isinstance(i, RecordChangeEvent)]
+    events = [i for i in items if isinstance(i, RecordChangeEvent)]
+
+    assert SAMPLE.size == 28
+    assert len(samples) == 31
+    assert samples[0].kind == KIND_HIT
+    assert samples[0].set_identifier == "blue"
+    assert samples[0].nameserver == "205.251.193.1"
+    assert samples[0].latency == pytest.approx(0.01)
+    assert samples[0].http_latency == pytest.approx(0.03)
+    error = samples[20]
+    assert (error.kind, error.rcode, error.set_identifier) == (KIND_ERROR, 2, None)
+    assert samples[-1].latency is None
+    assert samples[-1].http_latency is None
+    assert samples[-1].http_failure == "tls"
+    assert samples[0].http_failure is None
+    assert events[0].detected_at == pytest.approx(10.5)
+    assert events[0].weights == {"blue": 50, "green": 50}
+
+
+def test_truncated_tail_is_ignored(tmp_path):
+    """비정상 종료로 잘린 마지막 프레임은 무시해야 한다."""
+    path = tmp_path / "samples.bin"
+    _write_log(path, Stats(start_time=0.0))
+    data = path.read_bytes()
+    path.write_bytes(data[:-5])
+
+    samples = [i for i in iter_samples(path) if not isinstance(i, RecordChangeEvent)]
+    assert len(samples) == 30
+
+
+def test_reads_version_1_log(tmp_path):
+    """http_latency가 없는 버전 1 로그도 읽을 수 있어야 한다."""
+    path = tmp_path / "v1.bin"
+    header = json.dumps(
+        {"record_name": "api.example.com", "start_wall_time": 0.0, "records": [], "version": 1}
+    ).encode()
+    meta = json.dumps({"type": "sid", "index": 0, "value": "blue"}).encode()
+    path.write_bytes(
+        MAGIC
+        + struct.pack("<I", len(header))
+        + header
+        + META.pack(KIND_META, len(meta))
+        + meta
+        + SAMPLE_V1.pack(KIND_HIT, 0, 0xFFFF, 0, 0, 1.5, 0.01, 0.005)
+    )
+
+    (sample,) = list(iter_samples(path))
+
+    assert (sample.set_identifier, sample.t, sample.http_latency) == ("blue", 1.5, None)
+    assert sample.http_failure is None
+    assert sample.dns_latency == pytest.approx(0.005)
+
+
+def test_writer_does_not_overwrite_existing_log(tmp_path):
+    """기존 로그는 overwrite=True일 때만 덮어써야 한다."""
+    path = tmp_path / "samples.bin"
+    _write_log(path, Stats(start_time=0.0))
+    original = path.read_bytes()
+    header = SampleLogHeader(record_name="other.example.com", start_wall_time=0.0)
+
+    with pytest.raises(FileExistsError):
+        SampleLogWriter(path, header)
+    assert path.read_bytes() == original
+
+    SampleLogWriter(path, header, overwrite=True).close()
+    assert read_header(path).record_name == "other.example.com"
+
+
+def test_rejects_non_log_file(tmp_path):
+    """샘플 로그가 아닌 파일은 ValueError가 발생해야 한다."""
+    path = tmp_path / "other.bin"
+    path.write_bytes(b"not a sample log")
+    with pytest.raises(ValueError, match="샘플 로그 파일이 아닙니다"):
+        list(iter_samples(path))
+
+
+# ---------------------------------------------------------------------------
+# replay
+# ---------------------------------------------------------------------------
+
+
+def test_replay_rebuilds_stats(tmp_path):
+    """재생한 Stats의 스냅샷이 원본과 같아야 한다."""
+    path = tmp_path / "samples.bin"
+    original = Stats(start_time=0.0)
+    _write_log(path, original)
+
+    header, stats, last = replay(path)
+    snapshot = stats.get_snapshot(now=last)
+    expected = original.get_snapshot(now=last)
+
+    assert header.record_name == "api.example.com"
+    assert header.records == RECORDS
+    assert last == pytest.approx(11.9)
+    assert snapshot.distribution == expected.distribution == {"blue": 20, "green": 10}
+    assert snapshot.errors == 1
+    assert snapshot.nameserver_distribution == expected.nameserver_distribution
+    assert snapshot.nameserver_errors == {"205.251.192.1": 1}
+    assert snapshot.http_failures == expected.http_failures == {"green": {"tls": 10}}
+    assert stats.get_time_buckets() == original.get_time_buckets()
+    assert set(stats.get_http_latency_histograms()) == {"blue"}
+    assert len(snapshot.events) == 1
+
+
+def test_replay_until_stops_at_elapsed_second(tmp_path):
+    """until 이후의 샘플과 이벤트는 재생하지 않아야 한다."""
+    path = tmp_path / "samples.bin"
+    _write_log(path, Stats(start_time=0.0))
+
+    _, stats, last = replay(path, until=5.0)
+    snapshot = stats.get_snapshot(now=5.0)
+
+    assert last == pytest.approx(5.0)
+    assert snapshot.distribution == {"blue": 11}
+    assert snapshot.events == []
+
+
+def test_records_at_applies_event_weights(tmp_path):
+    """변경 이벤트의 가중치를 초기 레코드에 적용해야 한다."""
+    path = tmp_path / "samples.bin"
+    _write_log(path, Stats(start_time=0.0))
+    header, stats, _ = replay(path)
+
+    records = records_at(header, stats.get_snapshot(now=12.0).events)
+
+    assert [(r.set_identifier, r.weight) for r in records] == [("blue", 50), ("green", 50)]
+    assert records[0].values == ["10.0.0.1"]
@@ -2,11 +2,15 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
 
 from dns_monitor.aws import WeightedRecord, build_value_to_identifier_map
 from dns_monitor.config import MonitorConfig
-from dns_monitor.resolver import AliasResolution
+from dns_monitor.httpprobe import FAILURE_TLS, ProbeResult
+from dns_monitor.resolver import RCODE_NO_RESPONSE, AliasResolution, DnsAnswer
 from dns_monitor.sender import TrafficSender
 from dns_monitor.stats import Stats
 
@@ -123,3 +127,51 @@ def test_build_value_to_identifier_map_multiple_records():
 def test_build_value_to_identifier_map_empty_records():
     """빈 레코드 리스트는 빈 매핑을 반환해야 한다."""
     assert build_value_to_identifier_map([]) == {}
+
+
+# ---------------------------------------------------------------------------
+# _probe_once: 권한 NS 태깅
+# ---------------------------------------------------------------------------
+
+
+def test_probe_once_tags_sample_with_nameserver():
+    """probe 결과는 질의한 권한 NS IP와 함께 기록돼야 한다."""
+    records = [
+        WeightedRecord(set_identifier="blue", weight=100, record_type="A", values=["10.0.0.1"]),
+    ]
+    sender = _make_sender(records)
+    sender._resolver.query_from.return_value = DnsAnswer(values=["10.0.0.1"], rcode=0)
+
+    asyncio.run(sender._probe_once(None, "205.251.192.1"))
+    sender._resolver.query_from.return_value = DnsAnswer(values=[], rcode=RCODE_NO_RESPONSE)
+    asyncio.run(sender._probe_once(None, "205.251.193.1"))
+
+    snapshot = sender._stats.get_snapshot()
+    assert snapshot.nameserver_distribution == {"205.251.192.1": {"blue": 1}}
+    assert snapshot.nameserver_errors == {"205.251.193.1": 1}
+    assert "205.251.192.1" in snapshot.latency_by_nameserver
+
+
+def test_probe_once_records_http_latency_separately():
+    """HTTP latency는 DNS latency와 별도로 기록하고, HTTP 실패는 종류별로 집계해야 한다."""
+    records = [
+        WeightedRecord(set_identifier="blue", weight=100, record_type="A", values=["10.0.0.1"]),
+    ]
+    sender = _make_sender(records)
+    sender._resolver.query_from.return_value = DnsAnswer(values=["10.0.0.1"], rcode=0)
+    prober = MagicMock()
+    prober.probe = AsyncMock(
+        side_effect=[ProbeResult(latency=0.25), ProbeResult(failure=FAILURE_TLS)]
+    )
+
+    asyncio.run(sender._probe_once(prober, "205.251.192.1"))
+    asyncio.run(sender._probe_once(prober, "205.251.192.1"))
+
+    prober.probe.assert_awaited_with("10.0.0.1")
+    snapshot = sender._stats.get_snapshot()
+    assert snapshot.distribution == {"blue": 2}
+    assert snapshot.latency_by_identifier["blue"]["total"].count == 2
+    http = snapshot.http_latency_by_identifier["blue"]["total"]
+    assert http.count == 1
+    assert http.p50_ms == pytest.approx(250, rel=0.02)
+    assert snapshot.http_failures == {"blue": {"tls": 1}}
@@ -0,0 +1,114 @@
+"""dns_monitor.startup 단위 테스트."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+import threading
+
+import pytest
+
+from dns_monitor.startup import StartupProfile, run_concurrently
+
+
+class _FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+# ---------------------------------------------------------------------------
+# StartupProfile
+# ---------------------------------------------------------------------------
+
+
+def test_profile_records_phase_offsets_and_durations():
+    """단계 시작 시점은 측정 시작 기준, 소요 시간은 with 블록 실행 시간."""
+    clock = _FakeClock()
+    profile = StartupProfile(clock)
+    clock.now = 100.5
+    with profile.phase("a"):
+        clock.now = 101.0
+    with profile.phase("b"):
+        clock.now = 103.0
+
+    [a, b] = profile.phases
+    assert (a.name, a.start, a.duration) == ("a", 0.5, 0.5)
+    assert (b.name, b.start, b.end) == ("b", 1.0, 3.0)
+    assert profile.elapsed() == 3.0
+
+
+def test_profile_records_phase_even_when_it_raises():
+    """실패한 단계도 기록한다."""
+    profile = StartupProfile()
+    with pytest.raises(RuntimeError), profile.phase("boom"):
+        raise RuntimeError("x")
+    assert [p.name for p in profile.phases] == ["boom"]
+
+
+# ---------------------------------------------------------------------------
+# run_concurrently
+# ---------------------------------------------------------------------------
+
+
+def test_run_concurrently_runs_steps_in_parallel():
+    """모든 단계가 동시에 실행되어야 barrier를 통과한다 (순차 실행이면 타임아웃)."""
+    barrier = threading.Barrier(3, timeout=5)
+
+    def step(value: int):
+        return lambda: (barrier.wait(), value)[1]
+
+    profile = StartupProfile()
+    results = run_concurrently({"a": step(1), "b": step(2), "c": step(3)}, profile)
+
+    assert results == {"a": 1, "b": 2, "c": 3}
+    assert sorted(p.name for p in profile.phases) == ["a", "b", "c"]
+
+
+def test_run_concurrently_raises_first_failure_in_step_order():
+    """모든 단계가 끝난 뒤 steps 순서상 가장 앞선 단계의 예외를 발생시킨다."""
+    finished: list[str] = []
+    second_failed = threading.Event()
+
+    def first():
+        second_failed.wait(5)
+        finished.append("first")
+        raise PermissionError("credentials")
+
+    def second():
+        finished.append("second")
+        second_failed.set()
+        raise LookupError("api")
+
+    def third():
+        finished.append("third")
+        return 3
+
+    with pytest.raises(PermissionError):
+        run_concurrently({"first": first, "second": second, "third": third})
+    assert sorted(finished) == ["first", "second", "third"]
+
+
+def test_run_concurrently_single_step_runs_inline():
+    """단계가 1개면 스레드 없이 호출 스레드에서 실행한다."""
+    results = run_concurrently({"only": threading.current_thread})
+    assert results["only"] is threading.current_thread()
+
+
+# ---------------------------------------------------------------------------
+# 지연 import
+# ---------------------------------------------------------------------------
+
+
+def test_cli_import_does_not_load_boto3_or_dnspython():
+    """CLI 모듈 import 시점에는 boto3 / botocore / dnspython을 불러오지 않는다."""
+    code = (
+        "import sys, dns_monitor.cli; "
+        "print(','.join(m for m in ('boto3', 'botocore', 'dns') if m in sys.modules))"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+    assert out.strip() == ""
@@ -0,0 +1,178 @@
+"""dns_monitor.stats 단위 테스트."""
+
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from dns_monitor.stats import PropagationStats, Stats
+
+
+def _run_threads(target, count: int) -> None:
+    threads = [threading.Thread(target=target) for _ in range(count)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+
+# ---------------------------------------------------------------------------
+# Stats
+# ---------------------------------------------------------------------------
+
+
+def test_stats_merges_shards_from_multiple_threads():
+    """여러 스레드에서 기록한 값이 snapshot에서 모두 합산돼야 한다."""
+    stats = Stats()
+
+    def worker():
+        for i in range(1000):
+            stats.record_hit("blue" if i % 2 else "green", 0.01)
+        stats.record_error()
+
+    _run_threads(worker, 8)
+    snapshot = stats.get_snapshot()
+
+    assert snapshot.total_requests == 8 * 1001
+    assert snapshot.errors == 8
+    assert snapshot.distribution == {"blue": 4000, "green": 4000}
+    assert snapshot.avg_latency_ms is not None
+    assert round(snapshot.avg_latency_ms) == 10
+
+
+def test_stats_empty_snapshot():
+    """기록이 없으면 0 값의 snapshot을 반환해야 한다."""
+    snapshot = Stats().get_snapshot()
+
+    assert snapshot.total_requests == 0
+    assert snapshot.distribution == {}
+    assert snapshot.avg_latency_ms is None
+    assert snapshot.current_tps == 0.0
+
+
+# ---------------------------------------------------------------------------
+# PropagationStats
+# ---------------------------------------------------------------------------
+
+
+def test_propagation_stats_merges_per_resolver_buckets():
+    """리졸버별 분포가 스레드 shard 간에 병합돼야 한다."""
+    stats = PropagationStats()
+
+    def worker():
+        for _ in range(500):
+            stats.record_response("Google", "10.0.0.1", 0.02)
+            stats.record_response("Cloudflare", "10.0.0.2", 0.02)
+
+    _run_threads(worker, 4)
+    snapshot = stats.get_snapshot()
+
+    assert snapshot.total_queries == 4000
+    assert snapshot.overall_distribution == {"10.0.0.1": 2000, "10.0.0.2": 2000}
+    assert snapshot.resolver_distribution == {
+        "Google": {"10.0.0.1": 2000},
+        "Cloudflare": {"10.0.0.2": 2000},
+    }
+
+
+def test_propagation_view_merges_only_changed_resolvers():
+    """증분 snapshot은 전체 snapshot과 같은 내용이고, 바뀐 리졸버만 changed로 표시한다."""
+    stats = PropagationStats()
+    view = stats.view()
+
+    def worker():
+        for _ in range(100):
+            stats.record_answer("Google", ["10.0.0.1"], 0.02, ttl=30)
+            stats.record_answer("Cloudflare", ["10.0.0.2"], 0.02)
+
+    _run_threads(worker, 3)
+    first = view.refresh()
+    full = stats.get_snapshot()
+    assert first.resolver_distribution == full.resolver_distribution
+    assert first.overall_distribution == full.overall_distribution
+    assert first.resolver_ttl == {"Google": 30}
+    assert first.version == full.version > 0
+    assert first.changed_resolvers == {"Google", "Cloudflare"}
+
+    stats.record_answer("Quad9", ["10.0.0.3"])
+    stats.record_answer("Google", ["10.0.0.4"])
+    second = view.refresh()
+    assert second.changed_resolvers == {"Quad9", "Google"}
+    assert second.resolver_distribution == stats.get_snapshot().resolver_distribution
+    assert second.total_queries == 602
+
+    # 기록이 없으면 카운터는 그대로, 바뀐 리졸버 없음
+    third = view.refresh()
+    assert third.changed_resolvers == frozenset()
+    assert third.version == second.version
+    assert third.total_queries == second.total_queries
+
+
+def test_propagation_ttl_is_newest_across_shards():
+    """여러 shard에 TTL이 있으면 가장 최근 응답의 TTL을 써야 한다 (전체 / 증분 동일)."""
+    stats = PropagationStats()
+    view = stats.view()
+    stats.record_answer("Google", ["10.0.0.1"], ttl=30)
+    _run_threads(lambda: stats.record_answer("Google", ["10.0.0.1"], ttl=300), 1)
+    stats.record_answer("Google", ["10.0.0.1"], ttl=60)
+
+    assert stats.get_snapshot().resolver_ttl == {"Google": 60}
+    assert view.refresh().resolver_ttl == {"Google": 60}
+
+
+def test_propagation_view_counts_errors_as_changes():
+    """리졸버와 무관한 에러도 카운터를 다시 병합하게 한다."""
+    stats = PropagationStats()
+    view = stats.view()
+    view.refresh()
+    stats.record_error()
+    snapshot = view.refresh()
+    assert snapshot.errors == 1
+    assert snapshot.changed_resolvers == frozenset()
+
+
+def test_stats_latency_percentiles_per_identifier_and_nameserver():
+    """SetIdentifier별 / 권한 NS별 latency 백분위수가 snapshot에 포함돼야 한다."""
+    stats = Stats()
+    for _ in range(100):
+        stats.record_hit("blue", 0.050, nameserver="205.251.192.1", dns_latency=0.010)
+        stats.record_hit("green", 0.080, nameserver="205.251.193.1", dns_latency=0.030)
+
+    snapshot = stats.get_snapshot()
+
+    assert set(snapshot.latency_by_identifier) == {"blue", "green"}
+    assert snapshot.latency_by_identifier["blue"]["10s"].p95_ms == pytest.approx(50, rel=0.02)
+    assert snapshot.latency_by_nameserver["205.251.193.1"]["total"].count == 100
+    assert snapshot.latency_by_nameserver["205.251.192.1"]["1m"].p50_ms == pytest.approx(
+        10, rel=0.02
+    )
+
+
+def test_stats_nameserver_distribution_matrix():
+    """권한 NS별 × SetIdentifier별 분포와 NS별 에러가 집계돼야 한다."""
+    stats = Stats()
+    stats.record_hit("blue", nameserver="205.251.192.1")
+    stats.record_hit("blue", nameserver="205.251.192.1")
+    stats.record_hit("green", nameserver="205.251.193.1")
+    stats.record_error(nameserver="205.251.193.1")
+
+    snapshot = stats.get_snapshot()
+
+    assert snapshot.nameserver_distribution == {
+        "205.251.192.1": {"blue": 2},
+        "205.251.193.1": {"green": 1},
+    }
+    assert snapshot.nameserver_errors == {"205.251.193.1": 1}
+
+
+def test_stats_time_buckets_group_by_elapsed_second():
+    """초별 버킷은 경과 초 기준으로 SetIdentifier 분포를 집계해야 한다."""
+    stats = Stats()
+    stats.record_hit("blue")
+    stats.record_hit("green")
+
+    buckets = stats.get_time_buckets()
+
+    assert sum(sum(b.values()) for b in buckets.values()) == 2
+    assert stats.get_time_buckets(since_second=10_000) == {}
@@ -0,0 +1,109 @@
+"""dns_monitor.stub 단위 테스트."""
+
+from __future__ import annotations
+
+import asyncio
+
+import dns.exception
+import dns.flags
+import dns.message
+import dns.rcode
+import pytest
+
+from dns_monitor.aws import WeightedRecord
+from dns_monitor.stub import StubAuthoritativeServer
+from dns_monitor.udp import AsyncDnsClient
+
+RECORDS = [
+    WeightedRecord(set_identifier="blue", weight=3, record_type="A", values=["10.0.0.1"]),
+    WeightedRecord(
+        set_identifier="green", weight=1, record_type="A", values=["10.0.0.2", "10.0.0.3"]
+    ),
+    WeightedRecord(set_identifier="off", weight=0, record_type="A", values=["10.0.0.9"]),
+]
+
+
+async def _query_many(server: StubAuthoritativeServer, name: str, count: int, timeout=2.0):
+    """stub 서버에 count회 질의하고 응답(타임아웃이면 None) 목록을 반환한다."""
+    port = await server.start()
+    async with server, AsyncDnsClient(port=port) as client:
+
+        async def one():
+            request = dns.message.make_query(name, "A")
+            try:
+                return await client.query(request, "127.0.0.1", timeout=timeout)
+            except dns.exception.Timeout:
+                return None
+
+        return [await one() for _ in range(count)]
+
+
+def _values(response: dns.message.Message) -> list[str]:
+    return [rdata.to_text() for rrset in response.answer for rdata in rrset]
+
+
+# ---------------------------------------------------------------------------
+# StubAuthoritativeServer
+# ---------------------------------------------------------------------------
+
+
+def test_stub_answers_with_weighted_records():
+    """가중치 0인 레코드는 응답하지 않고, 레코드의 모든 값을 authoritative 응답으로 보낸다."""
+    server = StubAuthoritativeServer("api.example.com", RECORDS, ttl=30)
+    responses = asyncio.run(_query_many(server, "API.example.com", 200))
+
+    answers = {tuple(_values(r)) for r in responses}
+    assert answers == {("10.0.0.1",), ("10.0.0.2", "10.0.0.3")}
+    assert all(r.flags & dns.flags.AA for r in responses)
+    assert {rrset.ttl for r in responses for rrset in r.answer} == {30}
+    served = server.stats.served
+    assert "off" not in served
+    assert served["blue"] + served["green"] == 200
+    assert 120 < served["blue"] < 180
+
+
+def test_stub_selection_is_deterministic_for_seed():
+    """같은 seed면 질의 순서별 응답이 같다."""
+
+    def run(seed: int) -> list[tuple[str, ...]]:
+        server = StubAuthoritativeServer("api.example.com", RECORDS, seed=seed)
+        return [tuple(_values(r)) for r in asyncio.run(_query_many(server, "api.example.com", 50))]
+
+    assert run(7) == run(7)
+    assert run(7) != run(8)
+
+
+def test_stub_nxdomain_for_other_names():
+    """설정하지 않은 이름은 NXDOMAIN으로 응답한다."""
+    server = StubAuthoritativeServer("api.example.com", RECORDS)
+    [response] = asyncio.run(_query_many(server, "other.example.com", 1))
+    assert response.rcode() == dns.rcode.NXDOMAIN
+    assert server.stats.nxdomain == 1
+    assert server.stats.served == {}
+
+
+def test_stub_cname_answer():
+    """CNAME 레코드는 CNAME RR로 응답한다."""
+    records = [WeightedRecord("a", 1, "CNAME", ["target.example.net"])]
+    server = StubAuthoritativeServer("www.example.com", records)
+    [response] = asyncio.run(_query_many(server, "www.example.com", 1))
+    assert _values(response) == ["target.example.net."]
+
+
+def test_stub_drops_responses_with_loss():
+    """loss 확률로 응답을 버리고 dropped로 집계한다."""
+    server = StubAuthoritativeServer("api.example.com", RECORDS, loss=0.5, seed=1)
+    responses = asyncio.run(_query_many(server, "api.example.com", 40, timeout=0.05))
+
+    lost = sum(1 for r in responses if r is None)
+    assert lost == server.stats.dropped
+    assert 5 < lost < 35
+    assert sum(server.stats.served.values()) == 40 - lost
+
+
+def test_stub_rejects_unsupported_records():
+    """ALIAS 레코드나 잘못된 loss 값은 ValueError."""
+    with pytest.raises(ValueError, match="A / CNAME"):
+        StubAuthoritativeServer("a.example.com", [WeightedRecord("x", 1, "ALIAS", ["elb"])])
+    with pytest.raises(ValueError, match="loss"):
+        StubAuthoritativeServer("a.example.com", RECORDS, loss=1.0)
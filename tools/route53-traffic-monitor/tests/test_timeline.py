@@ -0,0 +1,176 @@
+"""dns_monitor.timeline 단위 테스트."""
+
+from __future__ import annotations
+
+import csv
+import json
+import random
+
+import pytest
+
+from dns_monitor.stats import RecordChangeEvent
+from dns_monitor.timeline import build_timeline, write_timeline
+
+START = 1000.0
+START_WALL = 1_700_000_000.0
+
+
+def _event(detected_second: float, last_unchanged_second: float, weights, previous):
+    return RecordChangeEvent(
+        detected_at=START + detected_second,
+        wall_time=START_WALL + detected_second,
+        last_unchanged_at=START + last_unchanged_second,
+        weights=weights,
+        previous_weights=previous,
+        changes=["blue: weight 100 → 50", "green: weight 0 → 50"],
+    )
+
+
+def _flip_buckets() -> dict[int, dict[str, int]]:
+    """0~19초 blue 100%, 20~24초 전환 중, 25초 이후 50:50."""
+    buckets: dict[int, dict[str, int]] = {}
+    for second in range(20):
+        buckets[second] = {"blue": 200}
+    for second in range(20, 25):
+        buckets[second] = {"blue": 160, "green": 40}
+    for second in range(25, 40):
+        buckets[second] = {"blue": 100, "green": 100}
+    return buckets
+
+
+def _noisy_buckets(seed: int, tps: int, seconds: int, shares_at) -> dict[int, dict[str, int]]:
+    """초마다 tps개 응답을 shares_at(second)의 blue 비율로 무작위 추출한다."""
+    rng = random.Random(seed)
+    buckets: dict[int, dict[str, int]] = {}
+    for second in range(seconds):
+        blue = sum(rng.random() < shares_at(second) for _ in range(tps))
+        buckets[second] = {"blue": blue, "green": tps - blue}
+    return buckets
+
+
+def test_build_timeline_rows_and_expected_shares():
+    """초별 행이 생성되고, 변경 이후 행은 새 설정 비율을 가져야 한다."""
+    event = _event(30, 0, {"blue": 50, "green": 50}, {"blue": 100, "green": 0})
+    timeline = build_timeline(
+        _flip_buckets(), [event], {"blue": 100, "green": 0}, START, START_WALL
+    )
+
+    assert len(timeline.rows) == 40
+    assert timeline.identifiers == ["blue", "green"]
+    assert timeline.rows[10].expected == {"blue": 1.0, "green": 0.0}
+    assert timeline.rows[30].event is event
+    assert timeline.rows[30].expected == {"blue": 0.5, "green": 0.5}
+    assert timeline.rows[27].share("green") == pytest.approx(0.5)
+
+
+def test_build_timeline_measures_time_to_converge():
+    """누적 표본이 새 비율에 들어온 구간의 시작 시점으로 수렴 시간을 계산해야 한다."""
+    event = _event(30, 0, {"blue": 50, "green": 50}, {"blue": 100, "green": 0})
+    timeline = build_timeline(
+        _flip_buckets(), [event], {"blue": 100, "green": 0}, START, START_WALL, tolerance=0.05
+    )
+
+    change = timeline.changes[0]
+    # 전환 중 구간은 새 비율을 벗어나므로 버리고, 25초부터 누적한 표본이 34초에 판정을 통과
+    assert change.converged_second == 25
+    assert change.confirmed_second == 34
+    assert change.seconds_since_detected == -5
+    assert change.seconds_upper_bound == 25
+
+
+def test_build_timeline_not_converged():
+    """새 비율에 도달하지 못하면 converged_second가 None이어야 한다."""
+    buckets = {s: {"blue": 10} for s in range(30)}
+    event = _event(5, 0, {"blue": 50, "green": 50}, {"blue": 100, "green": 0})
+    timeline = build_timeline(buckets, [event], {"blue": 100, "green": 0}, START, START_WALL)
+
+    assert timeline.changes[0].converged_second is None
+    assert timeline.changes[0].seconds_upper_bound is None
+
+
+def test_measure_change_ignores_noise_before_change():
+    """표본이 적거나 이전 비율과 구분되지 않는 감지 전 표본은 수렴으로 보지 않는다."""
+    # 10 TPS, 50:50 → 51:49 변경을 60초에 감지. 관측은 내내 이전 비율 그대로
+    event = _event(60, 0, {"blue": 51, "green": 49}, {"blue": 50, "green": 50})
+    for seed in range(20):
+        buckets = _noisy_buckets(seed, 10, 120, lambda _: 0.5)
+        timeline = build_timeline(buckets, [event], {"blue": 50, "green": 50}, START, START_WALL)
+        assert timeline.changes[0].converged_second is None
+
+    # 표본이 충분해도 감지 전 표본은 이전 비율과 구분되지 않으므로 감지 시점부터 누적한다
+    buckets = _noisy_buckets(1, 2000, 90, lambda s: 0.5 if s < 60 else 0.51)
+    timeline = build_timeline(
+        buckets, [event], {"blue": 50, "green": 50}, START, START_WALL, tolerance=0.03
+    )
+    assert timeline.changes[0].converged_second == 60
+
+
+def test_measure_change_converges_after_flip_with_noise():
+    """실제 변경 이후 표본만 수렴으로 인정하고, 감지 전이라도 변경이 보이면 인정한다."""
+    # 20초에 100:0 → 50:50 전환, 30초에 감지
+    event = _event(30, 0, {"blue": 50, "green": 50}, {"blue": 100, "green": 0})
+    buckets = _noisy_buckets(7, 2000, 60, lambda s: 1.0 if s < 20 else 0.5)
+    timeline = build_timeline(
+        buckets, [event], {"blue": 100, "green": 0}, START, START_WALL, tolerance=0.03
+    )
+
+    change = timeline.changes[0]
+    assert change.converged_second == 20
+    assert 20 <= change.confirmed_second <= 30
+
+
+def test_measure_change_converges_at_capped_tps():
+    """TPS 상한(100)과 기본 tolerance에서도 누적 표본으로 수렴을 확인해야 한다."""
+    # 30초에 100:0 → 50:50 전환, 25초 직후 변경되어 40초에 감지
+    event = _event(40, 25, {"blue": 50, "green": 50}, {"blue": 100, "green": 0})
+    buckets = _noisy_buckets(0, 100, 400, lambda s: 1.0 if s < 30 else 0.5)
+    timeline = build_timeline(buckets, [event], {"blue": 100, "green": 0}, START, START_WALL)
+
+    change = timeline.changes[0]
+    assert change.converged_second == 30
+    assert change.confirmed_second < 400
+
+
+def test_measure_change_stops_at_next_change():
+    """다음 변경 이후의 표본으로 이전 변경의 수렴을 판정하지 않는다."""
+    # 1차 변경(50:50)은 반영되지 않다가, 2차 변경(60:40) 직후부터 50:50 응답
+    first = _event(10, 5, {"blue": 50, "green": 50}, {"blue": 100, "green": 0})
+    second = _event(45, 40, {"blue": 60, "green": 40}, {"blue": 50, "green": 50})
+    buckets = {s: {"blue": 200} if s < 40 else {"blue": 100, "green": 100} for s in range(120)}
+    timeline = build_timeline(
+        buckets, [first, second], {"blue": 100, "green": 0}, START, START_WALL, tolerance=0.05
+    )
+
+    assert [c.converged_second for c in timeline.changes] == [None, None]
+
+
+def test_write_timeline_csv_and_jsonl(tmp_path):
+    """CSV/JSONL 파일로 내보낼 수 있어야 한다."""
+    event = _event(30, 0, {"blue": 50, "green": 50}, {"blue": 100, "green": 0})
+    timeline = build_timeline(
+        _flip_buckets(), [event], {"blue": 100, "green": 0}, START, START_WALL, tolerance=0.05
+    )
+
+    csv_path = tmp_path / "timeline.csv"
+    write_timeline(timeline, csv_path)
+    with open(csv_path, encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    assert len(rows) == 40
+    assert rows[30]["green_expected"] == "0.5000"
+    assert rows[30]["event"].startswith("blue: weight")
+
+    jsonl_path = tmp_path / "timeline.jsonl"
+    write_timeline(timeline, jsonl_path)
+    lines = [json.loads(line) for line in jsonl_path.read_text(encoding="utf-8").splitlines()]
+    assert [line["type"] for line in lines].count("second") == 40
+    change = next(line for line in lines if line["type"] == "change")
+    assert change["converged_second"] == 25
+    assert change["confirmed_second"] == 34
+    assert change["weights"] == {"blue": 50, "green": 50}
+
+
+def test_write_timeline_rejects_unknown_format(tmp_path):
+    """지원하지 않는 확장자는 ValueError가 발생해야 한다."""
+    timeline = build_timeline({}, [], {"blue": 100}, START, START_WALL)
+    with pytest.raises(ValueError, match="지원하지 않는"):
+        write_timeline(timeline, tmp_path / "timeline.txt")
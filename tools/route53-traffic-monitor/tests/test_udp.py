@@ -0,0 +1,108 @@
+"""dns_monitor.udp 단위 테스트."""
+
+from __future__ import annotations
+
+import asyncio
+
+import dns.exception
+import dns.message
+import dns.rrset
+import pytest
+
+from dns_monitor.udp import AsyncDnsClient
+
+
+class _StubServer(asyncio.DatagramProtocol):
+    """질의 이름에 따라 응답을 지연/생략하는 테스트용 DNS 서버."""
+
+    def __init__(self, delays: dict[str, float]):
+        self._delays = delays
+        self.transport: asyncio.DatagramTransport | None = None
+
+    def connection_made(self, transport) -> None:
+        self.transport = transport
+
+    def datagram_received(self, data: bytes, addr) -> None:
+        request = dns.message.from_wire(data)
+        name = request.question[0].name.to_text()
+        delay = self._delays.get(name, 0.0)
+        if delay < 0:
+            return  # 응답하지 않음
+        response = dns.message.make_response(request)
+        response.answer.append(dns.rrset.from_text(name, 60, "IN", "A", "10.0.0.1"))
+        loop = asyncio.get_running_loop()
+        loop.call_later(delay, self.transport.sendto, response.to_wire(), addr)
+
+
+async def _serve(delays: dict[str, float]):
+    loop = asyncio.get_running_loop()
+    transport, _ = await loop.create_datagram_endpoint(
+        lambda: _StubServer(delays), local_addr=("127.0.0.1", 0)
+    )
+    return transport, transport.get_extra_info("sockname")[1]
+
+
+def test_query_multiplexes_concurrent_requests():
+    """하나의 소켓으로 동시 질의하고, 늦은 응답이 다른 응답을 지연시키지 않아야 한다."""
+
+    async def scenario():
+        transport, port = await _serve({"slow.example.com.": 0.3})
+        try:
+            async with AsyncDnsClient(port=port) as client:
+                loop = asyncio.get_running_loop()
+                t0 = loop.time()
+                fast = asyncio.create_task(
+                    client.query(dns.message.make_query("fast.example.com", "A"), "127.0.0.1")
+                )
+                slow = asyncio.create_task(
+                    client.query(dns.message.make_query("slow.example.com", "A"), "127.0.0.1")
+                )
+                fast_response = await fast
+                fast_elapsed = loop.time() - t0
+                slow_response = await slow
+        finally:
+            transport.close()
+        return fast_response, fast_elapsed, slow_response
+
+    fast_response, fast_elapsed, slow_response = asyncio.run(scenario())
+    assert fast_response.answer[0].name.to_text() == "fast.example.com."
+    assert slow_response.answer[0].name.to_text() == "slow.example.com."
+    assert fast_elapsed < 0.2
+
+
+def test_query_reassigns_duplicate_message_id():
+    """같은 서버에 대기 중인 메시지 ID와 겹치면 새 ID를 할당해야 한다."""
+
+    async def scenario():
+        transport, port = await _serve({"a.example.com.": 0.05})
+        try:
+            async with AsyncDnsClient(port=port) as client:
+                first = dns.message.make_query("a.example.com", "A")
+                second = dns.message.make_query("b.example.com", "A")
+                second.id = first.id
+                return await asyncio.gather(
+                    client.query(first, "127.0.0.1"), client.query(second, "127.0.0.1")
+                )
+        finally:
+            transport.close()
+
+    first, second = asyncio.run(scenario())
+    assert first.id != second.id
+    assert second.answer[0].name.to_text() == "b.example.com."
+
+
+def test_query_timeout():
+    """응답이 없으면 dns.exception.Timeout이 발생해야 한다."""
+
+    async def scenario():
+        transport, port = await _serve({"drop.example.com.": -1})
+        try:
+            async with AsyncDnsClient(port=port) as client:
+                await client.query(
+                    dns.message.make_query("drop.example.com", "A"), "127.0.0.1", timeout=0.1
+                )
+        finally:
+            transport.close()
+
+    with pytest.raises(dns.exception.Timeout):
+        asyncio.run(scenario())